@@ -10,11 +10,14 @@ HOW: FastAPI router that extracts request data and delegates to FrontendGatewayS
 """
 
 from fastapi import APIRouter, Request, HTTPException, UploadFile, File, Form
+from fastapi.responses import JSONResponse
 from starlette.datastructures import UploadFile as StarletteUploadFile
 from typing import Dict, Any, Optional
 import logging
 import json
 
+from foundations.public_works_foundation.infrastructure_adapters.upload_stream import UploadStream, UploadTooLargeError
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Universal Pillar API"])
@@ -68,6 +71,38 @@ def _get_api_prefix() -> str:
         return _route_pattern
 
 
+def _get_upload_settings() -> Dict[str, Optional[int]]:
+    """Chunk size and size limit for streamed uploads (from configuration)."""
+    chunk_size = 8 * 1024 * 1024
+    max_bytes = None
+    try:
+        if _config_manager:
+            chunk_size = int(_config_manager.get("UPLOAD_CHUNK_SIZE") or chunk_size)
+            max_bytes = int(_config_manager.get("UPLOAD_MAX_BYTES") or 0) or None
+    except (TypeError, ValueError) as e:
+        logger.warning(f"⚠️ Invalid upload settings in config: {e}, using defaults")
+    return {"chunk_size": chunk_size, "max_bytes": max_bytes}
+
+
+def _is_streaming_upload(path: str) -> bool:
+    """File uploads whose content is streamed to storage instead of read into memory."""
+    return path.rstrip("/").endswith("upload-file")
+
+
+def _upload_too_large_response(size_error: UploadTooLargeError) -> JSONResponse:
+    """HTTP 413 for an upload over UPLOAD_MAX_BYTES."""
+    logger.warning(f"⚠️ Upload rejected: {size_error}")
+    return JSONResponse(
+        status_code=413,
+        content={
+            "success": False,
+            "error": "upload_too_large",
+            "message": str(size_error),
+            "max_bytes": size_error.max_bytes
+        }
+    )
+
+
 def set_frontend_gateway(gateway):
     """Inject FrontendGatewayService (dependency injection)."""
     global _frontend_gateway
@@ -122,6 +157,7 @@ async def universal_pillar_handler(request: Request, pillar: str, path: str):
     # Extract request data
     body = {}
     files = {}
+    upload_streams = []
     
     # Handle different content types
     content_type = request.headers.get("content-type", "").lower()
@@ -164,12 +200,23 @@ async def universal_pillar_handler(request: Request, pillar: str, path: str):
                     logger.info(f"   → is_upload_file: {is_upload_file}")
                     
                     if is_upload_file:
-                        # Read file content (can only read once, so store it)
                         filename = getattr(value, 'filename', None) or f"unknown_{key}"
-                        logger.info(f"📖 Reading file content for key='{key}', filename='{filename}'")
                         try:
-                            file_content = await value.read()
-                            logger.info(f"📖 File content read: type={type(file_content).__name__}, size={len(file_content) if file_content else 0} bytes")
+                            if _is_streaming_upload(path):
+                                # Stream the (parser-spooled) file part to storage in chunks
+                                # instead of reading it into memory
+                                upload_settings = _get_upload_settings()
+                                file_content = UploadStream.from_upload_file(value, **upload_settings)
+                                upload_streams.append(file_content)
+                                file_content.check_size()
+                                logger.info(f"📖 Streaming file content for key='{key}', filename='{filename}', size={len(file_content)} bytes")
+                            else:
+                                # Read file content (can only read once, so store it)
+                                logger.info(f"📖 Reading file content for key='{key}', filename='{filename}'")
+                                file_content = await value.read()
+                                logger.info(f"📖 File content read: type={type(file_content).__name__}, size={len(file_content) if file_content else 0} bytes")
+                        except UploadTooLargeError as size_error:
+                            return _upload_too_large_response(size_error)
                         except Exception as read_error:
                             logger.error(f"❌ Failed to read file content: {read_error}", exc_info=True)
                             file_content = None
@@ -177,7 +224,8 @@ async def universal_pillar_handler(request: Request, pillar: str, path: str):
                         # Validate file content is not empty
                         if file_content is None:
                             logger.warning(f"⚠️ File '{key}' has no content (None) - filename: {filename}")
-                        elif len(file_content) == 0:
+                        # A stream without a declared size is only measured while it is stored
+                        elif len(file_content) == 0 and not (isinstance(file_content, UploadStream) and file_content.size is None):
                             logger.warning(f"⚠️ File '{key}' has empty content (0 bytes) - filename: {filename}")
                         else:
                             content_type = getattr(value, 'content_type', None) or "application/octet-stream"
@@ -376,8 +424,16 @@ async def universal_pillar_handler(request: Request, pillar: str, path: str):
     try:
         result = await gateway.route_frontend_request(request_payload)
         
+        # An upload without a declared size only hits the limit while it is being stored;
+        # the layer that saw it may have turned it into an error body instead of re-raising
+        for upload_stream in upload_streams:
+            if upload_stream.size_error:
+                return _upload_too_large_response(upload_stream.size_error)
+        
         # Return result (FrontendGatewayService returns dict, FastAPI will serialize to JSON)
         return result
+    except UploadTooLargeError as size_error:
+        return _upload_too_large_response(size_error)
     except Exception as e:
         logger.error(f"❌ Error routing request: {e}", exc_info=True)
         raise HTTPException(
@@ -25,6 +25,7 @@ from typing import Dict, Any, Optional
 sys.path.insert(0, os.path.abspath('../../../../../../'))
 
 from bases.orchestrator_base import OrchestratorBase
+from foundations.public_works_foundation.infrastructure_adapters.upload_stream import UploadTooLargeError
 
 
 class DataSolutionOrchestrator(OrchestratorBase):
@@ -202,6 +203,8 @@ class DataSolutionOrchestrator(OrchestratorBase):
                 "workflow_id": workflow_id
             }
             
+        except UploadTooLargeError:
+            raise
         except Exception as e:
             self.logger.error(f"❌ Data ingestion failed: {e}")
             import traceback
@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 """Embedding creation module for Embedding Service."""
 
-import io
 import json
+import asyncio
 from typing import Dict, Any, List, Optional
 import pandas as pd
 import numpy as np
@@ -15,6 +15,10 @@ class EmbeddingCreation:
         """Initialize with service instance."""
         self.service = service_instance
         self.logger = service_instance.logger
+        
+        # Structured-file pipeline settings
+        self.meaning_concurrency = 8  # Concurrent semantic meaning (LLM) calls per file
+        self.embedding_batch_size = None  # Texts per embedding request (None: adapter default)
     
     async def _infer_semantic_meaning(
         self,
@@ -96,6 +100,151 @@ What does this column represent? Return ONLY a concise description (1-5 words)."
             self.logger.warning(f"⚠️ Failed to infer semantic meaning via agent for {column_name}: {e}, using column name")
             return f"Column: {column_name}"
     
+    async def _create_column_embeddings(
+        self,
+        columns: List[Any],
+        sampled_df: pd.DataFrame,
+        row_count: int,
+        parsed_file_id: Optional[str],
+        content_type: Optional[str],
+        format_type: Optional[str],
+        is_hybrid_part: bool = False,
+        hybrid_file_id: Optional[str] = None,
+        hybrid_part_type: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Create metadata/meaning/samples embeddings for every column of a structured file.
+        
+        Pipeline (instead of one LLM call and three embedding calls per column in series):
+        1. Collect metadata and sample texts for all columns
+        2. Infer semantic meanings with bounded concurrency (meaning_concurrency)
+        3. Embed all texts for the file via batched HuggingFaceAdapter requests
+        4. Reassemble embedding documents per column
+        
+        Args:
+            columns: Column descriptors (dicts with name/data_type, or names)
+            sampled_df: Sampled DataFrame
+            row_count: Row count of the full DataFrame
+            parsed_file_id: Parsed file ID (for linking)
+            content_type / format_type / is_hybrid_part / hybrid_file_id / hybrid_part_type:
+                Correlation metadata for hybrid files
+        
+        Returns:
+            List of embedding documents (one per column)
+        """
+        # Generate embeddings using HuggingFaceAdapter (PRIMARY PATHWAY ONLY - NO FALLBACKS)
+        if not self.service.hf_adapter:
+            raise ValueError("HuggingFaceAdapter not available - embeddings cannot be generated. Ensure HUGGINGFACE_EMBEDDINGS_ENDPOINT_URL and HUGGINGFACE_EMBEDDINGS_API_KEY are configured.")
+        
+        # Step 1: Collect column texts
+        column_specs = []
+        for col_idx, column_info in enumerate(columns):
+            column_name = column_info.get("name") if isinstance(column_info, dict) else str(column_info)
+            
+            # Get data type from metadata or DataFrame
+            if isinstance(column_info, dict):
+                data_type = column_info.get("data_type") or column_info.get("type") or "string"
+            else:
+                data_type = "string"
+            
+            # Extract column data from sampled DataFrame
+            sample_values = []
+            if column_name in sampled_df.columns:
+                column_data = sampled_df[column_name]
+                data_type = str(sampled_df[column_name].dtype) if data_type == "string" else data_type
+                
+                # Get sample values (first 10 non-null values as text)
+                for val in column_data.dropna().head(10):
+                    # Convert to string (handles numpy types)
+                    try:
+                        if pd.isna(val):
+                            continue
+                        # Convert numpy types to native Python types
+                        if isinstance(val, (np.integer, np.int64, np.int32)):
+                            sample_values.append(str(int(val)))
+                        elif isinstance(val, (np.floating, np.float64, np.float32)):
+                            sample_values.append(str(float(val)))
+                        elif isinstance(val, np.bool_):
+                            sample_values.append(str(bool(val)))
+                        else:
+                            sample_values.append(str(val))
+                    except Exception:
+                        sample_values.append(str(val))
+            else:
+                self.logger.warning(f"⚠️ Column {column_name} not found in sampled DataFrame - this should not happen")
+            
+            column_specs.append({
+                "column_name": column_name,
+                "column_position": col_idx,
+                "data_type": data_type,
+                "sample_values": sample_values,
+                # Metadata embedding: column name + data type + structure
+                "metadata_text": f"Column: {column_name}, Type: {data_type}, Position: {col_idx}",
+                # Samples embedding: representative sample values
+                "samples_text": f"Sample values: {', '.join(sample_values[:5])}"  # First 5 samples
+            })
+        
+        # Step 2: Meaning embedding text: semantic meaning (inferred via LLM, bounded concurrency)
+        semaphore = asyncio.Semaphore(self.meaning_concurrency)
+        
+        async def infer(spec: Dict[str, Any]) -> str:
+            async with semaphore:
+                return await self._infer_semantic_meaning(spec["column_name"], spec["data_type"], spec["sample_values"])
+        
+        meanings = await asyncio.gather(*(infer(spec) for spec in column_specs))
+        
+        # Step 3: Embed all texts for the file in batched requests
+        texts = []
+        for spec, meaning_text in zip(column_specs, meanings):
+            spec["meaning_text"] = meaning_text
+            texts.extend([spec["metadata_text"], meaning_text, spec["samples_text"]])
+        
+        try:
+            batch_result = await self.service.hf_adapter.generate_embeddings_batch(
+                texts,
+                batch_size=self.embedding_batch_size
+            )
+            vectors = batch_result.get("embeddings", [])
+            if len(vectors) != len(texts):
+                raise ValueError(f"HuggingFaceAdapter returned {len(vectors)} embeddings for {len(texts)} texts")
+            self.logger.info(f"✅ Generated {len(vectors)} embeddings via HuggingFaceAdapter for {len(column_specs)} columns")
+        except Exception as e:
+            self.logger.error(f"❌ HuggingFaceAdapter batch embedding failed: {e}")
+            raise  # Fail fast - no fallbacks
+        
+        # Step 4: Reassemble embedding documents per column
+        embeddings = []
+        for i, spec in enumerate(column_specs):
+            metadata_embedding, meaning_embedding, samples_embedding = vectors[3 * i:3 * i + 3]
+            if not metadata_embedding or not meaning_embedding or not samples_embedding:
+                raise ValueError(f"Failed to generate embeddings for column {spec['column_name']} - HuggingFaceAdapter returned empty results")
+            
+            embeddings.append({
+                "column_name": spec["column_name"],
+                # Embeddings (vectors)
+                "metadata_embedding": metadata_embedding,
+                "meaning_embedding": meaning_embedding,
+                "samples_embedding": samples_embedding,
+                # Enhanced metadata (text - for preview reconstruction)
+                "data_type": spec["data_type"],
+                "semantic_meaning": spec["meaning_text"],
+                "sample_values": spec["sample_values"],
+                "row_count": row_count,
+                "column_position": spec["column_position"],
+                "semantic_id": None,  # Will be populated by semantic matching (future)
+                "semantic_model_recommendation": None,  # Will be populated by semantic matching (future)
+                # Link to parsed file for matching
+                "parsed_file_id": parsed_file_id,
+                # Correlation metadata for hybrid files
+                "content_type": content_type,
+                "format_type": format_type,
+                "is_hybrid_part": is_hybrid_part,
+                "hybrid_file_id": hybrid_file_id,
+                "hybrid_part_type": hybrid_part_type
+            })
+        
+        return embeddings
+    
     async def create_representative_embeddings(
         self,
         parsed_file_id: str,
@@ -153,46 +302,37 @@ What does this column represent? Return ONLY a concise description (1-5 words)."
                 raise ValueError("Data Steward not available - cannot retrieve parsed file. This is required for embedding creation.")
             
             try:
-                # ✅ Use get_parsed_file() which looks up metadata and retrieves the actual GCS file
+                # ✅ Look up metadata first; the file content is fetched per format below
                 # ✅ CLARIFIED: parsed_file_id IS the GCS file UUID (stored in parsed_data_files.parsed_file_id)
                 # The parsed file is stored in GCS with this UUID, and metadata is stored in parsed_data_files table
                 # This UUID is returned from store_parsed_file() and used consistently throughout the platform
-                parsed_file_result = await self.service.data_steward.get_parsed_file(parsed_file_id)
+                parsed_file_result = await self.service.data_steward.get_parsed_file(parsed_file_id, include_data=False)
                 if not parsed_file_result:
                     raise ValueError(f"Parsed file not found: {parsed_file_id}. File must be parsed and saved before embeddings can be created.")
                 
-                # get_parsed_file() returns: {parsed_file_id, metadata, file_data, format_type, content_type}
-                self.logger.info(f"🔍 [create_representative_embeddings] parsed_file_result keys: {list(parsed_file_result.keys())}")
-                file_content = parsed_file_result.get("file_data")
-                format_type = parsed_file_result.get("format_type", "parquet").lower()
+                format_type = (parsed_file_result.get("format_type") or "parquet").lower()
                 content_type = parsed_file_result.get("content_type") or content_metadata.get("content_type", "structured")
-                self.logger.info(f"🔍 [create_representative_embeddings] file_data type: {type(file_content)}, length: {len(file_content) if isinstance(file_content, bytes) else 'N/A'}, format_type: {format_type}, content_type: {content_type}")
+                self.logger.info(f"🔍 [create_representative_embeddings] format_type: {format_type}, content_type: {content_type}")
                 
-                if not file_content:
-                    available_fields = list(parsed_file_result.keys()) if parsed_file_result else []
-                    self.logger.error(f"❌ Parsed file has no content: {parsed_file_id}. Available fields: {available_fields}")
-                    raise ValueError(f"Parsed file has no content: {parsed_file_id}. Available fields: {available_fields}. File must be parsed and saved before embeddings can be created.")
+                file_content = None
+                if format_type not in ("parquet", "parquet_file"):
+                    # JSON formats are parsed whole, so they are downloaded whole
+                    parsed_file_result = await self.service.data_steward.get_parsed_file(parsed_file_id)
+                    file_content = parsed_file_result.get("file_data") if parsed_file_result else None
+                    if not file_content:
+                        available_fields = list(parsed_file_result.keys()) if parsed_file_result else []
+                        self.logger.error(f"❌ Parsed file has no content: {parsed_file_id}. Available fields: {available_fields}")
+                        raise ValueError(f"Parsed file has no content: {parsed_file_id}. Available fields: {available_fields}. File must be parsed and saved before embeddings can be created.")
                 
                 # Support all format types: parquet, jsonl, json_structured, json_chunks
                 
                 if format_type == "parquet" or format_type == "parquet_file":
-                    # Validate parquet magic bytes before reading
-                    if isinstance(file_content, bytes) and len(file_content) >= 4:
-                        magic_bytes = file_content[:4]
-                        if magic_bytes != b'PAR1':
-                            self.logger.error(f"❌ Invalid parquet magic bytes: {magic_bytes} (expected PAR1)")
-                            self.logger.error(f"   Content type: {type(file_content)}, length: {len(file_content)}")
-                            self.logger.error(f"   First 20 bytes: {file_content[:20]}")
-                            self.logger.error(f"   Last 20 bytes: {file_content[-20:]}")
-                            raise ValueError(f"Retrieved file is not a valid parquet file: magic_bytes={magic_bytes}, expected PAR1")
-                        self.logger.info(f"✅ Parquet magic bytes validated: {magic_bytes}, size: {len(file_content)} bytes")
-                    else:
-                        self.logger.error(f"❌ Invalid parquet content: type={type(file_content)}, length={len(file_content) if isinstance(file_content, bytes) else 'N/A'}")
-                        raise ValueError(f"Retrieved file content is not valid bytes: type={type(file_content)}")
-                
-                    # Read parquet from bytes
-                    parquet_buffer = io.BytesIO(file_content)
-                    df = pd.read_parquet(parquet_buffer)
+                    # Read through the file management abstraction (footer + column chunks)
+                    # instead of downloading the whole object and re-parsing an in-memory copy
+                    parsed_parquet = await self.service.data_steward.read_parsed_parquet(parsed_file_id)
+                    if not parsed_parquet:
+                        raise ValueError(f"Retrieved file is not a valid parquet file: {parsed_file_id}")
+                    df = parsed_parquet["table"].to_pandas()
                     self.logger.info(f"✅ Loaded parquet file: {len(df)} rows, {len(df.columns)} columns")
                     
                 elif format_type == "jsonl":
@@ -339,184 +479,17 @@ What does this column represent? Return ONLY a concise description (1-5 words)."
                 self.logger.info(f"📊 Sampled {len(sampled_df)} rows (strategy: {sampling_strategy}, n: {n})")
                 
                 # Create embeddings for each column with enhanced metadata
-                for col_idx, column_info in enumerate(columns):
-                    column_name = column_info.get("name") if isinstance(column_info, dict) else str(column_info)
-                    
-                    # Get data type from metadata or DataFrame
-                    if isinstance(column_info, dict):
-                        data_type = column_info.get("data_type") or column_info.get("type") or "string"
-                    else:
-                        data_type = "string"
-                    
-                    # Extract column data from sampled DataFrame
-                    sample_values = []
-                    if column_name in sampled_df.columns:
-                        column_data = sampled_df[column_name]
-                        data_type = str(sampled_df[column_name].dtype) if data_type == "string" else data_type
-                        
-                        # Get sample values (first 10 non-null values as text)
-                        for val in column_data.dropna().head(10):
-                            # Convert to string (handles numpy types)
-                            try:
-                                if pd.isna(val):
-                                    continue
-                                # Convert numpy types to native Python types
-                                if isinstance(val, (np.integer, np.int64, np.int32)):
-                                    sample_values.append(str(int(val)))
-                                elif isinstance(val, (np.floating, np.float64, np.float32)):
-                                    sample_values.append(str(float(val)))
-                                elif isinstance(val, np.bool_):
-                                    sample_values.append(str(bool(val)))
-                                else:
-                                    sample_values.append(str(val))
-                            except Exception:
-                                sample_values.append(str(val))
-                    else:
-                        self.logger.warning(f"⚠️ Column {column_name} not found in sampled DataFrame - this should not happen")
-                    
-                    # Create embedding text for each type
-                    # Metadata embedding: column name + data type + structure
-                    metadata_text = f"Column: {column_name}, Type: {data_type}, Position: {col_idx}"
-                    
-                    # Meaning embedding: semantic meaning (inferred via LLM)
-                    meaning_text = await self._infer_semantic_meaning(column_name, data_type, sample_values)
-                    
-                    # Samples embedding: representative sample values
-                    samples_text = f"Sample values: {', '.join(sample_values[:5])}"  # First 5 samples
-                    
-                    # Generate embeddings using HuggingFaceAdapter (PRIMARY PATHWAY ONLY - NO FALLBACKS)
-                    if not self.service.hf_adapter:
-                        raise ValueError("HuggingFaceAdapter not available - embeddings cannot be generated. Ensure HUGGINGFACE_EMBEDDINGS_ENDPOINT_URL and HUGGINGFACE_EMBEDDINGS_API_KEY are configured.")
-                    
-                    try:
-                        metadata_result = await self.service.hf_adapter.generate_embedding(metadata_text)
-                        meaning_result = await self.service.hf_adapter.generate_embedding(meaning_text)
-                        samples_result = await self.service.hf_adapter.generate_embedding(samples_text)
-                        
-                        metadata_embedding = metadata_result.get("embedding", [])
-                        meaning_embedding = meaning_result.get("embedding", [])
-                        samples_embedding = samples_result.get("embedding", [])
-                        
-                        if not metadata_embedding or not meaning_embedding or not samples_embedding:
-                            raise ValueError(f"Failed to generate embeddings for column {column_name} - HuggingFaceAdapter returned empty results")
-                        
-                        self.logger.debug(f"✅ Generated embeddings via HuggingFaceAdapter for column: {column_name}")
-                    except Exception as e:
-                        self.logger.error(f"❌ HuggingFaceAdapter failed for {column_name}: {e}")
-                        raise  # Fail fast - no fallbacks
-                    
-                    # Build embedding document with enhanced metadata
-                    embedding_doc = {
-                        "column_name": column_name,
-                        # Embeddings (vectors)
-                        "metadata_embedding": metadata_embedding,
-                        "meaning_embedding": meaning_embedding,
-                        "samples_embedding": samples_embedding,
-                        # Enhanced metadata (text - for preview reconstruction)
-                        "data_type": data_type,  # ✅ NEW: Store data type
-                        "semantic_meaning": meaning_text,  # ✅ NEW: Store meaning as text
-                        "sample_values": sample_values,  # ✅ NEW: Store samples as text array
-                        "row_count": len(df),  # ✅ NEW: Store row count
-                        "column_position": col_idx,  # ✅ NEW: Store column order
-                        "semantic_id": None,  # Will be populated by semantic matching (future)
-                        "semantic_model_recommendation": None,  # ✅ NEW: Will be populated by semantic matching (future)
-                        # Correlation metadata for hybrid files
-                        "content_type": content_type,
-                        "format_type": format_type,
-                        "is_hybrid_part": is_hybrid_part,
-                        "hybrid_file_id": hybrid_file_id,
-                        "hybrid_part_type": hybrid_part_type
-                    }
-                    
-                    embeddings.append(embedding_doc)
-                column_name = column_info.get("name") if isinstance(column_info, dict) else str(column_info)
-                
-                # Get data type from metadata or DataFrame
-                if isinstance(column_info, dict):
-                    data_type = column_info.get("data_type") or column_info.get("type") or "string"
-                else:
-                    data_type = "string"
-                
-                # Extract column data from sampled DataFrame
-                sample_values = []
-                if column_name in sampled_df.columns:
-                    column_data = sampled_df[column_name]
-                    data_type = str(sampled_df[column_name].dtype) if data_type == "string" else data_type
-                    
-                    # Get sample values (first 10 non-null values as text)
-                    for val in column_data.dropna().head(10):
-                        # Convert to string (handles numpy types)
-                        try:
-                            if pd.isna(val):
-                                continue
-                            # Convert numpy types to native Python types
-                            if isinstance(val, (np.integer, np.int64, np.int32)):
-                                sample_values.append(str(int(val)))
-                            elif isinstance(val, (np.floating, np.float64, np.float32)):
-                                sample_values.append(str(float(val)))
-                            elif isinstance(val, np.bool_):
-                                sample_values.append(str(bool(val)))
-                            else:
-                                sample_values.append(str(val))
-                        except Exception:
-                            sample_values.append(str(val))
-                else:
-                    self.logger.warning(f"⚠️ Column {column_name} not found in sampled DataFrame - this should not happen")
-                
-                # Create embedding text for each type
-                # Metadata embedding: column name + data type + structure
-                metadata_text = f"Column: {column_name}, Type: {data_type}, Position: {col_idx}"
-                
-                # Meaning embedding: semantic meaning (inferred via LLM)
-                meaning_text = await self._infer_semantic_meaning(column_name, data_type, sample_values)
-                
-                # Samples embedding: representative sample values
-                samples_text = f"Sample values: {', '.join(sample_values[:5])}"  # First 5 samples
-                
-                # Generate embeddings using HuggingFaceAdapter (PRIMARY PATHWAY ONLY - NO FALLBACKS)
-                if not self.service.hf_adapter:
-                    raise ValueError("HuggingFaceAdapter not available - embeddings cannot be generated. Ensure HUGGINGFACE_EMBEDDINGS_ENDPOINT_URL and HUGGINGFACE_EMBEDDINGS_API_KEY are configured.")
-                
-                try:
-                    metadata_result = await self.service.hf_adapter.generate_embedding(metadata_text)
-                    meaning_result = await self.service.hf_adapter.generate_embedding(meaning_text)
-                    samples_result = await self.service.hf_adapter.generate_embedding(samples_text)
-                    
-                    metadata_embedding = metadata_result.get("embedding", [])
-                    meaning_embedding = meaning_result.get("embedding", [])
-                    samples_embedding = samples_result.get("embedding", [])
-                    
-                    if not metadata_embedding or not meaning_embedding or not samples_embedding:
-                        raise ValueError(f"Failed to generate embeddings for column {column_name} - HuggingFaceAdapter returned empty results")
-                    
-                    self.logger.debug(f"✅ Generated embeddings via HuggingFaceAdapter for column: {column_name}")
-                except Exception as e:
-                    self.logger.error(f"❌ HuggingFaceAdapter failed for {column_name}: {e}")
-                    raise  # Fail fast - no fallbacks
-                
-                # Build embedding document with enhanced metadata
-                # Get parsed_file_id from content_metadata for linking
-                parsed_file_id = content_metadata.get("parsed_file_id")
-                
-                embedding_doc = {
-                    "column_name": column_name,
-                    # Embeddings (vectors)
-                    "metadata_embedding": metadata_embedding,
-                    "meaning_embedding": meaning_embedding,
-                    "samples_embedding": samples_embedding,
-                    # Enhanced metadata (text - for preview reconstruction)
-                    "data_type": data_type,  # ✅ NEW: Store data type
-                    "semantic_meaning": meaning_text,  # ✅ NEW: Store meaning as text
-                    "sample_values": sample_values,  # ✅ NEW: Store samples as text array
-                    "row_count": len(df),  # ✅ NEW: Store row count
-                    "column_position": col_idx,  # ✅ NEW: Store column order
-                    "semantic_id": None,  # Will be populated by semantic matching (future)
-                    "semantic_model_recommendation": None,  # ✅ NEW: Will be populated by semantic matching (future)
-                    # Link to parsed file for matching
-                    "parsed_file_id": parsed_file_id  # ✅ NEW: Store parsed_file_id for matching
-                }
-                
-                embeddings.append(embedding_doc)
+                embeddings = await self._create_column_embeddings(
+                    columns=columns,
+                    sampled_df=sampled_df,
+                    row_count=len(df),
+                    parsed_file_id=content_metadata.get("parsed_file_id"),
+                    content_type=content_type,
+                    format_type=format_type,
+                    is_hybrid_part=is_hybrid_part,
+                    hybrid_file_id=hybrid_file_id,
+                    hybrid_part_type=hybrid_part_type
+                )
             
             self.logger.info(f"✅ Created {len(embeddings)} embedding documents")
             
@@ -78,7 +78,8 @@ class Initialization:
                         self.service.hf_adapter = HuggingFaceAdapter(
                             endpoint_url=endpoint_url, 
                             api_key=api_key,
-                            config_adapter=config_adapter  # Pass ConfigAdapter for centralized configuration
+                            config_adapter=config_adapter,  # Pass ConfigAdapter for centralized configuration
+                            embedding_cache=getattr(public_works, 'embedding_cache', None)
                         )
                         self.logger.info("✅ Created HuggingFaceAdapter directly")
                     else:
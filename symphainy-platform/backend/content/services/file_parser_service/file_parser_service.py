@@ -79,6 +79,11 @@ class FileParserService(RealmServiceBase):
         await super().initialize()
         return await self.initialization_module.initialize()
     
+    async def shutdown(self) -> bool:
+        """Stop the parsing worker processes, then shut down the service."""
+        await self.parsing_orchestrator_module.shutdown()
+        return await super().shutdown()
+    
     # SOA API Methods - delegate to modules
     async def retrieve_document(self, file_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve file via Content Steward SOA API (Smart City service)."""
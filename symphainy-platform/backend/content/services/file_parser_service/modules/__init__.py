@@ -8,6 +8,7 @@ from .utilities import Utilities
 from .file_retrieval import FileRetrieval
 from .file_parsing import FileParsing
 from .parsing_orchestrator import ParsingOrchestrator
+from .parsing_executor import ParsingExecutor, ParsingJobError, ParsingTimeoutError
 from .structured_parsing import StructuredParsing
 from .unstructured_parsing import UnstructuredParsing
 from .hybrid_parsing import HybridParsing
@@ -20,6 +21,9 @@ __all__ = [
     "FileRetrieval",
     "FileParsing",
     "ParsingOrchestrator",
+    "ParsingExecutor",
+    "ParsingJobError",
+    "ParsingTimeoutError",
     "StructuredParsing",
     "UnstructuredParsing",
     "HybridParsing",
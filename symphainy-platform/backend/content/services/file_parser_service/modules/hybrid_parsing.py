@@ -4,9 +4,14 @@ Hybrid Parsing Module - File Parser Service
 
 Handles hybrid parsing (structured + unstructured).
 Outputs 3 JSON files: structured data, unstructured chunks, and correlation map.
+
+The structured and unstructured passes run concurrently (each on the parsing executor),
+so hybrid latency approaches the slower pass rather than the sum of both.
 """
 
 import json
+import time
+import asyncio
 from typing import Dict, Any, Optional
 from datetime import datetime
 
@@ -58,39 +63,38 @@ class HybridParsing:
             structured_parsing = StructuredParsing(self.service)
             unstructured_parsing = UnstructuredParsing(self.service)
             
-            # 1. Parse structured portion
-            self.service.logger.info(f"📊 Parsing structured portion of hybrid file...")
-            structured_result = await structured_parsing.parse(
-                file_data=file_data,
-                file_type=file_type,
-                filename=filename,
-                parse_options=parse_options,
-                user_context=user_context
-            )
-            
-            if not structured_result.get("success"):
-                return {
-                    "success": False,
-                    "error": f"Structured parsing failed: {structured_result.get('error')}",
-                    "parsing_type": "hybrid"
-                }
+            # One immutable copy of the file bytes, shared by both passes
+            if not isinstance(file_data, bytes):
+                file_data = bytes(file_data)
             
-            # 2. Parse unstructured portion
-            self.service.logger.info(f"📝 Parsing unstructured portion of hybrid file...")
-            unstructured_result = await unstructured_parsing.parse(
-                file_data=file_data,
-                file_type=file_type,
-                filename=filename,
-                parse_options=parse_options,
-                user_context=user_context
-            )
+            # 1-2. Run structured and unstructured passes concurrently
+            self.service.logger.info(f"📊📝 Parsing structured and unstructured portions of hybrid file concurrently...")
+            pass_results = await self._run_passes({
+                "structured": structured_parsing,
+                "unstructured": unstructured_parsing
+            }, file_data, file_type, filename, parse_options, user_context)
+            structured_result = pass_results["structured"]
+            unstructured_result = pass_results["unstructured"]
             
-            if not unstructured_result.get("success"):
+            # A pass that timed out leaves a partial result; any other failure fails the hybrid parse
+            timed_out = [name for name, result in pass_results.items()
+                         if not result.get("success") and result.get("error") == "file_parsing_timeout"]
+            for name, result in pass_results.items():
+                if not result.get("success") and name not in timed_out:
+                    return {
+                        "success": False,
+                        "error": f"{name.capitalize()} parsing failed: {result.get('error')}",
+                        "parsing_type": "hybrid"
+                    }
+            if len(timed_out) == len(pass_results):
                 return {
                     "success": False,
-                    "error": f"Unstructured parsing failed: {unstructured_result.get('error')}",
+                    "error": "file_parsing_timeout",
+                    "message": "Structured and unstructured parsing both timed out",
                     "parsing_type": "hybrid"
                 }
+            if timed_out:
+                self.service.logger.warning(f"⚠️ Hybrid parse returning partial result ({', '.join(timed_out)} pass timed out)")
             
             # 3. Create correlation map
             self.service.logger.info(f"🔗 Creating correlation map...")
@@ -125,10 +129,14 @@ class HybridParsing:
                     "structured_metadata": structured_result.get("metadata", {}),
                     "unstructured_metadata": unstructured_result.get("metadata", {}),
                     "table_count": len(structured_result.get("tables", [])),
-                    "chunk_count": len(unstructured_result.get("chunks", []))
+                    "chunk_count": len(unstructured_result.get("chunks", [])),
+                    "pass_durations": {name: result.get("pass_duration") for name, result in pass_results.items()}
                 },
                 "parsed_at": datetime.utcnow().isoformat()
             }
+            if timed_out:
+                parsed_result["partial"] = True
+                parsed_result["timed_out_passes"] = timed_out
             
             # Record health metric (success)
             await self.service.record_health_metric("hybrid_files_parsed", 1.0, {
@@ -176,6 +184,60 @@ class HybridParsing:
                 "parsing_type": "hybrid"
             }
     
+    async def _run_passes(
+        self,
+        passes: Dict[str, Any],
+        file_data: bytes,
+        file_type: str,
+        filename: str,
+        parse_options: Optional[Dict[str, Any]],
+        user_context: Optional[Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Run parsing passes concurrently and collect their results by name.
+        
+        Each pass is bounded by its own parsing executor deadline; parse_options["hybrid_timeout"]
+        optionally bounds the whole hybrid parse. A pass still running at that point is cancelled
+        (its worker is killed) and reported as timed out.
+        """
+        hybrid_timeout = (parse_options or {}).get("hybrid_timeout")
+        
+        async def run(name: str, parsing_module: Any) -> Dict[str, Any]:
+            started = time.monotonic()
+            result = await parsing_module.parse(
+                file_data=file_data,
+                file_type=file_type,
+                filename=filename,
+                parse_options=parse_options,
+                user_context=user_context
+            )
+            result["pass_duration"] = round(time.monotonic() - started, 3)
+            return result
+        
+        tasks = {name: asyncio.create_task(run(name, module)) for name, module in passes.items()}
+        try:
+            done, pending = await asyncio.wait(tasks.values(), timeout=hybrid_timeout)
+        finally:
+            for task in tasks.values():
+                if not task.done():
+                    task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        
+        results = {}
+        for name, task in tasks.items():
+            if task in pending:
+                results[name] = {
+                    "success": False,
+                    "error": "file_parsing_timeout",
+                    "message": f"{name.capitalize()} pass did not finish within {hybrid_timeout} seconds"
+                }
+            elif task.exception() is not None:
+                results[name] = {"success": False, "error": str(task.exception())}
+            else:
+                results[name] = task.result()
+        return results
+    
     async def _create_correlation_map(
         self,
         structured_result: Dict[str, Any],
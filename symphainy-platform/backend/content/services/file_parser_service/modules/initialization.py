@@ -60,6 +60,13 @@ class Initialization:
                 self.service.logger.warning(f"⚠️ Could not verify file parsing abstractions: {e}")
                 # Don't fail initialization - abstractions may be lazy-loaded
             
+            # 2b. Size the parsing executor (worker processes, queue, per-job limits) from configuration
+            try:
+                config_adapter = self.service._get_config_adapter()
+                self.service.parsing_orchestrator_module.configure_parsing_executor(config_adapter)
+            except Exception as e:
+                self.service.logger.warning(f"⚠️ Using default parsing executor limits: {e}")
+            
             # 3. Register with Curator (Phase 2 pattern with CapabilityDefinition structure)
             # Note: Enabling services provide SOA APIs only (no MCP tools)
             # MCP servers are at the orchestrator level for use case-level tools
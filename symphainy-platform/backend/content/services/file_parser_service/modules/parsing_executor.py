@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Parsing Executor Module - File Parser Service
+
+Runs CPU-bound parsing jobs in dedicated worker processes so the event loop (and with it
+HTTP and WebSocket traffic) stays responsive while large files parse.
+
+- Wall-clock deadline per job: a job still running at its deadline has its worker killed
+  (asyncio.wait_for around an in-loop parse can never fire while the parse holds the loop)
+- Memory limit per job (RLIMIT_AS in the worker); exceeding it fails the job and recycles the worker
+- Bounded admission queue: jobs beyond max_workers + max_queue are rejected immediately
+- Per-parser concurrency quotas (e.g. at most 2 mainframe decodes at once)
+
+Workers are long-lived (recycled after max_jobs_per_worker jobs, a memory error or a kill) and
+build their own parsing abstractions from the Layer-1 adapters, so only the request and the
+FileParsingResult cross the process boundary.
+"""
+
+import asyncio
+import inspect
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Callable
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+
+class ParsingJobError(Exception):
+    """A parsing job could not be completed by the executor (code matches the parse result error codes)."""
+    
+    def __init__(self, code: str, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+class ParsingTimeoutError(ParsingJobError, asyncio.TimeoutError):
+    """A parsing job ran past its deadline and its worker was killed."""
+    
+    def __init__(self, message: str):
+        super().__init__("file_parsing_timeout", message)
+
+
+# ============================================================================
+# WORKER PROCESS SIDE
+# ============================================================================
+
+def _build_mainframe_parser():
+    from foundations.public_works_foundation.infrastructure_adapters.mainframe_processing_adapter import MainframeProcessingAdapter
+    from foundations.public_works_foundation.infrastructure_abstractions.mainframe_processing_abstraction import MainframeProcessingAbstraction
+    return MainframeProcessingAbstraction(mainframe_adapter=MainframeProcessingAdapter())
+
+
+def _build_excel_parser():
+    from foundations.public_works_foundation.infrastructure_adapters.excel_processing_adapter import ExcelProcessingAdapter
+    from foundations.public_works_foundation.infrastructure_abstractions.excel_processing_abstraction import ExcelProcessingAbstraction
+    return ExcelProcessingAbstraction(excel_adapter=ExcelProcessingAdapter())
+
+
+def _build_csv_parser():
+    from foundations.public_works_foundation.infrastructure_adapters.csv_processing_adapter import CsvProcessingAdapter
+    from foundations.public_works_foundation.infrastructure_abstractions.csv_processing_abstraction import CsvProcessingAbstraction
+    return CsvProcessingAbstraction(csv_adapter=CsvProcessingAdapter())
+
+
+def _build_json_parser():
+    from foundations.public_works_foundation.infrastructure_adapters.json_processing_adapter import JsonProcessingAdapter
+    from foundations.public_works_foundation.infrastructure_abstractions.json_processing_abstraction import JsonProcessingAbstraction
+    return JsonProcessingAbstraction(json_adapter=JsonProcessingAdapter())
+
+
+def _build_word_parser():
+    from foundations.public_works_foundation.infrastructure_adapters.python_docx_adapter import PythonDocxAdapter
+    from foundations.public_works_foundation.infrastructure_abstractions.word_processing_abstraction import WordProcessingAbstraction
+    return WordProcessingAbstraction(python_docx_adapter=PythonDocxAdapter())
+
+
+# Abstractions that can be rebuilt inside a worker process (no connections or DI state needed).
+# Anything else is parsed on the event loop as before. PDF is not listed: its adapters already
+# shard pages over their own process pool (PdfPageExtractionEngine), which a worker cannot nest.
+PROCESS_PARSER_FACTORIES: Dict[str, Callable[[], Any]] = {
+    "mainframe_processing": _build_mainframe_parser,
+    "excel_processing": _build_excel_parser,
+    "csv_processing": _build_csv_parser,
+    "json_processing": _build_json_parser,
+    "word_processing": _build_word_parser,
+}
+
+_process_parsers: Dict[str, Any] = {}
+
+
+def run_parse_job(abstraction_name: str, request: Any) -> Any:
+    """Worker-side job: parse a FileParsingRequest with this process's copy of the abstraction."""
+    parser = _process_parsers.get(abstraction_name)
+    if parser is None:
+        parser = _process_parsers[abstraction_name] = PROCESS_PARSER_FACTORIES[abstraction_name]()
+    return asyncio.run(parser.parse_file(request))
+
+
+def _set_memory_limit(limit_bytes: Optional[int]):
+    if resource is None:
+        return
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    soft = limit_bytes if limit_bytes else hard
+    if hard != resource.RLIM_INFINITY and soft > hard:
+        soft = hard
+    resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+
+
+def _worker_main(conn):
+    """Worker process loop: receive (fn, args, kwargs, memory limit), send back (status, payload)."""
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+        if message is None:
+            break
+        fn, args, kwargs, memory_limit = message
+        try:
+            _set_memory_limit(memory_limit)
+            result = fn(*args, **kwargs)
+            if inspect.isawaitable(result):
+                result = asyncio.run(result)
+            reply = ("ok", result)
+        except MemoryError:
+            reply = ("memory", "Parsing job exceeded its memory limit")
+        except Exception as e:
+            reply = ("error", f"{type(e).__name__}: {e}")
+        finally:
+            _set_memory_limit(None)
+        try:
+            conn.send(reply)
+        except Exception as e:
+            conn.send(("error", f"Parsing result could not be returned: {e}"))
+
+
+# ============================================================================
+# EVENT LOOP SIDE
+# ============================================================================
+
+class _ParsingWorker:
+    """One long-lived worker process and the pipe to it."""
+    
+    def __init__(self, context):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.jobs = 0
+    
+    def kill(self):
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=5)
+    
+    def close(self):
+        try:
+            self.conn.close()
+        except Exception:
+            pass
+
+
+class ParsingExecutor:
+    """
+    Process pool for parsing jobs with deadlines, memory limits, admission control and quotas.
+    """
+    
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_queue: int = 16,
+        default_timeout: float = 60.0,
+        memory_limit_mb: Optional[int] = None,
+        parser_quotas: Optional[Dict[str, int]] = None,
+        max_jobs_per_worker: int = 100,
+        mp_context: str = "spawn"
+    ):
+        """
+        Initialize Parsing Executor (worker processes start on first use).
+        
+        Args:
+            max_workers: Worker processes (jobs running at once)
+            max_queue: Jobs allowed to wait for a worker; beyond it jobs are rejected
+            default_timeout: Wall-clock seconds per job when the caller gives none
+            memory_limit_mb: Address-space limit per job (None = no limit)
+            parser_quotas: Jobs running at once per parser key (default: max_workers)
+            max_jobs_per_worker: Jobs before a worker process is replaced
+            mp_context: multiprocessing start method ("spawn" is safe with threads and event loops)
+        """
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.default_timeout = default_timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.parser_quotas = dict(parser_quotas or {})
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.context = multiprocessing.get_context(mp_context)
+        self.logger = logger
+        
+        self._idle_workers: List[_ParsingWorker] = []
+        self._busy_workers: set = set()
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._quotas: Dict[str, asyncio.Semaphore] = {}
+        self._io_threads: Optional[ThreadPoolExecutor] = None
+        self._waiting = 0
+        self._closed = False
+        self.stats = {
+            "submitted": 0, "completed": 0, "failed": 0, "rejected": 0,
+            "timed_out": 0, "memory_exceeded": 0, "workers_started": 0
+        }
+    
+    def _quota(self, parser: str) -> asyncio.Semaphore:
+        semaphore = self._quotas.get(parser)
+        if semaphore is None:
+            semaphore = self._quotas[parser] = asyncio.Semaphore(
+                min(self.parser_quotas.get(parser, self.max_workers), self.max_workers))
+        return semaphore
+    
+    def _take_worker(self) -> _ParsingWorker:
+        while self._idle_workers:
+            worker = self._idle_workers.pop()
+            if worker.process.is_alive():
+                return worker
+            worker.close()
+        self.stats["workers_started"] += 1
+        return _ParsingWorker(self.context)
+    
+    def _retire_worker(self, worker: _ParsingWorker):
+        worker.kill()
+        worker.close()
+    
+    async def submit(
+        self,
+        fn: Callable,
+        *args,
+        parser: str = "default",
+        timeout: Optional[float] = None,
+        memory_limit_mb: Optional[int] = None,
+        **kwargs
+    ) -> Any:
+        """
+        Run fn(*args, **kwargs) in a worker process.
+        
+        fn and its arguments must be picklable (module-level function). Coroutine functions
+        are run to completion inside the worker.
+        
+        Raises:
+            ParsingTimeoutError: The job ran past its deadline (its worker was killed)
+            ParsingJobError: Queue full, memory limit exceeded, worker crash or job exception
+        """
+        if self._closed or self.max_workers <= 0:
+            raise ParsingJobError("parsing_executor_closed", "Parsing executor is shut down or has no workers")
+        
+        # Bounded admission: queue beyond the running jobs, reject the rest (backpressure)
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_workers)
+            self._io_threads = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="parsing-io")
+        queue_full = self._slots.locked() or self._quota(parser).locked()
+        if queue_full and self._waiting >= self.max_queue:
+            self.stats["rejected"] += 1
+            raise ParsingJobError("parsing_queue_full", f"Parsing queue full ({self.max_queue} jobs waiting)")
+        
+        self.stats["submitted"] += 1
+        quota = self._quota(parser)
+        self._waiting += 1
+        try:
+            await quota.acquire()
+            try:
+                await self._slots.acquire()
+            except BaseException:
+                quota.release()
+                raise
+        finally:
+            self._waiting -= 1
+        
+        try:
+            return await self._run_on_worker(fn, args, kwargs, parser, timeout, memory_limit_mb)
+        finally:
+            self._slots.release()
+            quota.release()
+    
+    async def _run_on_worker(self, fn, args, kwargs, parser, timeout, memory_limit_mb) -> Any:
+        loop = asyncio.get_running_loop()
+        timeout = timeout or self.default_timeout
+        memory_limit_mb = memory_limit_mb or self.memory_limit_mb
+        memory_limit = memory_limit_mb * 1024 * 1024 if memory_limit_mb else None
+        
+        worker = self._take_worker()
+        self._busy_workers.add(worker)
+        reuse = False
+        started = time.monotonic()
+        try:
+            # Pipe I/O runs on helper threads: large payloads never block the loop
+            await loop.run_in_executor(self._io_threads, worker.conn.send, (fn, args, kwargs, memory_limit))
+            pending = self._io_threads.submit(worker.conn.recv)
+            try:
+                status, payload = await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(pending)), timeout=timeout)
+            except asyncio.TimeoutError:
+                self.stats["timed_out"] += 1
+                self.logger.error(f"❌ Parsing job ({parser}) exceeded {timeout}s, killing worker {worker.process.pid}")
+                worker.kill()
+                try:
+                    await asyncio.wrap_future(pending)
+                except Exception:
+                    pass
+                raise ParsingTimeoutError(f"Parsing job ({parser}) timed out after {timeout} seconds")
+            except (EOFError, OSError) as e:
+                self.stats["failed"] += 1
+                raise ParsingJobError("parsing_worker_crashed",
+                                      f"Parsing worker exited unexpectedly (exit code {worker.process.exitcode}): {e}")
+            
+            if status == "ok":
+                self.stats["completed"] += 1
+                worker.jobs += 1
+                reuse = worker.jobs < self.max_jobs_per_worker
+                self.logger.debug(f"✅ Parsing job ({parser}) finished in {time.monotonic() - started:.2f}s")
+                return payload
+            if status == "memory":
+                self.stats["memory_exceeded"] += 1
+                raise ParsingJobError("memory_limit_exceeded", f"{payload} ({memory_limit_mb} MB)")
+            self.stats["failed"] += 1
+            reuse = True
+            raise ParsingJobError("parsing_job_failed", payload)
+        finally:
+            self._busy_workers.discard(worker)
+            if reuse and not self._closed:
+                self._idle_workers.append(worker)
+            else:
+                self._retire_worker(worker)
+    
+    async def parse_file(self, abstraction_name: str, file_parser: Any, request: Any,
+                         timeout: Optional[float] = None) -> Any:
+        """
+        Parse a FileParsingRequest with the given abstraction.
+        
+        Abstractions that can be rebuilt in a worker run in the process pool; others fall back to
+        the in-loop parse with asyncio.wait_for.
+        """
+        timeout = timeout or self.default_timeout
+        if self.max_workers > 0 and abstraction_name in PROCESS_PARSER_FACTORIES:
+            return await self.submit(run_parse_job, abstraction_name, request, parser=abstraction_name, timeout=timeout)
+        return await asyncio.wait_for(file_parser.parse_file(request), timeout=timeout)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Executor counters and current load."""
+        return {
+            **self.stats,
+            "running": len(self._busy_workers),
+            "waiting": self._waiting,
+            "idle_workers": len(self._idle_workers),
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue
+        }
+    
+    async def shutdown(self):
+        """Stop all worker processes (running jobs are killed)."""
+        self._closed = True
+        for worker in self._idle_workers:
+            try:
+                worker.conn.send(None)
+                worker.process.join(timeout=1)
+            except Exception:
+                pass
+            self._retire_worker(worker)
+        self._idle_workers = []
+        for worker in list(self._busy_workers):
+            worker.kill()
+        if self._io_threads:
+            self._io_threads.shutdown(wait=False)
+        self.logger.info("✅ Parsing executor shut down")
@@ -3,10 +3,13 @@
 Parsing Orchestrator Module - File Parser Service
 
 Routes parsing requests to appropriate parsing module based on parsing type.
+Owns the parsing executor (worker process pool) that the parsing modules run parsers on.
 """
 
 from typing import Dict, Any, Optional
 
+from .parsing_executor import ParsingExecutor
+
 
 class ParsingOrchestrator:
     """Routes parsing requests to appropriate parsing module."""
@@ -15,6 +18,9 @@ class ParsingOrchestrator:
         """Initialize with service instance."""
         self.service = service_instance
         
+        # Parsing executor (worker processes start on first job; limits set by configure_parsing_executor)
+        self.parsing_executor = ParsingExecutor(parser_quotas={"mainframe_processing": 1})
+        
         # Lazy initialization of parsing modules
         self._structured_parsing = None
         self._unstructured_parsing = None
@@ -22,6 +28,32 @@ class ParsingOrchestrator:
         self._workflow_parsing = None
         self._sop_parsing = None
     
+    def get_parsing_executor(self) -> ParsingExecutor:
+        """Get the parsing executor shared by all parsing modules."""
+        return self.parsing_executor
+    
+    def configure_parsing_executor(self, config_adapter: Any):
+        """
+        Rebuild the parsing executor from configuration (call before the first parse).
+        
+        Keys: PARSING_MAX_WORKERS, PARSING_MAX_QUEUE, PARSING_DEFAULT_TIMEOUT, PARSING_JOB_MEMORY_LIMIT_MB,
+        PARSING_MAINFRAME_CONCURRENCY, PARSING_MAX_JOBS_PER_WORKER
+        """
+        memory_limit_mb = config_adapter.get_int("PARSING_JOB_MEMORY_LIMIT_MB", 0)
+        self.parsing_executor = ParsingExecutor(
+            max_workers=config_adapter.get_int("PARSING_MAX_WORKERS", 2),
+            max_queue=config_adapter.get_int("PARSING_MAX_QUEUE", 16),
+            default_timeout=config_adapter.get_float("PARSING_DEFAULT_TIMEOUT", 60.0),
+            memory_limit_mb=memory_limit_mb or None,
+            parser_quotas={"mainframe_processing": config_adapter.get_int("PARSING_MAINFRAME_CONCURRENCY", 1)},
+            max_jobs_per_worker=config_adapter.get_int("PARSING_MAX_JOBS_PER_WORKER", 100)
+        )
+        return self.parsing_executor
+    
+    async def shutdown(self):
+        """Stop the parsing executor's worker processes."""
+        await self.parsing_executor.shutdown()
+    
     async def _get_structured_parsing(self):
         """Lazy initialization of structured parsing module."""
         if self._structured_parsing is None:
@@ -11,6 +11,8 @@ import re
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
+from .parsing_executor import ParsingJobError
+
 
 class SOPParsing:
     """Handles SOP document parsing with structure extraction."""
@@ -139,9 +141,10 @@ class SOPParsing:
             
             # Step 4: Parse file via abstraction (with timeout)
             try:
-                result = await asyncio.wait_for(
-                    file_parser.parse_file(request),
-                    timeout=60.0  # 60 second timeout for file parsing
+                parsing_executor = self.service.parsing_orchestrator_module.get_parsing_executor()
+                result = await parsing_executor.parse_file(
+                    abstraction_name, file_parser, request,
+                    timeout=60.0  # 60 second timeout for file parsing (enforced in the worker pool)
                 )
             except asyncio.TimeoutError:
                 error_msg = f"SOP file parsing timed out after 60 seconds for {file_type} file"
@@ -163,6 +166,27 @@ class SOPParsing:
                     "error": "file_parsing_timeout",
                     "parsing_type": "sop"
                 }
+            except ParsingJobError as e:
+                # Rejected by admission control, over its memory limit, or the worker failed
+                error_msg = f"SOP file parsing failed in parsing executor: {e}"
+                self.service.logger.error(f"❌ {error_msg}")
+                await self.service.handle_error_with_audit(RuntimeError(error_msg), "sop_parse")
+                await self.service.record_health_metric("sop_files_parsed", 0.0, {
+                    "file_type": file_type,
+                    "success": False,
+                    "error": e.code
+                })
+                await self.service.log_operation_with_telemetry("sop_parse_complete", success=False, details={
+                    "file_type": file_type,
+                    "error": error_msg
+                })
+                return {
+                    "success": False,
+                    "message": error_msg,
+                    "file_type": file_type,
+                    "error": e.code,
+                    "parsing_type": "sop"
+                }
             
             if not result.success:
                 error_msg = result.error or "Unknown error during SOP file parsing"
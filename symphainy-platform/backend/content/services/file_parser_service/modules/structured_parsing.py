@@ -10,6 +10,8 @@ import asyncio
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+from .parsing_executor import ParsingJobError
+
 
 class StructuredParsing:
     """Handles structured data parsing."""
@@ -144,12 +146,11 @@ class StructuredParsing:
             # 4. Parse file via abstraction (with timeout)
             # For binary files with many fields (OCCURS expansion), parsing can take longer
             # Increased timeout to 300 seconds (5 minutes) to handle large copybooks
+            # Runs in the parsing executor's worker processes, so the deadline is enforced
             timeout_seconds = 300.0 if file_type in ["bin", "binary"] else 60.0
             try:
-                result = await asyncio.wait_for(
-                    file_parser.parse_file(request),
-                    timeout=timeout_seconds
-                )
+                parsing_executor = self.service.parsing_orchestrator_module.get_parsing_executor()
+                result = await parsing_executor.parse_file(abstraction_name, file_parser, request, timeout=timeout_seconds)
             except asyncio.TimeoutError:
                 error_msg = f"Structured file parsing timed out after {timeout_seconds} seconds for {file_type} file"
                 self.service.logger.error(f"❌ {error_msg}")
@@ -170,6 +171,27 @@ class StructuredParsing:
                     "error": "file_parsing_timeout",
                     "parsing_type": "structured"
                 }
+            except ParsingJobError as e:
+                # Rejected by admission control, over its memory limit, or the worker failed
+                error_msg = f"Structured file parsing failed in parsing executor: {e}"
+                self.service.logger.error(f"❌ {error_msg}")
+                await self.service.handle_error_with_audit(RuntimeError(error_msg), "structured_parse")
+                await self.service.record_health_metric("structured_files_parsed", 0.0, {
+                    "file_type": file_type,
+                    "success": False,
+                    "error": e.code
+                })
+                await self.service.log_operation_with_telemetry("structured_parse_complete", success=False, details={
+                    "file_type": file_type,
+                    "error": error_msg
+                })
+                return {
+                    "success": False,
+                    "message": error_msg,
+                    "file_type": file_type,
+                    "error": e.code,
+                    "parsing_type": "structured"
+                }
             
             if not result.success:
                 error_msg = result.error or "Unknown error during structured file parsing"
@@ -10,6 +10,8 @@ import asyncio
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
+from .parsing_executor import ParsingJobError
+
 
 class UnstructuredParsing:
     """Handles unstructured data parsing."""
@@ -131,9 +133,10 @@ class UnstructuredParsing:
             
             # 4. Parse file via abstraction (with timeout)
             try:
-                result = await asyncio.wait_for(
-                    file_parser.parse_file(request),
-                    timeout=60.0  # 60 second timeout for file parsing
+                parsing_executor = self.service.parsing_orchestrator_module.get_parsing_executor()
+                result = await parsing_executor.parse_file(
+                    abstraction_name, file_parser, request,
+                    timeout=60.0  # 60 second timeout for file parsing (enforced in the worker pool)
                 )
             except asyncio.TimeoutError:
                 error_msg = f"Unstructured file parsing timed out after 60 seconds for {file_type} file"
@@ -155,6 +158,27 @@ class UnstructuredParsing:
                     "error": "file_parsing_timeout",
                     "parsing_type": "unstructured"
                 }
+            except ParsingJobError as e:
+                # Rejected by admission control, over its memory limit, or the worker failed
+                error_msg = f"Unstructured file parsing failed in parsing executor: {e}"
+                self.service.logger.error(f"❌ {error_msg}")
+                await self.service.handle_error_with_audit(RuntimeError(error_msg), "unstructured_parse")
+                await self.service.record_health_metric("unstructured_files_parsed", 0.0, {
+                    "file_type": file_type,
+                    "success": False,
+                    "error": e.code
+                })
+                await self.service.log_operation_with_telemetry("unstructured_parse_complete", success=False, details={
+                    "file_type": file_type,
+                    "error": error_msg
+                })
+                return {
+                    "success": False,
+                    "message": error_msg,
+                    "file_type": file_type,
+                    "error": e.code,
+                    "parsing_type": "unstructured"
+                }
             
             if not result.success:
                 error_msg = result.error or "Unknown error during unstructured file parsing"
@@ -1906,52 +1906,41 @@ class ContentJourneyOrchestrator(OrchestratorBase):
         try:
             self.logger.info(f"👁️ Previewing parsed file: {parsed_file_id} (max_rows={max_rows}, max_columns={max_columns})")
             
-            # Retrieve parquet file from Data Steward
-            parsed_file = await self._realm_service.retrieve_document(parsed_file_id)
-            
-            if not parsed_file:
+            if not PANDAS_AVAILABLE:
                 return {
                     "success": False,
-                    "error": "Parsed file not found",
+                    "error": "pandas not available - cannot read parquet file",
                     "parsed_file_id": parsed_file_id
                 }
             
-            # Extract parquet data
-            parquet_data = parsed_file.get("file_content") or parsed_file.get("data") or parsed_file.get("content")
-            
-            if not parquet_data:
+            data_steward = await self.get_data_steward_api()
+            if not data_steward:
                 return {
                     "success": False,
-                    "error": "Parsed file has no data",
+                    "error": "Data Steward not available",
                     "parsed_file_id": parsed_file_id
                 }
             
-            # Load parquet into pandas DataFrame
-            if not PANDAS_AVAILABLE:
+            # Ranged read: only the footer and the leading row groups/columns leave storage
+            parsed_parquet = await data_steward.read_parsed_parquet(
+                parsed_file_id, max_rows=max_rows, max_columns=max_columns
+            )
+            
+            if not parsed_parquet:
                 return {
                     "success": False,
-                    "error": "pandas not available - cannot read parquet file",
+                    "error": "Parsed file not found",
                     "parsed_file_id": parsed_file_id
                 }
             
-            # Convert to bytes if needed
-            if isinstance(parquet_data, str):
-                parquet_data = parquet_data.encode('utf-8')
-            elif not isinstance(parquet_data, bytes):
-                parquet_data = bytes(parquet_data) if parquet_data else b""
-            
-            # Read parquet from bytes
-            df = pd.read_parquet(io.BytesIO(parquet_data))
-            
-            # Extract preview (first max_rows rows, first max_columns columns)
-            preview_df = df.iloc[:max_rows, :max_columns]
+            preview_df = parsed_parquet["table"].to_pandas()
             
             # Convert to JSON-serializable format
             preview_data = {
                 "columns": list(preview_df.columns),
                 "rows": preview_df.fillna("").astype(str).values.tolist(),
-                "total_rows": len(df),
-                "total_columns": len(df.columns),
+                "total_rows": parsed_parquet["total_rows"],
+                "total_columns": parsed_parquet["total_columns"],
                 "preview_rows": len(preview_df),
                 "preview_columns": len(preview_df.columns)
             }
@@ -28,6 +28,7 @@ sys.path.insert(0, os.path.abspath('../../../../../../../'))
 
 from bases.orchestrator_base import OrchestratorBase
 from utilities.security_authorization.request_context import get_request_user_context
+from foundations.public_works_foundation.infrastructure_adapters.upload_stream import UploadTooLargeError
 
 # JSONL conversion uses standard library json (no external dependencies needed)
 # For analytics, pandas can read JSONL: pd.read_json('file.jsonl', lines=True) or pd.DataFrame(list_of_dicts)
@@ -939,6 +940,8 @@ class ContentJourneyOrchestrator(OrchestratorBase):
                 error_msg = upload_result.get("error") or upload_result.get("message") or "Unknown error"
                 raise Exception(f"Content Steward upload failed: {error_msg}")
             
+        except UploadTooLargeError:
+            raise
         except Exception as e:
             self.logger.error(f"❌ File upload failed: {e}", exc_info=True)
             return {
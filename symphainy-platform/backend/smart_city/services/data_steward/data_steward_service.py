@@ -17,7 +17,7 @@ Phase 0.1: Consolidated from Content Steward and Data Steward to eliminate gap
 between file lifecycle and data governance.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable, Awaitable
 from datetime import datetime
 
 # Import base and protocol
@@ -111,6 +111,9 @@ class DataStewardService(SmartCityRoleBase, DataStewardServiceProtocol):
             # Initialize infrastructure connections
             await self.initialization_module.initialize_infrastructure_connections()
             
+            # Import WAL entries stored in State Management by earlier releases (one-time)
+            await self.write_ahead_logging_module.migrate_legacy_entries()
+            
             # Initialize SOA API exposure
             await self.soa_mcp_module.initialize_soa_api_exposure()
             
@@ -257,10 +260,23 @@ class DataStewardService(SmartCityRoleBase, DataStewardServiceProtocol):
     async def get_parsed_file(
         self,
         parsed_file_id: str,
-        user_context: Optional[Dict[str, Any]] = None
+        user_context: Optional[Dict[str, Any]] = None,
+        include_data: bool = True
     ) -> Optional[Dict[str, Any]]:
         """Get parsed file data and metadata."""
-        return await self.parsed_file_processing_module.get_parsed_file(parsed_file_id, user_context)
+        return await self.parsed_file_processing_module.get_parsed_file(parsed_file_id, user_context, include_data)
+    
+    async def read_parsed_parquet(
+        self,
+        parsed_file_id: str,
+        max_rows: Optional[int] = None,
+        max_columns: Optional[int] = None,
+        user_context: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Read a parsed Parquet file (leading rows/columns only) through ranged reads."""
+        return await self.parsed_file_processing_module.read_parsed_parquet(
+            parsed_file_id, max_rows, max_columns, user_context
+        )
     
     async def list_parsed_files(
         self,
@@ -386,7 +402,8 @@ class DataStewardService(SmartCityRoleBase, DataStewardServiceProtocol):
         from_timestamp: datetime,
         to_timestamp: datetime,
         filters: Optional[Dict[str, Any]] = None,
-        user_context: Optional[Dict[str, Any]] = None
+        user_context: Optional[Dict[str, Any]] = None,
+        on_page: Optional[Callable[[List[Dict[str, Any]]], Awaitable[None]]] = None
     ) -> List[Dict[str, Any]]:
         """
         Replay operations from WAL for recovery, debugging, or audit.
@@ -394,7 +411,7 @@ class DataStewardService(SmartCityRoleBase, DataStewardServiceProtocol):
         Governance capability - enables audit and recovery.
         """
         return await self.write_ahead_logging_module.replay_log(
-            namespace, from_timestamp, to_timestamp, filters, user_context
+            namespace, from_timestamp, to_timestamp, filters, user_context, on_page
         )
     
     async def update_log_status(
@@ -411,7 +428,36 @@ class DataStewardService(SmartCityRoleBase, DataStewardServiceProtocol):
         return await self.write_ahead_logging_module.update_log_status(
             log_id, status, result, error, user_context
         )
-    
+
+    async def replay_log_page(
+        self,
+        namespace: Optional[str],
+        from_timestamp: datetime,
+        to_timestamp: datetime,
+        filters: Optional[Dict[str, Any]] = None,
+        cursor: Optional[str] = None,
+        page_size: Optional[int] = None,
+        user_context: Optional[Dict[str, Any]] = None,
+        descending: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Replay one cursor page of WAL entries (entries + next_cursor), newest first if descending.
+        """
+        return await self.write_ahead_logging_module.replay_log_page(
+            namespace, from_timestamp, to_timestamp, filters, cursor, page_size, user_context, descending
+        )
+
+    async def get_wal_counters(
+        self,
+        namespace: Optional[str] = None,
+        user_context: Optional[Dict[str, Any]] = None,
+        since: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Get pre-aggregated per-namespace WAL status counters (entries since a timestamp, if given).
+        """
+        return await self.write_ahead_logging_module.get_wal_counters(namespace, user_context, since)
+
     # ============================================================================
     # UTILITY METHODS
     # ============================================================================
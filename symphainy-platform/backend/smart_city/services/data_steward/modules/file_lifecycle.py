@@ -13,6 +13,8 @@ import uuid
 from typing import Any, Dict, Optional
 from datetime import datetime
 
+from foundations.public_works_foundation.infrastructure_adapters.upload_stream import UploadTooLargeError
+
 
 class FileLifecycle:
     """File lifecycle module for Data Steward service."""
@@ -197,6 +199,8 @@ class FileLifecycle:
                 success=False,
                 details={"content_type": content_type, "file_size": file_size, "error": str(e)}
             )
+            if isinstance(e, UploadTooLargeError):
+                raise  # Mapped to HTTP 413 by the pillar router
             raise Exception(f"File upload failed: {str(e)}")
     
     async def get_file(self, file_id: str, user_context: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
@@ -520,8 +524,8 @@ class FileLifecycle:
             "extraction_method": "automatic"
         }
         
-        # Add content-specific metadata
-        if content_type.startswith("text/"):
+        # Add content-specific metadata (streamed uploads are not read ahead of storage)
+        if content_type.startswith("text/") and isinstance(file_data, (bytes, bytearray)):
             try:
                 text_content = file_data.decode('utf-8', errors='ignore')
                 metadata["text_metadata"] = {
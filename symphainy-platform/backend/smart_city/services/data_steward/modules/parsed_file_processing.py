@@ -244,7 +244,8 @@ class ParsedFileProcessing:
     async def get_parsed_file(
         self,
         parsed_file_id: str,
-        user_context: Optional[Dict[str, Any]] = None
+        user_context: Optional[Dict[str, Any]] = None,
+        include_data: bool = True
     ) -> Optional[Dict[str, Any]]:
         """
         Get parsed file data and metadata.
@@ -252,6 +253,7 @@ class ParsedFileProcessing:
         Args:
             parsed_file_id: Parsed file ID (from parsed_data_files table)
             user_context: Optional user context for security and tenant validation
+            include_data: Download the file content (False = metadata and gcs_path only)
             
         Returns:
             Dict with parsed file data and metadata, or None if not found
@@ -339,12 +341,13 @@ class ParsedFileProcessing:
             if not gcs_adapter:
                 raise ValueError("GCS adapter not available - cannot retrieve parsed file")
             
-            file_content = await gcs_adapter.download_file(gcs_path)
+            file_content = await gcs_adapter.download_file(gcs_path) if include_data else None
             
             return {
                 "parsed_file_id": parsed_file_id,
                 "metadata": parsed_file_metadata,
                 "file_data": file_content,
+                "gcs_path": gcs_path,
                 "format_type": parsed_file_metadata.get("format_type"),
                 "content_type": parsed_file_metadata.get("content_type")
             }
@@ -353,6 +356,60 @@ class ParsedFileProcessing:
             self.logger.error(f"❌ Failed to get parsed file {parsed_file_id}: {e}")
             return None
     
+    async def read_parsed_parquet(
+        self,
+        parsed_file_id: str,
+        max_rows: Optional[int] = None,
+        max_columns: Optional[int] = None,
+        user_context: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Read a parsed Parquet file through ranged reads instead of downloading it whole.
+        
+        Only the footer, the first max_columns columns and the row groups covering
+        max_rows are fetched from storage.
+        
+        Args:
+            parsed_file_id: Parsed file ID (from parsed_data_files table)
+            max_rows: Maximum rows to read (None = all)
+            max_columns: Maximum columns to read (None = all)
+            user_context: Optional user context for security and tenant validation
+            
+        Returns:
+            Dict with the pyarrow table, total row/column counts and metadata, or None if not found
+        """
+        parsed_file = await self.get_parsed_file(parsed_file_id, user_context, include_data=False)
+        if not parsed_file:
+            return None
+        
+        try:
+            file_management = self.service.file_management_abstraction
+            gcs_path = parsed_file["gcs_path"]
+            parquet_metadata = await file_management.read_parquet_metadata(gcs_path)
+            if parquet_metadata is None:
+                raise ValueError(f"Parsed file is not a valid parquet file: {gcs_path}")
+            
+            # pandas index columns are stored alongside the data; they are not data columns
+            columns = [name for name in parquet_metadata["columns"] if not name.startswith("__index_level_")]
+            selected_columns = columns[:max_columns] if max_columns is not None else None
+            table = await file_management.read_parquet(
+                gcs_path, columns=selected_columns, max_rows=max_rows, metadata=parquet_metadata
+            )
+            if table is None:
+                raise ValueError(f"Failed to read parsed parquet file: {gcs_path}")
+            
+            return {
+                **parsed_file,
+                "table": table,
+                "total_rows": parquet_metadata["num_rows"],
+                "total_columns": len(columns),
+                "bytes_fetched": parquet_metadata.get("bytes_fetched")
+            }
+            
+        except Exception as e:
+            self.logger.error(f"❌ Failed to read parsed parquet file {parsed_file_id}: {e}")
+            return None
+    
     async def list_parsed_files(
         self,
         file_id: Optional[str] = None,
@@ -6,21 +6,190 @@ Micro-module for write-ahead logging operations.
 Netflix-inspired WAL implementation as Data Steward governance capability.
 
 WHAT: Logs all critical operations BEFORE execution for durability and audit
-HOW: Provides durable, replayable log with delayed retry support
+HOW: Appends entries to a group-commit segment log (WALSegmentAdapter) and projects
+them into ArangoDB (governance metadata + lineage) asynchronously for the dashboards
 """
 
+import asyncio
 import uuid
-from typing import Any, Dict, Optional, List
+from typing import Any, Awaitable, Callable, Dict, Optional, List
 from datetime import datetime, timedelta
 
+from foundations.public_works_foundation.infrastructure_adapters.wal_segment_adapter import WALSegmentAdapter
+
 
 class WriteAheadLogging:
     """Write-Ahead Logging module for Data Steward service."""
     
-    def __init__(self, service: Any):
+    def __init__(self, service: Any, wal_engine: Optional[WALSegmentAdapter] = None):
         """Initialize with service instance."""
         self.service = service
         self.logger = self.service.di_container.get_logger(f"{self.__class__.__name__}")
+        
+        # Durable log (resolved from Public Works Foundation on first use)
+        self.wal_engine = wal_engine
+        self.replay_page_size = 500
+        self.legacy_migration_marker = "wal:migration"
+        
+        # Asynchronous ArangoDB projection (off the write path)
+        self.projection_queue_size = 10000
+        self._projection_queue: Optional[asyncio.Queue] = None
+        self._projection_task: Optional[asyncio.Task] = None
+    
+    def _get_wal_engine(self) -> WALSegmentAdapter:
+        """Get the WAL segment engine from Public Works Foundation."""
+        if self.wal_engine is None:
+            public_works = None
+            if hasattr(self.service.di_container, "get_public_works_foundation"):
+                public_works = self.service.di_container.get_public_works_foundation()
+            self.wal_engine = getattr(public_works, "wal_segment_adapter", None)
+            if self.wal_engine is None:
+                # A local fallback directory would not survive restarts; fail loudly instead
+                raise Exception("WAL segment adapter not available (configure WAL_DATA_DIR in Public Works)")
+        return self.wal_engine
+    
+    # ============================================================================
+    # LEGACY MIGRATION
+    # ============================================================================
+    
+    async def migrate_legacy_entries(self) -> Dict[str, Any]:
+        """
+        One-time import of WAL entries stored in State Management (wal:<log_id>) by
+        earlier releases, so they remain replayable and updatable from the segment log.
+        
+        Entries already in the log and entries past their TTL are skipped; a marker state
+        (wal:migration) records completion so later startups skip the scan.
+        
+        Returns:
+            Dict with success, migrated and skipped counts
+        """
+        try:
+            state_management = self.service.state_management_abstraction
+            if await state_management.retrieve_state(self.legacy_migration_marker):
+                return {"success": True, "migrated": 0, "skipped": 0, "already_migrated": True}
+            
+            migrated = 0
+            skipped = 0
+            for state in await state_management.list_states():
+                if (state.get("metadata") or {}).get("type") != "wal_entry":
+                    continue
+                if await self._import_legacy_entry(state.get("state_data") or {}):
+                    migrated += 1
+                else:
+                    skipped += 1
+            
+            await state_management.store_state(
+                state_id=self.legacy_migration_marker,
+                state_data={"migrated": migrated, "skipped": skipped, "completed_at": datetime.utcnow().isoformat()},
+                metadata={"type": "wal_migration", "backend": "arango_db", "strategy": "immediate_persist"}
+            )
+            self.logger.info(f"✅ WAL legacy migration complete: {migrated} migrated, {skipped} skipped")
+            return {"success": True, "migrated": migrated, "skipped": skipped}
+        
+        except Exception as e:
+            self.logger.error(f"❌ WAL legacy migration failed: {e}")
+            return {"success": False, "error": str(e)}
+    
+    async def _import_legacy_entry(self, wal_entry: Dict[str, Any]) -> bool:
+        """Append one legacy State Management WAL entry to the segment log (False if skipped)."""
+        log_id = wal_entry.get("log_id")
+        if not log_id or not wal_entry.get("timestamp"):
+            return False
+        wal_engine = self._get_wal_engine()
+        if await wal_engine.get_entry(log_id) is not None:
+            return False
+        
+        ttl = (wal_entry.get("lifecycle") or {}).get("ttl", 604800)
+        expires_at = datetime.fromisoformat(wal_entry["timestamp"]) + timedelta(seconds=ttl)
+        if expires_at <= datetime.utcnow():
+            return False
+        
+        await wal_engine.append_entry(wal_entry, ttl_seconds=ttl)
+        return True
+    
+    # ============================================================================
+    # ASYNCHRONOUS PROJECTION
+    # ============================================================================
+    
+    async def _enqueue_projection(self, kind: str, data: Dict[str, Any]):
+        """Queue a projection of a durable WAL record into ArangoDB (bounded; applies backpressure)."""
+        if self._projection_task is None or self._projection_task.done():
+            if self._projection_queue is None:
+                self._projection_queue = asyncio.Queue(maxsize=self.projection_queue_size)
+            self._projection_task = asyncio.create_task(self._projection_loop())
+        await self._projection_queue.put((kind, data))
+    
+    async def flush_projections(self):
+        """Wait until all queued projections have been applied."""
+        if self._projection_queue is not None:
+            await self._projection_queue.join()
+    
+    async def _projection_loop(self):
+        while True:
+            kind, data = await self._projection_queue.get()
+            try:
+                if kind == "entry":
+                    await self._project_entry(data["wal_entry"], data.get("user_context"))
+                elif kind == "status":
+                    await self.service.knowledge_governance_abstraction.update_asset_metadata(
+                        asset_id=f"wal_entry_{data['log_id']}",
+                        metadata_updates={
+                            "status": data["status"],
+                            "updated_at": data["updated_at"]
+                        }
+                    )
+            except Exception as e:
+                self.logger.warning(f"⚠️ WAL projection ({kind}) failed: {e}")
+            finally:
+                self._projection_queue.task_done()
+    
+    async def _project_entry(self, wal_entry: Dict[str, Any], user_context: Optional[Dict[str, Any]]):
+        """Project a WAL entry into governance metadata and lineage (ArangoDB)."""
+        log_id = wal_entry["log_id"]
+        namespace = wal_entry["namespace"]
+        
+        # WAL entries are projected as governance documents
+        await self.service.knowledge_governance_abstraction.create_asset_metadata(
+            asset_id=f"wal_entry_{log_id}",
+            metadata={
+                "type": "wal_entry",
+                "log_id": log_id,
+                "namespace": namespace,
+                "timestamp": wal_entry["timestamp"],
+                "target": wal_entry["target"],
+                "status": "pending",
+                "correlation_id": wal_entry["correlation_id"]
+            }
+        )
+        
+        # Automatically record lineage (WAL entry is a data asset)
+        await self.service.lineage_tracking_module.record_lineage(
+            lineage_data={
+                "asset_id": log_id,
+                "operation": wal_entry["payload"].get("operation", "wal_write"),
+                "source": namespace,
+                "target": wal_entry["target"],
+                "timestamp": wal_entry["timestamp"],
+                "metadata": {
+                    "log_id": log_id,
+                    "correlation_id": wal_entry["correlation_id"]
+                }
+            },
+            user_context=user_context
+        )
+        
+        # Record health metric (success)
+        await self.service.record_health_metric(
+            "write_to_log_success",
+            1.0,
+            {"namespace": namespace, "log_id": log_id}
+        )
+        
+        await self.service.log_operation_with_telemetry(
+            "write_to_log_complete",
+            success=True,
+            details={"log_id": log_id, "namespace": namespace}
+        )
     
     async def write_to_log(
         self,
@@ -45,13 +214,6 @@ class WriteAheadLogging:
         Returns:
             Dict with log_id, durable confirmation, and metadata
         """
-        # Start telemetry tracking
-        await self.service.log_operation_with_telemetry(
-            "write_to_log_start",
-            success=True,
-            details={"namespace": namespace, "target": target}
-        )
-        
         try:
             # Security validation (zero-trust: secure by design)
             if user_context:
@@ -127,63 +289,14 @@ class WriteAheadLogging:
                 }
             }
             
-            # Store WAL entry using Knowledge Governance Abstraction (ArangoDB)
-            # WAL entries are stored as governance documents
-            await self.service.knowledge_governance_abstraction.create_asset_metadata(
-                asset_id=f"wal_entry_{log_id}",
-                metadata={
-                    "type": "wal_entry",
-                    "log_id": log_id,
-                    "namespace": namespace,
-                    "timestamp": wal_entry["timestamp"],
-                    "target": target,
-                    "status": "pending",
-                    "correlation_id": correlation_id
-                }
-            )
-            
-            # Store full WAL entry using State Management Abstraction
-            await self.service.state_management_abstraction.store_state(
-                state_id=f"wal:{log_id}",
-                state_data=wal_entry,
-                metadata={
-                    "type": "wal_entry",
-                    "namespace": namespace,
-                    "log_id": log_id,
-                    "backend": "arango_db",
-                    "strategy": "immediate_persist"
-                }
-            )
-            
-            # Automatically record lineage (WAL entry is a data asset)
-            await self.service.lineage_tracking_module.record_lineage(
-                lineage_data={
-                    "asset_id": log_id,
-                    "operation": payload.get("operation", "wal_write"),
-                    "source": namespace,
-                    "target": target,
-                    "timestamp": wal_entry["timestamp"],
-                    "metadata": {
-                        "log_id": log_id,
-                        "correlation_id": correlation_id
-                    }
-                },
-                user_context=user_context
-            )
-            
-            # Record health metric (success)
-            await self.service.record_health_metric(
-                "write_to_log_success",
-                1.0,
-                {"namespace": namespace, "log_id": log_id}
+            # Durable append (group commit: one fsync covers all concurrent writers)
+            location = await self._get_wal_engine().append_entry(
+                wal_entry,
+                ttl_seconds=default_lifecycle["ttl"]
             )
             
-            # End telemetry tracking
-            await self.service.log_operation_with_telemetry(
-                "write_to_log_complete",
-                success=True,
-                details={"log_id": log_id, "namespace": namespace}
-            )
+            # Governance metadata, lineage and success telemetry are projected asynchronously
+            await self._enqueue_projection("entry", {"wal_entry": wal_entry, "user_context": user_context})
             
             self.logger.info(f"✅ WAL entry written: {log_id} (namespace: {namespace})")
             
@@ -193,7 +306,8 @@ class WriteAheadLogging:
                 "durable": True,
                 "timestamp": wal_entry["timestamp"],
                 "namespace": namespace,
-                "target": target
+                "target": target,
+                "offset": location["offset"]
             }
             
         except Exception as e:
@@ -229,7 +343,8 @@ class WriteAheadLogging:
         from_timestamp: datetime,
         to_timestamp: datetime,
         filters: Optional[Dict[str, Any]] = None,
-        user_context: Optional[Dict[str, Any]] = None
+        user_context: Optional[Dict[str, Any]] = None,
+        on_page: Optional[Callable[[List[Dict[str, Any]]], Awaitable[None]]] = None
     ) -> List[Dict[str, Any]]:
         """
         Replay operations from WAL for recovery, debugging, or audit.
@@ -242,9 +357,11 @@ class WriteAheadLogging:
             to_timestamp: End timestamp
             filters: Additional filters (operation, target, status, correlation_id)
             user_context: User context for security
+            on_page: Optional async callback handed each page of entries; when set,
+                entries are not accumulated, so only one page is held at a time
             
         Returns:
-            List of WAL entries matching criteria
+            List of WAL entries matching criteria (empty when on_page is set)
         """
         # Start telemetry tracking
         await self.service.log_operation_with_telemetry(
@@ -254,104 +371,24 @@ class WriteAheadLogging:
         )
         
         try:
-            # Security validation
-            if user_context:
-                security = self.service.get_security()
-                if security:
-                    if not await security.check_permissions(user_context, "data_governance", "read"):
-                        await self.service.record_health_metric(
-                            "replay_log_access_denied",
-                            1.0,
-                            {"namespace": namespace}
-                        )
-                        await self.service.log_operation_with_telemetry(
-                            "replay_log_complete",
-                            success=False
-                        )
-                        raise PermissionError(
-                            "Access denied: insufficient permissions to replay WAL"
-                        )
-            
-            # Tenant validation
-            tenant_id = None
-            if user_context:
-                tenant = self.service.get_tenant()
-                if tenant:
-                    tenant_id = user_context.get("tenant_id")
-                    if tenant_id:
-                        if not await tenant.validate_tenant_access(tenant_id):
-                            await self.service.record_health_metric(
-                                "replay_log_tenant_denied",
-                                1.0,
-                                {"namespace": namespace, "tenant_id": tenant_id}
-                            )
-                            await self.service.log_operation_with_telemetry(
-                                "replay_log_complete",
-                                success=False
-                            )
-                            raise PermissionError(f"Tenant access denied: {tenant_id}")
-            
-            if not self.service.is_infrastructure_connected:
-                raise Exception("Infrastructure not connected")
-            
-            # Query WAL entries from Knowledge Governance Abstraction
-            # Search for WAL entries in the specified namespace and time range
-            query_filters = {
-                "type": "wal_entry",
-                "namespace": namespace,
-                "timestamp": {
-                    "$gte": from_timestamp.isoformat(),
-                    "$lte": to_timestamp.isoformat()
-                }
-            }
+            tenant_id = await self._validate_read_access("replay_log", namespace, user_context)
             
-            # Add additional filters
-            if filters:
-                if "operation" in filters:
-                    query_filters["metadata.operation"] = filters["operation"]
-                if "target" in filters:
-                    query_filters["target"] = filters["target"]
-                if "status" in filters:
-                    query_filters["status"] = filters["status"]
-                if "correlation_id" in filters:
-                    query_filters["correlation_id"] = filters["correlation_id"]
-            
-            # Query WAL entries (using Knowledge Governance Abstraction search)
-            # For now, we'll retrieve from State Management Abstraction
-            # In production, this would use a proper query interface
-            
-            # Retrieve WAL entries from state storage
-            # This is a simplified implementation - in production, use proper querying
+            # Walk the cursor page by page; without on_page every page is collected into the result
             wal_entries = []
-            
-            # For MVP: Retrieve entries from state storage
-            # In production: Use proper query interface with indexes
-            try:
-                # Get all WAL entries for namespace (simplified - production would use query)
-                # This would typically use a query like:
-                # SELECT * FROM wal_entries WHERE namespace = ? AND timestamp BETWEEN ? AND ?
-                
-                # For now, we'll return a placeholder structure
-                # In production, implement proper querying via Knowledge Governance Abstraction
-                self.logger.warning(
-                    "⚠️ WAL replay query not fully implemented - using placeholder. "
-                    "Implement proper querying via Knowledge Governance Abstraction."
+            entry_count = 0
+            cursor = None
+            while True:
+                page = await self._scan_page(
+                    namespace, from_timestamp, to_timestamp, filters, tenant_id, cursor, self.replay_page_size
                 )
-                
-                # Placeholder: Return empty list for now
-                # TODO: Implement proper querying
-                wal_entries = []
-                
-            except Exception as query_error:
-                self.logger.error(f"❌ Error querying WAL entries: {query_error}")
-                raise
-            
-            # Filter by tenant if specified
-            if tenant_id:
-                wal_entries = [
-                    entry for entry in wal_entries
-                    if entry.get("metadata", {}).get("tenant_id") == tenant_id
-                ]
+                entry_count += len(page["entries"])
+                if on_page:
+                    await on_page(page["entries"])
+                else:
+                    wal_entries.extend(page["entries"])
+                cursor = page["next_cursor"]
+                if not cursor:
+                    break
             
             # Record health metric (success)
             await self.service.record_health_metric(
@@ -359,7 +396,7 @@ class WriteAheadLogging:
                 1.0,
                 {
                     "namespace": namespace,
-                    "entry_count": len(wal_entries),
+                    "entry_count": entry_count,
                     "from": from_timestamp.isoformat(),
                     "to": to_timestamp.isoformat()
                 }
@@ -371,12 +408,12 @@ class WriteAheadLogging:
                 success=True,
                 details={
                     "namespace": namespace,
-                    "entry_count": len(wal_entries)
+                    "entry_count": entry_count
                 }
             )
             
             self.logger.info(
-                f"✅ WAL replay complete: {len(wal_entries)} entries "
+                f"✅ WAL replay complete: {entry_count} entries "
                 f"(namespace: {namespace})"
             )
             
@@ -404,6 +441,185 @@ class WriteAheadLogging:
             
             return []
     
+    async def replay_log_page(
+        self,
+        namespace: Optional[str],
+        from_timestamp: datetime,
+        to_timestamp: datetime,
+        filters: Optional[Dict[str, Any]] = None,
+        cursor: Optional[str] = None,
+        page_size: Optional[int] = None,
+        user_context: Optional[Dict[str, Any]] = None,
+        descending: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Return one page of a WAL replay.
+        
+        Args:
+            namespace: Logical group to replay (None for all namespaces)
+            from_timestamp: Start timestamp
+            to_timestamp: End timestamp
+            filters: Additional filters (operation, target, status, correlation_id)
+            cursor: next_cursor from the previous page
+            page_size: Maximum entries scanned per page
+            user_context: User context for security
+            descending: Page newest first, from to_timestamp backwards
+            
+        Returns:
+            Dict with success, entries and next_cursor (None on the last page)
+        """
+        try:
+            tenant_id = await self._validate_read_access("replay_log", namespace, user_context)
+            page = await self._scan_page(
+                namespace, from_timestamp, to_timestamp, filters, tenant_id, cursor,
+                page_size or self.replay_page_size, descending
+            )
+            return {"success": True, **page}
+        except Exception as e:
+            self.logger.error(f"❌ Failed to read WAL page: {e}")
+            return {"success": False, "error": str(e), "entries": [], "next_cursor": None}
+    
+    async def get_wal_counters(
+        self,
+        namespace: Optional[str] = None,
+        user_context: Optional[Dict[str, Any]] = None,
+        since: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Get pre-aggregated per-namespace status counters (pending/completed/failed/retrying).
+        
+        Counters are maintained by the WAL engine on every write and status update in hourly
+        buckets, so the cost is independent of WAL size. Without since they cover the WAL
+        retention window.
+        
+        Args:
+            namespace: Restrict to one namespace (None returns all)
+            user_context: User context for security (scopes counters to the tenant)
+            since: Only count entries from the hour containing this timestamp on
+            
+        Returns:
+            Dict with success, counters (namespace -> status -> count) and the
+            time_range ({"from", "to"}) of the retained entries they cover
+        """
+        try:
+            tenant_id = await self._validate_read_access("wal_counters", namespace, user_context)
+            wal_engine = self._get_wal_engine()
+            await wal_engine.refresh()
+            oldest, newest = wal_engine.get_time_range(namespace)
+            if since is not None and oldest is not None:
+                # Timestamps in the WAL are naive UTC
+                oldest = max(oldest, (since - datetime(1970, 1, 1)).total_seconds())
+                if oldest > newest:
+                    oldest = newest = None
+            return {
+                "success": True,
+                "counters": wal_engine.get_counters(namespace=namespace, tenant_id=tenant_id, since=since),
+                "time_range": {
+                    "from": datetime.utcfromtimestamp(oldest).isoformat() if oldest is not None else None,
+                    "to": datetime.utcfromtimestamp(newest).isoformat() if newest is not None else None
+                }
+            }
+        except Exception as e:
+            self.logger.error(f"❌ Failed to read WAL counters: {e}")
+            return {"success": False, "error": str(e), "counters": {}}
+    
+    async def _validate_read_access(
+        self,
+        operation: str,
+        namespace: Optional[str],
+        user_context: Optional[Dict[str, Any]]
+    ) -> Optional[str]:
+        """Check read permissions and tenant access; returns the tenant to scope reads to."""
+        # Security validation
+        if user_context:
+            security = self.service.get_security()
+            if security:
+                if not await security.check_permissions(user_context, "data_governance", "read"):
+                    await self.service.record_health_metric(
+                        f"{operation}_access_denied",
+                        1.0,
+                        {"namespace": namespace}
+                    )
+                    await self.service.log_operation_with_telemetry(
+                        f"{operation}_complete",
+                        success=False
+                    )
+                    raise PermissionError(
+                        "Access denied: insufficient permissions to replay WAL"
+                    )
+        
+        # Tenant validation
+        tenant_id = None
+        if user_context:
+            tenant = self.service.get_tenant()
+            if tenant:
+                tenant_id = user_context.get("tenant_id")
+                if tenant_id:
+                    if not await tenant.validate_tenant_access(tenant_id):
+                        await self.service.record_health_metric(
+                            f"{operation}_tenant_denied",
+                            1.0,
+                            {"namespace": namespace, "tenant_id": tenant_id}
+                        )
+                        await self.service.log_operation_with_telemetry(
+                            f"{operation}_complete",
+                            success=False
+                        )
+                        raise PermissionError(f"Tenant access denied: {tenant_id}")
+        
+        if not self.service.is_infrastructure_connected:
+            raise Exception("Infrastructure not connected")
+        
+        return tenant_id
+    
+    async def _scan_page(
+        self,
+        namespace: Optional[str],
+        from_timestamp,
+        to_timestamp,
+        filters: Optional[Dict[str, Any]],
+        tenant_id: Optional[str],
+        cursor: Optional[str],
+        page_size: int,
+        descending: bool = False
+    ) -> Dict[str, Any]:
+        # Status, correlation_id and tenant are served by the engine indexes;
+        # operation and target apply to entry bodies after the page is read
+        index_filters = {}
+        if filters:
+            if "status" in filters:
+                index_filters["status"] = filters["status"]
+            if "correlation_id" in filters:
+                index_filters["correlation_id"] = filters["correlation_id"]
+        if tenant_id:
+            index_filters["tenant_id"] = tenant_id
+        
+        try:
+            page = await self._get_wal_engine().scan_page(
+                namespace,
+                from_timestamp,
+                to_timestamp,
+                filters=index_filters,
+                cursor=cursor,
+                page_size=page_size,
+                descending=descending
+            )
+        except Exception as query_error:
+            self.logger.error(f"❌ Error querying WAL entries: {query_error}")
+            raise
+        
+        wal_entries = page["entries"]
+        if filters:
+            if "operation" in filters:
+                wal_entries = [
+                    entry for entry in wal_entries
+                    if entry.get("metadata", {}).get("operation") == filters["operation"]
+                ]
+            if "target" in filters:
+                wal_entries = [entry for entry in wal_entries if entry.get("target") == filters["target"]]
+        
+        return {"entries": wal_entries, "next_cursor": page["next_cursor"]}
+    
     async def update_log_status(
         self,
         log_id: str,
@@ -427,53 +643,46 @@ class WriteAheadLogging:
         """
         try:
             # Retrieve WAL entry
-            wal_state = await self.service.state_management_abstraction.retrieve_state(
-                state_id=f"wal:{log_id}"
-            )
+            wal_engine = self._get_wal_engine()
+            wal_entry = await wal_engine.get_entry(log_id)
             
-            if not wal_state:
+            if not wal_entry:
+                # Read through to entries written to State Management before the migration ran
+                legacy_entry = await self.service.state_management_abstraction.retrieve_state(f"wal:{log_id}")
+                if legacy_entry and await self._import_legacy_entry(legacy_entry):
+                    wal_entry = await wal_engine.get_entry(log_id)
+            
+            if not wal_entry:
                 return {
                     "success": False,
                     "error": f"WAL entry not found: {log_id}"
                 }
             
-            wal_entry = wal_state.get("state_data", {})
-            
-            # Update status
-            wal_entry["status"] = status
-            wal_entry["updated_at"] = datetime.utcnow().isoformat()
+            # Status updates are appended as their own durable records
+            updates = {
+                "status": status,
+                "updated_at": datetime.utcnow().isoformat()
+            }
             
             if result:
-                wal_entry["result"] = result
+                updates["result"] = result
             if error:
-                wal_entry["error"] = error
-                wal_entry["error_timestamp"] = datetime.utcnow().isoformat()
+                updates["error"] = error
+                updates["error_timestamp"] = datetime.utcnow().isoformat()
             
             # Update retry count if retrying
             if status == "retrying":
-                wal_entry["retry_count"] = wal_entry.get("retry_count", 0) + 1
-            
-            # Store updated entry
-            await self.service.state_management_abstraction.store_state(
-                state_id=f"wal:{log_id}",
-                state_data=wal_entry,
-                metadata={
-                    "type": "wal_entry",
-                    "namespace": wal_entry.get("namespace"),
-                    "log_id": log_id,
-                    "backend": "arango_db",
-                    "strategy": "immediate_persist"
-                }
-            )
+                updates["retry_count"] = wal_entry.get("retry_count", 0) + 1
             
-            # Update metadata in Knowledge Governance
-            await self.service.knowledge_governance_abstraction.update_asset_metadata(
-                asset_id=f"wal_entry_{log_id}",
-                metadata_updates={
-                    "status": status,
-                    "updated_at": wal_entry["updated_at"]
-                }
-            )
+            await wal_engine.append_status(log_id, updates)
+            wal_entry.update(updates)
+            
+            # Update metadata in Knowledge Governance (asynchronous projection)
+            await self._enqueue_projection("status", {
+                "log_id": log_id,
+                "status": status,
+                "updated_at": wal_entry["updated_at"]
+            })
             
             return {
                 "success": True,
@@ -489,14 +698,3 @@ class WriteAheadLogging:
                 "error": str(e),
                 "log_id": log_id
             }
-
-
-
-
-
-
-
-
-
-
-
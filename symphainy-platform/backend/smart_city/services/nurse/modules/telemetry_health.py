@@ -305,9 +305,8 @@ class TelemetryHealth:
                         try:
                             # Simple ping test to check connection
                             redis_client = redis_abstraction.adapter._client
-                            # Use asyncio to run synchronous ping in executor
-                            loop = asyncio.get_event_loop()
-                            await loop.run_in_executor(None, redis_client.ping)
+                            # Adapters use the shared redis.asyncio pool; ping without blocking the loop
+                            await redis_client.ping()
                             redis_connected = True
                             redis_status = "connected"
                         except Exception:
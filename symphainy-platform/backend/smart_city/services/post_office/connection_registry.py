@@ -9,6 +9,7 @@ WHAT: I manage WebSocket connection state across gateway instances
 HOW: I use Redis for distributed connection tracking
 """
 
+import inspect
 import json
 import logging
 from datetime import datetime, timedelta
@@ -49,20 +50,23 @@ class ConnectionRegistry:
         if not self.redis_client:
             raise ValueError("Redis client not available from messaging abstraction")
         
-        # Verify redis client is async (redis.asyncio.Redis)
-        # If it's not async, we need to handle it differently
-        import inspect
-        if not inspect.iscoroutinefunction(getattr(self.redis_client, 'smembers', None)):
-            # If smembers is not async, it might be a sync client wrapped
-            # Try to get the actual async client or use a wrapper
-            self.logger.warning("⚠️ Redis client may not be async - checking methods")
-            # For now, assume it's async and let errors surface
-        
         # Default TTL for connections (1 hour, extendable via heartbeat)
         self.default_ttl = 3600  # seconds
         
         self.logger.info("✅ Connection Registry initialized (Redis-backed)")
     
+    async def _redis(self, command: str, *args, **kwargs) -> Any:
+        """
+        Run a Redis command, awaiting it when the client is async.
+        
+        redis.asyncio commands are plain methods returning awaitables, so the
+        result (not the method) decides whether to await.
+        """
+        result = getattr(self.redis_client, command)(*args, **kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+    
     async def register_connection(
         self,
         connection_id: str,
@@ -102,63 +106,33 @@ class ConnectionRegistry:
             
             # Store in Redis using direct Redis client
             # Use hset for hash structure (better for connection metadata)
-            import inspect
-            hset_method = getattr(self.redis_client, 'hset', None)
-            if hset_method and inspect.iscoroutinefunction(hset_method):
-                await self.redis_client.hset(
-                    connection_key,
-                    mapping=connection_data
-                )
-            else:
-                self.redis_client.hset(
-                    connection_key,
-                    mapping=connection_data
-                )
-            
-            expire_method = getattr(self.redis_client, 'expire', None)
-            if expire_method and inspect.iscoroutinefunction(expire_method):
-                await self.redis_client.expire(connection_key, self.default_ttl)
-            else:
-                self.redis_client.expire(connection_key, self.default_ttl)
+            await self._redis(
+                "hset",
+                connection_key,
+                mapping=connection_data
+            )
+            
+            await self._redis("expire", connection_key, self.default_ttl)
             
             # Add to channel index
             channel_key = f"websocket:channel:{channel}:connections"
-            sadd_method = getattr(self.redis_client, 'sadd', None)
-            if sadd_method and inspect.iscoroutinefunction(sadd_method):
-                await self.redis_client.sadd(channel_key, connection_id)
-            else:
-                self.redis_client.sadd(channel_key, connection_id)
+            await self._redis("sadd", channel_key, connection_id)
             
-            if expire_method and inspect.iscoroutinefunction(expire_method):
-                await self.redis_client.expire(channel_key, self.default_ttl)
-            else:
-                self.redis_client.expire(channel_key, self.default_ttl)
+            await self._redis("expire", channel_key, self.default_ttl)
             
             # Add to user index (for session management)
             user_id = metadata.get("user_id")
             if user_id:
                 user_key = f"websocket:user:{user_id}:connections"
-                if sadd_method and inspect.iscoroutinefunction(sadd_method):
-                    await self.redis_client.sadd(user_key, connection_id)
-                else:
-                    self.redis_client.sadd(user_key, connection_id)
+                await self._redis("sadd", user_key, connection_id)
                 
-                if expire_method and inspect.iscoroutinefunction(expire_method):
-                    await self.redis_client.expire(user_key, self.default_ttl)
-                else:
-                    self.redis_client.expire(user_key, self.default_ttl)
+                await self._redis("expire", user_key, self.default_ttl)
             
             # Add to gateway instance index
             gateway_key = f"websocket:gateway:{gateway_instance_id}:connections"
-            if sadd_method and inspect.iscoroutinefunction(sadd_method):
-                await self.redis_client.sadd(gateway_key, connection_id)
-            else:
-                self.redis_client.sadd(gateway_key, connection_id)
+            await self._redis("sadd", gateway_key, connection_id)
             
-            if expire_method and inspect.iscoroutinefunction(expire_method):
-                await self.redis_client.expire(gateway_key, self.default_ttl)
-            else:
-                self.redis_client.expire(gateway_key, self.default_ttl)
+            await self._redis("expire", gateway_key, self.default_ttl)
             
             # Verify registration was successful
             verify_conn = await self.get_connection(connection_id)
@@ -188,14 +162,7 @@ class ConnectionRegistry:
         try:
             connection_key = f"websocket:connection:{connection_id}"
             
-            # Check if redis_client is async
-            import inspect
-            hgetall_method = getattr(self.redis_client, 'hgetall', None)
-            if hgetall_method and inspect.iscoroutinefunction(hgetall_method):
-                data = await self.redis_client.hgetall(connection_key)
-            else:
-                # Fallback: try calling directly (might be sync)
-                data = self.redis_client.hgetall(connection_key)
+            data = await self._redis("hgetall", connection_key)
             
             # Convert bytes to strings if needed (redis-py returns bytes)
             if data:
@@ -241,7 +208,7 @@ class ConnectionRegistry:
             channel = conn.get("channel")
             if channel:
                 channel_key = f"websocket:channel:{channel}:connections"
-                await self.redis_client.srem(channel_key, connection_id)
+                await self._redis("srem", channel_key, connection_id)
             
             # Remove from user index
             metadata = conn.get("metadata", {})
@@ -254,22 +221,17 @@ class ConnectionRegistry:
             user_id = metadata.get("user_id")
             if user_id:
                 user_key = f"websocket:user:{user_id}:connections"
-                await self.redis_client.srem(user_key, connection_id)
+                await self._redis("srem", user_key, connection_id)
             
             # Remove from gateway instance index
             gateway_instance_id = conn.get("gateway_instance_id")
             if gateway_instance_id:
                 gateway_key = f"websocket:gateway:{gateway_instance_id}:connections"
-                await self.redis_client.srem(gateway_key, connection_id)
+                await self._redis("srem", gateway_key, connection_id)
             
             # Delete connection record
             connection_key = f"websocket:connection:{connection_id}"
-            import inspect
-            delete_method = getattr(self.redis_client, 'delete', None)
-            if delete_method and inspect.iscoroutinefunction(delete_method):
-                await self.redis_client.delete(connection_key)
-            else:
-                self.redis_client.delete(connection_key)
+            await self._redis("delete", connection_key)
             
             self.logger.debug(f"✅ Connection unregistered from Redis: {connection_id}")
             return True
@@ -283,27 +245,15 @@ class ConnectionRegistry:
         try:
             connection_key = f"websocket:connection:{connection_id}"
             
-            import inspect
-            hset_method = getattr(self.redis_client, 'hset', None)
-            if hset_method and inspect.iscoroutinefunction(hset_method):
-                await self.redis_client.hset(
-                    connection_key,
-                    "last_activity",
-                    datetime.utcnow().isoformat()
-                )
-            else:
-                self.redis_client.hset(
-                    connection_key,
-                    "last_activity",
-                    datetime.utcnow().isoformat()
-                )
+            await self._redis(
+                "hset",
+                connection_key,
+                "last_activity",
+                datetime.utcnow().isoformat()
+            )
             
             # Extend TTL
-            expire_method = getattr(self.redis_client, 'expire', None)
-            if expire_method and inspect.iscoroutinefunction(expire_method):
-                await self.redis_client.expire(connection_key, self.default_ttl)
-            else:
-                self.redis_client.expire(connection_key, self.default_ttl)
+            await self._redis("expire", connection_key, self.default_ttl)
             return True
             
         except Exception as e:
@@ -315,47 +265,76 @@ class ConnectionRegistry:
         try:
             connection_key = f"websocket:connection:{connection_id}"
             
-            import inspect
-            hset_method = getattr(self.redis_client, 'hset', None)
-            if hset_method and inspect.iscoroutinefunction(hset_method):
-                await self.redis_client.hset(
-                    connection_key,
-                    "last_heartbeat",
-                    datetime.utcnow().isoformat()
-                )
-            else:
-                self.redis_client.hset(
-                    connection_key,
-                    "last_heartbeat",
-                    datetime.utcnow().isoformat()
-                )
+            await self._redis(
+                "hset",
+                connection_key,
+                "last_heartbeat",
+                datetime.utcnow().isoformat()
+            )
             
             # Extend TTL
-            expire_method = getattr(self.redis_client, 'expire', None)
-            if expire_method and inspect.iscoroutinefunction(expire_method):
-                await self.redis_client.expire(connection_key, self.default_ttl)
-            else:
-                self.redis_client.expire(connection_key, self.default_ttl)
+            await self._redis("expire", connection_key, self.default_ttl)
             return True
             
         except Exception as e:
             self.logger.error(f"❌ Failed to update heartbeat for {connection_id}: {e}")
             return False
     
+    async def refresh_connections(self, heartbeat_ids: List[str], active_ids: Optional[List[str]] = None) -> List[str]:
+        """
+        Batch heartbeat/activity update for many connections.
+        
+        One pipeline extends the TTLs (which also tells which connections still exist),
+        a second writes last_heartbeat / last_activity for the ones that do.
+        
+        Args:
+            heartbeat_ids: Connections whose heartbeat succeeded
+            active_ids: Connections that sent messages since the last refresh
+            
+        Returns:
+            Connection IDs that are no longer registered
+        """
+        heartbeat_set, active_set = set(heartbeat_ids), set(active_ids or [])
+        connection_ids = list(heartbeat_set | active_set)
+        if not connection_ids:
+            return []
+        
+        try:
+            now = datetime.utcnow().isoformat()
+            keys = [f"websocket:connection:{connection_id}" for connection_id in connection_ids]
+            
+            pipeline = self.redis_client.pipeline(transaction=False)
+            for key in keys:
+                pipeline.expire(key, self.default_ttl)
+            exists = await pipeline.execute()
+            
+            pipeline = self.redis_client.pipeline(transaction=False)
+            missing = []
+            for connection_id, key, found in zip(connection_ids, keys, exists):
+                if not found:
+                    missing.append(connection_id)
+                    continue
+                mapping = {}
+                if connection_id in heartbeat_set:
+                    mapping["last_heartbeat"] = now
+                if connection_id in active_set:
+                    mapping["last_activity"] = now
+                pipeline.hset(key, mapping=mapping)
+            if len(missing) < len(connection_ids):
+                await pipeline.execute()
+            
+            return missing
+            
+        except Exception as e:
+            self.logger.error(f"❌ Failed to refresh {len(connection_ids)} connections: {e}")
+            return []
+    
     async def get_connections_by_channel(self, channel: str) -> List[str]:
         """Get all connection IDs for a channel."""
         try:
             channel_key = f"websocket:channel:{channel}:connections"
             
-            # Check if redis_client is async (redis.asyncio.Redis)
-            # If smembers is a coroutine, await it; otherwise call it directly
-            import inspect
-            smembers_method = getattr(self.redis_client, 'smembers', None)
-            if smembers_method and inspect.iscoroutinefunction(smembers_method):
-                connections = await self.redis_client.smembers(channel_key)
-            else:
-                # Fallback: try calling directly (might be sync)
-                connections = self.redis_client.smembers(channel_key)
+            connections = await self._redis("smembers", channel_key)
             
             if connections:
                 # Convert bytes to strings if needed, and convert set to list
@@ -375,13 +354,7 @@ class ConnectionRegistry:
         try:
             user_key = f"websocket:user:{user_id}:connections"
             
-            # Check if redis_client is async
-            import inspect
-            smembers_method = getattr(self.redis_client, 'smembers', None)
-            if smembers_method and inspect.iscoroutinefunction(smembers_method):
-                connections = await self.redis_client.smembers(user_key)
-            else:
-                connections = self.redis_client.smembers(user_key)
+            connections = await self._redis("smembers", user_key)
             
             if connections:
                 # Convert bytes to strings if needed, and convert set to list
@@ -399,13 +372,7 @@ class ConnectionRegistry:
         try:
             gateway_key = f"websocket:gateway:{gateway_instance_id}:connections"
             
-            # Check if redis_client is async
-            import inspect
-            smembers_method = getattr(self.redis_client, 'smembers', None)
-            if smembers_method and inspect.iscoroutinefunction(smembers_method):
-                connections = await self.redis_client.smembers(gateway_key)
-            else:
-                connections = self.redis_client.smembers(gateway_key)
+            connections = await self._redis("smembers", gateway_key)
             
             if connections:
                 # Convert bytes to strings if needed, and convert set to list
@@ -425,45 +392,24 @@ class ConnectionRegistry:
             
             self.logger.debug(f"📝 Adding channel subscription: connection_id={connection_id}, channel={channel}, channel_key={channel_key}")
             
-            # Check if redis_client is async
-            import inspect
-            sadd_method = getattr(self.redis_client, 'sadd', None)
-            if sadd_method and inspect.iscoroutinefunction(sadd_method):
-                result = await self.redis_client.sadd(channel_key, connection_id)
-            else:
-                result = self.redis_client.sadd(channel_key, connection_id)
+            result = await self._redis("sadd", channel_key, connection_id)
             
             self.logger.debug(f"✅ SADD result for {channel_key}: {result} (1=added, 0=already exists)")
             
             # Set TTL on channel key
-            expire_method = getattr(self.redis_client, 'expire', None)
-            if expire_method and inspect.iscoroutinefunction(expire_method):
-                await self.redis_client.expire(channel_key, self.default_ttl)
-            else:
-                self.redis_client.expire(channel_key, self.default_ttl)
+            await self._redis("expire", channel_key, self.default_ttl)
             
             # Update connection's channel in connection record
             connection_key = f"websocket:connection:{connection_id}"
-            hset_method = getattr(self.redis_client, 'hset', None)
-            if hset_method and inspect.iscoroutinefunction(hset_method):
-                await self.redis_client.hset(
-                    connection_key,
-                    "channel",
-                    channel
-                )
-            else:
-                self.redis_client.hset(
-                    connection_key,
-                    "channel",
-                    channel
-                )
+            await self._redis(
+                "hset",
+                connection_key,
+                "channel",
+                channel
+            )
             
             # Verify subscription was added
-            smembers_method = getattr(self.redis_client, 'smembers', None)
-            if smembers_method and inspect.iscoroutinefunction(smembers_method):
-                verify_connections = await self.redis_client.smembers(channel_key)
-            else:
-                verify_connections = self.redis_client.smembers(channel_key)
+            verify_connections = await self._redis("smembers", channel_key)
             
             if verify_connections:
                 if isinstance(verify_connections, set):
@@ -490,12 +436,7 @@ class ConnectionRegistry:
         try:
             channel_key = f"websocket:channel:{channel}:connections"
             
-            import inspect
-            srem_method = getattr(self.redis_client, 'srem', None)
-            if srem_method and inspect.iscoroutinefunction(srem_method):
-                await self.redis_client.srem(channel_key, connection_id)
-            else:
-                self.redis_client.srem(channel_key, connection_id)
+            await self._redis("srem", channel_key, connection_id)
             return True
             
         except Exception as e:
@@ -513,31 +454,19 @@ class ConnectionRegistry:
             
             # Count total connections (scan for all connection keys)
             # Note: This is expensive, use sparingly. In production, maintain counters.
-            import inspect
             pattern = "websocket:connection:*"
-            keys_method = getattr(self.redis_client, 'keys', None)
-            if keys_method and inspect.iscoroutinefunction(keys_method):
-                keys = await self.redis_client.keys(pattern)
-            else:
-                keys = self.redis_client.keys(pattern)
+            keys = await self._redis("keys", pattern)
             stats["total"] = len(keys) if keys else 0
             
             # Count by channel
             channel_pattern = "websocket:channel:*:connections"
-            if keys_method and inspect.iscoroutinefunction(keys_method):
-                channel_keys = await self.redis_client.keys(channel_pattern)
-            else:
-                channel_keys = self.redis_client.keys(channel_pattern)
+            channel_keys = await self._redis("keys", channel_pattern)
             
-            scard_method = getattr(self.redis_client, 'scard', None)
             for channel_key in (channel_keys or []):
                 # Convert bytes to string if needed
                 channel_key_str = channel_key.decode('utf-8') if isinstance(channel_key, bytes) else channel_key
                 channel_name = channel_key_str.split(":")[2]  # Extract channel name
-                if scard_method and inspect.iscoroutinefunction(scard_method):
-                    count = await self.redis_client.scard(channel_key_str)
-                else:
-                    count = self.redis_client.scard(channel_key_str)
+                count = await self._redis("scard", channel_key_str)
                 stats["by_channel"][channel_name] = count
             
             return stats
@@ -5,6 +5,15 @@ Fan-Out Manager - Redis Message Distribution
 Manages message fan-out to multiple WebSocket connections via Redis Pub/Sub.
 Handles cross-instance message routing for horizontal scaling.
 
+Local delivery uses an in-process channel -> connection index (no Redis lookup per message),
+passes each message to recipients as one pre-serialized frame, and gives every connection
+its own bounded send queue drained by its own task, so a slow client cannot delay the others.
+
+Client messages go to the inbound topic websocket:<channel> (read by agents); gateways fan out
+only the outbound topic websocket:out:<channel>, so one client's messages never reach the
+other clients on the channel. Outbound frames addressed to a target_connection_id go to that
+connection only.
+
 WHAT: I distribute messages to all WebSocket connections subscribed to channels
 HOW: I use Redis Pub/Sub for efficient fan-out across gateway instances
 """
@@ -12,11 +21,125 @@ HOW: I use Redis Pub/Sub for efficient fan-out across gateway instances
 import json
 import logging
 import asyncio
-from typing import Dict, Any, Set, Optional
+from typing import Dict, Any, Set, Optional, Callable
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+OUTBOUND_TOPIC_PREFIX = "websocket:out:"
+
+
+def inbound_topic(channel: str) -> str:
+    """Redis topic carrying client messages to agents."""
+    return f"websocket:{channel}"
+
+
+def outbound_topic(channel: str) -> str:
+    """Redis topic carrying agent messages to the channel's WebSocket clients."""
+    return f"{OUTBOUND_TOPIC_PREFIX}{channel}"
+
+
+class ConnectionSendQueue:
+    """
+    Bounded outbound queue for one WebSocket connection, drained by its own task.
+    
+    When the queue is full the slow consumer policy applies:
+    - "drop_oldest": discard the oldest queued frame to make room (default)
+    - "drop_newest": discard the new frame
+    - "close": close the connection (code 1013, try again later)
+    """
+    
+    POLICIES = ("drop_oldest", "drop_newest", "close")
+    
+    def __init__(self, connection_id: str, websocket: Any, max_size: int = 256,
+                 policy: str = "drop_oldest", send_timeout: float = 10.0,
+                 on_closed: Optional[Callable[[str], None]] = None):
+        """
+        Initialize Connection Send Queue.
+        
+        Args:
+            connection_id: Connection ID
+            websocket: WebSocket to send frames on
+            max_size: Maximum frames waiting to be sent
+            policy: Slow consumer policy when the queue is full
+            send_timeout: Seconds one send may take before the connection is treated as dead
+            on_closed: Called with connection_id once the queue stops (send failure or close policy)
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown slow consumer policy: {policy}")
+        self.connection_id = connection_id
+        self.websocket = websocket
+        self.policy = policy
+        self.send_timeout = send_timeout
+        self.on_closed = on_closed
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_size)
+        self.closed = False
+        self.stats = {"sent": 0, "dropped": 0, "send_failures": 0}
+        self.task = asyncio.create_task(self._drain())
+    
+    def offer(self, frame: str) -> bool:
+        """Queue a serialized frame without waiting; returns False if it was not queued."""
+        if self.closed:
+            return False
+        try:
+            self.queue.put_nowait(frame)
+            return True
+        except asyncio.QueueFull:
+            pass
+        
+        self.stats["dropped"] += 1
+        if self.policy == "drop_oldest":
+            self.queue.get_nowait()
+            self.queue.put_nowait(frame)
+            return True
+        if self.policy == "close":
+            logger.warning(f"⚠️ Closing slow consumer {self.connection_id} (send queue full)")
+            self._stop()
+            asyncio.create_task(self._close_websocket(1013, "Slow consumer"))
+        return False
+    
+    async def _drain(self):
+        try:
+            while True:
+                frame = await self.queue.get()
+                try:
+                    await asyncio.wait_for(self.websocket.send_text(frame), timeout=self.send_timeout)
+                    self.stats["sent"] += 1
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    self.stats["send_failures"] += 1
+                    logger.warning(f"⚠️ Failed to send to {self.connection_id}: {e}")
+                    # Connection is dead or stuck - stop sending, eviction cleans up the rest
+                    self._stop(cancel_task=False)
+                    return
+        except asyncio.CancelledError:
+            pass
+    
+    def _stop(self, cancel_task: bool = True):
+        if self.closed:
+            return
+        self.closed = True
+        if cancel_task:
+            self.task.cancel()
+        if self.on_closed:
+            self.on_closed(self.connection_id)
+    
+    async def _close_websocket(self, code: int, reason: str):
+        try:
+            await self.websocket.close(code=code, reason=reason)
+        except Exception as e:
+            logger.debug(f"Close failed for {self.connection_id}: {e}")
+    
+    async def close(self):
+        """Stop draining (queued frames are discarded)."""
+        self.closed = True
+        self.task.cancel()
+        try:
+            await self.task
+        except asyncio.CancelledError:
+            pass
+
 
 class FanOutManager:
     """
@@ -26,16 +149,26 @@ class FanOutManager:
     to coordinate message distribution to WebSocket connections.
     """
     
-    def __init__(self, messaging_abstraction: Any, connection_registry: Any):
+    def __init__(self, messaging_abstraction: Any, connection_registry: Any,
+                 send_queue_size: int = 256, slow_consumer_policy: str = "drop_oldest",
+                 send_timeout: float = 10.0):
         """
         Initialize Fan-Out Manager.
         
         Args:
             messaging_abstraction: Redis messaging abstraction
             connection_registry: ConnectionRegistry instance
+            send_queue_size: Maximum frames queued per connection
+            slow_consumer_policy: "drop_oldest", "drop_newest" or "close" when a queue is full
+            send_timeout: Seconds one send may take before the connection is treated as dead
         """
+        if slow_consumer_policy not in ConnectionSendQueue.POLICIES:
+            raise ValueError(f"Unknown slow consumer policy: {slow_consumer_policy}")
         self.messaging_abstraction = messaging_abstraction
         self.connection_registry = connection_registry
+        self.send_queue_size = send_queue_size
+        self.slow_consumer_policy = slow_consumer_policy
+        self.send_timeout = send_timeout
         self.logger = logger
         
         # Active subscriptions per gateway instance
@@ -44,19 +177,104 @@ class FanOutManager:
         # Background tasks
         self.subscription_tasks: Dict[str, asyncio.Task] = {}
         
+        # Local delivery: channel -> local connection IDs, connection ID -> send queue
+        self.channel_index: Dict[str, Set[str]] = {}
+        self.send_queues: Dict[str, ConnectionSendQueue] = {}
+        self.stats = {"messages": 0, "deliveries": 0, "dropped": 0, "queues_closed": 0}
+        
         self.logger.info("✅ Fan-Out Manager initialized")
     
-    async def start_channel_subscription(self, channel: str, gateway_instance_id: str, local_connections: Dict[str, Any]):
+    async def subscribe_connection(self, connection_id: str, channel: str, websocket: Any,
+                                   gateway_instance_id: Optional[str] = None):
+        """
+        Index a local connection under a channel, creating its send queue and this gateway's
+        Redis subscription to the channel if needed.
+        """
+        if websocket is None:
+            return
+        connection_ids = self.channel_index.setdefault(channel, set())
+        connection_ids.add(connection_id)
+        if connection_id not in self.send_queues:
+            self.send_queues[connection_id] = ConnectionSendQueue(
+                connection_id,
+                websocket,
+                max_size=self.send_queue_size,
+                policy=self.slow_consumer_policy,
+                send_timeout=self.send_timeout,
+                on_closed=self._on_queue_closed
+            )
+        if outbound_topic(channel) not in self.active_subscriptions:
+            await self.start_channel_subscription(channel, gateway_instance_id)
+    
+    async def unsubscribe_connection(self, connection_id: str, channel: Optional[str] = None):
+        """Remove a local connection from one channel, or from all channels (on disconnect)."""
+        channels = [channel] if channel else [ch for ch, ids in self.channel_index.items() if connection_id in ids]
+        for ch in channels:
+            connection_ids = self.channel_index.get(ch)
+            if connection_ids is None:
+                continue
+            connection_ids.discard(connection_id)
+            if not connection_ids:
+                del self.channel_index[ch]
+                await self.stop_channel_subscription(ch)
+        
+        if channel is None or not any(connection_id in ids for ids in self.channel_index.values()):
+            send_queue = self.send_queues.pop(connection_id, None)
+            if send_queue:
+                await send_queue.close()
+    
+    def _on_queue_closed(self, connection_id: str):
+        """A send queue stopped (dead connection or slow consumer closed) - stop delivering to it."""
+        if self.send_queues.pop(connection_id, None) is not None:
+            self.stats["queues_closed"] += 1
+        for connection_ids in self.channel_index.values():
+            connection_ids.discard(connection_id)
+    
+    def deliver_local(self, channel: str, frame: str, target_connection_id: Optional[str] = None,
+                      exclude_connection_id: Optional[str] = None) -> int:
         """
-        Start subscribing to Redis channel for message fan-out.
+        Queue one serialized frame for the local connections on the channel (no awaits).
+        
+        A frame addressed to target_connection_id goes to that connection only (if it is local
+        and on the channel); exclude_connection_id (the sender) never gets its own frame back.
+        """
+        connection_ids = self.channel_index.get(channel, set())
+        if target_connection_id is not None:
+            connection_ids = {target_connection_id} & connection_ids
+        delivered = 0
+        for connection_id in list(connection_ids):
+            if connection_id == exclude_connection_id:
+                continue
+            send_queue = self.send_queues.get(connection_id)
+            if send_queue is None:
+                continue
+            dropped_before = send_queue.stats["dropped"]
+            if send_queue.offer(frame):
+                delivered += 1
+            self.stats["dropped"] += send_queue.stats["dropped"] - dropped_before
+        self.stats["messages"] += 1
+        self.stats["deliveries"] += delivered
+        return delivered
+    
+    def get_fanout_stats(self) -> Dict[str, Any]:
+        """Fan-out counters, index size and current send queue depths."""
+        return {
+            **self.stats,
+            "channels": {channel: len(ids) for channel, ids in self.channel_index.items()},
+            "connections": len(self.send_queues),
+            "queued": sum(send_queue.queue.qsize() for send_queue in self.send_queues.values())
+        }
+    
+    async def start_channel_subscription(self, channel: str, gateway_instance_id: Optional[str] = None):
+        """
+        Start subscribing to the channel's outbound Redis topic for message fan-out.
         
         Args:
             channel: Channel name (e.g., "guide", "pillar:content")
             gateway_instance_id: ID of this gateway instance
-            local_connections: Dict of connection_id -> WebSocket for local connections
         """
         try:
-            redis_channel = f"websocket:{channel}"
+            redis_channel = outbound_topic(channel)
             
             # Check if already subscribed
             if redis_channel in self.active_subscriptions:
@@ -75,8 +293,7 @@ class FanOutManager:
                     self._handle_channel_messages(
                         redis_channel,
                         pubsub,
-                        gateway_instance_id,
-                        local_connections
+                        gateway_instance_id
                     )
                 )
                 self.subscription_tasks[redis_channel] = task
@@ -92,53 +309,44 @@ class FanOutManager:
         self,
         redis_channel: str,
         pubsub: Any,
-        gateway_instance_id: str,
-        local_connections: Dict[str, Any]
+        gateway_instance_id: Optional[str] = None
     ):
         """Background task to handle messages from Redis channel."""
+        channel = redis_channel[len(OUTBOUND_TOPIC_PREFIX):]
         try:
             self.logger.debug(f"📡 Listening for messages on {redis_channel}")
             
             async for message in pubsub.listen():
                 if message.get('type') == 'message':
                     try:
-                        # Parse message
-                        data = json.loads(message.get('data', '{}'))
+                        # The published payload is already JSON: parse it once for addressing and
+                        # send the same frame to every recipient (no per-recipient serialization)
+                        frame = message.get('data', '{}')
+                        if isinstance(frame, bytes):
+                            frame = frame.decode("utf-8")
+                        envelope = json.loads(frame)
+                        if not isinstance(envelope, dict):
+                            envelope = {}
                         
-                        # Get all connections for this channel (from Redis)
-                        connection_ids = await self.connection_registry.get_connections_by_channel(
-                            redis_channel.replace("websocket:", "")
+                        # Fan-out to local connections (queued; each connection drains on its own task)
+                        delivered = self.deliver_local(
+                            channel,
+                            frame,
+                            target_connection_id=envelope.get("target_connection_id"),
+                            exclude_connection_id=envelope.get("source_connection_id")
                         )
                         
-                        # Filter to only local connections
-                        local_connection_ids = [
-                            conn_id for conn_id in connection_ids
-                            if conn_id in local_connections
-                        ]
-                        
-                        # Fan-out to local connections
-                        for connection_id in local_connection_ids:
-                            websocket = local_connections.get(connection_id)
-                            if websocket:
-                                try:
-                                    await websocket.send_json(data)
-                                    self.logger.debug(f"✅ Fanned out message to {connection_id}")
-                                except Exception as e:
-                                    self.logger.warning(f"⚠️ Failed to send to {connection_id}: {e}")
-                                    # Connection might be dead, will be cleaned up by eviction
-                        
                         # Log fan-out metrics
-                        if len(local_connection_ids) > 0:
-                            self.logger.debug(
-                                f"📤 Fanned out message to {len(local_connection_ids)} local connections "
-                                f"(total: {len(connection_ids)})"
-                            )
+                        if delivered > 0:
+                            self.logger.debug(f"📤 Fanned out message to {delivered} local connections")
                             
                     except json.JSONDecodeError as e:
                         self.logger.warning(f"⚠️ Invalid JSON in message from {redis_channel}: {e}")
                     except Exception as e:
                         self.logger.error(f"❌ Error handling message from {redis_channel}: {e}")
                         
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             self.logger.error(f"❌ Error in channel message handler for {redis_channel}: {e}")
             # Remove subscription on error
@@ -152,28 +360,31 @@ class FanOutManager:
         self,
         channel: str,
         message: Dict[str, Any],
-        source_connection_id: Optional[str] = None
+        source_connection_id: Optional[str] = None,
+        target_connection_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
-        Publish message to Redis channel for fan-out.
+        Publish message to the channel's outbound Redis topic for fan-out.
         
         Args:
             channel: Channel name
             message: Message to publish
             source_connection_id: Optional connection ID that sent the message (to exclude from fan-out)
+            target_connection_id: Optional connection ID to deliver to (None = every connection on the channel)
             
         Returns:
             Dict with publish status
         """
         try:
-            redis_channel = f"websocket:{channel}"
+            redis_channel = outbound_topic(channel)
             
             # Add metadata
             message_with_metadata = {
                 "channel": channel,
                 "message": message,
                 "timestamp": datetime.utcnow().isoformat(),
-                "source_connection_id": source_connection_id
+                "source_connection_id": source_connection_id,
+                "target_connection_id": target_connection_id
             }
             
             # Publish to Redis
@@ -213,9 +424,9 @@ class FanOutManager:
             }
     
     async def stop_channel_subscription(self, channel: str):
-        """Stop subscribing to Redis channel."""
+        """Stop subscribing to the channel's outbound Redis topic."""
         try:
-            redis_channel = f"websocket:{channel}"
+            redis_channel = outbound_topic(channel)
             
             if redis_channel in self.active_subscriptions:
                 pubsub = self.active_subscriptions[redis_channel]
@@ -238,13 +449,19 @@ class FanOutManager:
             # Stop all subscriptions
             channels = list(self.active_subscriptions.keys())
             for redis_channel in channels:
-                channel = redis_channel.replace("websocket:", "")
+                channel = redis_channel[len(OUTBOUND_TOPIC_PREFIX):]
                 await self.stop_channel_subscription(channel)
             
             # Cancel all tasks
             for task in self.subscription_tasks.values():
                 task.cancel()
             
+            # Stop all send queues
+            for send_queue in list(self.send_queues.values()):
+                await send_queue.close()
+            self.send_queues.clear()
+            self.channel_index.clear()
+            
             self.logger.info("✅ Fan-Out Manager shut down")
             
         except Exception as e:
@@ -541,12 +541,14 @@ class PostOfficeService(SmartCityRoleBase, PostOfficeServiceProtocol):
         self,
         channel: str,
         message: Dict[str, Any],
-        realm: str
+        realm: str,
+        target_connection_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Publish message to agent channel.
         
-        Used by Business Enablement agents to send messages via WebSocket.
+        Used by Business Enablement agents to send messages via WebSocket. The message goes to
+        the channel's outbound topic, which gateways fan out to their connections on the channel.
         
         Note: Realm access validation happens at Platform Gateway level.
         This service trusts Platform Gateway has already validated.
@@ -555,6 +557,7 @@ class PostOfficeService(SmartCityRoleBase, PostOfficeServiceProtocol):
             channel: Channel name (e.g., "guide", "pillar:content")
             message: Message to publish
             realm: Realm publishing the message
+            target_connection_id: Optional connection to deliver to (None = every connection on the channel)
             
         Returns:
             Dict with status and channel info
@@ -566,14 +569,16 @@ class PostOfficeService(SmartCityRoleBase, PostOfficeServiceProtocol):
                     "error": "Messaging abstraction not available"
                 }
             
-            # Publish to Redis channel
-            redis_channel = f"websocket:{channel}"
+            # Publish to the channel's outbound topic (fanned out to WebSocket clients)
+            from .fanout_manager import outbound_topic
+            redis_channel = outbound_topic(channel)
             
             # Add metadata
             message_with_metadata = {
                 "source": realm,
                 "message": message,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": datetime.utcnow().isoformat(),
+                "target_connection_id": target_connection_id
             }
             
             # Publish to Redis using direct Redis client (pub/sub)
@@ -584,11 +589,9 @@ class PostOfficeService(SmartCityRoleBase, PostOfficeServiceProtocol):
                     redis_client = self.messaging_abstraction.messaging_adapter.redis_client
                     # Use Redis PUBLISH command for pub/sub
                     import inspect
-                    publish_method = getattr(redis_client, 'publish', None)
-                    if publish_method and inspect.iscoroutinefunction(publish_method):
-                        await redis_client.publish(redis_channel, json.dumps(message_with_metadata))
-                    else:
-                        redis_client.publish(redis_channel, json.dumps(message_with_metadata))
+                    result = redis_client.publish(redis_channel, json.dumps(message_with_metadata))
+                    if inspect.isawaitable(result):
+                        await result
                 else:
                     raise Exception("Redis client not available in messaging adapter")
             else:
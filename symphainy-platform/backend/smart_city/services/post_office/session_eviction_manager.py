@@ -5,18 +5,86 @@ Session Eviction Manager - Stale Connection Cleanup
 Manages session eviction for WebSocket connections.
 Implements heartbeat-based connection management with automatic cleanup.
 
+All connections share one timer wheel driven by a single task: each tick touches only the
+connections whose heartbeat is due, pings them concurrently, evicts the idle or dead ones, and
+writes their heartbeat/activity timestamps to the connection registry in one batch.
+
 WHAT: I clean up stale WebSocket connections
 HOW: I use heartbeat monitoring and automatic eviction
 """
 
+import math
+import time
 import logging
 import asyncio
-from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, List, Set
+from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
 
+class TimerWheel:
+    """
+    Hashed timer wheel: O(1) schedule/cancel, and each tick only visits one slot.
+
+    Delays longer than one revolution carry a rounds counter (decremented when their slot
+    comes up), so any delay is supported; for delays within one revolution every entry
+    visited by a tick is due.
+    """
+    
+    def __init__(self, tick_interval: float = 1.0, slots: int = 512, start: float = 0.0):
+        """
+        Initialize Timer Wheel.
+        
+        Args:
+            tick_interval: Seconds per slot
+            slots: Number of slots (one revolution = slots x tick_interval seconds)
+            start: Clock value of tick 0
+        """
+        self.tick_interval = tick_interval
+        self.slots: List[Dict[str, int]] = [dict() for _ in range(slots)]
+        self.positions: Dict[str, int] = {}  # key -> slot index
+        self.current_tick = 0
+        self.start = start
+    
+    def schedule(self, key: str, at: float):
+        """(Re)schedule key to expire at clock value `at` (rounded up to a whole tick)."""
+        self.cancel(key)
+        tick = max(self.current_tick + 1, math.ceil((at - self.start) / self.tick_interval))
+        slot = tick % len(self.slots)
+        self.slots[slot][key] = (tick - self.current_tick - 1) // len(self.slots)
+        self.positions[key] = slot
+    
+    def cancel(self, key: str) -> bool:
+        slot = self.positions.pop(key, None)
+        if slot is None:
+            return False
+        self.slots[slot].pop(key, None)
+        return True
+    
+    def advance(self, now: float) -> List[str]:
+        """Move the wheel up to `now`; returns the keys that expired (and removes them)."""
+        expired = []
+        target_tick = int((now - self.start) / self.tick_interval)
+        while self.current_tick < target_tick:
+            self.current_tick += 1
+            slot = self.slots[self.current_tick % len(self.slots)]
+            for key, rounds in list(slot.items()):
+                if rounds > 0:
+                    slot[key] = rounds - 1
+                else:
+                    del slot[key]
+                    del self.positions[key]
+                    expired.append(key)
+        return expired
+    
+    def __len__(self) -> int:
+        return len(self.positions)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self.positions
+
+
 class SessionEvictionManager:
     """
     Manages session eviction for WebSocket connections.
@@ -30,28 +98,43 @@ class SessionEvictionManager:
         connection_registry: Any,
         heartbeat_interval: int = 30,
         max_idle_time: int = 300,
-        eviction_check_interval: int = 60
+        eviction_check_interval: int = 60,
+        tick_interval: float = 1.0,
+        send_timeout: float = 5.0,
+        max_concurrent_pings: int = 256,
+        clock=time.monotonic
     ):
         """
         Initialize Session Eviction Manager.
         
         Args:
             connection_registry: ConnectionRegistry instance
-            heartbeat_interval: Seconds between heartbeat checks
-            max_idle_time: Maximum idle time before eviction (seconds)
-            eviction_check_interval: Interval for eviction checks (seconds)
+            heartbeat_interval: Seconds between heartbeats per connection
+            max_idle_time: Maximum time without a successful heartbeat or message before eviction (seconds)
+            eviction_check_interval: Kept for compatibility (idle checks now run at each connection's heartbeat)
+            tick_interval: Timer wheel resolution (seconds)
+            send_timeout: Seconds a ping may take before the connection counts as dead
+            max_concurrent_pings: Pings in flight at once per tick
         """
         self.connection_registry = connection_registry
         self.heartbeat_interval = heartbeat_interval
         self.max_idle_time = max_idle_time
         self.eviction_check_interval = eviction_check_interval
+        self.tick_interval = tick_interval
+        self.send_timeout = send_timeout
+        self.max_concurrent_pings = max_concurrent_pings
+        self.clock = clock
         self.logger = logger
         
-        # Active heartbeat monitors
-        self.heartbeat_monitors: Dict[str, asyncio.Task] = {}
+        # Monitored connections: connection_id -> WebSocket, plus local liveness
+        self.heartbeat_monitors: Dict[str, Any] = {}
+        self.last_seen: Dict[str, float] = {}
+        self.pending_activity: Set[str] = set()
+        self.timer_wheel = TimerWheel(tick_interval=tick_interval, start=clock())
         
-        # Eviction task
+        # Eviction task (single tick loop for all connections)
         self.eviction_task: Optional[asyncio.Task] = None
+        self.stats = {"ticks": 0, "heartbeats": 0, "evictions": 0, "registry_batches": 0}
         
         self.logger.info("✅ Session Eviction Manager initialized")
     
@@ -75,51 +158,20 @@ class SessionEvictionManager:
                 self.logger.debug(f"Heartbeat monitor already exists for {connection_id}")
                 return
             
-            # Create heartbeat monitor task
-            task = asyncio.create_task(
-                self._heartbeat_loop(connection_id, websocket, local_connections)
-            )
-            self.heartbeat_monitors[connection_id] = task
+            self.heartbeat_monitors[connection_id] = websocket
+            self.last_seen[connection_id] = self.clock()
+            self.timer_wheel.schedule(connection_id, self.clock() + self.heartbeat_interval)
             
             self.logger.debug(f"✅ Started heartbeat monitor for {connection_id}")
-            
+        
         except Exception as e:
             self.logger.error(f"❌ Failed to start heartbeat monitor for {connection_id}: {e}")
     
-    async def _heartbeat_loop(
-        self,
-        connection_id: str,
-        websocket: Any,
-        local_connections: Dict[str, Any]
-    ):
-        """Background task for heartbeat monitoring."""
-        try:
-            while True:
-                await asyncio.sleep(self.heartbeat_interval)
-                
-                try:
-                    # Send ping
-                    await websocket.send_json({
-                        "type": "ping",
-                        "timestamp": datetime.utcnow().isoformat()
-                    })
-                    
-                    # Update last heartbeat in Redis
-                    await self.connection_registry.update_connection_heartbeat(connection_id)
-                    
-                    self.logger.debug(f"💓 Heartbeat sent to {connection_id}")
-                    
-                except Exception as e:
-                    # Connection likely dead, stop monitoring
-                    self.logger.warning(f"⚠️ Heartbeat failed for {connection_id}: {e}")
-                    await self._evict_connection(connection_id, local_connections)
-                    break
-                    
-        except asyncio.CancelledError:
-            self.logger.debug(f"Heartbeat monitor cancelled for {connection_id}")
-        except Exception as e:
-            self.logger.error(f"❌ Error in heartbeat loop for {connection_id}: {e}")
-            await self._evict_connection(connection_id, local_connections)
+    def touch(self, connection_id: str):
+        """Record activity from a connection (local only; written to the registry in the next batch)."""
+        if connection_id in self.heartbeat_monitors:
+            self.last_seen[connection_id] = self.clock()
+            self.pending_activity.add(connection_id)
     
     async def start_eviction_monitor(self, local_connections: Dict[str, Any]):
         """Start background eviction monitor."""
@@ -133,91 +185,95 @@ class SessionEvictionManager:
         self.logger.info("✅ Started eviction monitor")
     
     async def _eviction_loop(self, local_connections: Dict[str, Any]):
-        """Background task to check for stale connections."""
+        """Background task driving the timer wheel for all connections."""
         try:
             while True:
-                await asyncio.sleep(self.eviction_check_interval)
-                
+                await asyncio.sleep(self.tick_interval)
                 try:
-                    # Get all connections from registry
-                    # Note: This is expensive, in production use Redis SCAN with cursor
-                    # For now, we'll check connections that are in local_connections
-                    
-                    stale_connections = []
-                    now = datetime.utcnow()
-                    
-                    for connection_id in list(local_connections.keys()):
-                        try:
-                            # Get connection from registry
-                            conn = await self.connection_registry.get_connection(connection_id)
-                            if not conn:
-                                # Connection not in registry, mark as stale
-                                stale_connections.append(connection_id)
-                                continue
-                            
-                            # Check last heartbeat
-                            last_heartbeat_str = conn.get("last_heartbeat")
-                            if last_heartbeat_str:
-                                try:
-                                    last_heartbeat = datetime.fromisoformat(last_heartbeat_str.replace('Z', '+00:00'))
-                                    idle_time = (now - last_heartbeat).total_seconds()
-                                    
-                                    if idle_time > self.max_idle_time:
-                                        self.logger.warning(
-                                            f"⚠️ Connection {connection_id} idle for {idle_time}s, evicting"
-                                        )
-                                        stale_connections.append(connection_id)
-                                except Exception as e:
-                                    self.logger.warning(f"⚠️ Error parsing heartbeat for {connection_id}: {e}")
-                                    stale_connections.append(connection_id)
-                            else:
-                                # No heartbeat, check last activity
-                                last_activity_str = conn.get("last_activity")
-                                if last_activity_str:
-                                    try:
-                                        last_activity = datetime.fromisoformat(last_activity_str.replace('Z', '+00:00'))
-                                        idle_time = (now - last_activity).total_seconds()
-                                        
-                                        if idle_time > self.max_idle_time:
-                                            self.logger.warning(
-                                                f"⚠️ Connection {connection_id} inactive for {idle_time}s, evicting"
-                                            )
-                                            stale_connections.append(connection_id)
-                                    except Exception as e:
-                                        self.logger.warning(f"⚠️ Error parsing activity for {connection_id}: {e}")
-                                        stale_connections.append(connection_id)
-                                else:
-                                    # No activity or heartbeat, evict
-                                    self.logger.warning(f"⚠️ Connection {connection_id} has no activity/heartbeat, evicting")
-                                    stale_connections.append(connection_id)
-                                    
-                        except Exception as e:
-                            self.logger.error(f"❌ Error checking connection {connection_id}: {e}")
-                            stale_connections.append(connection_id)
-                    
-                    # Evict stale connections
-                    for connection_id in stale_connections:
-                        await self._evict_connection(connection_id, local_connections)
-                    
-                    if stale_connections:
-                        self.logger.info(f"🧹 Evicted {len(stale_connections)} stale connections")
-                        
+                    await self.run_tick(local_connections)
                 except Exception as e:
                     self.logger.error(f"❌ Error in eviction loop: {e}")
-                    
+        
         except asyncio.CancelledError:
             self.logger.debug("Eviction monitor cancelled")
         except Exception as e:
             self.logger.error(f"❌ Error in eviction monitor: {e}")
     
+    async def run_tick(self, local_connections: Dict[str, Any]) -> Dict[str, int]:
+        """
+        Process connections whose heartbeat is due: evict idle ones, ping the rest
+        concurrently, then refresh the registry for all of them in one batch.
+        """
+        self.stats["ticks"] += 1
+        now = self.clock()
+        due = [connection_id for connection_id in self.timer_wheel.advance(now)
+               if connection_id in self.heartbeat_monitors]
+        
+        stale, to_ping = [], []
+        for connection_id in due:
+            if now - self.last_seen.get(connection_id, now) > self.max_idle_time:
+                self.logger.warning(f"⚠️ Connection {connection_id} idle for more than {self.max_idle_time}s, evicting")
+                stale.append(connection_id)
+            else:
+                to_ping.append(connection_id)
+        
+        alive = []
+        if to_ping:
+            semaphore = asyncio.Semaphore(self.max_concurrent_pings)
+            
+            async def ping(connection_id: str) -> bool:
+                async with semaphore:
+                    return await self._send_heartbeat(connection_id)
+            
+            results = await asyncio.gather(*(ping(connection_id) for connection_id in to_ping))
+            for connection_id, ok in zip(to_ping, results):
+                (alive if ok else stale).append(connection_id)
+        
+        # One registry round trip for the whole tick (heartbeats plus activity since the last tick)
+        active = [connection_id for connection_id in self.pending_activity if connection_id in self.heartbeat_monitors]
+        self.pending_activity.clear()
+        if alive or active:
+            self.stats["registry_batches"] += 1
+            missing = await self.connection_registry.refresh_connections(alive, active)
+            for connection_id in missing:
+                # Not in the registry any more (expired or removed elsewhere)
+                if connection_id in alive:
+                    alive.remove(connection_id)
+                stale.append(connection_id)
+        
+        for connection_id in alive:
+            self.timer_wheel.schedule(connection_id, self.clock() + self.heartbeat_interval)
+        for connection_id in dict.fromkeys(stale):
+            await self._evict_connection(connection_id, local_connections)
+        
+        if stale:
+            self.logger.info(f"🧹 Evicted {len(set(stale))} stale connections")
+        return {"due": len(due), "heartbeats": len(alive), "evicted": len(set(stale))}
+    
+    async def _send_heartbeat(self, connection_id: str) -> bool:
+        websocket = self.heartbeat_monitors.get(connection_id)
+        if websocket is None:
+            return False
+        try:
+            # Send ping
+            await asyncio.wait_for(websocket.send_json({
+                "type": "ping",
+                "timestamp": datetime.utcnow().isoformat()
+            }), timeout=self.send_timeout)
+            self.last_seen[connection_id] = self.clock()
+            self.stats["heartbeats"] += 1
+            self.logger.debug(f"💓 Heartbeat sent to {connection_id}")
+            return True
+        except Exception as e:
+            # Connection likely dead, stop monitoring
+            self.logger.warning(f"⚠️ Heartbeat failed for {connection_id}: {e}")
+            return False
+    
     async def _evict_connection(self, connection_id: str, local_connections: Dict[str, Any]):
         """Evict a connection."""
         try:
             # Stop heartbeat monitor
-            if connection_id in self.heartbeat_monitors:
-                task = self.heartbeat_monitors[connection_id]
-                task.cancel()
-                del self.heartbeat_monitors[connection_id]
+            self._forget(connection_id)
             
             # Close WebSocket if still open
             websocket = local_connections.get(connection_id)
@@ -231,18 +287,23 @@ class SessionEvictionManager:
             # Unregister from Redis
             await self.connection_registry.unregister_connection(connection_id)
             
+            self.stats["evictions"] += 1
             self.logger.info(f"✅ Evicted connection {connection_id}")
-            
+        
         except Exception as e:
             self.logger.error(f"❌ Error evicting connection {connection_id}: {e}")
     
+    def _forget(self, connection_id: str):
+        self.heartbeat_monitors.pop(connection_id, None)
+        self.last_seen.pop(connection_id, None)
+        self.pending_activity.discard(connection_id)
+        self.timer_wheel.cancel(connection_id)
+    
     async def stop_heartbeat_monitor(self, connection_id: str):
         """Stop heartbeat monitor for connection."""
         try:
             if connection_id in self.heartbeat_monitors:
-                task = self.heartbeat_monitors[connection_id]
-                task.cancel()
-                del self.heartbeat_monitors[connection_id]
+                self._forget(connection_id)
                 self.logger.debug(f"✅ Stopped heartbeat monitor for {connection_id}")
         except Exception as e:
             self.logger.error(f"❌ Error stopping heartbeat monitor for {connection_id}: {e}")
@@ -267,7 +328,6 @@ class SessionEvictionManager:
                 await self._evict_connection(connection_id, local_connections)
             
             self.logger.info("✅ Session Eviction Manager shut down")
-            
+        
         except Exception as e:
             self.logger.error(f"❌ Error shutting down Session Eviction Manager: {e}")
-
@@ -20,7 +20,7 @@ from collections import defaultdict
 from fastapi import WebSocket, WebSocketDisconnect
 from bases.smart_city_role_base import SmartCityRoleBase
 from .connection_registry import ConnectionRegistry
-from .fanout_manager import FanOutManager
+from .fanout_manager import FanOutManager, inbound_topic
 from .backpressure_manager import BackpressureManager
 from .session_eviction_manager import SessionEvictionManager
 
@@ -419,8 +419,10 @@ class WebSocketGatewayService(SmartCityRoleBase):
             if self.logger:
                 self.logger.debug(f"📨 Received message from {connection_id}: {data}")
             
-            # Update last activity in Redis
-            if self.connection_registry:
+            # Update last activity (batched into the eviction manager's next registry refresh)
+            if self.eviction_manager:
+                self.eviction_manager.touch(connection_id)
+            elif self.connection_registry:
                 await self.connection_registry.update_connection_activity(connection_id)
             
             # Extract channel from new format: { channel: "guide" | "pillar:content", intent: "...", payload: {...} }
@@ -481,6 +483,15 @@ class WebSocketGatewayService(SmartCityRoleBase):
                 if self.logger:
                     self.logger.warning(f"⚠️ Connection registry not available, cannot track channel subscription")
             
+            # Index the connection locally so fan-out needs no Redis lookup per message
+            if self.fanout_manager:
+                await self.fanout_manager.subscribe_connection(
+                    connection_id,
+                    channel,
+                    self.local_connections.get(connection_id),
+                    gateway_instance_id=self.instance_id
+                )
+            
             # Phase 3: Use backpressure manager for publishing
             if self.backpressure_manager:
                 result = await self.backpressure_manager.publish_with_backpressure(
@@ -499,8 +510,8 @@ class WebSocketGatewayService(SmartCityRoleBase):
                     if self.logger:
                         self.logger.debug(f"📦 Message queued for {channel} (backpressure)")
             else:
-                # Fallback: Direct publish
-                redis_channel = f"websocket:{channel}"
+                # Fallback: Direct publish (inbound topic - read by agents, not fanned out to clients)
+                redis_channel = inbound_topic(channel)
                 if self.messaging_abstraction:
                     if hasattr(self.messaging_abstraction, 'publish'):
                         await self.messaging_abstraction.publish(
@@ -558,6 +569,14 @@ class WebSocketGatewayService(SmartCityRoleBase):
             if connection_id in self.local_connections:
                 del self.local_connections[connection_id]
             
+            # Stop heartbeats for this connection
+            if self.eviction_manager:
+                await self.eviction_manager.stop_heartbeat_monitor(connection_id)
+            
+            # Remove from the local channel index (stops its send queue)
+            if self.fanout_manager:
+                await self.fanout_manager.unsubscribe_connection(connection_id)
+            
             # Unregister from Redis
             if self.connection_registry:
                 await self.connection_registry.unregister_connection(connection_id)
@@ -13,6 +13,7 @@ Key differences from Post Office ConnectionRegistry:
 - Supports Traffic Cop's nested connection structure
 """
 
+import inspect
 import json
 import logging
 from datetime import datetime, timedelta
@@ -62,6 +63,13 @@ class TrafficCopConnectionRegistry:
         
         self.logger.info("✅ Traffic Cop Connection Registry initialized (Redis-backed)")
     
+    async def _redis(self, command: str, *args, **kwargs) -> Any:
+        """Run a Redis command, awaiting the result when the client is async."""
+        result = getattr(self.redis_client, command)(*args, **kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+    
     async def register_connection(
         self,
         websocket_id: str,
@@ -99,64 +107,34 @@ class TrafficCopConnectionRegistry:
             }
             
             # Store in Redis using direct Redis client
-            import inspect
-            hset_method = getattr(self.redis_client, 'hset', None)
-            if hset_method and inspect.iscoroutinefunction(hset_method):
-                await self.redis_client.hset(
-                    connection_key,
-                    mapping=connection_data
-                )
-            else:
-                self.redis_client.hset(
-                    connection_key,
-                    mapping=connection_data
-                )
+            await self._redis(
+                "hset",
+                connection_key,
+                mapping=connection_data
+            )
             
             # Set TTL
-            expire_method = getattr(self.redis_client, 'expire', None)
-            if expire_method and inspect.iscoroutinefunction(expire_method):
-                await self.redis_client.expire(connection_key, self.default_ttl)
-            else:
-                self.redis_client.expire(connection_key, self.default_ttl)
+            await self._redis("expire", connection_key, self.default_ttl)
             
             # Add to session index
             session_index_key = f"traffic_cop:session:{session_id}:websockets"
-            sadd_method = getattr(self.redis_client, 'sadd', None)
-            if sadd_method and inspect.iscoroutinefunction(sadd_method):
-                await self.redis_client.sadd(session_index_key, websocket_id)
-            else:
-                self.redis_client.sadd(session_index_key, websocket_id)
+            await self._redis("sadd", session_index_key, websocket_id)
             
-            if expire_method and inspect.iscoroutinefunction(expire_method):
-                await self.redis_client.expire(session_index_key, self.default_ttl)
-            else:
-                self.redis_client.expire(session_index_key, self.default_ttl)
+            await self._redis("expire", session_index_key, self.default_ttl)
             
             # Add to agent_type index (if specified)
             if agent_type:
                 agent_index_key = f"traffic_cop:agent_type:{agent_type}:websockets"
-                if sadd_method and inspect.iscoroutinefunction(sadd_method):
-                    await self.redis_client.sadd(agent_index_key, websocket_id)
-                else:
-                    self.redis_client.sadd(agent_index_key, websocket_id)
+                await self._redis("sadd", agent_index_key, websocket_id)
                 
-                if expire_method and inspect.iscoroutinefunction(expire_method):
-                    await self.redis_client.expire(agent_index_key, self.default_ttl)
-                else:
-                    self.redis_client.expire(agent_index_key, self.default_ttl)
+                await self._redis("expire", agent_index_key, self.default_ttl)
             
             # Add to pillar index (if specified)
             if pillar:
                 pillar_index_key = f"traffic_cop:pillar:{pillar}:websockets"
-                if sadd_method and inspect.iscoroutinefunction(sadd_method):
-                    await self.redis_client.sadd(pillar_index_key, websocket_id)
-                else:
-                    self.redis_client.sadd(pillar_index_key, websocket_id)
+                await self._redis("sadd", pillar_index_key, websocket_id)
                 
-                if expire_method and inspect.iscoroutinefunction(expire_method):
-                    await self.redis_client.expire(pillar_index_key, self.default_ttl)
-                else:
-                    self.redis_client.expire(pillar_index_key, self.default_ttl)
+                await self._redis("expire", pillar_index_key, self.default_ttl)
             
             # Verify registration
             verify_conn = await self.get_connection(websocket_id, session_id)
@@ -205,12 +183,7 @@ class TrafficCopConnectionRegistry:
                 return None
             
             # Get connection data
-            import inspect
-            hgetall_method = getattr(self.redis_client, 'hgetall', None)
-            if hgetall_method and inspect.iscoroutinefunction(hgetall_method):
-                data = await self.redis_client.hgetall(connection_key)
-            else:
-                data = self.redis_client.hgetall(connection_key)
+            data = await self._redis("hgetall", connection_key)
             
             # Convert bytes to strings if needed
             if data:
@@ -256,12 +229,7 @@ class TrafficCopConnectionRegistry:
             
             # Get all websocket_ids for this session
             session_index_key = f"traffic_cop:session:{session_id}:websockets"
-            import inspect
-            smembers_method = getattr(self.redis_client, 'smembers', None)
-            if smembers_method and inspect.iscoroutinefunction(smembers_method):
-                websocket_ids = await self.redis_client.smembers(session_index_key)
-            else:
-                websocket_ids = self.redis_client.smembers(session_index_key)
+            websocket_ids = await self._redis("smembers", session_index_key)
             
             # Convert bytes to strings if needed
             if websocket_ids:
@@ -315,36 +283,21 @@ class TrafficCopConnectionRegistry:
             
             # Remove from session index
             session_index_key = f"traffic_cop:session:{session_id}:websockets"
-            import inspect
-            srem_method = getattr(self.redis_client, 'srem', None)
-            if srem_method and inspect.iscoroutinefunction(srem_method):
-                await self.redis_client.srem(session_index_key, websocket_id)
-            else:
-                self.redis_client.srem(session_index_key, websocket_id)
+            await self._redis("srem", session_index_key, websocket_id)
             
             # Remove from agent_type index
             if agent_type:
                 agent_index_key = f"traffic_cop:agent_type:{agent_type}:websockets"
-                if srem_method and inspect.iscoroutinefunction(srem_method):
-                    await self.redis_client.srem(agent_index_key, websocket_id)
-                else:
-                    self.redis_client.srem(agent_index_key, websocket_id)
+                await self._redis("srem", agent_index_key, websocket_id)
             
             # Remove from pillar index
             if pillar:
                 pillar_index_key = f"traffic_cop:pillar:{pillar}:websockets"
-                if srem_method and inspect.iscoroutinefunction(srem_method):
-                    await self.redis_client.srem(pillar_index_key, websocket_id)
-                else:
-                    self.redis_client.srem(pillar_index_key, websocket_id)
+                await self._redis("srem", pillar_index_key, websocket_id)
             
             # Delete connection record
             connection_key = f"traffic_cop:session:{session_id}:websocket:{websocket_id}"
-            delete_method = getattr(self.redis_client, 'delete', None)
-            if delete_method and inspect.iscoroutinefunction(delete_method):
-                await self.redis_client.delete(connection_key)
-            else:
-                self.redis_client.delete(connection_key)
+            await self._redis("delete", connection_key)
             
             self.logger.debug(f"✅ Connection unregistered from Redis: {websocket_id}")
             return True
@@ -358,27 +311,15 @@ class TrafficCopConnectionRegistry:
         try:
             connection_key = f"traffic_cop:session:{session_id}:websocket:{websocket_id}"
             
-            import inspect
-            hset_method = getattr(self.redis_client, 'hset', None)
-            if hset_method and inspect.iscoroutinefunction(hset_method):
-                await self.redis_client.hset(
-                    connection_key,
-                    "last_activity",
-                    datetime.utcnow().isoformat()
-                )
-            else:
-                self.redis_client.hset(
-                    connection_key,
-                    "last_activity",
-                    datetime.utcnow().isoformat()
-                )
+            await self._redis(
+                "hset",
+                connection_key,
+                "last_activity",
+                datetime.utcnow().isoformat()
+            )
             
             # Extend TTL
-            expire_method = getattr(self.redis_client, 'expire', None)
-            if expire_method and inspect.iscoroutinefunction(expire_method):
-                await self.redis_client.expire(connection_key, self.default_ttl)
-            else:
-                self.redis_client.expire(connection_key, self.default_ttl)
+            await self._redis("expire", connection_key, self.default_ttl)
             return True
             
         except Exception as e:
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Traffic Cop Instance Health Prober - In-memory health and latency table for load balancing
+
+Probes registered service instances in the background over one shared HTTP client and keeps
+their health, EWMA latency and in-flight request counts in process memory, so that selecting
+an instance is O(1) and never waits on the network or Redis.
+
+WHAT: I know which service instances are healthy and how fast they are
+HOW: I probe on an interval, eject outliers for a growing period, and pick instances with
+power-of-two-choices over latency x in-flight load
+"""
+
+import time
+import random
+import asyncio
+import logging
+from dataclasses import dataclass
+from collections import defaultdict
+from typing import Dict, Any, Optional, List, Set
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class InstanceHealth:
+    """Health, latency and load of one service instance."""
+    instance_id: str
+    service_name: str
+    weight: int = 1
+    health_check_url: Optional[str] = None
+    healthy: bool = True
+    latency_ewma: Optional[float] = None
+    in_flight: int = 0
+    consecutive_failures: int = 0
+    ejected_until: float = 0.0
+    ejection_count: int = 0
+    last_probe_at: Optional[float] = None
+
+
+class InstanceHealthProber:
+    """
+    Background health prober and instance selector for Traffic Cop load balancing.
+
+    Failures (probes or reported requests) eject an instance once `failure_threshold` happen in
+    a row; an ejected instance gets traffic again when its ejection period ends; instances whose latency exceeds `outlier_latency_factor` x the service median are
+    ejected as latency outliers. Ejection lasts base_ejection_seconds x times ejected (capped),
+    and never removes more than `max_ejection_fraction` of a service's instances.
+    """
+
+    def __init__(self, httpx_module: Any = None, probe_interval: float = 5.0, probe_timeout: float = 2.0,
+                 max_concurrent_probes: int = 32, ewma_alpha: float = 0.3, failure_threshold: int = 3,
+                 outlier_latency_factor: float = 3.0, base_ejection_seconds: float = 30.0,
+                 max_ejection_seconds: float = 300.0, max_ejection_fraction: float = 0.5,
+                 default_latency: float = 0.1, clock=time.monotonic, rng: Optional[random.Random] = None):
+        """
+        Initialize Instance Health Prober.
+
+        Args:
+            httpx_module: httpx module used to create the shared probe client (None = no HTTP probes)
+            probe_interval: Seconds between probe rounds
+            probe_timeout: Timeout for one health check request
+            max_concurrent_probes: Probes in flight at once (and client connection limit)
+            ewma_alpha: Weight of the newest latency sample
+            failure_threshold: Consecutive failures before an instance is ejected
+            outlier_latency_factor: Latency above this multiple of the service median is an outlier
+            base_ejection_seconds: First ejection period (grows with each ejection)
+            max_ejection_seconds: Longest ejection period
+            max_ejection_fraction: Largest share of a service's instances ejected at once
+            default_latency: Latency assumed before an instance has been measured
+        """
+        self.httpx = httpx_module
+        self.probe_interval = probe_interval
+        self.probe_timeout = probe_timeout
+        self.max_concurrent_probes = max_concurrent_probes
+        self.ewma_alpha = ewma_alpha
+        self.failure_threshold = failure_threshold
+        self.outlier_latency_factor = outlier_latency_factor
+        self.base_ejection_seconds = base_ejection_seconds
+        self.max_ejection_seconds = max_ejection_seconds
+        self.max_ejection_fraction = max_ejection_fraction
+        self.default_latency = default_latency
+        self.clock = clock
+        self.rng = rng or random.Random()
+        self.logger = logger
+
+        self._table: Dict[str, InstanceHealth] = {}
+        self._services: Dict[str, Set[str]] = defaultdict(set)
+        self._median_latency: Dict[str, float] = {}
+        self._client = None
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {"probe_rounds": 0, "probes": 0, "probe_failures": 0, "ejections": 0,
+                      "selections": 0, "fallback_selections": 0}
+
+    # ========================================================================
+    # INSTANCE REGISTRY
+    # ========================================================================
+
+    def add_instance(self, service_name: str, instance: Any):
+        """Track an instance (keeps existing health data if it is already tracked)."""
+        state = self._table.get(instance.id)
+        if state is None:
+            state = InstanceHealth(instance_id=instance.id, service_name=service_name)
+            self._table[instance.id] = state
+        state.weight = instance.weight
+        state.health_check_url = instance.health_check_url
+        self._services[service_name].add(instance.id)
+
+    def remove_instance(self, service_name: str, instance_id: str):
+        """Stop tracking an instance."""
+        self._table.pop(instance_id, None)
+        self._services.get(service_name, set()).discard(instance_id)
+
+    def get_state(self, instance_id: str) -> Optional[InstanceHealth]:
+        return self._table.get(instance_id)
+
+    def is_available(self, instance_id: str) -> bool:
+        """Not ejected (unknown instances count as available)."""
+        state = self._table.get(instance_id)
+        return state is None or state.ejected_until <= self.clock()
+
+    def health_score(self, instance_id: str) -> int:
+        """0-100 score from the table (no I/O): 100 available, 0 unhealthy or ejected, 50 unknown."""
+        if instance_id not in self._table:
+            return 50
+        state = self._table[instance_id]
+        return 100 if state.healthy and self.is_available(instance_id) else 0
+
+    # ========================================================================
+    # SELECTION
+    # ========================================================================
+
+    def select(self, instances: List[Any]) -> Optional[Any]:
+        """
+        Power-of-two-choices: draw two instances, keep the one with the lower
+        latency x (in-flight + 1) / weight. Unavailable draws are redrawn a few times;
+        only when most of the fleet is down does selection scan all instances.
+        """
+        if not instances:
+            return None
+        self.stats["selections"] += 1
+        if len(instances) == 1:
+            return instances[0]
+
+        now = self.clock()
+        best, best_score = None, float("inf")
+        for _ in range(3):
+            first = self.rng.randrange(len(instances))
+            second = self.rng.randrange(len(instances) - 1)
+            if second >= first:
+                second += 1
+            for candidate in (instances[first], instances[second]):
+                score = self._score(candidate, now)
+                if score < best_score:
+                    best, best_score = candidate, score
+            if best is not None:
+                return best
+
+        # Mostly ejected fleet: scan for any available instance, else use all of them (panic mode)
+        self.stats["fallback_selections"] += 1
+        available = [instance for instance in instances if self._score(instance, now) < float("inf")]
+        pool = available or instances
+        return min(self.rng.sample(pool, min(2, len(pool))), key=lambda instance: self._load(instance))
+
+    def _score(self, instance: Any, now: float) -> float:
+        state = self._table.get(instance.id)
+        if state is not None and state.ejected_until > now:
+            return float("inf")
+        return self._load(instance)
+
+    def _load(self, instance: Any) -> float:
+        state = self._table.get(instance.id)
+        if state is None:
+            return self.default_latency / max(instance.weight, 1)
+        latency = state.latency_ewma
+        if latency is None:
+            latency = self._median_latency.get(state.service_name, self.default_latency)
+        return latency * (state.in_flight + 1) / max(state.weight, 1)
+
+    # ========================================================================
+    # REQUEST FEEDBACK (passive health)
+    # ========================================================================
+
+    def begin_request(self, instance_id: str):
+        """Count a request routed to the instance as in flight."""
+        state = self._table.get(instance_id)
+        if state is not None:
+            state.in_flight += 1
+
+    def end_request(self, instance_id: str, latency: Optional[float] = None, success: bool = True):
+        """Finish an in-flight request, folding its latency and outcome into the table."""
+        state = self._table.get(instance_id)
+        if state is None:
+            return
+        state.in_flight = max(0, state.in_flight - 1)
+        self._record_outcome(state, success, latency)
+
+    def _record_outcome(self, state: InstanceHealth, success: bool, latency: Optional[float]):
+        if success:
+            state.healthy = True
+            state.consecutive_failures = 0
+            if latency is not None:
+                state.latency_ewma = latency if state.latency_ewma is None else (
+                    self.ewma_alpha * latency + (1 - self.ewma_alpha) * state.latency_ewma)
+            return
+        state.consecutive_failures += 1
+        if state.consecutive_failures >= self.failure_threshold:
+            state.healthy = False
+            self._eject(state, "failures")
+
+    def _eject(self, state: InstanceHealth, reason: str) -> bool:
+        now = self.clock()
+        if state.ejected_until > now:
+            return False
+        members = self._services.get(state.service_name, set())
+        ejected = sum(1 for instance_id in members
+                      if instance_id in self._table and self._table[instance_id].ejected_until > now)
+        if ejected + 1 > self.max_ejection_fraction * len(members):
+            return False
+        state.ejection_count += 1
+        state.ejected_until = now + min(self.base_ejection_seconds * state.ejection_count, self.max_ejection_seconds)
+        self.stats["ejections"] += 1
+        self.logger.warning(f"⚠️ Ejected instance {state.instance_id} ({state.service_name}, {reason}) "
+                            f"for {state.ejected_until - now:.0f}s")
+        return True
+
+    def _evaluate_outliers(self, service_name: str):
+        """Eject latency outliers relative to the service median (after each probe round)."""
+        now = self.clock()
+        states = [self._table[instance_id] for instance_id in self._services.get(service_name, set())
+                  if instance_id in self._table]
+        latencies = sorted(state.latency_ewma for state in states
+                           if state.latency_ewma is not None and state.ejected_until <= now)
+        if not latencies:
+            return
+        median = latencies[len(latencies) // 2]
+        self._median_latency[service_name] = median
+        if len(latencies) < 3 or median <= 0:
+            return
+        for state in states:
+            if state.latency_ewma is not None and state.latency_ewma > self.outlier_latency_factor * median:
+                self._eject(state, "latency")
+
+    # ========================================================================
+    # BACKGROUND PROBING
+    # ========================================================================
+
+    async def probe_instance(self, state: InstanceHealth):
+        """Probe one instance and record the result."""
+        self.stats["probes"] += 1
+        state.last_probe_at = self.clock()
+        if not state.health_check_url or self._client is None:
+            return  # Nothing to probe - only reported request outcomes apply
+        start = time.perf_counter()
+        try:
+            response = await self._client.get(state.health_check_url, timeout=self.probe_timeout)
+            success = response.status_code == 200
+        except Exception as e:
+            self.logger.debug(f"Health probe failed for {state.instance_id}: {e}")
+            success = False
+        if not success:
+            self.stats["probe_failures"] += 1
+        elif state.ejected_until <= self.clock():
+            state.ejection_count = max(0, state.ejection_count - 1)
+        self._record_outcome(state, success, time.perf_counter() - start if success else None)
+
+    async def probe_all(self):
+        """Run one probe round over every tracked instance, then evaluate latency outliers."""
+        self.stats["probe_rounds"] += 1
+        semaphore = asyncio.Semaphore(self.max_concurrent_probes)
+
+        async def bounded(state: InstanceHealth):
+            async with semaphore:
+                await self.probe_instance(state)
+
+        await asyncio.gather(*(bounded(state) for state in list(self._table.values())))
+        for service_name in list(self._services):
+            self._evaluate_outliers(service_name)
+
+    async def start(self):
+        """Create the shared probe client and start the background probe loop."""
+        if self._task is not None and not self._task.done():
+            return
+        if self.httpx is not None and self._client is None:
+            self._client = self.httpx.AsyncClient(
+                timeout=self.probe_timeout,
+                limits=self.httpx.Limits(max_connections=self.max_concurrent_probes)
+            )
+        self._task = asyncio.create_task(self._probe_loop())
+        self.logger.info(f"✅ Instance health prober started (interval {self.probe_interval}s)")
+
+    async def _probe_loop(self):
+        while True:
+            try:
+                await self.probe_all()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"❌ Health probe round failed: {e}")
+            await asyncio.sleep(self.probe_interval)
+
+    async def shutdown(self):
+        """Stop the probe loop and close the shared client."""
+        try:
+            if self._task is not None:
+                self._task.cancel()
+                try:
+                    await self._task
+                except asyncio.CancelledError:
+                    pass
+                self._task = None
+            if self._client is not None:
+                await self._client.aclose()
+                self._client = None
+            self.logger.info("✅ Instance health prober shut down")
+        except Exception as e:
+            self.logger.error(f"❌ Error shutting down instance health prober: {e}")
+
+    def get_snapshot(self, service_name: Optional[str] = None) -> Dict[str, Any]:
+        """Table contents (optionally for one service) and prober counters."""
+        now = self.clock()
+        return {
+            "instances": {
+                instance_id: {
+                    "service_name": state.service_name,
+                    "available": state.ejected_until <= now,
+                    "healthy": state.healthy,
+                    "latency_ewma": state.latency_ewma,
+                    "in_flight": state.in_flight,
+                    "consecutive_failures": state.consecutive_failures,
+                    "ejected_for": max(0.0, state.ejected_until - now)
+                }
+                for instance_id, state in self._table.items()
+                if service_name is None or state.service_name == service_name
+            },
+            "stats": dict(self.stats)
+        }
@@ -97,15 +97,19 @@ class ApiRouting:
                     error="No service instances available"
                 )
             
-            # Route request to selected service
-            processing_time = time.time() - start_time
+            # Route request to selected service (in-flight count and latency feed instance selection)
+            instance = load_balancing_response.service_instance
+            forward_start = time.time()
+            forwarded = False
+            load_balancing.begin_request(instance.id)
+            try:
+                response_data = await self._forward_request(request, instance)
+                forwarded = True
+            finally:
+                load_balancing.complete_request(instance.id, latency=time.time() - forward_start, success=forwarded)
             
-            # Mock response (in real implementation, this would forward the request)
-            response_data = {
-                "message": "Request processed successfully",
-                "service_instance": load_balancing_response.service_instance.id,
-                "processing_time": processing_time
-            }
+            processing_time = time.time() - start_time
+            response_data["processing_time"] = processing_time
             
             self.service.traffic_metrics["successful_requests"] += 1
             
@@ -127,7 +131,7 @@ class ApiRouting:
                 success=True,
                 status_code=200,
                 body=response_data,
-                service_instance=load_balancing_response.service_instance,
+                service_instance=instance,
                 processing_time=processing_time
             )
             
@@ -149,6 +153,14 @@ class ApiRouting:
                 error=str(e)
             )
     
+    async def _forward_request(self, request: APIGatewayRequest, instance) -> Dict[str, Any]:
+        """Forward the request to the selected service instance."""
+        # Mock response (in real implementation, this would forward the request)
+        return {
+            "message": "Request processed successfully",
+            "service_instance": instance.id
+        }
+    
     async def get_api_routes(self) -> List[Dict[str, Any]]:
         """Get available API routes."""
         return [
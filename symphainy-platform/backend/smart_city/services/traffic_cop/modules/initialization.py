@@ -29,6 +29,11 @@ class Initialization:
             self.service.state_management_abstraction = self.service.get_state_management_abstraction()
             self.service.messaging_abstraction = self.service.get_messaging_abstraction()
             self.service.file_management_abstraction = self.service.get_file_management_abstraction()
+            # Shared rate limiter engine (optional - rate_limiting module falls back to in-process)
+            try:
+                self.service.rate_limiter = self.service.get_infrastructure_abstraction("rate_limiting")
+            except Exception:
+                self.service.rate_limiter = None
             # Analytics abstraction doesn't exist - skip it (optional)
             try:
                 self.service.analytics_abstraction = self.service.get_infrastructure_abstraction("analytics")
@@ -141,6 +146,11 @@ class Initialization:
             self.service.service_instances = {}
             self.service.load_balancing_counters = {}
             
+            # Background health prober (in-memory health/latency table for load balancing)
+            from backend.smart_city.services.traffic_cop.instance_health_prober import InstanceHealthProber
+            self.service.instance_health_prober = InstanceHealthProber(httpx_module=self.service.httpx)
+            await self.service.instance_health_prober.start()
+            
             # Initialize rate limiting
             self.service.rate_limit_counters = {}
             
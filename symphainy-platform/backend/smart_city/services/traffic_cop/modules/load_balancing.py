@@ -3,6 +3,9 @@
 Load Balancing Module - Traffic Cop Service
 
 Handles service instance selection and load balancing strategies.
+
+Health- and load-aware strategies read the instance health table kept up to date by the
+background InstanceHealthProber, so a selection is O(1) with no network or Redis I/O.
 """
 
 import random
@@ -12,6 +15,7 @@ from backend.smart_city.protocols.traffic_cop_service_protocol import (
     LoadBalancingRequest, LoadBalancingResponse, LoadBalancingStrategy,
     ServiceInstance
 )
+from backend.smart_city.services.traffic_cop.instance_health_prober import InstanceHealthProber
 
 
 class LoadBalancing:
@@ -21,6 +25,14 @@ class LoadBalancing:
         """Initialize with service instance."""
         self.service = service_instance
     
+    def _get_prober(self) -> InstanceHealthProber:
+        """Health table shared by all module instances (lives on the service)."""
+        prober = getattr(self.service, "instance_health_prober", None)
+        if prober is None:
+            prober = InstanceHealthProber(httpx_module=getattr(self.service, "httpx", None))
+            self.service.instance_health_prober = prober
+        return prober
+    
     async def select_service(self, request: LoadBalancingRequest, user_context: Optional[Dict[str, Any]] = None) -> LoadBalancingResponse:
         """Select service instance using load balancing strategy."""
         service_name = request.service_name
@@ -142,23 +154,11 @@ class LoadBalancing:
         return selected_instance
     
     async def _least_connections_selection(self, instances: List[ServiceInstance]) -> ServiceInstance:
-        """Least connections selection algorithm."""
+        """Least connections selection algorithm (power-of-two-choices over in-flight requests)."""
         if not instances:
             return None
         
-        # Get connection counts from Redis via messaging abstraction
-        min_connections = float('inf')
-        selected_instance = None
-        
-        for instance in instances:
-            connection_key = f"load_balancer:connections:{instance.id}"
-            connections = await self.service.messaging_abstraction.get_data(connection_key) or 0
-            
-            if connections < min_connections:
-                min_connections = connections
-                selected_instance = instance
-        
-        return selected_instance or instances[0]
+        return self._get_prober().select(instances)
     
     async def _weighted_selection(self, instances: List[ServiceInstance]) -> ServiceInstance:
         """Weighted selection algorithm."""
@@ -180,21 +180,11 @@ class LoadBalancing:
         return instances[-1]
     
     async def _health_based_selection(self, instances: List[ServiceInstance]) -> ServiceInstance:
-        """Health-based selection algorithm."""
+        """Health-based selection algorithm (power-of-two-choices, skipping ejected instances)."""
         if not instances:
             return None
         
-        # Check health of instances
-        best_health_score = -1
-        selected_instance = None
-        
-        for instance in instances:
-            health_score = await self._check_instance_health(instance)
-            if health_score > best_health_score:
-                best_health_score = health_score
-                selected_instance = instance
-        
-        return selected_instance or instances[0]
+        return self._get_prober().select(instances)
     
     async def _random_selection(self, instances: List[ServiceInstance]) -> ServiceInstance:
         """Random selection algorithm."""
@@ -204,25 +194,18 @@ class LoadBalancing:
         return random.choice(instances)
     
     async def _check_instance_health(self, instance: ServiceInstance) -> int:
-        """Check health of a specific instance."""
-        try:
-            if not instance.health_check_url:
-                return 100  # Assume healthy if no health check URL
-            
-            # Use httpx for health check
-            if self.service.httpx:
-                async with self.service.httpx.AsyncClient() as client:
-                    response = await client.get(instance.health_check_url, timeout=5.0)
-                    if response.status_code == 200:
-                        return 100
-                    else:
-                        return 0
-            
-            return 50  # Default health score
-            
-        except Exception as e:
-            self.service._log("error", f"Health check failed for {instance.id}: {e}")
-            return 0
+        """Health score of a specific instance from the prober's table (no I/O)."""
+        if not instance.health_check_url and not self._get_prober().get_state(instance.id):
+            return 100  # Assume healthy if no health check URL
+        return self._get_prober().health_score(instance.id)
+    
+    def begin_request(self, instance_id: str):
+        """Report a request forwarded to an instance (in-flight count for selection)."""
+        self._get_prober().begin_request(instance_id)
+    
+    def complete_request(self, instance_id: str, latency: Optional[float] = None, success: bool = True):
+        """Report the outcome of a forwarded request (latency and passive failure detection)."""
+        self._get_prober().end_request(instance_id, latency, success)
     
     async def register_service_instance(self, service_name: str, instance: ServiceInstance, user_context: Optional[Dict[str, Any]] = None) -> bool:
         """Register a new service instance."""
@@ -248,6 +231,7 @@ class LoadBalancing:
                 self.service.load_balancing_counters[service_name] = 0
             
             self.service.service_instances[service_name].append(instance)
+            self._get_prober().add_instance(service_name, instance)
             
             # Store in Redis via messaging abstraction
             if self.service.messaging_abstraction:
@@ -302,6 +286,7 @@ class LoadBalancing:
                     inst for inst in self.service.service_instances[service_name] 
                     if inst.id != instance_id
                 ]
+                self._get_prober().remove_instance(service_name, instance_id)
                 
                 # Update Redis
                 service_key = f"load_balancer:services:{service_name}"
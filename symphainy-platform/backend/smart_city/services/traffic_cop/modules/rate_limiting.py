@@ -3,13 +3,20 @@
 Rate Limiting Module - Traffic Cop Service
 
 Handles rate limiting checks and resets.
+
+Decisions come from the shared GCRA limiter engine (Public Works "rate_limiting"), the same
+engine the HTTP rate limiting middleware uses: one atomic Redis round trip per decision for
+both the per-minute and per-hour limits, so the configured limits hold across all workers.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime, timedelta
 from backend.smart_city.protocols.traffic_cop_service_protocol import (
     RateLimitRequest, RateLimitResponse, RateLimitType
 )
+from foundations.public_works_foundation.infrastructure_adapters.rate_limiting_adapter import (
+    GCRARateLimiter, InMemoryGCRABackend, RateLimit
+)
 
 
 class RateLimiting:
@@ -18,6 +25,35 @@ class RateLimiting:
     def __init__(self, service_instance):
         """Initialize with service instance."""
         self.service = service_instance
+        self._local_limiter = None
+    
+    def _get_limiter(self) -> GCRARateLimiter:
+        """Shared engine, or an in-process one if Public Works did not provide it."""
+        limiter = getattr(self.service, "rate_limiter", None)
+        if limiter is not None:
+            return limiter
+        if self._local_limiter is None:
+            self.service._log("warning", "⚠️ Shared rate limiter not available - limits are enforced per process")
+            self._local_limiter = GCRARateLimiter(InMemoryGCRABackend())
+        return self._local_limiter
+    
+    @staticmethod
+    def _get_key(limit_type: RateLimitType, user_id: Optional[str] = None,
+                 api_endpoint: Optional[str] = None, ip_address: Optional[str] = None) -> str:
+        if limit_type == RateLimitType.PER_USER:
+            return f"rate_limit:user:{user_id}"
+        elif limit_type == RateLimitType.PER_API:
+            return f"rate_limit:api:{api_endpoint}"
+        elif limit_type == RateLimitType.PER_IP:
+            return f"rate_limit:ip:{ip_address}"
+        return "rate_limit:global"
+    
+    @staticmethod
+    def _get_limits(key: str, request: RateLimitRequest) -> List[RateLimit]:
+        return [
+            RateLimit(f"{key}:minute", request.requests_per_minute, 60),
+            RateLimit(f"{key}:hour", request.requests_per_hour, 3600)
+        ]
     
     async def check_rate_limit(self, request: RateLimitRequest, user_context: Optional[Dict[str, Any]] = None) -> RateLimitResponse:
         """Check if request is within rate limits."""
@@ -30,51 +66,39 @@ class RateLimiting:
         
         try:
             # Generate rate limit key
-            if request.limit_type == RateLimitType.PER_USER:
-                key = f"rate_limit:user:{request.user_id}"
-            elif request.limit_type == RateLimitType.PER_API:
-                key = f"rate_limit:api:{request.api_endpoint}"
-            elif request.limit_type == RateLimitType.PER_IP:
-                key = f"rate_limit:ip:{request.ip_address}"
-            else:  # GLOBAL
-                key = "rate_limit:global"
+            key = self._get_key(request.limit_type, request.user_id, request.api_endpoint, request.ip_address)
             
-            # Get current count from Redis
-            current_count = await self.service.messaging_abstraction.get_data(key) or 0 if self.service.messaging_abstraction else 0
+            # Check and record in one atomic decision (per-minute and per-hour limits together)
+            decision = await self._get_limiter().check(self._get_limits(key, request))
             
-            # Check limits
-            if current_count >= request.requests_per_minute:
+            if not decision.allowed:
                 await self.service.record_health_metric("rate_limit_exceeded", 1.0, {"limit_type": request.limit_type.value})
                 await self.service.log_operation_with_telemetry("check_rate_limit_complete", success=False, details={"limit_type": request.limit_type.value, "reason": "exceeded"})
                 return RateLimitResponse(
                     allowed=False,
                     remaining_requests=0,
-                    reset_time=(datetime.utcnow() + timedelta(minutes=1)).isoformat(),
+                    reset_time=(datetime.utcnow() + timedelta(seconds=decision.retry_after)).isoformat(),
                     limit_type=request.limit_type.value
                 )
             
-            # Increment counter
-            if self.service.messaging_abstraction:
-                await self.service.messaging_abstraction.increment_counter(key, 60)  # 60 second TTL
-            
             # Record health metric
             await self.service.record_health_metric(
                 "rate_limit_checked",
                 1.0,
-                {"limit_type": request.limit_type.value, "remaining": request.requests_per_minute - current_count - 1}
+                {"limit_type": request.limit_type.value, "remaining": decision.remaining}
             )
             
             # End telemetry tracking
             await self.service.log_operation_with_telemetry(
                 "check_rate_limit_complete",
                 success=True,
-                details={"limit_type": request.limit_type.value, "remaining": request.requests_per_minute - current_count - 1}
+                details={"limit_type": request.limit_type.value, "remaining": decision.remaining, "source": decision.source}
             )
             
             return RateLimitResponse(
                 allowed=True,
-                remaining_requests=request.requests_per_minute - current_count - 1,
-                reset_time=(datetime.utcnow() + timedelta(minutes=1)).isoformat(),
+                remaining_requests=decision.remaining,
+                reset_time=(datetime.utcnow() + timedelta(seconds=decision.reset_after)).isoformat(),
                 limit_type=request.limit_type.value
             )
             
@@ -113,12 +137,11 @@ class RateLimiting:
                         return False
             
             if api_endpoint:
-                key = f"rate_limit:api:{api_endpoint}"
+                key = self._get_key(RateLimitType.PER_API, api_endpoint=api_endpoint)
             else:
-                key = f"rate_limit:user:{user_id}"
+                key = self._get_key(RateLimitType.PER_USER, user_id=user_id)
             
-            if self.service.messaging_abstraction:
-                await self.service.messaging_abstraction.delete_data(key)
+            await self._get_limiter().reset([f"{key}:minute", f"{key}:hour"])
             
             # Record health metric
             await self.service.record_health_metric(
@@ -68,7 +68,9 @@ class TrafficCopService(SmartCityRoleBase, TrafficCopServiceProtocol):
         # Traffic Cop specific state
         self.service_instances: Dict[str, List[Any]] = {}
         self.load_balancing_counters: Dict[str, int] = {}
+        self.instance_health_prober = None  # Background health/latency table for load balancing
         self.rate_limit_counters: Dict[str, Dict[str, Any]] = {}
+        self.rate_limiter = None  # Shared GCRA engine (Public Works "rate_limiting")
         self.api_routes: Dict[str, Dict[str, Any]] = {}
         # WebSocket connections now stored in Redis via connection_registry (removed in-memory dict for horizontal scaling)
         self.websocket_connection_registry = None
@@ -207,6 +209,12 @@ class TrafficCopService(SmartCityRoleBase, TrafficCopServiceProtocol):
             
             return False
     
+    async def shutdown(self) -> bool:
+        """Stop background health probing, then shut down the Smart City role."""
+        if self.instance_health_prober:
+            await self.instance_health_prober.shutdown()
+        return await super().shutdown()
+    
     # ============================================================================
     # LOAD BALANCING METHODS - Delegate to load_balancing module
     # ============================================================================
@@ -26,6 +26,7 @@ from typing import Dict, Any, Optional, List, Callable
 sys.path.insert(0, os.path.abspath('../../../../../../'))
 
 from bases.orchestrator_base import OrchestratorBase
+from foundations.public_works_foundation.infrastructure_adapters.upload_stream import UploadTooLargeError
 
 
 class ContentSolutionOrchestratorService(OrchestratorBase):
@@ -347,6 +348,8 @@ class ContentSolutionOrchestratorService(OrchestratorBase):
             
             return result
             
+        except UploadTooLargeError:
+            raise
         except Exception as e:
             self.logger.error(f"❌ Content upload failed: {e}")
             await self._realm_service.handle_error_with_audit(e, "orchestrate_content_upload")
@@ -27,6 +27,7 @@ from typing import Dict, Any, Optional, List, Callable
 sys.path.insert(0, os.path.abspath('../../../../../../'))
 
 from bases.orchestrator_base import OrchestratorBase
+from foundations.public_works_foundation.infrastructure_adapters.upload_stream import UploadTooLargeError
 
 
 class DataSolutionOrchestratorService(OrchestratorBase):
@@ -1203,6 +1204,8 @@ class DataSolutionOrchestratorService(OrchestratorBase):
             
             return result
             
+        except UploadTooLargeError:
+            raise
         except Exception as e:
             self.logger.error(f"❌ Data ingestion failed: {e}")
             import traceback
@@ -2122,6 +2125,8 @@ class DataSolutionOrchestratorService(OrchestratorBase):
                     "available_paths": ["mash", "ingest", "parse", "embed", "expose"]
                 }
                 
+        except UploadTooLargeError:
+            raise
         except Exception as e:
             # Error handling with audit
             await self._realm_service.handle_error_with_audit(
@@ -38,6 +38,13 @@ class WALOperationsDashboardService(RealmServiceBase):
         # Will be initialized in initialize()
         self.data_steward = None
         self.saga_wal_agent = None
+        
+        # Triage reads one bounded WAL page, newest first (most recent hour)
+        self.triage_window = timedelta(hours=1)
+        self.triage_page_size = 500
+        
+        # Dashboard counts cover the last day; replay status covers the whole retention window
+        self.counts_window = timedelta(hours=24)
     
     async def initialize(self) -> bool:
         """
@@ -201,33 +208,12 @@ class WALOperationsDashboardService(RealmServiceBase):
                 "timestamp": datetime.utcnow().isoformat()
             }
             
-            # Get WAL entries from Data Steward (if available)
+            # Get pre-aggregated WAL counters from Data Steward (if available)
             if self.data_steward:
                 try:
-                    # Get recent WAL entries (last 24 hours)
-                    from_timestamp = datetime.utcnow() - timedelta(days=1)
-                    to_timestamp = datetime.utcnow()
-                    
-                    filters = {}
-                    if namespace:
-                        filters["namespace"] = namespace
-                    
-                    wal_entries = await self.data_steward.replay_log(
-                        namespace=namespace or "all",
-                        from_timestamp=from_timestamp,
-                        to_timestamp=to_timestamp,
-                        filters=filters,
-                        user_context=user_context
-                    )
-                    
-                    # Categorize WAL entries
-                    for entry in wal_entries:
-                        status = entry.get("status", "pending")
-                        dashboard_data["wal_entries"][status] = dashboard_data["wal_entries"].get(status, 0) + 1
-                        dashboard_data["wal_entries"]["total"] += 1
-                    
+                    dashboard_data["wal_entries"].update(await self._get_wal_counts(namespace, user_context))
                 except Exception as e:
-                    self.logger.warning(f"⚠️ Could not get WAL entries: {e}")
+                    self.logger.warning(f"⚠️ Could not get WAL counters: {e}")
             
             # Get agent triage insights
             if self.saga_wal_agent:
@@ -236,17 +222,7 @@ class WALOperationsDashboardService(RealmServiceBase):
                     wal_entries_for_triage = []
                     if self.data_steward:
                         try:
-                            from_timestamp = datetime.utcnow() - timedelta(hours=1)
-                            to_timestamp = datetime.utcnow()
-                            
-                            wal_entries = await self.data_steward.replay_log(
-                                namespace=namespace or "all",
-                                from_timestamp=from_timestamp,
-                                to_timestamp=to_timestamp,
-                                filters={},
-                                user_context=user_context
-                            )
-                            wal_entries_for_triage = wal_entries
+                            wal_entries_for_triage = await self._get_triage_entries(namespace, user_context)
                         except Exception:
                             pass
                     
@@ -322,16 +298,7 @@ class WALOperationsDashboardService(RealmServiceBase):
             # Get recent WAL entries
             wal_entries = []
             if self.data_steward:
-                from_timestamp = datetime.utcnow() - timedelta(hours=1)
-                to_timestamp = datetime.utcnow()
-                
-                wal_entries = await self.data_steward.replay_log(
-                    namespace=namespace or "all",
-                    from_timestamp=from_timestamp,
-                    to_timestamp=to_timestamp,
-                    filters={},
-                    user_context=user_context
-                )
+                wal_entries = await self._get_triage_entries(namespace, user_context)
             
             triage_result = await self.saga_wal_agent.triage_wal_entries(
                 wal_entries=wal_entries,
@@ -358,26 +325,17 @@ class WALOperationsDashboardService(RealmServiceBase):
             }
         
         try:
-            # Get recent WAL entries to determine replay status
-            from_timestamp = datetime.utcnow() - timedelta(days=1)
-            to_timestamp = datetime.utcnow()
-            
-            wal_entries = await self.data_steward.replay_log(
-                namespace=namespace or "all",
-                from_timestamp=from_timestamp,
-                to_timestamp=to_timestamp,
-                filters={},
-                user_context=user_context
-            )
+            # Entries available for replay = everything inside the WAL retention window
+            result = await self._read_wal_counters(namespace, user_context)
+            counts = self._sum_wal_counts(result)
             
             return {
                 "success": True,
                 "replay_status": {
-                    "entries_available": len(wal_entries),
-                    "time_range": {
-                        "from": from_timestamp.isoformat(),
-                        "to": to_timestamp.isoformat()
-                    },
+                    "entries_available": counts["total"],
+                    "pending": counts["pending"],
+                    "retrying": counts["retrying"],
+                    "time_range": result.get("time_range", {"from": None, "to": None}),
                     "namespace": namespace or "all"
                 }
             }
@@ -401,6 +359,52 @@ class WALOperationsDashboardService(RealmServiceBase):
             }
         return dashboard_result
     
+    async def _get_wal_counts(
+        self,
+        namespace: Optional[str],
+        user_context: Optional[Dict[str, Any]]
+    ) -> Dict[str, int]:
+        """Sum Data Steward's hourly WAL counters over the last day (O(namespaces x hours), not O(entries))."""
+        since = datetime.utcnow() - self.counts_window
+        return self._sum_wal_counts(await self._read_wal_counters(namespace, user_context, since))
+    
+    async def _read_wal_counters(
+        self,
+        namespace: Optional[str],
+        user_context: Optional[Dict[str, Any]],
+        since: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        result = await self.data_steward.get_wal_counters(namespace=namespace, user_context=user_context, since=since)
+        if not result.get("success"):
+            raise Exception(result.get("error", "WAL counters unavailable"))
+        return result
+    
+    @staticmethod
+    def _sum_wal_counts(result: Dict[str, Any]) -> Dict[str, int]:
+        counts = {"pending": 0, "completed": 0, "failed": 0, "retrying": 0, "total": 0}
+        for namespace_counts in result.get("counters", {}).values():
+            for status, count in namespace_counts.items():
+                counts[status] = counts.get(status, 0) + count
+        return counts
+    
+    async def _get_triage_entries(
+        self,
+        namespace: Optional[str],
+        user_context: Optional[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Read one bounded page of the most recent WAL entries (newest first) for agent triage."""
+        to_timestamp = datetime.utcnow()
+        page = await self.data_steward.replay_log_page(
+            namespace=namespace,
+            from_timestamp=to_timestamp - self.triage_window,
+            to_timestamp=to_timestamp,
+            filters={},
+            page_size=self.triage_page_size,
+            user_context=user_context,
+            descending=True
+        )
+        return page.get("entries", [])
+    
     # ========================================================================
     # HEALTH & METADATA
     # ========================================================================
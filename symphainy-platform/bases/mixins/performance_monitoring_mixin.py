@@ -111,12 +111,13 @@ class PerformanceMonitoringMixin:
             metrics["max_duration"] = max(metrics["max_duration"], duration)
             metrics["last_execution"] = datetime.utcnow().isoformat()
             
-            # Send telemetry (async)
+            # Send telemetry (aggregated in process, exported by the telemetry flush task)
             tags = {k: str(v) for k, v in (metadata or {}).items() if isinstance(v, (str, int, float, bool))}
             await self.telemetry.record_metric(
                 f"operation.{operation}.duration",
                 duration,
-                tags
+                tags,
+                metric_type="histogram"
             )
             
         except Exception as e:
@@ -479,7 +479,7 @@ class EnvironmentLoader:
             "cache_redis_url": self.config_manager.get("LLM_CACHE_REDIS_URL", "redis://localhost:6379/1"),
             
             # Rate Limiting
-            "rate_limit_enabled": self.config_manager.get_bool("LLM_RATE_LIMIT_ENABLED", True),
+            "rate_limit_enabled": self.config_manager.get_bool("LLM_RATE_LIMIT_ENABLED", False),
             "rate_limit_requests_per_minute": self.config_manager.get_int("LLM_RATE_LIMIT_REQUESTS_PER_MINUTE", 60),
             "rate_limit_requests_per_hour": self.config_manager.get_int("LLM_RATE_LIMIT_REQUESTS_PER_HOUR", 1000),
             "rate_limit_tokens_per_minute": self.config_manager.get_int("LLM_RATE_LIMIT_TOKENS_PER_MINUTE", 100000),
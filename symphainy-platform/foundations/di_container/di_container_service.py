@@ -397,6 +397,17 @@ class DIContainerService:
             "docs_url": "/docs",
             "redoc_url": "/redoc"
         }
+    
+    # ============================================================================
+    # LIFECYCLE METHODS
+    # ============================================================================
+    
+    async def shutdown(self):
+        """Stop the telemetry flush task and export the metrics aggregated so far."""
+        telemetry = getattr(self, "telemetry", None)
+        if telemetry is not None:
+            await telemetry.shutdown()
+        self._logger.info("✅ DI Container shutdown complete")
 
 
 # ============================================================================
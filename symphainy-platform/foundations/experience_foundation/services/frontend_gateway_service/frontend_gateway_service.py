@@ -26,6 +26,7 @@ from pathlib import Path
 sys.path.insert(0, os.path.abspath('../../../../'))
 
 from bases.realm_service_base import RealmServiceBase
+from foundations.public_works_foundation.infrastructure_adapters.upload_stream import UploadTooLargeError
 
 
 class APIEndpointType(Enum):
@@ -700,6 +701,8 @@ class FrontendGatewayService(RealmServiceBase):
                                         kwargs = dict(request_body) if isinstance(request_body, dict) else {}
                                         kwargs["user_id"] = user_id or "anonymous"
                                         return await handler_method(**kwargs)
+                                except UploadTooLargeError:
+                                    raise
                                 except Exception as e:
                                     self.logger.error(f"❌ Handler {handler_method_name} execution failed: {e}", exc_info=True)
                                     return {"success": False, "error": str(e)}
@@ -1706,6 +1709,8 @@ class FrontendGatewayService(RealmServiceBase):
             # Return response body
             return response_context.body
             
+        except UploadTooLargeError:
+            raise
         except Exception as e:
             self.logger.error(f"❌ Discovered routing failed: {e}", exc_info=True)
             return {"success": False, "error": str(e), "routing_method": "discovered"}
@@ -1982,6 +1987,10 @@ class FrontendGatewayService(RealmServiceBase):
                 "message": f"No route found for: {endpoint}"
             }
             
+        except UploadTooLargeError:
+            # The pillar router answers 413 for this
+            await self.log_operation_with_telemetry("route_frontend_request_complete", success=False)
+            raise
         except Exception as e:
             # Use enhanced error handling with audit
             await self.handle_error_with_audit(e, "route_frontend_request")
@@ -3054,6 +3063,8 @@ class FrontendGatewayService(RealmServiceBase):
             
             return result
             
+        except UploadTooLargeError:
+            raise
         except Exception as e:
             # Log error without exc_info to avoid LogRecord conflict with TraceContextFormatter
             # The exception details are already in the message
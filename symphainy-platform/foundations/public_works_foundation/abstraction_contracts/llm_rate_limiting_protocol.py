@@ -17,6 +17,7 @@ class RateLimitRequest:
     user_id: str
     model: str
     estimated_tokens: int = 0
+    tenant_id: Optional[str] = None
 
 
 @dataclass
@@ -53,6 +54,18 @@ class LLMRateLimitingProtocol(Protocol):
         """Check if request is within rate limits."""
         ...
     
+    async def wait_for_capacity(self, request: RateLimitRequest, max_wait: float = None) -> RateLimitResponse:
+        """Reserve capacity, waiting up to max_wait seconds for it to become available."""
+        ...
+    
+    async def reconcile_usage(self, request: RateLimitRequest, actual_tokens: int) -> bool:
+        """Correct a reservation's estimated tokens with the provider-reported usage."""
+        ...
+    
+    async def release_reservation(self, request: RateLimitRequest) -> bool:
+        """Give back a reservation whose call failed (the request and its estimated tokens)."""
+        ...
+    
     async def get_rate_limit_status(self, user_id: str, model: str) -> Dict[str, Any]:
         """Get current rate limit status for user and model."""
         ...
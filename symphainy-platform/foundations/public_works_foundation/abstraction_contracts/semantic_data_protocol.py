@@ -58,6 +58,25 @@ class SemanticDataProtocol(Protocol):
         """
         ...
     
+    async def delete_semantic_embeddings(
+        self,
+        content_id: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        user_context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Delete semantic embeddings.
+        
+        Args:
+            content_id: Optional content metadata ID
+            filters: Optional filters (file_id, parsed_file_id, column_name, etc.)
+            user_context: Optional user context for tenant_id
+        
+        Returns:
+            Deletion result with count of deleted embeddings
+        """
+        ...
+    
     async def query_by_semantic_id(
         self,
         semantic_id: str,
@@ -80,7 +99,8 @@ class SemanticDataProtocol(Protocol):
         query_embedding: List[float],
         limit: int = 10,
         filters: Optional[Dict[str, Any]] = None,
-        user_context: Optional[Dict[str, Any]] = None
+        user_context: Optional[Dict[str, Any]] = None,
+        embedding_fields: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """
         Vector similarity search.
@@ -90,6 +110,7 @@ class SemanticDataProtocol(Protocol):
             limit: Maximum number of results
             filters: Optional filters (content_id, file_id, column_name, etc.)
             user_context: Optional user context for tenant_id
+            embedding_fields: Optional vector fields to search (default: all)
         
         Returns:
             List of matching embedding dictionaries with similarity scores
@@ -12,10 +12,11 @@ HOW (Infrastructure Implementation): I implement business rules for file managem
 import logging
 import hashlib
 import uuid
-from typing import Dict, Any, List, Optional
+from typing import AsyncIterator, Dict, Any, List, Optional
 from datetime import datetime
 
 from ..abstraction_contracts.file_management_protocol import FileManagementProtocol
+from ..infrastructure_adapters.upload_stream import UploadStream, UploadTooLargeError
 
 logger = logging.getLogger(__name__)
 
@@ -80,6 +81,7 @@ class FileManagementAbstraction:
             # Store file in GCS first
             blob_name = None
             file_size = 0
+            content_hash = None
             if "file_content" in file_data:
                 blob_name = f"files/{file_uuid}"
                 file_size = len(file_data["file_content"])
@@ -101,19 +103,36 @@ class FileManagementAbstraction:
                     }
                     content_type = mime_map.get(content_type.lower(), "application/octet-stream")
                 
-                gcs_success = await self.gcs_adapter.upload_file(
-                    blob_name=blob_name,
-                    file_data=file_data["file_content"],
-                    content_type=content_type,
-                    metadata={
-                        "user_id": file_data["user_id"],
-                        "ui_name": file_data["ui_name"],
-                        "file_type": file_data["file_type"]  # Keep for business logic, but filter in adapter
-                    }
-                )
+                gcs_metadata = {
+                    "user_id": file_data["user_id"],
+                    "ui_name": file_data["ui_name"],
+                    "file_type": file_data["file_type"]  # Keep for business logic, but filter in adapter
+                }
                 
-                if not gcs_success:
-                    raise Exception(f"Failed to upload file to GCS: {blob_name}")
+                if isinstance(file_data["file_content"], UploadStream):
+                    # Streamed upload: chunks go straight to storage, size and hash are taken on the way
+                    stream_result = await self.gcs_adapter.upload_stream(
+                        blob_name=blob_name,
+                        stream=file_data["file_content"],
+                        content_type=content_type,
+                        metadata=gcs_metadata
+                    )
+                    if not stream_result.get("success"):
+                        if stream_result.get("error") == "upload_too_large":
+                            raise UploadTooLargeError(stream_result["size"], stream_result["max_bytes"])
+                        raise Exception(f"Failed to upload file to GCS: {blob_name} ({stream_result.get('error')})")
+                    file_size = stream_result["size"]
+                    content_hash = stream_result["sha256"]
+                else:
+                    gcs_success = await self.gcs_adapter.upload_file(
+                        blob_name=blob_name,
+                        file_data=file_data["file_content"],
+                        content_type=content_type,
+                        metadata=gcs_metadata
+                    )
+                    
+                    if not gcs_success:
+                        raise Exception(f"Failed to upload file to GCS: {blob_name}")
             
             # Prepare metadata for Supabase (matching schema)
             supabase_metadata = {
@@ -133,6 +152,7 @@ class FileManagementAbstraction:
                     "gcs_blob_name": blob_name,
                     "gcs_bucket": self.gcs_adapter.bucket_name if blob_name else None,
                     "storage_type": "gcs",
+                    **({"content_sha256": content_hash} if content_hash else {}),
                     **(file_data.get("metadata", {}) or {})
                 },
                 "created_at": datetime.utcnow().isoformat(),
@@ -150,6 +170,63 @@ class FileManagementAbstraction:
             self.logger.error(f"❌ Failed to create file: {e}")
             raise  # Re-raise for service layer to handle
     
+    # ============================================================================
+    # RANGED AND STREAMING READS
+    # ============================================================================
+    
+    async def read_file_range(self, blob_name: str, start: int, end: Optional[int] = None) -> Optional[bytes]:
+        """Read bytes [start, end) of a stored object without downloading the rest (negative start counts from the end)."""
+        content = await self.gcs_adapter.read_range(blob_name, start, end)
+        if content is None:
+            self.logger.warning(f"⚠️ Failed to read range {start}-{end} of {blob_name}")
+        return content
+    
+    async def stream_file(self, blob_name: str, chunk_size: int = 8 * 1024 * 1024) -> AsyncIterator[bytes]:
+        """Stream a stored object in chunks, holding at most one chunk in memory."""
+        async for chunk in self.gcs_adapter.stream_file(blob_name, chunk_size=chunk_size):
+            yield chunk
+    
+    async def read_parquet_metadata(self, blob_name: str) -> Optional[Dict[str, Any]]:
+        """Read schema, row and row group counts of a stored Parquet file from its footer (None if not Parquet)."""
+        metadata = await self.gcs_adapter.read_parquet_metadata(blob_name)
+        if metadata is None:
+            self.logger.warning(f"⚠️ Not a readable Parquet file: {blob_name}")
+        return metadata
+    
+    async def read_parquet(self, blob_name: str, columns: Optional[List[str]] = None,
+                           max_rows: Optional[int] = None, metadata: Optional[Dict[str, Any]] = None):
+        """
+        Read a stored Parquet file as a pyarrow Table, fetching only the needed columns and row groups.
+        
+        Args:
+            blob_name: Storage path of the Parquet file
+            columns: Column names to read (None = all)
+            max_rows: Read only the leading row groups covering this many rows (None = all rows)
+            metadata: Footer metadata from read_parquet_metadata(), to avoid reading the footer twice
+        
+        Returns:
+            pyarrow.Table (at most max_rows rows), or None on failure
+        """
+        row_groups = None
+        if max_rows is not None:
+            metadata = metadata or await self.read_parquet_metadata(blob_name)
+            if metadata is None:
+                return None
+            row_groups, covered = [], 0
+            for index, group_rows in enumerate(metadata["row_group_rows"]):
+                if covered >= max_rows:
+                    break
+                row_groups.append(index)
+                covered += group_rows
+        
+        table = await self.gcs_adapter.read_parquet(blob_name, columns=columns, row_groups=row_groups)
+        if table is None:
+            self.logger.warning(f"⚠️ Failed to read Parquet file: {blob_name}")
+            return None
+        if max_rows is not None and table.num_rows > max_rows:
+            table = table.slice(0, max_rows)
+        return table
+    
     async def get_file(self, file_uuid: str) -> Optional[Dict[str, Any]]:
         """Get file with business logic validation from GCS + Supabase."""
         try:
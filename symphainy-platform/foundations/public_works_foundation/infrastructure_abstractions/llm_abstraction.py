@@ -11,11 +11,14 @@ HOW (Infrastructure Implementation): I coordinate multiple LLM providers and han
 
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+import dataclasses
 import json
 import logging
 import asyncio
 
 from ..abstraction_contracts.llm_protocol import LLMProtocol, LLMRequest, LLMResponse, LLMModel
+from ..abstraction_contracts.llm_caching_protocol import CacheRequest, CacheResponse
+from .llm_caching_abstraction import build_cache_key
 from ..infrastructure_adapters.openai_adapter import OpenAIAdapter
 from ..infrastructure_adapters.anthropic_adapter import AnthropicAdapter
 # Ollama adapter has been moved to archive - not part of current platform scope
@@ -81,6 +84,14 @@ class LLMAbstraction:
         # Ensure timeout is a float (config might return string)
         self.timeout = float(timeout_raw) if timeout_raw is not None else 120.0
         self.rate_limiting_abstraction = kwargs.get("rate_limiting_abstraction", None)
+        self.rate_limit_max_wait = float(kwargs.get("rate_limit_max_wait", 30.0))
+        
+        # Response cache + single-flight for deterministic requests
+        # (temperature 0, or request.metadata["cache"] = True; metadata["cache"] = False opts out)
+        self.caching_abstraction = kwargs.get("caching_abstraction", None)
+        self.cache_ttl = kwargs.get("cache_ttl", None)
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self.cache_stats = {"hits": 0, "misses": 0, "coalesced": 0, "bypassed": 0, "stores": 0}
         
         # Load configuration from DI container if available
         if di_container and hasattr(di_container, 'get_config'):
@@ -151,6 +162,182 @@ class LLMAbstraction:
                                 retry_config: Optional[Dict[str, Any]] = None,
                                 timeout: Optional[float] = None) -> LLMResponse:
         """
+        Generate LLM response, serving deterministic requests from the response cache.
+        
+        Deterministic requests are looked up by a hash of the normalized prompt, model and
+        parameters before dispatch; concurrent identical requests share one provider call.
+        Everything else goes straight to the provider.
+        
+        Args:
+            request: LLM request
+            retry_config: Optional retry configuration (overrides instance defaults)
+            timeout: Optional timeout in seconds (overrides instance default)
+            
+        Returns:
+            LLMResponse: LLM response (metadata["cached"] / ["coalesced"] mark shared results)
+        """
+        if not self._is_cacheable(request):
+            self.cache_stats["bypassed"] += 1
+            return await self._generate_uncached(request, retry_config, timeout)
+        
+        cache_request = self._to_cache_request(request)
+        cache_key = build_cache_key(cache_request)
+        
+        # Join an identical in-flight request instead of dispatching again
+        while cache_key in self._in_flight:
+            in_flight = self._in_flight[cache_key]
+            try:
+                response = await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                if in_flight.cancelled():
+                    continue  # The leading caller was cancelled: take over
+                raise
+            self.cache_stats["coalesced"] += 1
+            return self._share_response(response, coalesced=True)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[cache_key] = future
+        try:
+            response = await self._lookup_cached_response(request, cache_request)
+            if response is None:
+                response = await self._generate_uncached(request, retry_config, timeout)
+                await self._store_cached_response(cache_request, response)
+            future.set_result(response)
+            return response
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved: followers (if any) re-raise it themselves
+            raise
+        finally:
+            self._in_flight.pop(cache_key, None)
+    
+    def _is_cacheable(self, request: LLMRequest) -> bool:
+        """Deterministic, non-streaming requests are cacheable unless the caller opts out."""
+        cache_flag = request.metadata.get("cache") if request.metadata else None
+        if cache_flag is False or request.stream:
+            return False
+        return cache_flag is True or request.temperature == 0
+    
+    def _to_cache_request(self, request: LLMRequest) -> CacheRequest:
+        """Cache request over everything that changes the provider's answer."""
+        return CacheRequest(
+            prompt=json.dumps(request.messages, sort_keys=True, ensure_ascii=False),
+            model=request.model.value if request.model else self.default_model.value,
+            temperature=request.temperature if request.temperature is not None else self.temperature,
+            max_tokens=request.max_tokens or self.max_tokens
+        )
+    
+    async def _lookup_cached_response(self, request: LLMRequest, cache_request: CacheRequest) -> Optional[LLMResponse]:
+        """Return the cached response, or None on a miss (cache failures count as misses)."""
+        if not self.caching_abstraction:
+            self.cache_stats["misses"] += 1
+            return None
+        try:
+            cached = await self.caching_abstraction.get_cached_response(cache_request)
+        except Exception as e:
+            self.logger.warning(f"⚠️ LLM response cache lookup failed (treating as miss): {e}")
+            cached = None
+        if cached is None:
+            self.cache_stats["misses"] += 1
+            return None
+        self.cache_stats["hits"] += 1
+        return LLMResponse(
+            response_id=cached.response_id,
+            model=request.model or self.default_model,
+            content=cached.content,
+            usage=cached.usage,
+            finish_reason="stop",
+            metadata={"cached": True}
+        )
+    
+    async def _store_cached_response(self, cache_request: CacheRequest, response: LLMResponse):
+        """Store a provider response (best effort)."""
+        if not self.caching_abstraction:
+            return
+        try:
+            stored = await self.caching_abstraction.store_response(cache_request, CacheResponse(
+                response_id=response.response_id or "",
+                content=response.content,
+                model=cache_request.model,
+                usage=response.usage,
+                timestamp=datetime.now()
+            ), self.cache_ttl)
+            if stored:
+                self.cache_stats["stores"] += 1
+        except Exception as e:
+            self.logger.warning(f"⚠️ Failed to store LLM response in cache: {e}")
+    
+    @staticmethod
+    def _share_response(response: LLMResponse, coalesced: bool = False) -> LLMResponse:
+        """Copy of a shared response so callers cannot mutate each other's metadata."""
+        metadata = dict(response.metadata or {})
+        if coalesced:
+            metadata["coalesced"] = True
+        return dataclasses.replace(response, usage=dict(response.usage or {}), metadata=metadata)
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Response cache hit/miss/coalesced counters."""
+        lookups = self.cache_stats["hits"] + self.cache_stats["misses"]
+        return {
+            **self.cache_stats,
+            "in_flight": len(self._in_flight),
+            "hit_rate": self.cache_stats["hits"] / lookups if lookups else 0.0,
+            "cache_enabled": self.caching_abstraction is not None
+        }
+    
+    async def _reserve_rate_limit(self, request: LLMRequest):
+        """Reserve the request and its estimated tokens; limiter failures are non-critical."""
+        try:
+            from ..abstraction_contracts.llm_rate_limiting_protocol import RateLimitRequest
+            metadata = request.metadata or {}
+            
+            # Estimate tokens (rough estimate: 4 chars per token); reconciled after the call
+            estimated_tokens = sum(len(msg.get("content", "")) for msg in request.messages) // 4
+            
+            rate_limit_request = RateLimitRequest(
+                user_id=metadata.get("user_id", "default"),
+                tenant_id=metadata.get("tenant_id"),
+                model=request.model.value if request.model else self.default_model.value,
+                estimated_tokens=estimated_tokens
+            )
+            if hasattr(self.rate_limiting_abstraction, "wait_for_capacity"):
+                response = await self.rate_limiting_abstraction.wait_for_capacity(
+                    rate_limit_request, max_wait=metadata.get("rate_limit_max_wait", self.rate_limit_max_wait)
+                )
+            else:
+                response = await self.rate_limiting_abstraction.check_rate_limit(rate_limit_request)
+            return (rate_limit_request if response.allowed else None), response
+        except Exception as e:
+            # If rate limiting check fails, log but continue (non-critical)
+            self.logger.warning(f"⚠️ Rate limiting check failed (non-critical): {e}")
+            return None, None
+    
+    async def _reconcile_rate_limit(self, rate_limit_request, usage: Dict[str, Any]):
+        """Replace the estimate with provider-reported usage (best effort)."""
+        actual_tokens = (usage or {}).get("total_tokens")
+        if actual_tokens is None or not hasattr(self.rate_limiting_abstraction, "reconcile_usage"):
+            return
+        try:
+            await self.rate_limiting_abstraction.reconcile_usage(rate_limit_request, actual_tokens)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Failed to reconcile LLM token usage: {e}")
+    
+    async def _release_rate_limit(self, rate_limit_request):
+        """Refund a reservation whose call failed (best effort)."""
+        if not hasattr(self.rate_limiting_abstraction, "release_reservation"):
+            return
+        try:
+            await self.rate_limiting_abstraction.release_reservation(rate_limit_request)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Failed to release LLM rate limit reservation: {e}")
+    
+    async def _generate_uncached(self, request: LLMRequest, 
+                                 retry_config: Optional[Dict[str, Any]] = None,
+                                 timeout: Optional[float] = None) -> LLMResponse:
+        """
         Generate LLM response with retry logic, timeout handling, and rate limiting.
         
         Args:
@@ -179,125 +366,117 @@ class LLMAbstraction:
             "model": request.model.value if request.model else self.default_model.value,
             "messages": request.messages,
             "max_tokens": request.max_tokens or self.max_tokens,
-            "temperature": request.temperature or self.temperature,
+            "temperature": request.temperature if request.temperature is not None else self.temperature,
             "stream": request.stream or False
         }
         
-        # Rate limiting check (if enabled)
+        # Rate limiting: reserve capacity (waiting for it if needed) before dispatch
+        rate_limit_request = None
         if self.rate_limiting_abstraction:
-            try:
-                from ..abstraction_contracts.llm_rate_limiting_protocol import RateLimitRequest
-                user_id = request.metadata.get("user_id", "default") if request.metadata else "default"
-                model_name = request.model.value if request.model else self.default_model.value
-                
-                # Estimate tokens (rough estimate: 4 chars per token)
-                estimated_tokens = sum(len(msg.get("content", "")) for msg in request.messages) // 4
-                
-                rate_limit_request = RateLimitRequest(
-                    user_id=user_id,
-                    model=model_name,
-                    estimated_tokens=estimated_tokens
+            rate_limit_request, rate_limit_response = await self._reserve_rate_limit(request)
+            if rate_limit_response is not None and not rate_limit_response.allowed:
+                self.logger.warning(
+                    f"⚠️ Rate limit exceeded: {rate_limit_response.reason}. "
+                    f"Retry after {rate_limit_response.retry_after}s"
+                )
+                raise RuntimeError(
+                    f"Rate limit exceeded: {rate_limit_response.reason}. "
+                    f"Retry after {rate_limit_response.retry_after}s"
                 )
-                
-                rate_limit_response = await self.rate_limiting_abstraction.check_rate_limit(rate_limit_request)
-                
-                if not rate_limit_response.allowed:
-                    self.logger.warning(
-                        f"⚠️ Rate limit exceeded: {rate_limit_response.reason}. "
-                        f"Retry after {rate_limit_response.retry_after}s"
-                    )
-                    raise RuntimeError(
-                        f"Rate limit exceeded: {rate_limit_response.reason}. "
-                        f"Retry after {rate_limit_response.retry_after}s"
-                    )
-            except Exception as e:
-                # If rate limiting check fails, log but continue (non-critical)
-                self.logger.debug(f"Rate limiting check failed (non-critical): {e}")
         
-        # Retry logic with exponential backoff
-        last_exception = None
-        for attempt in range(max_retries if retry_enabled else 1):
-            try:
-                # Generate response with timeout
-                async def _call_adapter():
-                    response = await adapter.generate_completion(adapter_request)
+        try:
+            # Retry logic with exponential backoff
+            last_exception = None
+            for attempt in range(max_retries if retry_enabled else 1):
+                try:
+                    # Generate response with timeout
+                    async def _call_adapter():
+                        response = await adapter.generate_completion(adapter_request)
                     
-                    # Check for adapter errors
-                    if "error" in response:
-                        error_msg = response.get("error", "Unknown error")
-                        self.logger.error(f"❌ Adapter returned error: {error_msg}")
-                        raise RuntimeError(f"LLM adapter error: {error_msg}")
+                        # Check for adapter errors
+                        if "error" in response:
+                            error_msg = response.get("error", "Unknown error")
+                            self.logger.error(f"❌ Adapter returned error: {error_msg}")
+                            raise RuntimeError(f"LLM adapter error: {error_msg}")
                     
-                    return response
+                        return response
                 
-                # Apply timeout
-                try:
-                    response = await asyncio.wait_for(_call_adapter(), timeout=timeout_value)
-                except asyncio.TimeoutError:
-                    raise TimeoutError(f"LLM request timed out after {timeout_value}s")
+                    # Apply timeout
+                    try:
+                        response = await asyncio.wait_for(_call_adapter(), timeout=timeout_value)
+                    except asyncio.TimeoutError:
+                        raise TimeoutError(f"LLM request timed out after {timeout_value}s")
                 
-                # Create LLM response
-                kwargs = {
-                    "response_id": response.get("id"),
-                    "model": request.model or self.default_model,
-                    "content": response.get("choices", [{}])[0].get("message", {}).get("content", ""),
-                    "usage": response.get("usage", {}),
-                    "finish_reason": response.get("choices", [{}])[0].get("finish_reason")
-                }
-                if response.get("metadata"):
-                    kwargs["metadata"] = response.get("metadata")
-                llm_response = LLMResponse(**kwargs)
+                    # Create LLM response
+                    kwargs = {
+                        "response_id": response.get("id"),
+                        "model": request.model or self.default_model,
+                        "content": response.get("choices", [{}])[0].get("message", {}).get("content", ""),
+                        "usage": response.get("usage", {}),
+                        "finish_reason": response.get("choices", [{}])[0].get("finish_reason")
+                    }
+                    if response.get("metadata"):
+                        kwargs["metadata"] = response.get("metadata")
+                    llm_response = LLMResponse(**kwargs)
                 
-                self.logger.info(f"✅ LLM response generated for model {llm_response.model.value}")
-                return llm_response
+                    if rate_limit_request is not None:
+                        await self._reconcile_rate_limit(rate_limit_request, llm_response.usage)
                 
-            except (TimeoutError, ConnectionError) as e:
-                # Retryable errors
-                last_exception = e
-                if retry_enabled and attempt < max_retries - 1:
-                    delay = retry_base_delay * (2 ** attempt)  # Exponential backoff
-                    self.logger.warning(
-                        f"⚠️ LLM request failed (attempt {attempt + 1}/{max_retries}): {e}. "
-                        f"Retrying in {delay}s..."
-                    )
-                    await asyncio.sleep(delay)
-                    continue
-                else:
-                    # Max retries exceeded or retry disabled
-                    self.logger.error(f"❌ LLM request failed after {attempt + 1} attempts: {e}")
-                    raise
-                    
-            except (ValueError, RuntimeError) as e:
-                # Check if it's a rate limit error (retryable)
-                error_str = str(e).lower()
-                if "rate limit" in error_str or "429" in error_str:
-                    # Rate limit error - retryable
+                    self.logger.info(f"✅ LLM response generated for model {llm_response.model.value}")
+                    return llm_response
+                
+                except (TimeoutError, ConnectionError) as e:
+                    # Retryable errors
                     last_exception = e
                     if retry_enabled and attempt < max_retries - 1:
                         delay = retry_base_delay * (2 ** attempt)  # Exponential backoff
                         self.logger.warning(
-                            f"⚠️ Rate limit hit (attempt {attempt + 1}/{max_retries}). "
+                            f"⚠️ LLM request failed (attempt {attempt + 1}/{max_retries}): {e}. "
                             f"Retrying in {delay}s..."
                         )
                         await asyncio.sleep(delay)
                         continue
                     else:
-                        self.logger.error(f"❌ Rate limit exceeded after {attempt + 1} attempts: {e}")
+                        # Max retries exceeded or retry disabled
+                        self.logger.error(f"❌ LLM request failed after {attempt + 1} attempts: {e}")
                         raise
-                else:
-                    # Non-retryable errors (authentication, invalid request, etc.)
-                    self.logger.error(f"❌ Non-retryable error: {e}")
-                    raise
                     
-            except Exception as e:
-                # Unknown errors - don't retry by default
-                self.logger.error(f"❌ Unexpected error in LLM request: {e}")
-                raise
+                except (ValueError, RuntimeError) as e:
+                    # Check if it's a rate limit error (retryable)
+                    error_str = str(e).lower()
+                    if "rate limit" in error_str or "429" in error_str:
+                        # Rate limit error - retryable
+                        last_exception = e
+                        if retry_enabled and attempt < max_retries - 1:
+                            delay = retry_base_delay * (2 ** attempt)  # Exponential backoff
+                            self.logger.warning(
+                                f"⚠️ Rate limit hit (attempt {attempt + 1}/{max_retries}). "
+                                f"Retrying in {delay}s..."
+                            )
+                            await asyncio.sleep(delay)
+                            continue
+                        else:
+                            self.logger.error(f"❌ Rate limit exceeded after {attempt + 1} attempts: {e}")
+                            raise
+                    else:
+                        # Non-retryable errors (authentication, invalid request, etc.)
+                        self.logger.error(f"❌ Non-retryable error: {e}")
+                        raise
+                    
+                except Exception as e:
+                    # Unknown errors - don't retry by default
+                    self.logger.error(f"❌ Unexpected error in LLM request: {e}")
+                    raise
         
-        # If we get here, all retries failed
-        if last_exception:
-            raise last_exception
-        raise RuntimeError("LLM request failed for unknown reason")
+            # If we get here, all retries failed
+            if last_exception:
+                raise last_exception
+            raise RuntimeError("LLM request failed for unknown reason")
+        except BaseException:
+            # The provider call failed (or was cancelled) - give the reserved capacity back
+            if rate_limit_request is not None:
+                await self._release_rate_limit(rate_limit_request)
+            raise
 
         """
         Generate embeddings for text.
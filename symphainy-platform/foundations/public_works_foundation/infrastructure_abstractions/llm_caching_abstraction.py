@@ -11,6 +11,7 @@ from datetime import datetime, timedelta
 import logging
 import hashlib
 import json
+import unicodedata
 import uuid
 
 from ..abstraction_contracts.llm_caching_protocol import (
@@ -18,6 +19,26 @@ from ..abstraction_contracts.llm_caching_protocol import (
 )
 from ..infrastructure_adapters.cache_adapter import CacheAdapter
 
+
+def normalize_prompt(prompt: str) -> str:
+    """NFC-normalize, unify line endings and strip trailing whitespace (content is otherwise preserved)."""
+    text = unicodedata.normalize("NFC", prompt).replace("\r\n", "\n").replace("\r", "\n")
+    return "\n".join(line.rstrip() for line in text.strip().split("\n"))
+
+
+def build_cache_key(request: CacheRequest, prefix: str = "llm_cache") -> str:
+    """Deterministic key over the normalized prompt, model and generation parameters."""
+    key_data = {
+        "prompt": normalize_prompt(request.prompt),
+        "model": request.model,
+        "temperature": float(request.temperature) if request.temperature is not None else None,
+        "max_tokens": request.max_tokens,
+        "parameters": request.parameters or {}
+    }
+    key_string = json.dumps(key_data, sort_keys=True, separators=(",", ":"), default=str)
+    return f"{prefix}:{hashlib.sha256(key_string.encode()).hexdigest()}"
+
+
 class LLMCachingAbstraction(LLMCachingProtocol):
     """LLM caching abstraction using cache adapter."""
     
@@ -63,27 +84,14 @@ class LLMCachingAbstraction(LLMCachingProtocol):
         except Exception as e:
             self.logger.error(f"Failed to initialize LLM caching abstraction: {e}")
             raise  # Re-raise for service layer to handle
-
+    
+    def _generate_cache_key(self, request: CacheRequest) -> str:
         """Generate cache key for request."""
         try:
-            # Create hash of request parameters
-            key_data = {
-                "prompt": request.prompt,
-                "model": request.model,
-                "temperature": request.temperature,
-                "max_tokens": request.max_tokens,
-                "parameters": request.parameters or {}
-            }
-            
-            key_string = json.dumps(key_data, sort_keys=True)
-            key_hash = hashlib.sha256(key_string.encode()).hexdigest()
-            
-            return f"{self.cache_prefix}:{key_hash}"
+            return build_cache_key(request, self.cache_prefix)
             
         except Exception as e:
             self.logger.error(f"Failed to generate cache key: {e}")
-            # Fallback to simple hash
-    
             raise  # Re-raise for service layer to handle
     
     async def get_cached_response(self, request: CacheRequest) -> Optional[CacheResponse]:
@@ -134,7 +142,8 @@ class LLMCachingAbstraction(LLMCachingProtocol):
         except Exception as e:
             self.logger.error(f"Failed to get cached response: {e}")
             raise  # Re-raise for service layer to handle
-
+    
+    async def cache_response(self, request: CacheRequest, response: CacheResponse, ttl: int = None) -> bool:
         """
         Cache response for future use.
         
@@ -146,6 +155,8 @@ class LLMCachingAbstraction(LLMCachingProtocol):
         Returns:
             bool: Success status
         """
+        return await self.store_response(request, response, ttl)
+    
     async def store_response(self, request: CacheRequest, response: CacheResponse, ttl: int = None) -> bool:
         """Store response in cache."""
         try:
@@ -176,7 +187,8 @@ class LLMCachingAbstraction(LLMCachingProtocol):
         except Exception as e:
             self.logger.error(f"Failed to cache response: {e}")
             raise  # Re-raise for service layer to handle
-
+    
+    def _is_cache_valid(self, cached_data: Dict[str, Any]) -> bool:
         """Check if cached data is still valid."""
         try:
             timestamp = datetime.fromisoformat(cached_data["timestamp"])
@@ -188,7 +200,8 @@ class LLMCachingAbstraction(LLMCachingProtocol):
         except Exception as e:
             self.logger.error(f"Failed to validate cache entry: {e}")
             raise  # Re-raise for service layer to handle
-
+    
+    async def invalidate_cache(self, request: CacheRequest) -> bool:
         """
         Invalidate cache entry for request.
         
@@ -210,7 +223,8 @@ class LLMCachingAbstraction(LLMCachingProtocol):
         except Exception as e:
             self.logger.error(f"Failed to invalidate cache: {e}")
             raise  # Re-raise for service layer to handle
-
+    
+    async def clear_cache(self) -> bool:
         """
         Clear all cache entries.
         
@@ -236,7 +250,8 @@ class LLMCachingAbstraction(LLMCachingProtocol):
         except Exception as e:
             self.logger.error(f"Failed to clear cache: {e}")
             raise  # Re-raise for service layer to handle
-
+    
+    async def get_cache_stats(self) -> CacheStats:
         """
         Get cache statistics.
         
@@ -263,7 +278,8 @@ class LLMCachingAbstraction(LLMCachingProtocol):
         except Exception as e:
             self.logger.error(f"Failed to get cache stats: {e}")
             raise  # Re-raise for service layer to handle
-
+    
+    async def health_check(self) -> Dict[str, Any]:
         """
         Perform health check.
         
@@ -4,17 +4,27 @@ LLM Rate Limiting Abstraction
 
 Infrastructure abstraction for LLM request rate limiting.
 Implements LLMRateLimitingProtocol using RateLimitingAdapter.
+
+Limits are token buckets per tenant/user/model: requests and tokens, each per minute and per
+hour. check_rate_limit reserves one request and the estimated tokens from all four buckets in
+one atomic step; reconcile_usage then corrects the token buckets with the provider-reported
+usage, so estimate errors do not accumulate.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 from datetime import datetime
+import asyncio
+import math
 import time
 import logging
 
 from ..abstraction_contracts.llm_rate_limiting_protocol import (
     LLMRateLimitingProtocol, RateLimitRequest, RateLimitResponse, RateLimitStats
 )
-from ..infrastructure_adapters.rate_limiting_adapter import RateLimitingAdapter
+from ..infrastructure_adapters.rate_limiting_adapter import RateLimitingAdapter, TokenBucket
+
+WINDOW_SECONDS = {"minute": 60, "hour": 3600}
+
 
 class LLMRateLimitingAbstraction(LLMRateLimitingProtocol):
     """LLM rate limiting abstraction using rate limiting adapter."""
@@ -43,13 +53,20 @@ class LLMRateLimitingAbstraction(LLMRateLimitingProtocol):
         self.tokens_per_minute = kwargs.get("tokens_per_minute", 100000)
         self.tokens_per_hour = kwargs.get("tokens_per_hour", 1000000)
         self.enabled = kwargs.get("enabled", True)
+        self.default_max_wait = kwargs.get("max_wait", 30.0)
+        self.key_prefix = kwargs.get("key_prefix", "llm_rate_limit")
         
         # Rate limiting statistics
         self.stats = {
             "total_requests": 0,
             "allowed_requests": 0,
             "blocked_requests": 0,
-            "rate_limit_hits": 0
+            "rate_limit_hits": 0,
+            "waits": 0,
+            "reconciliations": 0,
+            "tokens_refunded": 0,
+            "tokens_charged": 0,
+            "released_reservations": 0
         }
         
         # Initialize abstraction
@@ -59,28 +76,68 @@ class LLMRateLimitingAbstraction(LLMRateLimitingProtocol):
         """Initialize the LLM rate limiting abstraction."""
         try:
             self.logger.info("✅ LLM rate limiting abstraction initialized")
-            
+        
         except Exception as e:
             self.logger.error(f"Failed to initialize LLM rate limiting abstraction: {e}")
             raise  # Re-raise for service layer to handle
-
-        """Generate rate limiting key for request."""
-        return f"rate_limit:requests:{user_id}:{model}:{window}"
     
-    def _get_token_key(self, user_id: str, model: str, window: str) -> str:
+    def _scope(self, user_id: str, model: str, tenant_id: Optional[str] = None) -> str:
+        # Hash tag keeps one scope's buckets in one Redis Cluster slot (multi-key script)
+        return f"{self.key_prefix}:{{{tenant_id or 'default'}:{user_id}:{model}}}"
+    
+    def _get_request_key(self, user_id: str, model: str, window: str, tenant_id: Optional[str] = None) -> str:
+        """Generate rate limiting key for requests."""
+        return f"{self._scope(user_id, model, tenant_id)}:requests:{window}"
+    
+    def _get_token_key(self, user_id: str, model: str, window: str, tenant_id: Optional[str] = None) -> str:
         """Generate rate limiting key for tokens."""
-        return f"rate_limit:tokens:{user_id}:{model}:{window}"
+        return f"{self._scope(user_id, model, tenant_id)}:tokens:{window}"
+    
+    def _request_buckets(self, user_id: str, model: str, tenant_id: Optional[str] = None,
+                         cost: float = 0) -> List[TokenBucket]:
+        limits = {"minute": self.requests_per_minute, "hour": self.requests_per_hour}
+        return [
+            TokenBucket(self._get_request_key(user_id, model, window, tenant_id), limit,
+                        limit / WINDOW_SECONDS[window], cost)
+            for window, limit in limits.items()
+        ]
+    
+    def _token_buckets(self, user_id: str, model: str, tenant_id: Optional[str] = None,
+                       cost: float = 0) -> List[TokenBucket]:
+        limits = {"minute": self.tokens_per_minute, "hour": self.tokens_per_hour}
+        return [
+            TokenBucket(self._get_token_key(user_id, model, window, tenant_id), limit,
+                        limit / WINDOW_SECONDS[window], cost)
+            for window, limit in limits.items()
+        ]
+    
+    def _response(self, allowed: bool, reason: str, retry_after: float, levels: List[float]) -> RateLimitResponse:
+        # levels: [requests/minute, requests/hour, tokens/minute, tokens/hour] remaining
+        return RateLimitResponse(
+            allowed=allowed,
+            reason=reason,
+            retry_after=math.ceil(retry_after),
+            current_requests=max(0, int(self.requests_per_minute - levels[0])),
+            current_tokens=max(0, int(self.tokens_per_minute - levels[2])),
+            request_limit=self.requests_per_minute,
+            token_limit=self.tokens_per_minute
+        )
     
     async def check_rate_limit(self, request: RateLimitRequest) -> RateLimitResponse:
         """
-        Check if request is within rate limits.
+        Check rate limits and, if allowed, reserve the request and its estimated tokens.
         
         Args:
             request: Rate limit request
-            
+        
         Returns:
-            RateLimitResponse: Rate limit response
+            RateLimitResponse: Rate limit response (retry_after is when the reservation would fit)
         """
+        response, _ = await self._reserve(request)
+        return response
+    
+    async def _reserve(self, request: RateLimitRequest):
+        """Reserve atomically; returns (response, exact seconds until it would fit)."""
         try:
             if not self.enabled:
                 return RateLimitResponse(
@@ -91,246 +148,195 @@ class LLMRateLimitingAbstraction(LLMRateLimitingProtocol):
                     current_tokens=0,
                     request_limit=self.requests_per_minute,
                     token_limit=self.tokens_per_minute
-                )
+                ), 0.0
             
             self.stats["total_requests"] += 1
             
-            # Check request rate limits
-            request_allowed = await self._check_request_rate_limit(request)
-            if not request_allowed["allowed"]:
-                self.stats["blocked_requests"] += 1
-                self.stats["rate_limit_hits"] += 1
-                return RateLimitResponse(
-                    allowed=False,
-                    reason=request_allowed["reason"],
-                    retry_after=request_allowed["retry_after"],
-                    current_requests=request_allowed["current_requests"],
-                    current_tokens=0,
-                    request_limit=self.requests_per_minute,
-                    token_limit=self.tokens_per_minute
-                )
+            buckets = (self._request_buckets(request.user_id, request.model, request.tenant_id, 1) +
+                       self._token_buckets(request.user_id, request.model, request.tenant_id,
+                                           max(0, request.estimated_tokens)))
+            result = await self.rate_limiting.reserve(buckets)
             
-            # Check token rate limits
-            token_allowed = await self._check_token_rate_limit(request)
-            if not token_allowed["allowed"]:
+            if not result["allowed"]:
                 self.stats["blocked_requests"] += 1
                 self.stats["rate_limit_hits"] += 1
-                return RateLimitResponse(
-                    allowed=False,
-                    reason=token_allowed["reason"],
-                    retry_after=token_allowed["retry_after"],
-                    current_requests=request_allowed["current_requests"],
-                    current_tokens=token_allowed["current_tokens"],
-                    request_limit=self.requests_per_minute,
-                    token_limit=self.tokens_per_minute
-                )
-            
-            # Record the request
-            await self._record_request(request)
+                return self._response(False, self._denial_reason(buckets, result["levels"]),
+                                      result["retry_after"], result["levels"]), result["retry_after"]
             
             self.stats["allowed_requests"] += 1
-            
-            response = RateLimitResponse(
-                allowed=True,
-                reason="within_limits",
-                retry_after=0,
-                current_requests=request_allowed["current_requests"] + 1,
-                current_tokens=token_allowed["current_tokens"] + request.estimated_tokens,
-                request_limit=self.requests_per_minute,
-                token_limit=self.tokens_per_minute
-            )
-            
-            return response
-            
+            return self._response(True, "within_limits", 0, result["levels"]), 0.0
+        
         except Exception as e:
             self.logger.error(f"Failed to check rate limit: {e}")
             raise  # Re-raise for service layer to handle
     
-    async def _check_request_rate_limit(self, request: RateLimitRequest) -> Dict[str, Any]:
-        """Check request rate limits."""
-        try:
-            # Check per-minute limits
-            minute_key = self._get_request_key(request.user_id, request.model, "minute")
-            current_requests = await self.rate_limiting.get_counter(minute_key)
-            
-            if current_requests >= self.requests_per_minute:
-                return {
-                    "allowed": False,
-                    "reason": "request_rate_limit_exceeded",
-                    "retry_after": 60,  # 1 minute
-                    "current_requests": current_requests
-                }
-            
-            # Check per-hour limits
-            hour_key = self._get_request_key(request.user_id, request.model, "hour")
-            current_hourly_requests = await self.rate_limiting.get_counter(hour_key)
-            
-            if current_hourly_requests >= self.requests_per_hour:
-                return {
-                    "allowed": False,
-                    "reason": "hourly_request_rate_limit_exceeded",
-                    "retry_after": 3600,  # 1 hour
-                    "current_requests": current_hourly_requests
-                }
-            
-            return {
-                "allowed": True,
-                "current_requests": current_requests
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Failed to check request rate limit: {e}")
+    @staticmethod
+    def _denial_reason(buckets: List[TokenBucket], levels: List[float]) -> str:
+        reasons = ["request_rate_limit_exceeded", "hourly_request_rate_limit_exceeded",
+                   "token_rate_limit_exceeded", "hourly_token_rate_limit_exceeded"]
+        for bucket, level, reason in zip(buckets, levels, reasons):
+            if min(bucket.cost, bucket.capacity) > level:
+                return reason
+        return "rate_limit_exceeded"
     
-            raise  # Re-raise for service layer to handle
-
-        """Check token rate limits."""
+    async def wait_for_capacity(self, request: RateLimitRequest, max_wait: float = None) -> RateLimitResponse:
+        """
+        Reserve capacity, sleeping until the buckets refill instead of failing immediately.
+        
+        Args:
+            request: Rate limit request
+            max_wait: Maximum seconds to wait (default: configured max_wait)
+        
+        Returns:
+            RateLimitResponse: allowed=True once reserved, or the last denial if the wait
+            needed would exceed max_wait
+        """
+        max_wait = self.default_max_wait if max_wait is None else max_wait
+        deadline = time.monotonic() + max_wait
+        waited = False
+        while True:
+            response, retry_after = await self._reserve(request)
+            if response.allowed:
+                return response
+            
+            # Bucket levels give an exact refill time; re-check then (others may take it first)
+            delay = max(0.01, retry_after)
+            if delay > deadline - time.monotonic():
+                return response
+            if not waited:
+                self.stats["waits"] += 1
+                waited = True
+            await asyncio.sleep(delay)
+    
+    async def reconcile_usage(self, request: RateLimitRequest, actual_tokens: int) -> bool:
+        """
+        Correct the token buckets after the call: refund an overestimate, charge an underestimate.
+        
+        Args:
+            request: The request that was reserved (with its estimated_tokens)
+            actual_tokens: Provider-reported total tokens
+        
+        Returns:
+            bool: Success status
+        """
         try:
-            # Check per-minute token limits
-            minute_key = self._get_token_key(request.user_id, request.model, "minute")
-            current_tokens = await self.rate_limiting.get_counter(minute_key)
-            
-            if current_tokens + request.estimated_tokens > self.tokens_per_minute:
-                return {
-                    "allowed": False,
-                    "reason": "token_rate_limit_exceeded",
-                    "retry_after": 60,  # 1 minute
-                    "current_tokens": current_tokens
-                }
-            
-            # Check per-hour token limits
-            hour_key = self._get_token_key(request.user_id, request.model, "hour")
-            current_hourly_tokens = await self.rate_limiting.get_counter(hour_key)
-            
-            if current_hourly_tokens + request.estimated_tokens > self.tokens_per_hour:
-                return {
-                    "allowed": False,
-                    "reason": "hourly_token_rate_limit_exceeded",
-                    "retry_after": 3600,  # 1 hour
-                    "current_tokens": current_hourly_tokens
-                }
-            
-            return {
-                "allowed": True,
-                "current_tokens": current_tokens
-            }
-            
+            if not self.enabled:
+                return True
+            delta = int(actual_tokens) - max(0, request.estimated_tokens)
+            if delta == 0:
+                return True
+            await self.rate_limiting.adjust(
+                self._token_buckets(request.user_id, request.model, request.tenant_id, delta)
+            )
+            self.stats["reconciliations"] += 1
+            self.stats["tokens_charged" if delta > 0 else "tokens_refunded"] += abs(delta)
+            return True
+        
         except Exception as e:
-            self.logger.error(f"Failed to check token rate limit: {e}")
-    
+            self.logger.error(f"Failed to reconcile usage: {e}")
             raise  # Re-raise for service layer to handle
-
-        """Record request in rate limiting counters."""
+    
+    async def release_reservation(self, request: RateLimitRequest) -> bool:
+        """
+        Refund a reservation whose provider call failed - the request and its estimated tokens.
+        
+        Args:
+            request: The request that was reserved
+        
+        Returns:
+            bool: Success status
+        """
         try:
-            # Record per-minute request
-            minute_request_key = self._get_request_key(request.user_id, request.model, "minute")
-            await self.rate_limiting.increment_counter(minute_request_key, 60)
-            
-            # Record per-hour request
-            hour_request_key = self._get_request_key(request.user_id, request.model, "hour")
-            await self.rate_limiting.increment_counter(hour_request_key, 3600)
-            
-            # Record per-minute tokens
-            minute_token_key = self._get_token_key(request.user_id, request.model, "minute")
-            await self.rate_limiting.increment_counter(minute_token_key, 60)
-            
-            # Record per-hour tokens
-            hour_token_key = self._get_token_key(request.user_id, request.model, "hour")
-            await self.rate_limiting.increment_counter(hour_token_key, 3600)
-            
+            if not self.enabled:
+                return True
+            estimated_tokens = max(0, request.estimated_tokens)
+            await self.rate_limiting.adjust(
+                self._request_buckets(request.user_id, request.model, request.tenant_id, -1) +
+                self._token_buckets(request.user_id, request.model, request.tenant_id, -estimated_tokens)
+            )
+            self.stats["released_reservations"] += 1
+            self.stats["tokens_refunded"] += estimated_tokens
+            return True
+        
         except Exception as e:
-            self.logger.error(f"Failed to record request: {e}")
-    
+            self.logger.error(f"Failed to release reservation: {e}")
             raise  # Re-raise for service layer to handle
-
+    
+    async def get_rate_limit_status(self, user_id: str, model: str, tenant_id: str = None) -> Dict[str, Any]:
         """
         Get current rate limit status for user and model.
         
         Args:
             user_id: User ID
             model: Model name
-            
+            tenant_id: Tenant ID (optional)
+        
         Returns:
             Dict: Rate limit status
         """
         try:
-            # Get current counters
-            minute_request_key = self._get_request_key(user_id, model, "minute")
-            hour_request_key = self._get_request_key(user_id, model, "hour")
-            minute_token_key = self._get_token_key(user_id, model, "minute")
-            hour_token_key = self._get_token_key(user_id, model, "hour")
-            
-            current_minute_requests = await self.rate_limiting.get_counter(minute_request_key)
-            current_hour_requests = await self.rate_limiting.get_counter(hour_request_key)
-            current_minute_tokens = await self.rate_limiting.get_counter(minute_token_key)
-            current_hour_tokens = await self.rate_limiting.get_counter(hour_token_key)
+            levels = await self.rate_limiting.peek(
+                self._request_buckets(user_id, model, tenant_id) + self._token_buckets(user_id, model, tenant_id)
+            )
+            limits = [self.requests_per_minute, self.requests_per_hour, self.tokens_per_minute, self.tokens_per_hour]
+            used = [max(0.0, limit - level) for limit, level in zip(limits, levels)]
             
             status = {
                 "user_id": user_id,
+                "tenant_id": tenant_id,
                 "model": model,
-                "current_minute_requests": current_minute_requests,
+                "current_minute_requests": int(used[0]),
                 "minute_request_limit": self.requests_per_minute,
-                "current_hour_requests": current_hour_requests,
+                "current_hour_requests": int(used[1]),
                 "hour_request_limit": self.requests_per_hour,
-                "current_minute_tokens": current_minute_tokens,
+                "current_minute_tokens": int(used[2]),
                 "minute_token_limit": self.tokens_per_minute,
-                "current_hour_tokens": current_hour_tokens,
+                "current_hour_tokens": int(used[3]),
                 "hour_token_limit": self.tokens_per_hour,
-                "minute_request_usage_percent": (current_minute_requests / self.requests_per_minute) * 100,
-                "hour_request_usage_percent": (current_hour_requests / self.requests_per_hour) * 100,
-                "minute_token_usage_percent": (current_minute_tokens / self.tokens_per_minute) * 100,
-                "hour_token_usage_percent": (current_hour_tokens / self.tokens_per_hour) * 100
+                "minute_request_usage_percent": (used[0] / self.requests_per_minute) * 100,
+                "hour_request_usage_percent": (used[1] / self.requests_per_hour) * 100,
+                "minute_token_usage_percent": (used[2] / self.tokens_per_minute) * 100,
+                "hour_token_usage_percent": (used[3] / self.tokens_per_hour) * 100
             }
             
             return status
-            
+        
         except Exception as e:
             self.logger.error(f"Failed to get rate limit status: {e}")
             raise  # Re-raise for service layer to handle
-
+    
+    async def reset_user_limits(self, user_id: str, model: str = None, tenant_id: str = None) -> bool:
         """
         Reset rate limits for user and model.
         
         Args:
             user_id: User ID
-            model: Model name (None for all models)
-            
+            model: Model name (None for common models)
+            tenant_id: Tenant ID (optional)
+        
         Returns:
             bool: Success status
         """
         try:
-            if model:
-                # Reset specific model
-                keys_to_reset = [
-                    self._get_request_key(user_id, model, "minute"),
-                    self._get_request_key(user_id, model, "hour"),
-                    self._get_token_key(user_id, model, "minute"),
-                    self._get_token_key(user_id, model, "hour")
-                ]
-            else:
-                # Reset all models (would need to enumerate all possible models)
-                # For now, just reset common models
-                common_models = ["gpt-3.5-turbo", "gpt-4", "gpt-4-turbo"]
-                keys_to_reset = []
-                for m in common_models:
-                    keys_to_reset.extend([
-                        self._get_request_key(user_id, m, "minute"),
-                        self._get_request_key(user_id, m, "hour"),
-                        self._get_token_key(user_id, m, "minute"),
-                        self._get_token_key(user_id, m, "hour")
-                    ])
+            models = [model] if model else ["gpt-3.5-turbo", "gpt-4", "gpt-4-turbo", "gpt-4o", "gpt-4o-mini"]
+            keys_to_reset = []
+            for m in models:
+                keys_to_reset.extend(
+                    bucket.key for bucket in
+                    self._request_buckets(user_id, m, tenant_id) + self._token_buckets(user_id, m, tenant_id)
+                )
             
-            # Delete all keys
-            for key in keys_to_reset:
-                await self.rate_limiting.delete_counter(key)
+            await self.rate_limiting.delete_buckets(keys_to_reset)
             
             self.logger.info(f"Rate limits reset for user: {user_id}, model: {model or 'all'}")
             
             return True
-            
+        
         except Exception as e:
             self.logger.error(f"Failed to reset limits for user {user_id}: {e}")
             raise  # Re-raise for service layer to handle
-
+    
+    async def get_rate_limit_stats(self) -> RateLimitStats:
         """
         Get overall rate limiting statistics.
         
@@ -359,11 +365,12 @@ class LLMRateLimitingAbstraction(LLMRateLimitingProtocol):
             )
             
             return stats
-            
+        
         except Exception as e:
             self.logger.error(f"Failed to get rate limit stats: {e}")
             raise  # Re-raise for service layer to handle
-
+    
+    async def health_check(self) -> Dict[str, Any]:
         """
         Perform health check.
         
@@ -387,8 +394,7 @@ class LLMRateLimitingAbstraction(LLMRateLimitingProtocol):
             }
             
             return health_status
-            
+        
         except Exception as e:
             self.logger.error(f"Health check failed: {e}")
-
             raise  # Re-raise for service layer to handle
@@ -205,3 +205,21 @@ class MessagingAbstraction(MessagingProtocol):
         except Exception as e:
             self.logger.error(f"❌ Error cleaning up old messages: {e}")
             raise  # Re-raise for service layer to handle
+    
+    def pubsub(self):
+        """
+        Create a Redis PubSub for channel fan-out (subscribe / listen / unsubscribe).
+        """
+        return self.messaging_adapter.pubsub()
+    
+    async def publish(self, channel: str, payload: str) -> int:
+        """
+        Publish a serialized payload to a pub/sub channel.
+        """
+        try:
+            subscribers = await self.messaging_adapter.publish(channel, payload)
+            self.logger.debug(f"✅ Published to {channel} ({subscribers} subscribers)")
+            return subscribers
+        except Exception as e:
+            self.logger.error(f"❌ Error publishing to {channel}: {e}")
+            raise  # Re-raise for service layer to handle
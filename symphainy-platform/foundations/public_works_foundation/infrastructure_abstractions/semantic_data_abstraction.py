@@ -9,12 +9,15 @@ WHAT (Infrastructure Role): I manage semantic data operations with business logi
 HOW (Infrastructure Implementation): I implement business rules for semantic data storage and retrieval
 """
 
+import asyncio
 import logging
+import time
 import uuid
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime, timedelta
 
 from ..abstraction_contracts.semantic_data_protocol import SemanticDataProtocol
+from ..infrastructure_adapters.vector_index_adapter import VectorIndexAdapter
 
 logger = logging.getLogger(__name__)
 
@@ -26,13 +29,26 @@ class SemanticDataAbstraction(SemanticDataProtocol):
     validation, and enhanced functionality for the platform.
     """
     
-    def __init__(self, arango_adapter, config_adapter, di_container=None):
+    def __init__(self, arango_adapter, config_adapter, di_container=None, vector_index_adapter=None,
+                 vector_refresh_seconds: float = 60):
         """Initialize semantic data abstraction."""
         self.arango_adapter = arango_adapter
         self.config_adapter = config_adapter
         self.di_container = di_container
         self.service_name = "semantic_data_abstraction"
         
+        # In-process vector index (partitioned by tenant, hydrated lazily on first search).
+        # A partition is re-synced from ArangoDB once it is older than vector_refresh_seconds:
+        # documents changed since the partition's cursor are upserted and deleted keys removed,
+        # so other workers' writes, updates and deletes become visible.
+        self.vector_index_adapter = vector_index_adapter or VectorIndexAdapter()
+        self.vector_refresh_seconds = vector_refresh_seconds
+        self.vector_sync_page_size = 1000
+        # Re-read this much before the cursor to tolerate clock skew between workers
+        self.vector_sync_overlap_seconds = 300
+        self._vector_synced_at: Dict[Optional[str], float] = {}
+        self._vector_sync_locks: Dict[Optional[str], asyncio.Lock] = {}
+        
         # Semantic data collections for ArangoDB
         self.structured_embeddings_collection = "structured_embeddings"
         self.semantic_graph_nodes_collection = "semantic_graph_nodes"
@@ -101,6 +117,7 @@ class SemanticDataAbstraction(SemanticDataProtocol):
             
             stored_count = 0
             tenant_id = user_context.get("tenant_id") if user_context else None
+            stored_docs = []
             
             for emb in embeddings:
                 # Get parsed_file_id and embedding_file_id from embedding document if available
@@ -138,11 +155,18 @@ class SemanticDataAbstraction(SemanticDataProtocol):
                     "tenant_id": tenant_id,
                     "created_at": datetime.utcnow().isoformat()
                 }
+                # updated_at drives the incremental vector index sync; writers that modify an
+                # embedding must bump it
+                embedding_doc["updated_at"] = embedding_doc["created_at"]
                 await self.arango_adapter.create_document(
                     self.structured_embeddings_collection,
                     embedding_doc
                 )
                 stored_count += 1
+                stored_docs.append(embedding_doc)
+            
+            # Keep this worker's vector index current (incremental add, no rebuild)
+            await asyncio.to_thread(self.vector_index_adapter.add_documents, tenant_id, stored_docs)
             
             self.logger.info(f"✅ Stored {stored_count} semantic embeddings for content {content_id}")
             
@@ -219,6 +243,53 @@ class SemanticDataAbstraction(SemanticDataProtocol):
             self.logger.error(f"❌ Failed to get semantic embeddings for {content_id}: {e}")
             raise
     
+    async def delete_semantic_embeddings(
+        self,
+        content_id: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        user_context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Delete semantic embeddings and drop them from this worker's vector index.
+        
+        Args:
+            content_id: Optional content metadata ID
+            filters: Optional filters (file_id, parsed_file_id, column_name, etc.)
+            user_context: Optional user context for tenant_id
+        
+        Returns:
+            Deletion result with count of deleted embeddings
+        """
+        try:
+            if content_id is None and not filters:
+                raise ValueError("content_id or filters are required")
+            
+            tenant_id = user_context.get("tenant_id") if user_context else None
+            filter_conditions = dict(filters or {})
+            if content_id is not None:
+                filter_conditions["content_id"] = content_id
+            filter_conditions["tenant_id"] = tenant_id
+            
+            documents = await self.arango_adapter.find_documents(
+                self.structured_embeddings_collection,
+                filter_conditions=filter_conditions
+            )
+            deleted_keys = []
+            for document in documents:
+                if await self.arango_adapter.delete_document(self.structured_embeddings_collection, document["_key"]):
+                    deleted_keys.append(document["_key"])
+            
+            # Other workers drop these keys on their next partition sync
+            await asyncio.to_thread(self.vector_index_adapter.remove_documents, tenant_id, deleted_keys)
+            
+            self.logger.info(f"✅ Deleted {len(deleted_keys)} semantic embeddings ({filter_conditions})")
+            
+            return {"success": True, "deleted_count": len(deleted_keys)}
+            
+        except Exception as e:
+            self.logger.error(f"❌ Failed to delete semantic embeddings for {content_id}: {e}")
+            raise
+    
     async def query_by_semantic_id(
         self,
         semantic_id: str,
@@ -259,52 +330,148 @@ class SemanticDataAbstraction(SemanticDataProtocol):
         query_embedding: List[float],
         limit: int = 10,
         filters: Optional[Dict[str, Any]] = None,
-        user_context: Optional[Dict[str, Any]] = None
+        user_context: Optional[Dict[str, Any]] = None,
+        embedding_fields: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """
         Vector similarity search with business logic validation.
         
+        Searches the tenant's partition of the in-process vector index. The partition is
+        loaded on first use, kept current by store_semantic_embeddings, and re-synced
+        from ArangoDB every vector_refresh_seconds. Scoring runs in a worker thread.
+        
         Args:
             query_embedding: Query vector (embedding)
             limit: Maximum number of results
             filters: Optional filters (content_id, file_id, column_name, etc.)
             user_context: Optional user context for tenant_id
+            embedding_fields: Optional vector fields to search (default: all)
         
         Returns:
             List of matching embedding dictionaries with similarity scores
+            (similarity_score, matched_embedding_field), best first
         """
         try:
             # Validate query embedding
             if not query_embedding or len(query_embedding) == 0:
                 raise ValueError("query_embedding cannot be empty")
             
-            # Build AQL query for vector similarity search
-            # Note: This is a simplified version - actual implementation may use
-            # ArangoDB's vector search capabilities or external vector database
-            filter_conditions = filters or {}
-            
-            # Add tenant filtering if provided
-            if user_context and user_context.get("tenant_id"):
-                filter_conditions["tenant_id"] = user_context.get("tenant_id")
-            
-            # For now, return filtered results (vector similarity will be implemented
-            # when ArangoDB vector search is configured)
-            result = await self.arango_adapter.find_documents(
-                self.structured_embeddings_collection,
-                filter_conditions=filter_conditions,
-                limit=limit
+            tenant_id = user_context.get("tenant_id") if user_context else None
+            await self._ensure_vector_partition(tenant_id)
+            
+            result = await asyncio.to_thread(
+                self.vector_index_adapter.search,
+                tenant_id,
+                query_embedding,
+                limit=limit,
+                filters=filters,
+                embedding_fields=embedding_fields
             )
             
             self.logger.debug(f"✅ Vector search returned {len(result)} results")
             
-            # TODO: Add actual vector similarity calculation when ArangoDB vector search is available
-            
             return result
             
         except Exception as e:
             self.logger.error(f"❌ Failed to perform vector search: {e}")
             raise
     
+    async def save_vector_index_snapshot(self, user_context: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """Persist the tenant's vector index partition to the configured snapshot directory."""
+        tenant_id = user_context.get("tenant_id") if user_context else None
+        return await asyncio.to_thread(self.vector_index_adapter.save_snapshot, tenant_id)
+    
+    async def _ensure_vector_partition(self, tenant_id: Optional[str]):
+        """
+        Make sure a tenant's vector index partition reflects ArangoDB.
+        
+        The first call warm-starts from the tenant's snapshot when one exists (saved at
+        shutdown, together with its sync cursor). Every sync then upserts the documents
+        changed since the cursor and removes indexed keys that no longer exist in ArangoDB.
+        Syncs are skipped while the partition is younger than vector_refresh_seconds.
+        """
+        synced_at = self._vector_synced_at.get(tenant_id)
+        if synced_at is not None and time.monotonic() - synced_at < self.vector_refresh_seconds:
+            return
+        
+        lock = self._vector_sync_locks.setdefault(tenant_id, asyncio.Lock())
+        async with lock:
+            synced_at = self._vector_synced_at.get(tenant_id)
+            if synced_at is not None and time.monotonic() - synced_at < self.vector_refresh_seconds:
+                return
+            
+            if synced_at is None and not self.vector_index_adapter.has_tenant(tenant_id):
+                await asyncio.to_thread(self.vector_index_adapter.load_snapshot, tenant_id)
+            
+            started = time.monotonic()
+            self.vector_index_adapter.ensure_tenant(tenant_id)
+            
+            # Upsert documents changed since the cursor
+            cursor = self.vector_index_adapter.get_sync_cursor(tenant_id)
+            changed, cursor = await self._fetch_changed_embeddings(tenant_id, cursor)
+            indexed = await asyncio.to_thread(self.vector_index_adapter.add_documents, tenant_id, changed)
+            
+            # Remove deleted documents. Keys are taken from the index before ArangoDB is read, so
+            # embeddings stored by this worker in the meantime are not mistaken for deletes.
+            indexed_keys = set(self.vector_index_adapter.document_keys(tenant_id))
+            existing_keys = set(await self.arango_adapter.execute_aql(
+                f"FOR doc IN {self.structured_embeddings_collection} "
+                "FILTER doc.tenant_id == @tenant_id RETURN doc._key",
+                {"tenant_id": tenant_id}
+            ))
+            removed = await asyncio.to_thread(
+                self.vector_index_adapter.remove_documents, tenant_id, list(indexed_keys - existing_keys)
+            )
+            
+            self.vector_index_adapter.set_sync_cursor(tenant_id, cursor)
+            self._vector_synced_at[tenant_id] = started
+            self.logger.info(
+                f"✅ Vector index synced for tenant {tenant_id}: {len(changed)} changed documents, "
+                f"{indexed} vectors indexed, {removed} documents removed"
+            )
+    
+    async def _fetch_changed_embeddings(
+        self,
+        tenant_id: Optional[str],
+        cursor: Optional[str]
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Page through a tenant's embeddings changed at or after the cursor (minus the skew overlap).
+        
+        Returns:
+            (changed documents, new cursor = latest change timestamp seen)
+        """
+        since = ""
+        if cursor:
+            since = (datetime.fromisoformat(cursor) - timedelta(seconds=self.vector_sync_overlap_seconds)).isoformat()
+        
+        query = f"""
+        FOR doc IN {self.structured_embeddings_collection}
+            FILTER doc.tenant_id == @tenant_id
+            LET changed_at = NOT_NULL(doc.updated_at, doc.created_at, "")
+            FILTER changed_at > @after_ts OR (changed_at == @after_ts AND doc._key > @after_key)
+            SORT changed_at, doc._key
+            LIMIT @page_size
+            RETURN doc
+        """
+        changed = []
+        after_ts, after_key = since, ""
+        while True:
+            page = await self.arango_adapter.execute_aql(query, {
+                "tenant_id": tenant_id,
+                "after_ts": after_ts,
+                "after_key": after_key,
+                "page_size": self.vector_sync_page_size
+            })
+            changed.extend(page)
+            if len(page) < self.vector_sync_page_size:
+                break
+            last = page[-1]
+            after_ts, after_key = last.get("updated_at") or last.get("created_at") or "", last["_key"]
+        
+        latest = max((doc.get("updated_at") or doc.get("created_at") or "" for doc in changed), default="")
+        return changed, max(latest, cursor or "") or None
+    
     # ============================================================================
     # SEMANTIC GRAPH OPERATIONS WITH BUSINESS LOGIC
     # ============================================================================
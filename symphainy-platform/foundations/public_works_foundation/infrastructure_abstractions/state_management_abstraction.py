@@ -6,12 +6,15 @@ Implements state management operations across different backends.
 This is Layer 3 of the 5-layer infrastructure architecture.
 
 WHAT (Infrastructure Role): I manage state data storage and retrieval
-HOW (Infrastructure Implementation): I coordinate between ArangoDB and Redis adapters
+HOW (Infrastructure Implementation): I coordinate between ArangoDB and Redis adapters, reading
+through memory -> Redis -> ArangoDB and promoting hits into the faster tiers
 """
 
 import logging
 import json
+import time
 import uuid
+from collections import OrderedDict
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 from foundations.public_works_foundation.abstraction_contracts.state_management_protocol import StateManagementProtocol
@@ -24,6 +27,11 @@ class StateManagementAbstraction(StateManagementProtocol):
     
     Coordinates between ArangoDB (complex state) and Redis (session state)
     based on the Traffic Cop state promotion decisions.
+    
+    Reads go memory -> Redis -> ArangoDB. A hit in a slower tier is promoted into
+    the faster ones as a cached copy with a per-tier TTL. Every stored value carries
+    a version; writes bump it and invalidate the cached copies, and a per-state
+    generation counter stops a read that raced with a write from promoting stale data.
     """
     
     def __init__(self, arango_adapter, redis_adapter, config_adapter, di_container=None):
@@ -45,8 +53,29 @@ class StateManagementAbstraction(StateManagementProtocol):
         self.redis_prefix = "traffic_cop:state:"
         self.memory_states = {}  # In-memory cache
         
+        # Read-through tiers: promoted copies live apart from the backends' own data
+        self.redis_cache_prefix = "traffic_cop:state_cache:"
+        self.tier_ttls = {
+            "memory": self._config_int("STATE_MEMORY_TTL_SECONDS", 30),
+            "redis": self._config_int("STATE_REDIS_TTL_SECONDS", 300)
+        }
+        self.memory_cache_max_entries = self._config_int("STATE_MEMORY_CACHE_MAX_ENTRIES", 10000)
+        self._memory_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self.tier_stats = {tier: {"hits": 0, "misses": 0} for tier in ("memory", "redis", "arango_db")}
+        self.tier_stats["promotions"] = 0
+        self.tier_stats["invalidations"] = 0
+        
         self.logger.info("✅ State Management Abstraction initialized")
     
+    def _config_int(self, key: str, default: int) -> int:
+        if self.config_adapter and hasattr(self.config_adapter, "get_int"):
+            try:
+                return self.config_adapter.get_int(key, default)
+            except Exception:
+                pass
+        return default
+    
     async def store_state(self, 
                          state_id: str,
                          state_data: Dict[str, Any],
@@ -80,14 +109,27 @@ class StateManagementAbstraction(StateManagementProtocol):
             
             if metadata:
                 storage_metadata.update(metadata)
-            
-            # Store in appropriate backend
-            if backend == 'arango_db':
-                result = await self._store_in_arango(state_id, state_data, storage_metadata, ttl_value)
-            elif backend == 'redis':
-                result = await self._store_in_redis(state_id, state_data, storage_metadata, ttl_value)
-            else:  # memory
-                result = await self._store_in_memory(state_id, state_data, storage_metadata, ttl_value)
+            # Overwrites continue the newest stored version (in any backend) instead of restarting at 1
+            stored_versions = await self._stored_versions(state_id)
+            storage_metadata["version"] = max(
+                int(storage_metadata.get("version") or 0), *(version or 0 for version in stored_versions.values())
+            ) + 1
+            
+            # Store in appropriate backend; cached copies are dropped once it holds the new value
+            try:
+                if backend == 'arango_db':
+                    result = await self._store_in_arango(state_id, state_data, storage_metadata, ttl_value)
+                elif backend == 'redis':
+                    result = await self._store_in_redis(state_id, state_data, storage_metadata, ttl_value)
+                else:  # memory
+                    result = await self._store_in_memory(state_id, state_data, storage_metadata, ttl_value)
+                # Reads stop at the first tier holding the state: older values elsewhere must go
+                if result:
+                    await self._drop_from_other_backends(
+                        state_id, [other for other, version in stored_versions.items() if version is not None and other != backend]
+                    )
+            finally:
+                await self._invalidate_cached_copies(state_id)
             
             return result
                 
@@ -131,7 +173,7 @@ class StateManagementAbstraction(StateManagementProtocol):
             }
             
             # Store in Redis
-            success = await self.redis_adapter.set_json(redis_key, redis_data, ttl)
+            success = await self._redis_set_json(redis_key, redis_data, ttl)
             
             if success:
                 self.logger.debug(f"State stored in Redis: {state_id}")
@@ -165,54 +207,49 @@ class StateManagementAbstraction(StateManagementProtocol):
     
     async def retrieve_state(self, state_id: str) -> Optional[Dict[str, Any]]:
         """
-        Retrieve state data from the appropriate backend.
+        Retrieve state data through the tier hierarchy.
         
-        Tries backends in order of persistence:
-        1. ArangoDB (most persistent)
-        2. Redis (session storage)
-        3. Memory (temporary cache)
+        Tries tiers fastest first and promotes hits into the faster tiers:
+        1. Memory (own entries + promoted copies)
+        2. Redis (own entries + promoted copies)
+        3. ArangoDB (most persistent)
         """
         try:
-            # Try ArangoDB first
-            arango_result = await self._retrieve_from_arango(state_id)
-            if arango_result:
-                return arango_result
+            generation = self._generations.get(state_id, 0)
+            
+            # Try memory first
+            memory_result = await self._retrieve_from_memory(state_id)
+            if memory_result is not None:
+                self.tier_stats["memory"]["hits"] += 1
+                return memory_result.get("state_data")
+            self.tier_stats["memory"]["misses"] += 1
             
             # Try Redis second
             redis_result = await self._retrieve_from_redis(state_id)
-            if redis_result:
-                return redis_result
+            if redis_result is not None:
+                self.tier_stats["redis"]["hits"] += 1
+                self._promote_to_memory(state_id, redis_result, generation)
+                return redis_result.get("state_data")
+            self.tier_stats["redis"]["misses"] += 1
             
-            # Try memory last
-            memory_result = await self._retrieve_from_memory(state_id)
-            if memory_result:
-                return memory_result
+            # Try ArangoDB last
+            arango_result = await self._retrieve_from_arango(state_id)
+            if arango_result is not None:
+                self.tier_stats["arango_db"]["hits"] += 1
+                await self._promote_to_redis(state_id, arango_result, generation)
+                self._promote_to_memory(state_id, arango_result, generation)
+                return arango_result.get("state_data")
+            self.tier_stats["arango_db"]["misses"] += 1
             
             self.logger.warning(f"State not found in any backend: {state_id}")
+            return None
             
         except Exception as e:
             self.logger.error(f"❌ Failed to retrieve state {state_id}: {e}")
             raise  # Re-raise for service layer to handle
-        """Retrieve state from ArangoDB."""
-        try:
-            result = await self.arango_adapter.get_document(self.arango_collection, state_id)
-            if result:
-                return result.get('state_data')
-            return None
-        except Exception as e:
-            self.logger.error(f"❌ Error retrieving state from ArangoDB {state_id}: {e}")
-            raise  # Re-raise for service layer to handle
-        """Retrieve state from Redis."""
-        try:
-            redis_key = f"{self.redis_prefix}{state_id}"
-            result = await self.redis_adapter.get_json(redis_key)
-            if result:
-                return result.get('state_data')
-            return None
-        except Exception as e:
-            self.logger.error(f"❌ Error retrieving state from Redis {state_id}: {e}")
-            raise  # Re-raise for service layer to handle
-        """Retrieve state from memory."""
+    
+    async def _retrieve_from_memory(self, state_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieve state entry (state_data, metadata) from memory or the promoted-copy cache."""
         try:
             if state_id in self.memory_states:
                 state_info = self.memory_states[state_id]
@@ -224,12 +261,156 @@ class StateManagementAbstraction(StateManagementProtocol):
                         del self.memory_states[state_id]
                         return None
                 
-                return state_info.get('state_data')
-            return None
+                return state_info
+            
+            cached = self._memory_cache.get(state_id)
+            if cached is None:
+                return None
+            if cached["expires_at"] <= time.monotonic():
+                del self._memory_cache[state_id]
+                return None
+            self._memory_cache.move_to_end(state_id)
+            return cached["entry"]
         except Exception as e:
             self.logger.error(f"❌ Error retrieving state from memory {state_id}: {e}")
             raise  # Re-raise for service layer to handle
     
+    async def _retrieve_from_redis(self, state_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieve state entry from Redis (own key, then promoted copy) in one round trip."""
+        try:
+            own, cached = await self._redis_get_json_many([
+                f"{self.redis_prefix}{state_id}",
+                f"{self.redis_cache_prefix}{state_id}"
+            ])
+            return own or cached
+        except Exception as e:
+            self.logger.error(f"❌ Error retrieving state from Redis {state_id}: {e}")
+            raise  # Re-raise for service layer to handle
+    
+    async def _retrieve_from_arango(self, state_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieve state document from ArangoDB."""
+        try:
+            result = await self.arango_adapter.get_document(self.arango_collection, state_id)
+            if result:
+                return {"state_data": result.get('state_data'), "metadata": result.get('metadata', {})}
+            return None
+        except Exception as e:
+            self.logger.error(f"❌ Error retrieving state from ArangoDB {state_id}: {e}")
+            raise  # Re-raise for service layer to handle
+    
+    # ============================================================================
+    # READ-THROUGH TIERS
+    # ============================================================================
+    
+    @staticmethod
+    def _version_of(entry: Dict[str, Any]) -> int:
+        return int((entry.get("metadata") or {}).get("version") or 0)
+    
+    def _promote_to_memory(self, state_id: str, entry: Dict[str, Any], generation: int):
+        """Cache a copy in process memory unless a write happened since the read started."""
+        if self._generations.get(state_id, 0) != generation:
+            return
+        current = self._memory_cache.get(state_id)
+        if current is not None and self._version_of(current["entry"]) > self._version_of(entry):
+            return
+        self._memory_cache[state_id] = {
+            "entry": {"state_data": entry.get("state_data"), "metadata": entry.get("metadata", {})},
+            "expires_at": time.monotonic() + self.tier_ttls["memory"]
+        }
+        self._memory_cache.move_to_end(state_id)
+        while len(self._memory_cache) > self.memory_cache_max_entries:
+            self._memory_cache.popitem(last=False)
+        self.tier_stats["promotions"] += 1
+    
+    async def _promote_to_redis(self, state_id: str, entry: Dict[str, Any], generation: int):
+        """Cache a copy in Redis (best effort; cross-process staleness is bounded by the Redis tier TTL)."""
+        if self._generations.get(state_id, 0) != generation:
+            return
+        try:
+            copy = {"state_data": entry.get("state_data"), "metadata": entry.get("metadata", {})}
+            if await self._redis_set_json(f"{self.redis_cache_prefix}{state_id}", copy, self.tier_ttls["redis"]):
+                self.tier_stats["promotions"] += 1
+        except Exception as e:
+            self.logger.warning(f"⚠️ Failed to promote state {state_id} to Redis: {e}")
+    
+    async def _stored_versions(self, state_id: str) -> Dict[str, Optional[int]]:
+        """Version of the value each backend currently holds for state_id (None when absent)."""
+        entries = {
+            "memory": self.memory_states.get(state_id),
+            "redis": await self._redis_get_json(f"{self.redis_prefix}{state_id}"),
+            "arango_db": await self._retrieve_from_arango(state_id)
+        }
+        return {backend: self._version_of(entry) if entry else None for backend, entry in entries.items()}
+    
+    async def _drop_from_other_backends(self, state_id: str, backends: List[str]):
+        """Remove a state's older values from backends other than the one just written."""
+        for backend in backends:
+            try:
+                if backend == 'arango_db':
+                    await self.arango_adapter.delete_document(self.arango_collection, state_id)
+                elif backend == 'redis':
+                    await self._redis_delete(f"{self.redis_prefix}{state_id}")
+                else:
+                    self.memory_states.pop(state_id, None)
+            except Exception as e:
+                self.logger.warning(f"⚠️ Failed to drop older copy of state {state_id} from {backend}: {e}")
+    
+    async def _invalidate_cached_copies(self, state_id: str):
+        """
+        Drop promoted copies of a state from every tier and fence in-flight promotions.
+        
+        Called after the backend write: a read that raced with the write either
+        promoted before this point (and is dropped here) or still holds the old
+        generation (and its promotion is skipped).
+        """
+        self._generations[state_id] = self._generations.get(state_id, 0) + 1
+        self._memory_cache.pop(state_id, None)
+        try:
+            await self._redis_delete(f"{self.redis_cache_prefix}{state_id}")
+        except Exception as e:
+            self.logger.warning(f"⚠️ Failed to invalidate Redis copy of state {state_id}: {e}")
+        self.tier_stats["invalidations"] += 1
+    
+    def get_tier_stats(self) -> Dict[str, Any]:
+        """Per-tier hit/miss counts and hit ratios for retrieve_state."""
+        stats = {}
+        for tier in ("memory", "redis", "arango_db"):
+            hits, misses = self.tier_stats[tier]["hits"], self.tier_stats[tier]["misses"]
+            stats[tier] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": hits / (hits + misses) if hits + misses else 0.0
+            }
+        stats["promotions"] = self.tier_stats["promotions"]
+        stats["invalidations"] = self.tier_stats["invalidations"]
+        stats["memory_cache_size"] = len(self._memory_cache)
+        stats["ttls"] = dict(self.tier_ttls)
+        return stats
+    
+    async def _redis_get_json_many(self, keys: List[str]) -> List[Optional[Dict[str, Any]]]:
+        # RedisStateAdapter exposes get_strings, RedisAdapter exposes mget
+        for method in ("get_strings", "mget"):
+            if hasattr(self.redis_adapter, method):
+                raw = await getattr(self.redis_adapter, method)(keys)
+                return [json.loads(value) if value else None for value in raw]
+        return [await self._redis_get_json(key) for key in keys]
+    
+    async def _redis_get_json(self, key: str) -> Optional[Dict[str, Any]]:
+        if hasattr(self.redis_adapter, "get_json"):
+            return await self.redis_adapter.get_json(key)
+        raw = await self.redis_adapter.get(key)
+        return json.loads(raw) if raw else None
+    
+    async def _redis_set_json(self, key: str, data: Dict[str, Any], ttl: int = None) -> bool:
+        if hasattr(self.redis_adapter, "set_json"):
+            return await self.redis_adapter.set_json(key, data, ttl)
+        return await self.redis_adapter.set(key, json.dumps(data), ttl)
+    
+    async def _redis_delete(self, key: str) -> bool:
+        if hasattr(self.redis_adapter, "delete_string"):
+            return await self.redis_adapter.delete_string(key)
+        return await self.redis_adapter.delete(key)
+    
     async def update_state(self,
                           state_id: str,
                           updates: Dict[str, Any],
@@ -240,20 +421,24 @@ class StateManagementAbstraction(StateManagementProtocol):
         Updates the state in the backend where it's stored.
         """
         try:
-            # Try to update in ArangoDB first
-            arango_success = await self._update_in_arango(state_id, updates, metadata)
-            if arango_success:
-                return True
-            
-            # Try to update in Redis
-            redis_success = await self._update_in_redis(state_id, updates, metadata)
-            if redis_success:
-                return True
-            
-            # Try to update in memory
-            memory_success = await self._update_in_memory(state_id, updates, metadata)
-            if memory_success:
-                return True
+            # Cached copies are invalidated after the owning backend is updated
+            try:
+                # Try to update in ArangoDB first
+                arango_success = await self._update_in_arango(state_id, updates, metadata)
+                if arango_success:
+                    return True
+                
+                # Try to update in Redis
+                redis_success = await self._update_in_redis(state_id, updates, metadata)
+                if redis_success:
+                    return True
+                
+                # Try to update in memory
+                memory_success = await self._update_in_memory(state_id, updates, metadata)
+                if memory_success:
+                    return True
+            finally:
+                await self._invalidate_cached_copies(state_id)
             
             self.logger.warning(f"State not found for update: {state_id}")
             return False
@@ -280,6 +465,7 @@ class StateManagementAbstraction(StateManagementProtocol):
             if metadata:
                 updated_metadata.update(metadata)
             updated_metadata['updated_at'] = datetime.utcnow().isoformat()
+            updated_metadata['version'] = int(updated_metadata.get('version') or 0) + 1
             
             # Update document
             updated_doc = {
@@ -301,7 +487,7 @@ class StateManagementAbstraction(StateManagementProtocol):
         """Update state in Redis."""
         try:
             redis_key = f"{self.redis_prefix}{state_id}"
-            existing = await self.redis_adapter.get_json(redis_key)
+            existing = await self._redis_get_json(redis_key)
             if not existing:
                 return False
             
@@ -314,6 +500,7 @@ class StateManagementAbstraction(StateManagementProtocol):
             if metadata:
                 updated_metadata.update(metadata)
             updated_metadata['updated_at'] = datetime.utcnow().isoformat()
+            updated_metadata['version'] = int(updated_metadata.get('version') or 0) + 1
             
             # Update in Redis
             updated_data = {
@@ -322,7 +509,7 @@ class StateManagementAbstraction(StateManagementProtocol):
                 "updated_at": datetime.utcnow().isoformat()
             }
             
-            success = await self.redis_adapter.set_json(redis_key, updated_data)
+            success = await self._redis_set_json(redis_key, updated_data, updated_metadata.get("ttl"))
             if success:
                 self.logger.debug(f"State updated in Redis: {state_id}")
                 return True
@@ -349,6 +536,7 @@ class StateManagementAbstraction(StateManagementProtocol):
             if metadata:
                 updated_metadata.update(metadata)
             updated_metadata['updated_at'] = datetime.utcnow().isoformat()
+            updated_metadata['version'] = int(updated_metadata.get('version') or 0) + 1
             
             # Update in memory
             self.memory_states[state_id] = {
@@ -372,12 +560,15 @@ class StateManagementAbstraction(StateManagementProtocol):
         Deletes from all backends where it might exist.
         """
         try:
-            # Delete from all backends
-            arango_success = await self.arango_adapter.delete_document(self.arango_collection, state_id)
-            redis_success = await self.redis_adapter.delete_string(f"{self.redis_prefix}{state_id}")
-            memory_success = state_id in self.memory_states
-            if memory_success:
-                del self.memory_states[state_id]
+            # Delete from all backends, then their cached copies
+            try:
+                arango_success = await self.arango_adapter.delete_document(self.arango_collection, state_id)
+                redis_success = await self._redis_delete(f"{self.redis_prefix}{state_id}")
+                memory_success = state_id in self.memory_states
+                if memory_success:
+                    del self.memory_states[state_id]
+            finally:
+                await self._invalidate_cached_copies(state_id)
             
             # Return True if deleted from any backend
             success = arango_success or redis_success or memory_success
@@ -393,7 +584,7 @@ class StateManagementAbstraction(StateManagementProtocol):
             raise  # Re-raise for service layer to handle
 
     async def list_states(self, filters: Dict[str, Any] = None,
-                         limit: int = None) -> List[Dict[str, Any]]:
+                         limit: int = None, offset: int = None) -> List[Dict[str, Any]]:
         """
         List states matching the given criteria.
         
@@ -456,7 +647,8 @@ class StateManagementAbstraction(StateManagementProtocol):
             self.logger.error(f"❌ Error listing states from ArangoDB: {e}")
             raise  # Re-raise for service layer to handle
 
-    async def _limit(self, int = None, offset: int = None) -> List[Dict[str, Any]]:
+    async def _list_from_redis(self, filters: Dict[str, Any] = None,
+                             limit: int = None, offset: int = None) -> List[Dict[str, Any]]:
         """List states from Redis."""
         try:
             # Get all keys with prefix
@@ -499,7 +691,8 @@ class StateManagementAbstraction(StateManagementProtocol):
             self.logger.error(f"❌ Error listing states from Redis: {e}")
             raise  # Re-raise for service layer to handle
 
-    async def _limit(self, int = None, offset: int = None) -> List[Dict[str, Any]]:
+    async def _list_from_memory(self, filters: Dict[str, Any] = None,
+                              limit: int = None, offset: int = None) -> List[Dict[str, Any]]:
         """List states from memory."""
         try:
             states = []
@@ -535,8 +728,9 @@ class StateManagementAbstraction(StateManagementProtocol):
             self.logger.error(f"❌ Error listing states from memory: {e}")
             raise  # Re-raise for service layer to handle
 
-    async def _query(self, query: str,
-                          fields: List[str] = None) -> List[Dict[str, Any]]:
+    async def search_states(self, query: str,
+                          fields: List[str] = None,
+                          limit: int = None) -> List[Dict[str, Any]]:
         """
         Search for states using a query string.
         
@@ -599,7 +793,7 @@ class StateManagementAbstraction(StateManagementProtocol):
             self.logger.error(f"❌ Error searching states in ArangoDB: {e}")
             raise  # Re-raise for service layer to handle
 
-    async def _limit(self, int = None) -> List[Dict[str, Any]]:
+    async def _search_in_redis(self, query: str, fields: List[str] = None, limit: int = None) -> List[Dict[str, Any]]:
         """Search states in Redis."""
         try:
             # Get all keys with prefix
@@ -629,7 +823,7 @@ class StateManagementAbstraction(StateManagementProtocol):
             self.logger.error(f"❌ Error searching states in Redis: {e}")
             raise  # Re-raise for service layer to handle
 
-    async def _limit(self, int = None) -> List[Dict[str, Any]]:
+    async def _search_in_memory(self, query: str, fields: List[str] = None, limit: int = None) -> List[Dict[str, Any]]:
         """Search states in memory."""
         try:
             states = []
@@ -651,6 +845,8 @@ class StateManagementAbstraction(StateManagementProtocol):
         except Exception as e:
             self.logger.error(f"❌ Error searching states in memory: {e}")
             raise  # Re-raise for service layer to handle
+
+    async def get_state_metadata(self, state_id: str) -> Optional[Dict[str, Any]]:
         """Get metadata for a specific state."""
         # Get utilities from DI container
         error_handler = None
@@ -679,20 +875,23 @@ class StateManagementAbstraction(StateManagementProtocol):
                                    metadata: Dict[str, Any]) -> bool:
         """Update metadata for a specific state."""
         try:
-            # Try to update in ArangoDB first
-            arango_success = await self._update_metadata_in_arango(state_id, metadata)
-            if arango_success:
-                return True
-            
-            # Try to update in Redis
-            redis_success = await self._update_metadata_in_redis(state_id, metadata)
-            if redis_success:
-                return True
-            
-            # Try to update in memory
-            memory_success = await self._update_metadata_in_memory(state_id, metadata)
-            if memory_success:
-                return True
+            try:
+                # Try to update in ArangoDB first
+                arango_success = await self._update_metadata_in_arango(state_id, metadata)
+                if arango_success:
+                    return True
+                
+                # Try to update in Redis
+                redis_success = await self._update_metadata_in_redis(state_id, metadata)
+                if redis_success:
+                    return True
+                
+                # Try to update in memory
+                memory_success = await self._update_metadata_in_memory(state_id, metadata)
+                if memory_success:
+                    return True
+            finally:
+                await self._invalidate_cached_copies(state_id)
             
             return False
             
@@ -851,6 +1050,7 @@ class StateManagementAbstraction(StateManagementProtocol):
                     "redis": {"count": redis_count, "type": "session"},
                     "memory": {"count": memory_count, "type": "cache"}
                 },
+                "read_tiers": self.get_tier_stats(),
                 "timestamp": datetime.utcnow().isoformat()
             }
             
@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+Batch OCR Engine - Raw Technology Client
+
+Batch OCR of scanned pages in worker processes.
+This is Layer 1 of the 5-layer infrastructure architecture.
+
+Each page is preprocessed (DPI normalization, binarization, deskew) and OCR'd by tesseract
+in a bounded process pool, so a scanned document no longer runs OpenCV and tesseract on the
+serving loop one page at a time. Pages that already carry a text layer skip OCR, and OCR
+results are cached by image content hash so re-ingesting the same scan is free.
+
+WHAT (Infrastructure Role): I OCR batches of page images off the event loop
+HOW (Infrastructure Implementation): I run preprocessing and tesseract per page over a process pool
+"""
+
+import io
+import os
+import math
+import time
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, Optional, List, Callable, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+try:
+    import pytesseract
+except ImportError:
+    pytesseract = None
+
+logger = logging.getLogger(__name__)
+
+TARGET_DPI = 300
+MAX_SKEW_DEGREES = 15.0
+
+
+# ============================================================================
+# WORKER PROCESS FUNCTIONS (module level so they can be pickled)
+# ============================================================================
+
+def decode_image(image_data: bytes) -> Any:
+    """Decode image bytes to a grayscale uint8 array."""
+    if np is None:
+        raise RuntimeError("Batch OCR requires numpy")
+    if cv2 is not None:
+        gray = cv2.imdecode(np.frombuffer(image_data, dtype=np.uint8), cv2.IMREAD_GRAYSCALE)
+        if gray is None:
+            raise ValueError("Unreadable image data")
+        return gray
+    if Image is not None:
+        with Image.open(io.BytesIO(image_data)) as image:
+            return np.asarray(image.convert("L"), dtype=np.uint8)
+    raise RuntimeError("Batch OCR requires OpenCV or Pillow to decode images")
+
+
+def normalize_dpi(gray: Any, source_dpi: Optional[float], target_dpi: int = TARGET_DPI) -> Any:
+    """Rescale a page to the DPI tesseract is tuned for (scale clamped to 0.25x-4x)."""
+    if not source_dpi or abs(source_dpi - target_dpi) < 1:
+        return gray
+    scale = min(4.0, max(0.25, target_dpi / float(source_dpi)))
+    height, width = gray.shape[:2]
+    new_size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    if cv2 is not None:
+        interpolation = cv2.INTER_CUBIC if scale > 1 else cv2.INTER_AREA
+        return cv2.resize(gray, new_size, interpolation=interpolation)
+    rows = np.minimum((np.arange(new_size[1]) / scale).astype(int), height - 1)
+    cols = np.minimum((np.arange(new_size[0]) / scale).astype(int), width - 1)
+    return gray[rows[:, None], cols]
+
+
+def otsu_threshold(gray: Any) -> int:
+    """Otsu's threshold for a grayscale uint8 array."""
+    histogram = np.bincount(gray.ravel(), minlength=256).astype(np.float64)
+    total = histogram.sum()
+    if total == 0:
+        return 127
+    levels = np.arange(256)
+    weight_background = np.cumsum(histogram)
+    weight_foreground = total - weight_background
+    cumulative_mean = np.cumsum(histogram * levels)
+    mean_background = cumulative_mean / np.maximum(weight_background, 1)
+    mean_foreground = (cumulative_mean[-1] - cumulative_mean) / np.maximum(weight_foreground, 1)
+    between_variance = weight_background * weight_foreground * (mean_background - mean_foreground) ** 2
+    return int(np.argmax(between_variance))
+
+
+def binarize(gray: Any) -> Any:
+    """Black text on white (0/255) using Otsu's threshold."""
+    if cv2 is not None:
+        _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        return binary
+    return np.where(gray > otsu_threshold(gray), 255, 0).astype(np.uint8)
+
+
+def _projection_sharpness(x: Any, y: Any, angle: float) -> float:
+    """Variance of the row profile of ink pixels after undoing a candidate skew."""
+    theta = math.radians(angle)
+    rows = np.rint(y * math.cos(theta) - x * math.sin(theta)).astype(np.int64)
+    profile = np.bincount(rows - rows.min())
+    return float(profile.var())
+
+
+def estimate_skew_angle(binary: Any, max_points: int = 50000) -> float:
+    """
+    Skew of the text lines in degrees (counter-clockwise positive).
+    
+    Projection-profile search: the angle that makes the row profile of ink pixels sharpest
+    (text lines collapsing onto single rows) is the page skew. Searched in 1 degree steps
+    within MAX_SKEW_DEGREES, then refined in 0.1 degree steps.
+    """
+    rows, cols = np.nonzero(binary == 0)
+    if len(rows) < 2:
+        return 0.0
+    if len(rows) > max_points:
+        step = len(rows) // max_points + 1
+        rows, cols = rows[::step], cols[::step]
+    x = cols.astype(np.float64)
+    y = -rows.astype(np.float64)  # image rows grow downwards
+    
+    coarse = max(np.arange(-MAX_SKEW_DEGREES, MAX_SKEW_DEGREES + 1, 1.0),
+                 key=lambda angle: _projection_sharpness(x, y, angle))
+    fine = max(np.arange(coarse - 1.0, coarse + 1.05, 0.1),
+               key=lambda angle: _projection_sharpness(x, y, angle))
+    return float(fine)
+
+
+def rotate(binary: Any, angle: float) -> Any:
+    """Rotate a page counter-clockwise about its centre, filling with white."""
+    height, width = binary.shape[:2]
+    if cv2 is not None:
+        matrix = cv2.getRotationMatrix2D((width / 2, height / 2), angle, 1.0)
+        return cv2.warpAffine(binary, matrix, (width, height), flags=cv2.INTER_NEAREST,
+                              borderMode=cv2.BORDER_CONSTANT, borderValue=255)
+    theta = math.radians(angle)
+    rows, cols = np.indices((height, width))
+    x = cols - width / 2
+    y = height / 2 - rows
+    source_x = np.rint(x * math.cos(theta) + y * math.sin(theta) + width / 2).astype(int)
+    source_y = np.rint(height / 2 - (y * math.cos(theta) - x * math.sin(theta))).astype(int)
+    inside = (source_x >= 0) & (source_x < width) & (source_y >= 0) & (source_y < height)
+    rotated = np.full_like(binary, 255)
+    rotated[inside] = binary[source_y[inside], source_x[inside]]
+    return rotated
+
+
+def preprocess_page(gray: Any, source_dpi: Optional[float] = None, target_dpi: int = TARGET_DPI) -> tuple:
+    """DPI normalization, binarization and deskew - returns (page, preprocessing details)."""
+    normalized = normalize_dpi(gray, source_dpi, target_dpi)
+    binary = binarize(normalized)
+    skew_angle = estimate_skew_angle(binary)
+    if abs(skew_angle) >= 0.1:
+        binary = rotate(binary, -skew_angle)
+    return binary, {
+        "skew_angle": round(skew_angle, 2),
+        "scale": round(normalized.shape[1] / gray.shape[1], 3),
+        "width": int(binary.shape[1]),
+        "height": int(binary.shape[0])
+    }
+
+
+def text_from_ocr_data(data: Dict[str, List[Any]]) -> str:
+    """
+    Rebuild page text from pytesseract image_to_data output (one tesseract pass instead of two).
+    
+    Words are joined with spaces within a line, lines with newlines and blocks/paragraphs
+    with a blank line, as image_to_string lays them out.
+    """
+    paragraphs: "OrderedDict[tuple, OrderedDict[tuple, List[str]]]" = OrderedDict()
+    for index, word in enumerate(data["text"]):
+        word = (word or "").strip()
+        if not word:
+            continue
+        paragraph = (data["block_num"][index], data["par_num"][index])
+        line = paragraph + (data["line_num"][index],)
+        paragraphs.setdefault(paragraph, OrderedDict()).setdefault(line, []).append(word)
+    return "\n\n".join(
+        "\n".join(" ".join(words) for words in lines.values()) for lines in paragraphs.values()
+    )
+
+
+def ocr_page(image_data: bytes, source_dpi: Optional[float] = None, language: str = "eng",
+             config: Optional[str] = None, target_dpi: int = TARGET_DPI) -> Dict[str, Any]:
+    """Preprocess and OCR one page image."""
+    if pytesseract is None:
+        raise RuntimeError("Batch OCR requires pytesseract")
+    started = time.perf_counter()
+    page, preprocessing = preprocess_page(decode_image(image_data), source_dpi, target_dpi)
+    preprocessed = time.perf_counter()
+    
+    data = pytesseract.image_to_data(page, lang=language, config=config or "",
+                                     output_type=pytesseract.Output.DICT)
+    words = [word.strip() for word, conf in zip(data["text"], data["conf"]) if float(conf) > 0 and word.strip()]
+    confidences = [float(conf) for conf in data["conf"] if float(conf) > 0]
+    
+    return {
+        "text": text_from_ocr_data(data),
+        "confidence": (sum(confidences) / len(confidences) / 100.0) if confidences else 0.0,
+        "word_count": len(words),
+        "preprocessing": preprocessing,
+        "preprocess_seconds": round(preprocessed - started, 4),
+        "ocr_seconds": round(time.perf_counter() - preprocessed, 4)
+    }
+
+
+# ============================================================================
+# ENGINE
+# ============================================================================
+
+class BatchOCREngine:
+    """
+    Raw batch OCR over a process pool - no business logic.
+    """
+    
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        cache_size: int = 1024,
+        target_dpi: int = TARGET_DPI,
+        mp_context: str = "spawn",
+        page_processor: Callable[..., Dict[str, Any]] = ocr_page
+    ):
+        """
+        Initialize batch OCR engine (the process pool starts on first use).
+        
+        Args:
+            max_workers: Worker processes (default: CPU count, at most 8)
+            cache_size: OCR results kept by image content hash (0 disables the cache)
+            target_dpi: Resolution pages are normalized to before OCR
+            mp_context: multiprocessing start method
+            page_processor: Worker function preprocessing and OCR'ing one page
+        """
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self.cache_size = max(0, cache_size)
+        self.target_dpi = target_dpi
+        self.mp_context = mp_context
+        self.page_processor = page_processor
+        self.engine_name = "batch_ocr_engine"
+        self.logger = logging.getLogger(__name__)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Bounds page images waiting in the pool's call queue
+        self._slots = asyncio.Semaphore(self.max_workers * 2)
+        self.stats = {
+            "pages": 0,
+            "ocr_pages": 0,
+            "text_layer_pages": 0,
+            "cache_hits": 0,
+            "failed_pages": 0,
+            "batches": 0,
+            "busy_seconds": 0.0
+        }
+        
+        self.logger.info(f"✅ {self.engine_name} initialized ({self.max_workers} workers)")
+    
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context(self.mp_context)
+            )
+        return self._pool
+    
+    def content_hash(self, image_data: bytes, language: str, config: Optional[str]) -> str:
+        """Cache key: the image bytes plus everything that changes the OCR output."""
+        digest = hashlib.sha256(image_data)
+        digest.update(f"|{language}|{config or ''}|{self.target_dpi}".encode())
+        return digest.hexdigest()
+    
+    def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        result = self._cache.get(key)
+        if result is not None:
+            self._cache.move_to_end(key)
+        return result
+    
+    def _cache_put(self, key: str, result: Dict[str, Any]):
+        if not self.cache_size:
+            return
+        self._cache[key] = result
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+    
+    def _discard_pool(self, pool: ProcessPoolExecutor):
+        """Drop a pool whose worker died; the next page starts a fresh one."""
+        if self._pool is pool:
+            self.logger.warning("⚠️ OCR worker process died, restarting the pool")
+            pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+    
+    async def _run_page(self, page: Dict[str, Any], language: str, config: Optional[str]) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        async with self._slots:
+            pool = self._get_pool()
+            try:
+                return await loop.run_in_executor(
+                    pool, self.page_processor,
+                    page["image_data"], page.get("dpi"), language, config, self.target_dpi
+                )
+            except BrokenProcessPool:
+                self._discard_pool(pool)
+                raise
+    
+    async def ocr_pages(
+        self,
+        pages: List[Union[bytes, Dict[str, Any]]],
+        language: str = "eng",
+        config: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        OCR a batch of pages, returning per-page results in input order.
+        
+        Each page is image bytes or a dict with "image_data" and optionally "page_number",
+        "dpi" (source resolution) and "text_layer" (embedded text; OCR is skipped when present).
+        Identical images in a batch are OCR'd once.
+        """
+        started = time.perf_counter()
+        pages = [page if isinstance(page, dict) else {"image_data": page} for page in pages]
+        results: List[Optional[Dict[str, Any]]] = [None] * len(pages)
+        pending: Dict[str, List[int]] = {}
+        
+        for index, page in enumerate(pages):
+            page_number = page.get("page_number", index)
+            text_layer = (page.get("text_layer") or "").strip()
+            if text_layer:
+                results[index] = {"page_number": page_number, "success": True, "source": "text_layer",
+                                  "text": text_layer, "confidence": 1.0, "word_count": len(text_layer.split())}
+                continue
+            key = self.content_hash(page["image_data"], language, config)
+            cached = self._cache_get(key)
+            if cached is not None:
+                results[index] = {"page_number": page_number, "success": True, "source": "cache", **cached}
+                continue
+            pending.setdefault(key, []).append(index)
+        
+        keys = list(pending)
+        outcomes = await asyncio.gather(
+            *(self._run_page(pages[pending[key][0]], language, config) for key in keys),
+            return_exceptions=True
+        )
+        for key, outcome in zip(keys, outcomes):
+            if isinstance(outcome, BaseException):
+                self.logger.warning(f"⚠️ OCR failed for page(s) {pending[key]}: {outcome}")
+                outcome_result = {"success": False, "source": "ocr", "text": "", "confidence": 0.0,
+                                  "word_count": 0, "error": str(outcome)}
+            else:
+                self._cache_put(key, outcome)
+                outcome_result = {"success": True, "source": "ocr", **outcome}
+            for index in pending[key]:
+                results[index] = {"page_number": pages[index].get("page_number", index), **outcome_result}
+        
+        elapsed = time.perf_counter() - started
+        counts = {source: sum(1 for result in results if result["source"] == source)
+                  for source in ("text_layer", "cache", "ocr")}
+        failed = sum(1 for result in results if not result["success"])
+        self.stats["pages"] += len(results)
+        self.stats["ocr_pages"] += len(keys)
+        self.stats["text_layer_pages"] += counts["text_layer"]
+        self.stats["cache_hits"] += counts["cache"] + counts["ocr"] - len(keys)
+        self.stats["failed_pages"] += failed
+        self.stats["batches"] += 1
+        self.stats["busy_seconds"] += elapsed
+        
+        return {
+            "success": failed < len(results) or not results,
+            "pages": results,
+            "text": "\n".join(result["text"] for result in results if result["text"]),
+            "page_count": len(results),
+            "ocr_pages": len(keys),
+            "text_layer_pages": counts["text_layer"],
+            "cache_hits": counts["cache"] + counts["ocr"] - len(keys),
+            "failed_pages": failed,
+            "elapsed_seconds": round(elapsed, 4),
+            "pages_per_second": round(len(results) / elapsed, 2) if elapsed > 0 else 0.0,
+            "extractor": self.engine_name
+        }
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Throughput (pages per second of batch wall time) and cache counters."""
+        busy = self.stats["busy_seconds"]
+        return {
+            **self.stats,
+            "pages_per_second": round(self.stats["pages"] / busy, 2) if busy > 0 else 0.0,
+            "ocr_pages_per_second": round(self.stats["ocr_pages"] / busy, 2) if busy > 0 else 0.0,
+            "cache_entries": len(self._cache),
+            "max_workers": self.max_workers
+        }
+    
+    def shutdown(self):
+        """Stop the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
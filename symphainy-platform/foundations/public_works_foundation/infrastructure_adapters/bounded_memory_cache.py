@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Bounded Memory Cache - Layer 1 helper for the CacheAdapter memory tier
+
+In-process key/value cache with hard limits on entry count and approximate bytes,
+per-entry TTL expiry and LRU eviction, so long-running workers cannot grow without bound
+as LLM responses and session data accumulate.
+
+WHAT (Infrastructure): I hold recently used values in process memory within a fixed budget
+HOW (Cache): OrderedDict LRU with lazy + periodic TTL expiry and entry/byte accounting
+"""
+
+import sys
+import json
+import time
+import logging
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class BoundedMemoryCache:
+    """
+    LRU cache bounded by entry count and approximate size in bytes.
+
+    Entries are (value, size, expires_at) tuples; expires_at uses time.monotonic() and is
+    None for entries without a TTL. Expired entries are dropped when read and by a sweep
+    every `sweep_interval` writes, so dead entries cannot pin the byte budget either.
+    """
+
+    def __init__(self, max_entries: int = 10000, max_bytes: int = 64 * 1024 * 1024,
+                 default_ttl: Optional[int] = None, sweep_interval: int = 1024):
+        """
+        Initialize bounded memory cache.
+
+        Args:
+            max_entries: Maximum number of entries kept
+            max_bytes: Maximum approximate size of all values in bytes
+            default_ttl: TTL in seconds for entries set without one (None = no expiry)
+            sweep_interval: Number of writes between full sweeps for expired entries
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.sweep_interval = sweep_interval
+
+        self._entries: "OrderedDict[str, Tuple[Any, int, Optional[float]]]" = OrderedDict()
+        self._bytes = 0
+        self._writes_since_sweep = 0
+        self.stats = {"hits": 0, "misses": 0, "sets": 0, "evictions": 0, "expirations": 0, "rejected": 0}
+
+    @staticmethod
+    def estimate_size(key: str, value: Any) -> int:
+        """Approximate footprint of an entry (serialized value size plus key and bookkeeping)."""
+        try:
+            value_size = len(json.dumps(value, default=str))
+        except (TypeError, ValueError):
+            value_size = sys.getsizeof(value)
+        return value_size + len(key) + 64
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the value for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        if entry[2] is not None and entry[2] <= time.monotonic():
+            self._remove(key)
+            self.stats["expirations"] += 1
+            self.stats["misses"] += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return entry[0]
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """Store value under key, evicting least recently used entries to stay within bounds."""
+        size = self.estimate_size(key, value)
+        if size > self.max_bytes:
+            self.stats["rejected"] += 1
+            self._remove(key)
+            return False
+
+        ttl = ttl if ttl is not None else self.default_ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._remove(key)
+        self._entries[key] = (value, size, expires_at)
+        self._bytes += size
+        self.stats["sets"] += 1
+
+        self._writes_since_sweep += 1
+        if self._writes_since_sweep >= self.sweep_interval:
+            self.purge_expired()
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, (_, evicted_size, _) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+            self.stats["evictions"] += 1
+        return True
+
+    def delete(self, key: str) -> bool:
+        """Remove key if present."""
+        return self._remove(key)
+
+    def contains(self, key: str) -> bool:
+        """True if key is present and not expired (does not count as a hit or touch LRU order)."""
+        entry = self._entries.get(key)
+        return entry is not None and (entry[2] is None or entry[2] > time.monotonic())
+
+    def clear(self):
+        """Remove all entries (stats are kept)."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def purge_expired(self) -> int:
+        """Drop every expired entry; returns the number removed."""
+        self._writes_since_sweep = 0
+        now = time.monotonic()
+        expired = [key for key, entry in self._entries.items() if entry[2] is not None and entry[2] <= now]
+        for key in expired:
+            self._remove(key)
+        self.stats["expirations"] += len(expired)
+        return len(expired)
+
+    def _remove(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= entry[1]
+        return True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Size, bounds, eviction counts and hit rate."""
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hit_rate": self.stats["hits"] / lookups if lookups else 0.0
+        }
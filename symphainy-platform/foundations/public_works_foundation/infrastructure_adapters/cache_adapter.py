@@ -6,18 +6,22 @@ Raw cache client wrapper for LLM response caching.
 Thin wrapper around cache libraries with no business logic.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 import json
 import os
 import logging
 from datetime import datetime
 
 try:
-    import redis
+    import redis.asyncio as aioredis
     from redis.exceptions import RedisError
+    from .redis_connection_pool import get_shared_pool, DEFAULT_MAX_CONNECTIONS
 except ImportError:
-    redis = None
+    aioredis = None
     RedisError = Exception
+    DEFAULT_MAX_CONNECTIONS = 50
+
+from .bounded_memory_cache import BoundedMemoryCache
 
 
 class CacheAdapter:
@@ -29,19 +33,23 @@ class CacheAdapter:
         
         Args:
             storage_type: Storage type (memory, redis, file)
-            **kwargs: Additional configuration
+            **kwargs: Additional configuration (memory tier bounds: memory_max_entries,
+                memory_max_bytes, memory_default_ttl)
         """
         self.storage_type = storage_type
         self.logger = logging.getLogger("CacheAdapter")
         
         # Storage configuration
         self.redis_url = kwargs.get("redis_url", "redis://localhost:6379/1")
+        self.max_connections = kwargs.get("max_connections", DEFAULT_MAX_CONNECTIONS)
         self.cache_dir = kwargs.get("cache_dir", "cache/llm")
+        self.memory_max_entries = kwargs.get("memory_max_entries", 10000)
+        self.memory_max_bytes = kwargs.get("memory_max_bytes", 64 * 1024 * 1024)
+        self.memory_default_ttl = kwargs.get("memory_default_ttl")
         
         # Storage clients
         self.redis_client = None
-        self.memory_cache = {}
-        self.access_times = {}
+        self.memory_cache = None
         
         # Initialize storage
         self._initialize_storage()
@@ -66,12 +74,14 @@ class CacheAdapter:
     
     def _initialize_redis(self):
         """Initialize Redis storage."""
-        if redis is None:
+        if aioredis is None:
             raise ImportError("Redis not available")
             
         try:
-            self.redis_client = redis.from_url(self.redis_url)
-            self.redis_client.ping()  # Test connection
+            # Shared asyncio pool; connectivity is verified lazily (see health_check)
+            self.redis_client = aioredis.Redis(connection_pool=get_shared_pool(
+                url=self.redis_url, decode_responses=False, max_connections=self.max_connections
+            ))
             self.logger.info("✅ Redis storage initialized")
             
         except Exception as e:
@@ -80,9 +90,14 @@ class CacheAdapter:
     
     def _initialize_memory(self):
         """Initialize memory storage."""
-        self.memory_cache = {}
-        self.access_times = {}
-        self.logger.info("✅ Memory storage initialized")
+        self.memory_cache = BoundedMemoryCache(
+            max_entries=self.memory_max_entries,
+            max_bytes=self.memory_max_bytes,
+            default_ttl=self.memory_default_ttl
+        )
+        self.logger.info(
+            f"✅ Memory storage initialized (max {self.memory_max_entries} entries, {self.memory_max_bytes} bytes)"
+        )
     
     def _initialize_file(self):
         """Initialize file storage."""
@@ -163,6 +178,66 @@ class CacheAdapter:
             self.logger.error(f"Failed to delete from {self.storage_type} storage: {e}")
             return False
     
+    async def get_many(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several values in one round trip (MGET for Redis).
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Dict: key -> cached value, for keys that were found
+        """
+        try:
+            if self.storage_type == "redis":
+                values = await self.redis_client.mget(keys) if keys else []
+                return {key: json.loads(data) for key, data in zip(keys, values) if data}
+            results = {}
+            for key in keys:
+                value = await self.get(key)
+                if value is not None:
+                    results[key] = value
+            return results
+                
+        except Exception as e:
+            self.logger.error(f"Failed to get many from {self.storage_type} storage: {e}")
+            return {}
+    
+    async def set_many(self, items: Dict[str, Dict[str, Any]], ttl: int = None) -> bool:
+        """
+        Set several values in one round trip (pipelined for Redis).
+        
+        Args:
+            items: key -> value to cache
+            ttl: Time to live in seconds
+            
+        Returns:
+            bool: Success status
+        """
+        try:
+            if self.storage_type == "redis":
+                pipe = self.redis_client.pipeline(transaction=False)
+                for key, value in items.items():
+                    if ttl:
+                        pipe.setex(key, ttl, json.dumps(value))
+                    else:
+                        pipe.set(key, json.dumps(value))
+                await pipe.execute()
+                return True
+            for key, value in items.items():
+                await self.set(key, value, ttl)
+            return True
+                
+        except Exception as e:
+            self.logger.error(f"Failed to set many in {self.storage_type} storage: {e}")
+            return False
+    
+    def pipeline(self, transaction: bool = True):
+        """Raw Redis pipeline (redis storage only) - queue commands, then await execute()."""
+        if self.storage_type != "redis":
+            raise RuntimeError(f"Pipelines require redis storage (current: {self.storage_type})")
+        return self.redis_client.pipeline(transaction=transaction)
+    
     async def exists(self, key: str) -> bool:
         """
         Check if key exists in cache.
@@ -212,7 +287,7 @@ class CacheAdapter:
     async def _get_from_redis(self, key: str) -> Optional[Dict[str, Any]]:
         """Get from Redis."""
         try:
-            data = self.redis_client.get(key)
+            data = await self.redis_client.get(key)
             return json.loads(data) if data else None
         except Exception as e:
             self.logger.error(f"Failed to get from Redis: {e}")
@@ -222,9 +297,9 @@ class CacheAdapter:
         """Set in Redis."""
         try:
             if ttl:
-                self.redis_client.setex(key, ttl, json.dumps(value))
+                await self.redis_client.setex(key, ttl, json.dumps(value))
             else:
-                self.redis_client.set(key, json.dumps(value))
+                await self.redis_client.set(key, json.dumps(value))
             return True
         except Exception as e:
             self.logger.error(f"Failed to set in Redis: {e}")
@@ -233,7 +308,7 @@ class CacheAdapter:
     async def _delete_from_redis(self, key: str) -> bool:
         """Delete from Redis."""
         try:
-            self.redis_client.delete(key)
+            await self.redis_client.delete(key)
             return True
         except Exception as e:
             self.logger.error(f"Failed to delete from Redis: {e}")
@@ -242,7 +317,7 @@ class CacheAdapter:
     async def _exists_in_redis(self, key: str) -> bool:
         """Check existence in Redis."""
         try:
-            return bool(self.redis_client.exists(key))
+            return bool(await self.redis_client.exists(key))
         except Exception as e:
             self.logger.error(f"Failed to check existence in Redis: {e}")
             return False
@@ -250,7 +325,7 @@ class CacheAdapter:
     async def _clear_redis(self) -> bool:
         """Clear Redis."""
         try:
-            self.redis_client.flushdb()
+            await self.redis_client.flushdb()
             return True
         except Exception as e:
             self.logger.error(f"Failed to clear Redis: {e}")
@@ -268,9 +343,7 @@ class CacheAdapter:
     async def _set_in_memory(self, key: str, value: Dict[str, Any], ttl: int = None) -> bool:
         """Set in memory."""
         try:
-            self.memory_cache[key] = value
-            self.access_times[key] = datetime.now()
-            return True
+            return self.memory_cache.set(key, value, ttl)
         except Exception as e:
             self.logger.error(f"Failed to set in memory: {e}")
             return False
@@ -278,8 +351,7 @@ class CacheAdapter:
     async def _delete_from_memory(self, key: str) -> bool:
         """Delete from memory."""
         try:
-            self.memory_cache.pop(key, None)
-            self.access_times.pop(key, None)
+            self.memory_cache.delete(key)
             return True
         except Exception as e:
             self.logger.error(f"Failed to delete from memory: {e}")
@@ -288,7 +360,7 @@ class CacheAdapter:
     async def _exists_in_memory(self, key: str) -> bool:
         """Check existence in memory."""
         try:
-            return key in self.memory_cache
+            return self.memory_cache.contains(key)
         except Exception as e:
             self.logger.error(f"Failed to check existence in memory: {e}")
             return False
@@ -297,7 +369,6 @@ class CacheAdapter:
         """Clear memory."""
         try:
             self.memory_cache.clear()
-            self.access_times.clear()
             return True
         except Exception as e:
             self.logger.error(f"Failed to clear memory: {e}")
@@ -376,7 +447,7 @@ class CacheAdapter:
             # Test storage connectivity
             if self.storage_type == "redis":
                 try:
-                    self.redis_client.ping()
+                    await self.redis_client.ping()
                     health_status["storage_connected"] = True
                 except Exception as e:
                     health_status["storage_connected"] = False
@@ -385,6 +456,7 @@ class CacheAdapter:
             elif self.storage_type == "memory":
                 health_status["storage_connected"] = True
                 health_status["current_size"] = len(self.memory_cache)
+                health_status["memory_cache"] = self.memory_cache.get_stats()
             elif self.storage_type == "file":
                 health_status["storage_connected"] = os.path.exists(self.cache_dir)
                 if not health_status["storage_connected"]:
@@ -246,7 +246,8 @@ class ConfigAdapter:
             "port": port,
             "db": db,
             "password": self.get("REDIS_PASSWORD"),
-            "url": redis_url or f"redis://{host}:{port}/{db}"
+            "url": redis_url or f"redis://{host}:{port}/{db}",
+            "max_connections": self.get_int("REDIS_MAX_CONNECTIONS", 50)
         }
     
     def get_redis_host(self) -> str:
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Copybook Layout Cache - Layer 1 helper for MainframeProcessingAdapter
+
+Caches compiled copybook layouts keyed by a hash of the copybook content plus codepage,
+so repeated uploads that share a copybook skip continuation-line cleanup, regex parsing,
+OCCURS expansion and validation-rule extraction.
+
+WHAT (Infrastructure): I remember compiled copybook layouts
+HOW (Cache): In-process LRU tier, optionally backed by Redis for cross-worker reuse
+"""
+
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import Dict, Any, Optional, List
+
+from .cobol_record_decoder import CompiledRecordLayout, FieldPlan
+
+logger = logging.getLogger(__name__)
+
+
+class CopybookLayoutCache:
+    """
+    Two-tier cache for compiled copybook layouts.
+
+    Entries hold the denormalized field definitions (used by parse_file), the compiled
+    record plan (used by CobolRecordDecoder), the validation rules and the record length.
+    The memory tier is a bounded LRU; the optional Redis tier stores entries as JSON
+    under "copybook_layout:<hash>" with a TTL.
+    """
+
+    KEY_PREFIX = "copybook_layout:"
+
+    def __init__(self, max_entries: int = 128, redis_adapter=None, redis_ttl: int = 7 * 24 * 3600):
+        """
+        Initialize copybook layout cache.
+
+        Args:
+            max_entries: Maximum number of layouts kept in process
+            redis_adapter: Optional RedisAdapter (async get/set) for the shared tier
+            redis_ttl: TTL in seconds for Redis entries
+        """
+        self.max_entries = max_entries
+        self.redis_adapter = redis_adapter
+        self.redis_ttl = redis_ttl
+        self.logger = logging.getLogger("CopybookLayoutCache")
+
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.stats = {"memory_hits": 0, "redis_hits": 0, "misses": 0, "evictions": 0}
+
+    @staticmethod
+    def make_key(copybook_content: str, codepage: str) -> str:
+        """Cache key: sha256 of the copybook content and codepage."""
+        digest = hashlib.sha256()
+        digest.update((codepage or "").lower().encode("utf-8"))
+        digest.update(b"\x00")
+        digest.update(copybook_content.encode("utf-8"))
+        return digest.hexdigest()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached entry (memory first, then Redis).
+
+        Returns:
+            Dict with field_definitions, layout, validation_rules and record_length, or None
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.stats["memory_hits"] += 1
+            return entry
+
+        if self.redis_adapter is not None:
+            try:
+                payload = await self.redis_adapter.get(self.KEY_PREFIX + key)
+                if payload:
+                    entry = self._deserialize(payload)
+                    self._remember(key, entry)
+                    self.stats["redis_hits"] += 1
+                    return entry
+            except Exception as e:
+                self.logger.warning(f"⚠️ Redis copybook cache lookup failed: {e}")
+
+        self.stats["misses"] += 1
+        return None
+
+    async def put(
+        self,
+        key: str,
+        field_definitions: List[Dict[str, Any]],
+        layout: Optional[CompiledRecordLayout],
+        validation_rules: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Store an entry in both tiers and return it."""
+        entry = {
+            "field_definitions": field_definitions,
+            "layout": layout,
+            "validation_rules": validation_rules,
+            "record_length": layout.record_length if layout else 0
+        }
+        self._remember(key, entry)
+
+        if self.redis_adapter is not None:
+            try:
+                await self.redis_adapter.set(self.KEY_PREFIX + key, self._serialize(entry), ttl=self.redis_ttl)
+            except Exception as e:
+                self.logger.warning(f"⚠️ Redis copybook cache store failed: {e}")
+
+        return entry
+
+    def clear(self):
+        """Drop all in-process entries (Redis entries expire by TTL)."""
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size."""
+        return {**self.stats, "size": len(self._entries), "max_entries": self.max_entries}
+
+    def _remember(self, key: str, entry: Dict[str, Any]):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    @staticmethod
+    def _serialize(entry: Dict[str, Any]) -> str:
+        layout = entry.get("layout")
+        return json.dumps({
+            "field_definitions": entry.get("field_definitions", []),
+            "validation_rules": entry.get("validation_rules", {}),
+            "record_length": entry.get("record_length", 0),
+            "layout": {
+                "fields": [asdict(f) for f in layout.fields],
+                "record_length": layout.record_length,
+                "codepage": layout.codepage
+            } if layout else None
+        })
+
+    @staticmethod
+    def _deserialize(payload: str) -> Dict[str, Any]:
+        data = json.loads(payload)
+        layout_data = data.get("layout")
+        layout = None
+        if layout_data:
+            layout = CompiledRecordLayout(
+                fields=[FieldPlan(**f) for f in layout_data.get("fields", [])],
+                record_length=layout_data.get("record_length", 0),
+                codepage=layout_data.get("codepage", "cp037"),
+                metadata={"validation_rules": data.get("validation_rules", {})}
+            )
+        return {
+            "field_definitions": data.get("field_definitions", []),
+            "layout": layout,
+            "validation_rules": data.get("validation_rules", {}),
+            "record_length": data.get("record_length", 0)
+        }
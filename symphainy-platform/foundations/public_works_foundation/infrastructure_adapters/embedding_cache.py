@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Embedding Cache - Layer 1 helper for embedding adapters
+
+Content-addressed cache for embedding vectors, shared by HuggingFaceAdapter and OpenAIAdapter.
+Keys are the model name plus a hash of the normalized input text, so the same column names,
+type descriptions and sample strings are embedded once across files, re-parses and tenants.
+Adapters pass a model key namespaced by the endpoint that serves it (URL, revision), so
+vectors from different deployments never mix.
+
+WHAT (Infrastructure): I remember embedding vectors for texts already embedded
+HOW (Cache): In-process LRU of compact float32 arrays, optionally backed by Redis raw bytes
+"""
+
+import sys
+import hashlib
+import logging
+import unicodedata
+from array import array
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """
+    Two-tier content-addressed embedding cache.
+
+    The memory tier is a bounded LRU of array('f') vectors (4 bytes per dimension instead
+    of a Python float object per dimension). The optional Redis tier stores the raw
+    little-endian float32 bytes under "embedding:<model>:<sha256>" with a TTL, using the
+    RedisAdapter's binary get_bytes/set_bytes operations.
+    """
+
+    KEY_PREFIX = "embedding:"
+
+    def __init__(self, max_entries: int = 50000, redis_adapter=None, redis_ttl: int = 30 * 24 * 3600):
+        """
+        Initialize embedding cache.
+
+        Args:
+            max_entries: Maximum number of vectors kept in process
+            redis_adapter: Optional RedisAdapter (async get_bytes/set_bytes) for the shared tier
+            redis_ttl: TTL in seconds for Redis entries
+        """
+        self.max_entries = max_entries
+        self.redis_adapter = redis_adapter
+        self.redis_ttl = redis_ttl
+        self.logger = logging.getLogger("EmbeddingCache")
+
+        self._entries: "OrderedDict[str, array]" = OrderedDict()
+        self.stats = {"memory_hits": 0, "redis_hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """NFKC-normalize and collapse whitespace (case is preserved: models are case-sensitive)."""
+        return " ".join(unicodedata.normalize("NFKC", text).split())
+
+    @classmethod
+    def make_key(cls, model: str, text: str) -> str:
+        """Cache key: model plus sha256 of the normalized text."""
+        digest = hashlib.sha256(cls.normalize_text(text).encode("utf-8")).hexdigest()
+        return f"{model}:{digest}"
+
+    async def get(self, model: str, text: str) -> Optional[List[float]]:
+        """Look up one vector (memory first, then Redis)."""
+        return (await self.get_many(model, [text]))[0]
+
+    async def get_many(self, model: str, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Look up vectors for several texts.
+
+        Returns:
+            List aligned with texts: the cached vector, or None on a miss
+        """
+        keys = [self.make_key(model, text) for text in texts]
+        results: List[Optional[List[float]]] = [None] * len(keys)
+        missing = []
+
+        for i, key in enumerate(keys):
+            vector = self._entries.get(key)
+            if vector is not None:
+                self._entries.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                results[i] = vector.tolist()
+            else:
+                missing.append(i)
+
+        if missing and self.redis_adapter is not None:
+            try:
+                payloads = await self.redis_adapter.mget_bytes([self.KEY_PREFIX + keys[i] for i in missing])
+                still_missing = []
+                for i, payload in zip(missing, payloads):
+                    if payload:
+                        vector = self._from_bytes(payload)
+                        self._remember(keys[i], vector)
+                        self.stats["redis_hits"] += 1
+                        results[i] = vector.tolist()
+                    else:
+                        still_missing.append(i)
+                missing = still_missing
+            except Exception as e:
+                self.logger.warning(f"⚠️ Redis embedding cache lookup failed: {e}")
+
+        self.stats["misses"] += len(missing)
+        return results
+
+    async def put(self, model: str, text: str, vector: List[float]):
+        """Store one vector in both tiers."""
+        await self.put_many(model, [text], [vector])
+
+    async def put_many(self, model: str, texts: List[str], vectors: List[List[float]]):
+        """Store vectors for several texts in both tiers (empty vectors are skipped)."""
+        redis_items = {}
+        for text, vector in zip(texts, vectors):
+            if not vector:
+                continue
+            key = self.make_key(model, text)
+            compact = array("f", vector)
+            self._remember(key, compact)
+            self.stats["stores"] += 1
+            redis_items[self.KEY_PREFIX + key] = self._to_bytes(compact)
+
+        if redis_items and self.redis_adapter is not None:
+            try:
+                await self.redis_adapter.mset_bytes(redis_items, ttl=self.redis_ttl)
+            except Exception as e:
+                self.logger.warning(f"⚠️ Redis embedding cache store failed: {e}")
+
+    def clear(self):
+        """Drop all in-process entries (Redis entries expire by TTL)."""
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size."""
+        lookups = self.stats["memory_hits"] + self.stats["redis_hits"] + self.stats["misses"]
+        hits = self.stats["memory_hits"] + self.stats["redis_hits"]
+        return {
+            **self.stats,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "size": len(self._entries),
+            "max_entries": self.max_entries
+        }
+
+    def _remember(self, key: str, vector: array):
+        self._entries[key] = vector
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    @staticmethod
+    def _to_bytes(vector: array) -> bytes:
+        if sys.byteorder == "big":
+            vector = array("f", vector)
+            vector.byteswap()
+        return vector.tobytes()
+
+    @staticmethod
+    def _from_bytes(payload: bytes) -> array:
+        vector = array("f")
+        vector.frombytes(payload)
+        if sys.byteorder == "big":
+            vector.byteswap()
+        return vector
@@ -9,9 +9,24 @@ WHAT (Infrastructure Role): I provide raw GCS operations for file storage
 HOW (Infrastructure Implementation): I use real GCS client with no business logic
 """
 
-from typing import Dict, Any, Optional, List, BinaryIO
+from typing import Dict, Any, Optional, List, BinaryIO, AsyncIterator
 from datetime import datetime, timedelta
+import io
+import os
+import asyncio
 import logging
+import tempfile
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from .upload_stream import UploadStream, UploadTooLargeError
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
 
 try:
     from google.cloud import storage
@@ -64,6 +79,44 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+
+class _RangedBlobReader(io.RawIOBase):
+    """Seekable read-only view of a blob - every read is one ranged GET, nothing is prefetched."""
+    
+    def __init__(self, blob, size: int):
+        super().__init__()
+        self.blob = blob
+        self.size = size
+        self.position = 0
+        self.requests = 0
+        self.bytes_fetched = 0
+    
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def tell(self) -> int:
+        return self.position
+    
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self.position, io.SEEK_END: self.size}[whence]
+        self.position = max(0, base + offset)
+        return self.position
+    
+    def readinto(self, buffer) -> int:
+        length = min(len(buffer), self.size - self.position)
+        if length <= 0:
+            return 0
+        data = self.blob.download_as_bytes(start=self.position, end=self.position + length - 1)
+        buffer[:len(data)] = data
+        self.position += len(data)
+        self.requests += 1
+        self.bytes_fetched += len(data)
+        return len(data)
+
+
 class GCSFileAdapter:
     """
     Raw GCS client wrapper for file operations - no business logic.
@@ -80,7 +133,12 @@ class GCSFileAdapter:
     - GCS_CREDENTIALS_JSON = Bucket access (application data) - JSON string, no file paths!
     """
     
-    def __init__(self, project_id: str, bucket_name: str, credentials_json: str = None):
+    # Resumable upload chunks must be a multiple of 256 KiB
+    RESUMABLE_CHUNK_ALIGNMENT = 256 * 1024
+    
+    def __init__(self, project_id: str, bucket_name: str, credentials_json: str = None,
+                 bucket=None, upload_chunk_size: int = 8 * 1024 * 1024, spool_dir: str = None,
+                 io_workers: int = 16):
         """
         Initialize GCS file adapter with real connection.
         
@@ -93,11 +151,29 @@ class GCSFileAdapter:
             project_id: GCP project ID
             bucket_name: GCS bucket name
             credentials_json: Service account credentials as JSON string (from GCS_CREDENTIALS_JSON)
+            bucket: Optional bucket object to use instead of creating a GCS client
+                (e.g. a LocalObjectStoreBucket for local development and tests)
+            upload_chunk_size: Bytes per resumable upload request for streamed uploads
+            spool_dir: Directory for on-disk spooling when a streaming write is not possible
+            io_workers: Threads in the adapter's dedicated storage I/O pool
         """
         import json
         
         self.project_id = project_id
         self.bucket_name = bucket_name
+        alignment = self.RESUMABLE_CHUNK_ALIGNMENT
+        self.upload_chunk_size = max(alignment, -(-upload_chunk_size // alignment) * alignment)
+        self.spool_dir = spool_dir
+        # Blocking client calls run here, not on the event loop or the shared default executor
+        self._io_executor = ThreadPoolExecutor(max_workers=max(1, io_workers), thread_name_prefix="gcs-io")
+        
+        if bucket is not None:
+            self._client = None
+            self._bucket = bucket
+            self.client = self._client
+            self.bucket = self._bucket
+            logger.info(f"✅ GCS File adapter initialized with injected bucket: {getattr(bucket, 'name', bucket_name)}")
+            return
         
         # CRITICAL: We do NOT modify GOOGLE_APPLICATION_CREDENTIALS globally
         # This would break SSH access and other GCP tools
@@ -145,6 +221,15 @@ class GCSFileAdapter:
         self.bucket = self._bucket
         logger.info(f"✅ GCS File adapter initialized with bucket: {bucket_name}, project: {project_id}")
     
+    async def _run(self, func, *args, **kwargs):
+        """Run a blocking storage call on the dedicated I/O thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io_executor, functools.partial(func, *args, **kwargs))
+    
+    def shutdown(self):
+        """Stop the storage I/O thread pool."""
+        self._io_executor.shutdown(wait=False, cancel_futures=True)
+    
     # ============================================================================
     # RAW FILE UPLOAD OPERATIONS
     # ============================================================================
@@ -182,10 +267,10 @@ class GCSFileAdapter:
             if content_type:
                 blob.content_type = content_type
                 # Explicitly pass content_type to upload_from_string to ensure it's used
-                blob.upload_from_string(file_data, content_type=content_type)
+                await self._run(blob.upload_from_string, file_data, content_type=content_type)
             else:
                 # If no content_type provided, let GCS auto-detect
-                blob.upload_from_string(file_data)
+                await self._run(blob.upload_from_string, file_data)
             
             logger.info(f"✅ Successfully uploaded file {blob_name} to GCS (content_type: {content_type or 'auto-detected'}, size: {len(file_data)} bytes)")
             return True
@@ -198,12 +283,94 @@ class GCSFileAdapter:
             logger.error(f"   Error Message: {error_msg}")
             logger.error(f"   Bucket: {self.bucket_name}")
             logger.error(f"   Project: {self.project_id}")
-            import os
             logger.error(f"   Credentials: {os.getenv('GOOGLE_APPLICATION_CREDENTIALS', 'Using Application Default Credentials')}")
             import traceback
             logger.error(f"   Full Traceback:\n{traceback.format_exc()}")
             return False
     
+    async def upload_stream(self, blob_name: str, stream: UploadStream,
+                            content_type: str = None, metadata: Dict[str, str] = None) -> Dict[str, Any]:
+        """
+        Raw streamed upload - no business logic.
+        
+        Writes the stream chunk by chunk to a resumable upload, so memory is bounded by the
+        chunk size rather than the file size; the object is only finalized once the last chunk
+        is written. If the bucket cannot take a streaming write (or the resumable session fails
+        on a rewindable source), the stream is spooled to a temporary file and uploaded from disk.
+        Size limit violations abort the upload without creating the object.
+        
+        Returns:
+            Dict with success, size, sha256, md5 and method ("resumable" or "spooled")
+        """
+        blob = self._bucket.blob(blob_name)
+        if metadata:
+            filtered_metadata = {k: v for k, v in metadata.items()
+                                 if k not in ['file_type', 'content_type']}
+            if filtered_metadata:
+                blob.metadata = filtered_metadata
+        if content_type:
+            blob.content_type = content_type
+        
+        try:
+            stream.check_size()
+            method = "resumable"
+            if callable(getattr(blob, "open", None)):
+                try:
+                    await self._upload_resumable(blob, stream, content_type)
+                except UploadTooLargeError:
+                    raise
+                except Exception as e:
+                    if not stream.rewindable:
+                        raise
+                    logger.warning(f"⚠️ Resumable upload of {blob_name} failed ({e}) - retrying from an on-disk spool")
+                    await stream.rewind()
+                    method = "spooled"
+            else:
+                method = "spooled"
+            if method == "spooled":
+                await self._upload_spooled(blob, stream)
+            
+            logger.info(f"✅ Streamed file {blob_name} to GCS ({method}, {stream.bytes_read} bytes, sha256 {stream.sha256[:12]})")
+            return {
+                "success": True,
+                "blob_name": blob_name,
+                "size": stream.bytes_read,
+                "sha256": stream.sha256,
+                "md5": stream.md5,
+                "method": method
+            }
+        except UploadTooLargeError as e:
+            logger.warning(f"⚠️ Streamed upload of {blob_name} rejected: {e}")
+            return {"success": False, "blob_name": blob_name, "error": "upload_too_large", "message": str(e),
+                    "size": stream.bytes_read, "max_bytes": e.max_bytes}
+        except Exception as e:
+            logger.error(f"❌ Failed to stream file {blob_name}: {e}")
+            return {"success": False, "blob_name": blob_name, "error": str(e), "size": stream.bytes_read}
+    
+    async def _upload_resumable(self, blob, stream: UploadStream, content_type: str = None):
+        """Write chunks through a resumable upload session; abandon the session on failure."""
+        writer = await self._run(
+            blob.open, "wb", chunk_size=self.upload_chunk_size, content_type=content_type, ignore_flush=True
+        )
+        try:
+            async for chunk in stream.chunks():
+                await self._run(writer.write, chunk)
+        except BaseException:
+            # Not closing leaves the resumable session unfinalized - no object is created
+            abort = getattr(writer, "abort", None)
+            if callable(abort):
+                await self._run(abort)
+            raise
+        await self._run(writer.close)
+    
+    async def _upload_spooled(self, blob, stream: UploadStream):
+        """Spool chunks to a temporary file, then upload from disk."""
+        with tempfile.TemporaryFile(dir=self.spool_dir) as spool:
+            async for chunk in stream.chunks():
+                await self._run(spool.write, chunk)
+            spool.seek(0)
+            await self._run(blob.upload_from_file, spool)
+    
     async def upload_file_from_path(self, blob_name: str, file_path: str,
                                    content_type: str = None, metadata: Dict[str, str] = None) -> bool:
         """Raw file upload from path - no business logic."""
@@ -217,9 +384,9 @@ class GCSFileAdapter:
             # Upload with explicit content_type to prevent auto-detection conflicts
             if content_type:
                 blob.content_type = content_type
-                blob.upload_from_filename(file_path, content_type=content_type)
+                await self._run(blob.upload_from_filename, file_path, content_type=content_type)
             else:
-                blob.upload_from_filename(file_path)
+                await self._run(blob.upload_from_filename, file_path)
             
             return True
         except GoogleCloudError as e:
@@ -239,9 +406,9 @@ class GCSFileAdapter:
             # Upload with explicit content_type to prevent auto-detection conflicts
             if content_type:
                 blob.content_type = content_type
-                blob.upload_from_file(file_stream, content_type=content_type)
+                await self._run(blob.upload_from_file, file_stream, content_type=content_type)
             else:
-                blob.upload_from_file(file_stream)
+                await self._run(blob.upload_from_file, file_stream)
             
             return True
         except GoogleCloudError as e:
@@ -256,11 +423,11 @@ class GCSFileAdapter:
         """Raw file download - no business logic."""
         try:
             blob = self._bucket.blob(blob_name)
-            if not blob.exists():
+            if not await self._run(blob.exists):
                 logger.warning(f"⚠️ [GCS download] Blob does not exist: {blob_name}")
                 return None
             
-            file_data = blob.download_as_bytes()
+            file_data = await self._run(blob.download_as_bytes)
             
             # Validate parquet bytes after download (if it's a parquet file)
             if file_data and len(file_data) >= 4:
@@ -280,13 +447,126 @@ class GCSFileAdapter:
             logger.error(f"❌ Failed to download file {blob_name}: {e}")
             return None
     
+    async def get_file_size(self, blob_name: str) -> Optional[int]:
+        """Raw object size lookup (metadata only) - no business logic."""
+        try:
+            blob = self._bucket.blob(blob_name)
+            await self._run(blob.reload)
+            return blob.size
+        except (GoogleCloudError, OSError) as e:
+            logger.error(f"❌ Failed to get size of {blob_name}: {e}")
+            return None
+    
+    async def read_range(self, blob_name: str, start: int, end: Optional[int] = None) -> Optional[bytes]:
+        """
+        Raw ranged read - bytes [start, end) of the object, without downloading the rest.
+        
+        A negative start counts from the end of the object (start=-1024 reads the last 1 KiB);
+        end=None reads to the end.
+        """
+        try:
+            blob = self._bucket.blob(blob_name)
+            if start < 0:
+                await self._run(blob.reload)
+                start = max(0, blob.size + start)
+            if end is not None and end <= start:
+                return b""
+            return await self._run(blob.download_as_bytes, start=start,
+                                   end=end - 1 if end is not None else None)
+        except (GoogleCloudError, OSError) as e:
+            logger.error(f"❌ Failed to read range {start}-{end} of {blob_name}: {e}")
+            return None
+    
+    async def stream_file(self, blob_name: str, chunk_size: int = 8 * 1024 * 1024) -> AsyncIterator[bytes]:
+        """
+        Raw streaming read - yields the object in chunks, holding at most one chunk in memory.
+        
+        Each chunk is a ranged GET issued from the I/O thread pool as the consumer asks for it.
+        """
+        blob = self._bucket.blob(blob_name)
+        if not callable(getattr(blob, "open", None)):
+            yield await self._run(blob.download_as_bytes)
+            return
+        reader = await self._run(blob.open, "rb", chunk_size=chunk_size)
+        try:
+            while True:
+                chunk = await self._run(reader.read, chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            await self._run(reader.close)
+    
+    async def read_parquet_metadata(self, blob_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Raw Parquet footer read - schema, row and row group counts from the footer alone.
+        """
+        if pq is None:
+            logger.error("❌ pyarrow is required to read Parquet files")
+            return None
+        try:
+            return await self._run(self._read_parquet_metadata_sync, blob_name)
+        except (GoogleCloudError, OSError, ValueError, pa.ArrowException) as e:
+            # ArrowInvalid (a ValueError) when the object is not a Parquet file
+            logger.error(f"❌ Failed to read Parquet metadata of {blob_name}: {e}")
+            return None
+    
+    async def read_parquet(self, blob_name: str, columns: Optional[List[str]] = None,
+                           row_groups: Optional[List[int]] = None):
+        """
+        Raw Parquet read - fetches the footer plus only the requested row groups and columns.
+        
+        Args:
+            blob_name: Parquet object name
+            columns: Column names to read (None = all)
+            row_groups: Row group indices to read (None = all)
+        
+        Returns:
+            pyarrow.Table, or None on failure
+        """
+        if pq is None:
+            logger.error("❌ pyarrow is required to read Parquet files")
+            return None
+        try:
+            return await self._run(self._read_parquet_sync, blob_name, columns, row_groups)
+        except (GoogleCloudError, OSError, ValueError, pa.ArrowException) as e:
+            logger.error(f"❌ Failed to read Parquet file {blob_name}: {e}")
+            return None
+    
+    def _open_ranged(self, blob_name: str) -> _RangedBlobReader:
+        blob = self._bucket.blob(blob_name)
+        blob.reload()
+        return _RangedBlobReader(blob, blob.size)
+    
+    def _read_parquet_metadata_sync(self, blob_name: str) -> Dict[str, Any]:
+        reader = self._open_ranged(blob_name)
+        metadata = pq.ParquetFile(reader).metadata
+        return {
+            "num_rows": metadata.num_rows,
+            "num_columns": metadata.num_columns,
+            "num_row_groups": metadata.num_row_groups,
+            "columns": list(metadata.schema.names),
+            "row_group_rows": [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)],
+            "size": reader.size,
+            "bytes_fetched": reader.bytes_fetched
+        }
+    
+    def _read_parquet_sync(self, blob_name: str, columns: Optional[List[str]], row_groups: Optional[List[int]]):
+        reader = self._open_ranged(blob_name)
+        parquet_file = pq.ParquetFile(reader)
+        if row_groups is None:
+            row_groups = list(range(parquet_file.num_row_groups))
+        table = parquet_file.read_row_groups(row_groups, columns=columns)
+        logger.debug(f"📄 [GCS parquet] {blob_name}: fetched {reader.bytes_fetched} of {reader.size} bytes in {reader.requests} ranged reads")
+        return table
+    
     async def download_file_to_path(self, blob_name: str, file_path: str) -> bool:
         """Raw file download to path - no business logic."""
         try:
             blob = self._bucket.blob(blob_name)
-            if not blob.exists():
+            if not await self._run(blob.exists):
                 return False
-            blob.download_to_filename(file_path)
+            await self._run(blob.download_to_filename, file_path)
             return True
         except GoogleCloudError as e:
             logger.error(f"❌ Failed to download file to path {blob_name}: {e}")
@@ -296,9 +576,9 @@ class GCSFileAdapter:
         """Raw file download to stream - no business logic."""
         try:
             blob = self._bucket.blob(blob_name)
-            if not blob.exists():
+            if not await self._run(blob.exists):
                 return False
-            blob.download_to_file(file_stream)
+            await self._run(blob.download_to_file, file_stream)
             return True
         except GoogleCloudError as e:
             logger.error(f"❌ Failed to download file to stream {blob_name}: {e}")
@@ -312,10 +592,10 @@ class GCSFileAdapter:
         """Raw file metadata retrieval - no business logic."""
         try:
             blob = self._bucket.blob(blob_name)
-            if not blob.exists():
+            if not await self._run(blob.exists):
                 return None
             
-            blob.reload()
+            await self._run(blob.reload)
             return {
                 "name": blob.name,
                 "size": blob.size,
@@ -335,10 +615,10 @@ class GCSFileAdapter:
         """Raw file metadata update - no business logic."""
         try:
             blob = self._bucket.blob(blob_name)
-            if not blob.exists():
+            if not await self._run(blob.exists):
                 return False
             blob.metadata = metadata
-            blob.patch()
+            await self._run(blob.patch)
             return True
         except GoogleCloudError as e:
             logger.error(f"❌ Failed to update file metadata {blob_name}: {e}")
@@ -351,7 +631,7 @@ class GCSFileAdapter:
     async def list_files(self, prefix: str = None, delimiter: str = None) -> List[Dict[str, Any]]:
         """Raw file listing - no business logic."""
         try:
-            blobs = self._bucket.list_blobs(prefix=prefix, delimiter=delimiter)
+            blobs = await self._run(lambda: list(self._bucket.list_blobs(prefix=prefix, delimiter=delimiter)))
             files = []
             for blob in blobs:
                 files.append({
@@ -371,7 +651,7 @@ class GCSFileAdapter:
         """Raw file existence check - no business logic."""
         try:
             blob = self._bucket.blob(blob_name)
-            return blob.exists()
+            return await self._run(blob.exists)
         except GoogleCloudError as e:
             logger.error(f"❌ Failed to check file existence {blob_name}: {e}")
             return False
@@ -384,9 +664,9 @@ class GCSFileAdapter:
         """Raw file deletion - no business logic."""
         try:
             blob = self._bucket.blob(blob_name)
-            if not blob.exists():
+            if not await self._run(blob.exists):
                 return False
-            blob.delete()
+            await self._run(blob.delete)
             return True
         except GoogleCloudError as e:
             logger.error(f"❌ Failed to delete file {blob_name}: {e}")
@@ -396,7 +676,7 @@ class GCSFileAdapter:
         """Raw multiple file deletion - no business logic."""
         try:
             blobs = [self._bucket.blob(name) for name in blob_names]
-            self._client.delete_blobs(blobs)
+            await self._run(self._bucket.delete_blobs, blobs)
             return len(blob_names)
         except GoogleCloudError as e:
             logger.error(f"❌ Failed to delete files: {e}")
@@ -410,9 +690,9 @@ class GCSFileAdapter:
         """Raw file copy - no business logic."""
         try:
             source_blob = self._bucket.blob(source_blob_name)
-            if not source_blob.exists():
+            if not await self._run(source_blob.exists):
                 return False
-            self._bucket.copy_blob(source_blob, self._bucket, destination_blob_name)
+            await self._run(self._bucket.copy_blob, source_blob, self._bucket, destination_blob_name)
             return True
         except GoogleCloudError as e:
             logger.error(f"❌ Failed to copy file {source_blob_name}: {e}")
@@ -442,9 +722,10 @@ class GCSFileAdapter:
         """Raw signed URL generation - no business logic."""
         try:
             blob = self._bucket.blob(blob_name)
-            if not blob.exists():
+            if not await self._run(blob.exists):
                 return None
-            return blob.generate_signed_url(
+            return await self._run(
+                blob.generate_signed_url,
                 expiration=datetime.utcnow() + timedelta(seconds=expiration),
                 method=method
             )
@@ -456,7 +737,7 @@ class GCSFileAdapter:
         """Raw public URL generation - no business logic."""
         try:
             blob = self._bucket.blob(blob_name)
-            if not blob.exists():
+            if not await self._run(blob.exists):
                 return None
             return blob.public_url
         except GoogleCloudError as e:
@@ -486,7 +767,7 @@ class GCSFileAdapter:
     async def test_connection(self) -> bool:
         """Raw connection test - no business logic."""
         try:
-            self._bucket.reload()
+            await self._run(self._bucket.reload)
             return True
         except GoogleCloudError as e:
             logger.error(f"❌ Connection test failed: {e}")
@@ -10,9 +10,10 @@ HOW (Infrastructure Implementation): I use real HuggingFace Inference Endpoints
 """
 
 import os
+import asyncio
 import httpx
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +25,8 @@ class HuggingFaceAdapter:
     without any business logic or abstraction. It's the raw technology layer.
     """
     
-    def __init__(self, endpoint_url: str = None, api_key: str = None, config_adapter = None):
+    def __init__(self, endpoint_url: str = None, api_key: str = None, config_adapter = None, embedding_cache = None,
+                 revision: str = None):
         """
         Initialize HuggingFace adapter.
         
@@ -32,11 +34,15 @@ class HuggingFaceAdapter:
             endpoint_url: HuggingFace Inference Endpoint URL (takes precedence)
             api_key: HuggingFace API key/token (takes precedence)
             config_adapter: ConfigAdapter for reading configuration (REQUIRED if parameters not provided)
+            embedding_cache: Optional EmbeddingCache consulted before calling the endpoint
+            revision: Optional deployment/model revision served by the endpoint
+                (default: HUGGINGFACE_EMBEDDINGS_REVISION); part of the cache namespace
         
         Raises:
             ValueError: If required configuration is missing
         """
         self.config_adapter = config_adapter
+        self.embedding_cache = embedding_cache
         
         # Get from parameters or ConfigAdapter (no fallback to os.getenv)
         if endpoint_url:
@@ -71,6 +77,14 @@ class HuggingFaceAdapter:
                 "Example: HuggingFaceAdapter(config_adapter=config_adapter)"
             )
         
+        # Texts per request for generate_embeddings_batch
+        self.batch_size = config_adapter.get_int("HUGGINGFACE_EMBEDDINGS_BATCH_SIZE", 32) if config_adapter else 32
+        
+        # The endpoint decides which model actually runs (the model argument is only a label),
+        # so cached vectors are namespaced by endpoint URL and deployment revision
+        self.revision = revision or (config_adapter.get("HUGGINGFACE_EMBEDDINGS_REVISION") if config_adapter else None)
+        self.cache_namespace = self.endpoint_url.rstrip("/") + (f"@{self.revision}" if self.revision else "")
+        
         logger.info(f"✅ HuggingFace adapter initialized for endpoint: {self.endpoint_url[:50]}...")
     
     async def generate_embedding(
@@ -88,10 +102,101 @@ class HuggingFaceAdapter:
         Returns:
             Dict with embedding and metadata
         """
-        return await self.inference(
+        if self.embedding_cache is not None:
+            cached = await self.embedding_cache.get(self._cache_model(model), text)
+            if cached is not None:
+                return {"embedding": cached, "model": model, "dimension": len(cached), "cached": True}
+        
+        result = await self.inference(
             inputs=text,
             model=model
         )
+        
+        if self.embedding_cache is not None:
+            await self.embedding_cache.put(self._cache_model(model), text, result.get("embedding"))
+        return result
+    
+    async def generate_embeddings_batch(
+        self,
+        texts: List[str],
+        model: str = "sentence-transformers/all-mpnet-base-v2",
+        batch_size: Optional[int] = None,
+        max_concurrency: int = 4
+    ) -> Dict[str, Any]:
+        """
+        Generate embeddings for many texts using batched endpoint requests.
+        
+        Texts are split into batches of batch_size and sent as list inputs; up to
+        max_concurrency batches are in flight at once over a shared HTTP client.
+        With an embedding cache, only distinct texts that miss the cache are sent.
+        
+        Args:
+            texts: Texts to generate embeddings for
+            model: Model name (for reference, endpoint is already configured)
+            batch_size: Texts per request (default: HUGGINGFACE_EMBEDDINGS_BATCH_SIZE or 32)
+            max_concurrency: Maximum concurrent batch requests
+        
+        Returns:
+            Dict with embeddings (same order as texts) and metadata
+        """
+        if not texts:
+            return {"embeddings": [], "model": model, "dimension": 0, "count": 0}
+        
+        if self.embedding_cache is not None:
+            cached = await self.embedding_cache.get_many(self._cache_model(model), texts)
+            pending = list(dict.fromkeys(text for text, vector in zip(texts, cached) if vector is None))
+            computed = dict(zip(pending, await self._embed_batches(pending, batch_size, max_concurrency)))
+            await self.embedding_cache.put_many(self._cache_model(model), pending, [computed[text] for text in pending])
+            embeddings = [vector if vector is not None else computed[text] for text, vector in zip(texts, cached)]
+            cached_count = len(texts) - sum(1 for vector in cached if vector is None)
+        else:
+            embeddings = await self._embed_batches(texts, batch_size, max_concurrency)
+            cached_count = 0
+        
+        return {
+            "embeddings": embeddings,
+            "model": model,
+            "dimension": len(embeddings[0]) if embeddings and isinstance(embeddings[0], list) else 0,
+            "count": len(embeddings),
+            "cached_count": cached_count
+        }
+    
+    def _cache_model(self, model: str) -> str:
+        """Embedding cache model key: endpoint namespace plus the model label."""
+        return f"{self.cache_namespace}|{model}"
+    
+    async def _embed_batches(
+        self,
+        texts: List[str],
+        batch_size: Optional[int],
+        max_concurrency: int
+    ) -> List[List[float]]:
+        """Send texts to the endpoint in concurrent list-input batches, preserving order."""
+        if not texts:
+            return []
+        
+        batch_size = max(1, batch_size or self.batch_size)
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async with httpx.AsyncClient(timeout=120.0) as client:
+            async def embed_batch(batch: List[str]) -> List[List[float]]:
+                async with semaphore:
+                    result = await self._post({"inputs": batch}, client)
+                if isinstance(result, dict) and "embeddings" in result:
+                    result = result["embeddings"]
+                if not isinstance(result, list) or len(result) != len(batch):
+                    raise ValueError(
+                        f"HF endpoint returned {len(result) if isinstance(result, list) else type(result).__name__} "
+                        f"embeddings for a batch of {len(batch)} texts"
+                    )
+                return result
+            
+            results = await asyncio.gather(*(embed_batch(batch) for batch in batches))
+        
+        embeddings = [embedding for batch_result in results for embedding in batch_result]
+        logger.debug(f"✅ Generated {len(embeddings)} embeddings in {len(batches)} batch requests")
+        return embeddings
     
     async def inference(
         self,
@@ -110,39 +215,43 @@ class HuggingFaceAdapter:
         Returns:
             Response from HuggingFace endpoint
         """
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "X-Scale-Up-Timeout": "600"  # Wait for cold start if needed
-        }
-        
         payload = {
             "inputs": inputs,
             **kwargs
         }
         
+        async with httpx.AsyncClient(timeout=120.0) as client:
+            result = await self._post(payload, client)
+        
+        # Handle different response formats
+        if isinstance(result, list) and len(result) > 0:
+            embedding = result[0] if isinstance(result[0], list) else result
+        elif isinstance(result, dict) and "embedding" in result:
+            embedding = result["embedding"]
+        else:
+            embedding = result
+        
+        return {
+            "embedding": embedding if isinstance(embedding, list) else [embedding],
+            "model": model,
+            "dimension": len(embedding) if isinstance(embedding, list) else 1
+        }
+    
+    async def _post(self, payload: Dict[str, Any], client: httpx.AsyncClient) -> Any:
+        """POST a payload to the endpoint and return the decoded JSON response."""
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "X-Scale-Up-Timeout": "600"  # Wait for cold start if needed
+        }
+        
         try:
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                response = await client.post(
-                    self.endpoint_url,
-                    json=payload,
-                    headers=headers
-                )
-                response.raise_for_status()
-                result = response.json()
-                
-                # Handle different response formats
-                if isinstance(result, list) and len(result) > 0:
-                    embedding = result[0] if isinstance(result[0], list) else result
-                elif isinstance(result, dict) and "embedding" in result:
-                    embedding = result["embedding"]
-                else:
-                    embedding = result
-                
-                return {
-                    "embedding": embedding if isinstance(embedding, list) else [embedding],
-                    "model": model,
-                    "dimension": len(embedding) if isinstance(embedding, list) else 1
-                }
+            response = await client.post(
+                self.endpoint_url,
+                json=payload,
+                headers=headers
+            )
+            response.raise_for_status()
+            return response.json()
         
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 503:
@@ -162,9 +271,3 @@ class HuggingFaceAdapter:
         except Exception as e:
             logger.error(f"❌ HF inference failed: {e}")
             raise
-
-
-
-
-
-
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Local Object Store - Raw Technology Client
+
+Filesystem-backed stand-in for a GCS bucket, for local development and tests.
+This is Layer 1 of the 5-layer infrastructure architecture.
+
+LocalObjectStoreBucket implements the subset of the google-cloud-storage Bucket/Blob API
+that GCSFileAdapter uses (blob(), upload_from_*/download_as_bytes with byte ranges,
+streaming blob.open() readers and writers, list_blobs, exists/reload/delete), storing each
+object as a file under a root directory. Streaming writes go to a temporary file that only
+becomes the object when closed, like a resumable upload that is only finalized at the end.
+Every byte moved in or out is counted so tests can assert on transfer volume.
+
+WHAT (Infrastructure Role): I provide a bucket backed by the local filesystem
+HOW (Infrastructure Implementation): I map blob names to files and count bytes transferred
+"""
+
+import io
+import os
+import hashlib
+import base64
+import logging
+import tempfile
+from datetime import datetime
+from typing import Dict, Any, Optional, List, BinaryIO
+
+logger = logging.getLogger(__name__)
+
+
+class _CountingWriter(io.RawIOBase):
+    """Streaming blob writer - the object appears only when the writer is closed."""
+    
+    def __init__(self, blob: "LocalObjectStoreBlob", content_type: Optional[str] = None):
+        super().__init__()
+        self.blob = blob
+        self.content_type = content_type
+        os.makedirs(os.path.dirname(blob.path), exist_ok=True)
+        fd, self._temp_path = tempfile.mkstemp(dir=os.path.dirname(blob.path), prefix=".upload-")
+        self._file = os.fdopen(fd, "wb")
+    
+    def writable(self) -> bool:
+        return True
+    
+    def write(self, data) -> int:
+        written = self._file.write(data)
+        self.blob.bucket.stats["bytes_uploaded"] += written
+        return written
+    
+    def close(self):
+        if self.closed:
+            return
+        self._file.close()
+        os.replace(self._temp_path, self.blob.path)
+        self.blob.bucket.stats["uploads"] += 1
+        if self.content_type:
+            self.blob.content_type = self.content_type
+        self.blob._store_properties()
+        super().close()
+    
+    def abort(self):
+        """Discard the partial object."""
+        if self.closed:
+            return
+        self._file.close()
+        os.remove(self._temp_path)
+        io.RawIOBase.close(self)
+
+
+class _CountingReader(io.RawIOBase):
+    """Streaming blob reader counting bytes read."""
+    
+    def __init__(self, blob: "LocalObjectStoreBlob"):
+        super().__init__()
+        self.blob = blob
+        self._file = open(blob.path, "rb")
+        self.blob.bucket.stats["downloads"] += 1
+    
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self._file.seek(offset, whence)
+    
+    def tell(self) -> int:
+        return self._file.tell()
+    
+    def readinto(self, buffer) -> int:
+        count = self._file.readinto(buffer)
+        self.blob.bucket.stats["bytes_downloaded"] += count
+        return count
+    
+    def close(self):
+        self._file.close()
+        super().close()
+
+
+class LocalObjectStoreBlob:
+    """One object in a LocalObjectStoreBucket."""
+    
+    def __init__(self, bucket: "LocalObjectStoreBucket", name: str):
+        self.bucket = bucket
+        self.name = name
+        self.path = bucket.path_for(name)
+        properties = bucket.properties.get(name, {})
+        self.content_type = properties.get("content_type")
+        self.metadata = dict(properties.get("metadata") or {})
+    
+    def _store_properties(self):
+        with open(self.path, "rb") as handle:
+            md5 = hashlib.md5()
+            for block in iter(lambda: handle.read(1024 * 1024), b""):
+                md5.update(block)
+        now = datetime.utcnow()
+        existing = self.bucket.properties.get(self.name, {})
+        self.bucket.properties[self.name] = {
+            "content_type": self.content_type,
+            "metadata": dict(self.metadata or {}),
+            "md5_hash": base64.b64encode(md5.digest()).decode(),
+            "time_created": existing.get("time_created", now),
+            "updated": now
+        }
+    
+    # Properties (populated from the stored object, like after reload())
+    @property
+    def size(self) -> Optional[int]:
+        return os.path.getsize(self.path) if os.path.exists(self.path) else None
+    
+    @property
+    def md5_hash(self) -> Optional[str]:
+        return self.bucket.properties.get(self.name, {}).get("md5_hash")
+    
+    @property
+    def etag(self) -> Optional[str]:
+        return self.md5_hash
+    
+    @property
+    def crc32c(self) -> Optional[str]:
+        return None
+    
+    @property
+    def time_created(self) -> Optional[datetime]:
+        return self.bucket.properties.get(self.name, {}).get("time_created")
+    
+    @property
+    def updated(self) -> Optional[datetime]:
+        return self.bucket.properties.get(self.name, {}).get("updated")
+    
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+    
+    def reload(self):
+        if not self.exists():
+            raise FileNotFoundError(self.name)
+        properties = self.bucket.properties.get(self.name, {})
+        self.content_type = properties.get("content_type")
+        self.metadata = dict(properties.get("metadata") or {})
+    
+    def patch(self):
+        if self.name in self.bucket.properties:
+            self.bucket.properties[self.name]["metadata"] = dict(self.metadata or {})
+    
+    def delete(self):
+        os.remove(self.path)
+        self.bucket.properties.pop(self.name, None)
+    
+    # Uploads
+    def open(self, mode: str = "rb", chunk_size: Optional[int] = None,
+             content_type: Optional[str] = None, **kwargs):
+        if mode == "wb":
+            return _CountingWriter(self, content_type)
+        if mode == "rb":
+            return io.BufferedReader(_CountingReader(self), buffer_size=chunk_size or io.DEFAULT_BUFFER_SIZE)
+        raise ValueError(f"Unsupported mode: {mode}")
+    
+    def upload_from_file(self, file_obj: BinaryIO, rewind: bool = False, size: Optional[int] = None,
+                         content_type: Optional[str] = None, **kwargs):
+        if rewind:
+            file_obj.seek(0)
+        writer = _CountingWriter(self, content_type)
+        remaining = size
+        while remaining is None or remaining > 0:
+            block = file_obj.read(1024 * 1024 if remaining is None else min(remaining, 1024 * 1024))
+            if not block:
+                break
+            writer.write(block)
+            if remaining is not None:
+                remaining -= len(block)
+        writer.close()
+    
+    def upload_from_string(self, data, content_type: Optional[str] = None, **kwargs):
+        self.upload_from_file(io.BytesIO(data.encode() if isinstance(data, str) else data),
+                              content_type=content_type)
+    
+    def upload_from_filename(self, filename: str, content_type: Optional[str] = None, **kwargs):
+        with open(filename, "rb") as handle:
+            self.upload_from_file(handle, content_type=content_type)
+    
+    # Downloads
+    def download_as_bytes(self, start: Optional[int] = None, end: Optional[int] = None, **kwargs) -> bytes:
+        """Whole object, or bytes start..end inclusive (GCS range semantics)."""
+        if not self.exists():
+            raise FileNotFoundError(self.name)
+        with open(self.path, "rb") as handle:
+            handle.seek(start or 0)
+            data = handle.read() if end is None else handle.read(max(0, end - (start or 0) + 1))
+        self.bucket.stats["downloads"] += 1
+        self.bucket.stats["bytes_downloaded"] += len(data)
+        return data
+    
+    def download_as_string(self, **kwargs) -> bytes:
+        return self.download_as_bytes(**kwargs)
+    
+    def download_to_file(self, file_obj: BinaryIO, **kwargs):
+        with self.open("rb") as reader:
+            for block in iter(lambda: reader.read(1024 * 1024), b""):
+                file_obj.write(block)
+    
+    def download_to_filename(self, filename: str, **kwargs):
+        with open(filename, "wb") as handle:
+            self.download_to_file(handle)
+
+
+class LocalObjectStoreBucket:
+    """
+    Raw filesystem-backed bucket - no business logic.
+    """
+    
+    def __init__(self, root: str, name: str = "local-bucket"):
+        """
+        Initialize local object store.
+        
+        Args:
+            root: Directory holding the objects
+            name: Bucket name reported to callers
+        """
+        self.root = os.path.abspath(root)
+        self.name = name
+        self.location = "local"
+        self.storage_class = "STANDARD"
+        self.time_created = None
+        self.updated = None
+        self.versioning_enabled = False
+        self.labels = {}
+        self.properties: Dict[str, Dict[str, Any]] = {}
+        self.stats = {"uploads": 0, "downloads": 0, "bytes_uploaded": 0, "bytes_downloaded": 0}
+        os.makedirs(self.root, exist_ok=True)
+    
+    def path_for(self, name: str) -> str:
+        path = os.path.abspath(os.path.join(self.root, name))
+        if not path.startswith(self.root + os.sep):
+            raise ValueError(f"Invalid object name: {name}")
+        return path
+    
+    def blob(self, name: str) -> LocalObjectStoreBlob:
+        return LocalObjectStoreBlob(self, name)
+    
+    def list_blobs(self, prefix: Optional[str] = None, delimiter: Optional[str] = None) -> List[LocalObjectStoreBlob]:
+        blobs = []
+        for directory, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                if filename.startswith(".upload-"):
+                    continue
+                name = os.path.relpath(os.path.join(directory, filename), self.root).replace(os.sep, "/")
+                if prefix and not name.startswith(prefix):
+                    continue
+                if delimiter and delimiter in name[len(prefix or ""):]:
+                    continue
+                blobs.append(self.blob(name))
+        return sorted(blobs, key=lambda blob: blob.name)
+    
+    def copy_blob(self, blob: LocalObjectStoreBlob, destination_bucket: "LocalObjectStoreBucket",
+                  new_name: str) -> LocalObjectStoreBlob:
+        target = destination_bucket.blob(new_name)
+        with open(blob.path, "rb") as handle:
+            target.content_type = blob.content_type
+            target.metadata = dict(blob.metadata or {})
+            target.upload_from_file(handle)
+        return target
+    
+    def delete_blobs(self, blobs: List[LocalObjectStoreBlob]):
+        for blob in blobs:
+            blob.delete()
+    
+    def reload(self):
+        if not os.path.isdir(self.root):
+            raise FileNotFoundError(self.root)
+    
+    def reset_stats(self):
+        for key in self.stats:
+            self.stats[key] = 0
@@ -31,7 +31,7 @@ except ImportError:
 class OpenAIAdapter:
     """Raw OpenAI adapter for LLM operations."""
     
-    def __init__(self, api_key: str = None, base_url: str = None, config_adapter = None, **kwargs):
+    def __init__(self, api_key: str = None, base_url: str = None, config_adapter = None, embedding_cache = None, **kwargs):
         """
         Initialize OpenAI adapter.
         
@@ -39,11 +39,13 @@ class OpenAIAdapter:
             api_key: OpenAI API key (takes precedence)
             base_url: OpenAI base URL (for custom endpoints)
             config_adapter: ConfigAdapter for reading configuration (REQUIRED if api_key not provided)
+            embedding_cache: Optional EmbeddingCache consulted before calling the embeddings API
         
         Raises:
             ValueError: If neither api_key nor config_adapter is provided
         """
         self.config_adapter = config_adapter
+        self.embedding_cache = embedding_cache
         self.logger = logging.getLogger("OpenAIAdapter")
         
         # Support both LLM_OPENAI_API_KEY and OPENAI_API_KEY for compatibility
@@ -150,6 +152,11 @@ class OpenAIAdapter:
         Returns:
             List[float]: Embeddings
         """
+        if self.embedding_cache is not None:
+            cached = await self.embedding_cache.get(self._cache_model(model), text)
+            if cached is not None:
+                return cached
+        
         if not self._client:
             return []
             
@@ -164,12 +171,18 @@ class OpenAIAdapter:
             embeddings = response.data[0].embedding if response.data else []
             
             self.logger.info(f"✅ Embeddings generated for text (length: {len(text)})")
+            if self.embedding_cache is not None:
+                await self.embedding_cache.put(self._cache_model(model), text, embeddings)
             return embeddings
             
         except Exception as e:
             self.logger.error(f"Failed to generate embeddings: {e}")
             return []
     
+    def _cache_model(self, model: str) -> str:
+        """Embedding cache model key: API base URL (custom endpoints may serve other weights) plus model."""
+        return f"{(self.base_url or 'https://api.openai.com/v1').rstrip('/')}|{model}"
+    
     async def get_models(self) -> List[Dict[str, Any]]:
         """
         Get available models from OpenAI.
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+PDF Page Extraction Engine - Raw Technology Client
+
+Page-sharded PDF text and table extraction in worker processes.
+This is Layer 1 of the 5-layer infrastructure architecture.
+
+The document is written once to a temp file and split into page ranges; each range is
+extracted in a worker process (PyPDF2 for text, pdfplumber for tables). Per-page results
+stream back as ranges complete and are reassembled in page order. The table pass is skipped
+on pages without ruling lines (no grid structure), which is where most of pdfplumber's time
+goes. One extraction of a document is shared by every caller that asks for it while it runs
+or shortly after (the text and table adapters parse the same upload back to back).
+
+WHAT (Infrastructure Role): I extract PDF text and tables page-parallel, off the event loop
+HOW (Infrastructure Implementation): I shard page ranges over a process pool and stream per-page results
+"""
+
+import os
+import time
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import tempfile
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, Optional, List, Callable, AsyncIterator
+
+try:
+    from PyPDF2 import PdfReader
+except ImportError:
+    PdfReader = None
+
+try:
+    import pdfplumber
+except ImportError:
+    pdfplumber = None
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# WORKER PROCESS FUNCTIONS (module level so they can be pickled)
+# ============================================================================
+
+def has_table_structure(edges: List[Dict[str, Any]], min_rules: int = 3) -> bool:
+    """
+    Whether a page has ruling lines that can form a table.
+    
+    A grid (at least two horizontal and two vertical edges) or several horizontal rules
+    (ruled tables without column lines) counts; anything else skips the table pass.
+    """
+    horizontal = sum(1 for edge in edges if edge.get("orientation") == "h")
+    vertical = sum(1 for edge in edges if edge.get("orientation") == "v")
+    return (horizontal >= 2 and vertical >= 2) or horizontal >= min_rules
+
+
+def read_pdf_info(file_path: str) -> Dict[str, Any]:
+    """Page count and document info (title, author, ...) - read once per document."""
+    if PdfReader is not None:
+        reader = PdfReader(file_path)
+        metadata = reader.metadata or {}
+        return {"page_count": len(reader.pages),
+                "metadata": {str(key): str(value) for key, value in metadata.items()}}
+    if pdfplumber is not None:
+        with pdfplumber.open(file_path) as pdf:
+            return {"page_count": len(pdf.pages),
+                    "metadata": {str(key): str(value) for key, value in (pdf.metadata or {}).items()}}
+    raise RuntimeError("PDF page extraction requires PyPDF2 or pdfplumber")
+
+
+def extract_page_range(file_path: str, start_page: int, end_page: int,
+                       extract_text: bool = True, extract_tables: bool = True) -> List[Dict[str, Any]]:
+    """Extract text and tables from pages [start_page, end_page) - one result per page, in page order."""
+    pages = [{"page_number": page_number, "text": "", "tables": [], "table_pass_skipped": False}
+             for page_number in range(start_page, end_page)]
+    
+    if extract_text and PdfReader is not None:
+        reader = PdfReader(file_path)
+        for page in pages:
+            page["text"] = (reader.pages[page["page_number"]].extract_text() or "").strip()
+    
+    use_plumber_text = extract_text and PdfReader is None
+    if (extract_tables or use_plumber_text) and pdfplumber is not None:
+        with pdfplumber.open(file_path) as pdf:
+            for page in pages:
+                plumber_page = pdf.pages[page["page_number"]]
+                if use_plumber_text:
+                    page["text"] = (plumber_page.extract_text() or "").strip()
+                if not extract_tables:
+                    continue
+                if not has_table_structure(plumber_page.edges):
+                    page["table_pass_skipped"] = True
+                    continue
+                for table_number, table in enumerate(plumber_page.extract_tables()):
+                    page["tables"].append({
+                        "table_id": f"page_{page['page_number']}_table_{table_number}",
+                        "page_number": page["page_number"],
+                        "table_number": table_number,
+                        "rows": table,
+                        "row_count": len(table),
+                        "column_count": len(table[0]) if table else 0
+                    })
+    return pages
+
+
+# ============================================================================
+# ENGINE
+# ============================================================================
+
+class _SharedExtraction:
+    """One running or recently finished extraction; its shards are replayed to every consumer."""
+    
+    def __init__(self, digest: str, extract_text: bool, extract_tables: bool):
+        self.digest = digest
+        self.extract_text = extract_text
+        self.extract_tables = extract_tables
+        self.info: Optional[Dict[str, Any]] = None
+        self.shards: List[Dict[str, Any]] = []
+        self.error: Optional[BaseException] = None
+        self.done = False
+        self.finished_at: Optional[float] = None
+        self.consumers = 0
+        self.task: Optional[asyncio.Task] = None
+        self.changed = asyncio.Event()
+    
+    def covers(self, digest: str, extract_text: bool, extract_tables: bool) -> bool:
+        return (self.digest == digest and self.error is None
+                and (self.extract_text or not extract_text) and (self.extract_tables or not extract_tables))
+    
+    def notify(self):
+        event, self.changed = self.changed, asyncio.Event()
+        event.set()
+
+
+class PdfPageExtractionEngine:
+    """
+    Raw page-parallel PDF extraction - no business logic.
+    """
+    
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        pages_per_shard: int = 8,
+        mp_context: str = "spawn",
+        info_reader: Callable[[str], Dict[str, Any]] = read_pdf_info,
+        range_extractor: Callable[..., List[Dict[str, Any]]] = extract_page_range,
+        share_ttl: float = 30.0,
+        max_shared: int = 4
+    ):
+        """
+        Initialize PDF page extraction engine (the process pool starts on first use).
+        
+        Args:
+            max_workers: Worker processes (default: CPU count, at most 8)
+            pages_per_shard: Pages per range handed to a worker (smaller streams results sooner)
+            mp_context: multiprocessing start method
+            info_reader: Worker function returning the page count and document info
+            range_extractor: Worker function extracting one page range
+            share_ttl: Seconds a finished extraction is kept for callers asking for the same document
+            max_shared: Finished extractions kept at most
+        """
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self.pages_per_shard = max(1, pages_per_shard)
+        self.mp_context = mp_context
+        self.info_reader = info_reader
+        self.range_extractor = range_extractor
+        self.share_ttl = share_ttl
+        self.max_shared = max(0, max_shared)
+        self.engine_name = "pdf_page_extraction_engine"
+        self.logger = logging.getLogger(__name__)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._shared: List[_SharedExtraction] = []
+        self.stats = {"extractions": 0, "shared": 0, "pool_restarts": 0}
+        
+        self.logger.info(f"✅ {self.engine_name} initialized ({self.max_workers} workers)")
+    
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context(self.mp_context)
+            )
+        return self._pool
+    
+    def plan_shards(self, page_count: int) -> List[tuple]:
+        """Split pages into ranges - at least one per worker for small documents."""
+        shard_size = min(self.pages_per_shard, max(1, -(-page_count // self.max_workers)))
+        return [(start, min(start + shard_size, page_count)) for start in range(0, page_count, shard_size)]
+    
+    async def iter_shards(
+        self,
+        file_data: bytes,
+        extract_text: bool = True,
+        extract_tables: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield each page range as it completes (ranges in completion order, pages in order).
+        
+        Every item carries the document's page_count and metadata plus start_page, end_page
+        and its per-page results; a document without pages yields one empty range. If an
+        extraction covering the same document and passes is running or finished within
+        `share_ttl`, its ranges are replayed instead of extracting again. When the last
+        caller stops early or is cancelled (e.g. by a timeout), pending ranges are cancelled
+        and workers still running are killed.
+        """
+        shared = self._share(file_data, extract_text, extract_tables)
+        shared.consumers += 1
+        try:
+            index = 0
+            while True:
+                if index < len(shared.shards):
+                    yield {"page_count": shared.info["page_count"], "metadata": shared.info["metadata"],
+                           **shared.shards[index]}
+                    index += 1
+                elif shared.done:
+                    if shared.error is not None:
+                        raise shared.error
+                    return
+                else:
+                    await shared.changed.wait()
+        finally:
+            shared.consumers -= 1
+            if shared.consumers == 0 and not shared.done:
+                shared.task.cancel()
+                await asyncio.gather(shared.task, return_exceptions=True)
+    
+    async def extract(self, file_data: bytes, extract_text: bool = True, extract_tables: bool = True) -> Dict[str, Any]:
+        """Extract all pages (see iter_shards) and reassemble them in page order."""
+        info, pages, shard_count = {"page_count": 0, "metadata": {}}, [], 0
+        async for shard in self.iter_shards(file_data, extract_text, extract_tables):
+            info = shard
+            pages.extend(shard["pages"])
+            shard_count += 1 if shard["pages"] else 0
+        
+        pages.sort(key=lambda page: page["page_number"])
+        return {
+            "success": True,
+            "page_count": info["page_count"],
+            "metadata": info["metadata"],
+            "pages": pages,
+            "text": "\n".join(page["text"] for page in pages if page["text"]),
+            "tables": [table for page in pages for table in page["tables"]],
+            "table_pass_skipped_pages": sum(1 for page in pages if page["table_pass_skipped"]),
+            "shards": shard_count,
+            "extractor": self.engine_name
+        }
+    
+    def _share(self, file_data: bytes, extract_text: bool, extract_tables: bool) -> _SharedExtraction:
+        """Join a running or recent extraction of the same document, or start one."""
+        now = time.monotonic()
+        self._shared = [shared for shared in self._shared
+                        if not shared.done or (shared.error is None and now - shared.finished_at < self.share_ttl)]
+        digest = hashlib.sha256(file_data).hexdigest()
+        for shared in self._shared:
+            if shared.covers(digest, extract_text, extract_tables):
+                self.stats["shared"] += 1
+                return shared
+        
+        shared = _SharedExtraction(digest, extract_text, extract_tables)
+        shared.task = asyncio.create_task(self._produce(shared, file_data))
+        self._shared.append(shared)
+        finished = [entry for entry in self._shared if entry.done]
+        for entry in finished[:max(0, len(finished) - self.max_shared)]:
+            self._shared.remove(entry)
+        self.stats["extractions"] += 1
+        return shared
+    
+    async def _produce(self, shared: _SharedExtraction, file_data: bytes):
+        """Run one extraction, publishing each completed range to the shared record."""
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as pdf_file:
+            pdf_file.write(file_data)
+        pool = None
+        try:
+            pool = self._get_pool()
+            (info,) = await self._run(pool, [pool.submit(self.info_reader, pdf_file.name)])
+            shards = self.plan_shards(info["page_count"])
+            futures = {
+                pool.submit(self.range_extractor, pdf_file.name, start, end,
+                            shared.extract_text, shared.extract_tables): (start, end)
+                for start, end in shards
+            }
+            shared.info = info
+            if not shards:
+                shared.shards.append({"start_page": 0, "end_page": 0, "pages": []})
+            async for future, pages in self._as_completed(pool, list(futures)):
+                start, end = futures[future]
+                shared.shards.append({"start_page": start, "end_page": end, "pages": pages})
+                shared.notify()
+        except BaseException as e:
+            if isinstance(e, BrokenProcessPool) and pool is not None:
+                self._reset_pool(pool)
+            shared.error = e
+        finally:
+            os.unlink(pdf_file.name)
+            shared.done = True
+            shared.finished_at = time.monotonic()
+            shared.notify()
+    
+    async def _run(self, pool: ProcessPoolExecutor, futures: List[Future]) -> List[Any]:
+        """Await pool futures; on failure or cancellation stop the ones still pending or running."""
+        try:
+            return await asyncio.gather(*(asyncio.wrap_future(future) for future in futures))
+        except BaseException as e:
+            self._stop(pool, futures, e)
+            raise
+    
+    async def _as_completed(self, pool: ProcessPoolExecutor, futures: List[Future]):
+        """Yield (future, result) as pool futures complete; stop the rest on failure or cancellation."""
+        wrapped = {asyncio.wrap_future(future): future for future in futures}
+        pending = set(wrapped)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield wrapped[task], task.result()
+        except BaseException as e:
+            self._stop(pool, futures, e)
+            raise
+    
+    def _stop(self, pool: ProcessPoolExecutor, futures: List[Future], error: BaseException):
+        for future in futures:
+            future.cancel()
+        if isinstance(error, BrokenProcessPool):
+            self._reset_pool(pool)
+        # A task already running in a worker cannot be cancelled - kill the workers instead
+        elif self._pool is pool and any(not future.done() for future in futures):
+            self._kill_workers()
+    
+    def _reset_pool(self, pool: ProcessPoolExecutor):
+        """Drop a pool whose worker died; the next extraction starts a fresh one."""
+        if self._pool is pool:
+            self._pool = None
+            pool.shutdown(wait=False, cancel_futures=True)
+            self.stats["pool_restarts"] += 1
+            self.logger.warning(f"⚠️ {self.engine_name} worker process died, restarting the pool")
+    
+    def _kill_workers(self):
+        pool, self._pool = self._pool, None
+        for process in list((getattr(pool, "_processes", None) or {}).values()):
+            process.kill()
+        pool.shutdown(wait=False, cancel_futures=True)
+        self.logger.warning(f"⚠️ {self.engine_name} killed workers of a cancelled extraction")
+    
+    def shutdown(self):
+        """Stop the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
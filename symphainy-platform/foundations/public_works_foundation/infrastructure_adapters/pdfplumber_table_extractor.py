@@ -31,9 +31,15 @@ class PdfplumberTableExtractor:
     any business logic or abstraction. It's the raw technology layer.
     """
     
-    def __init__(self):
-        """Initialize pdfplumber table extractor adapter."""
+    def __init__(self, page_engine=None):
+        """
+        Initialize pdfplumber table extractor adapter.
+        
+        Args:
+            page_engine: Optional PdfPageExtractionEngine; when set, byte extraction runs page-parallel in worker processes
+        """
         self.extractor_name = "pdfplumber_table_extractor"
+        self.page_engine = page_engine
         self.logger = logging.getLogger(__name__)
         
         self.logger.info(f"✅ {self.extractor_name} initialized")
@@ -88,6 +94,8 @@ class PdfplumberTableExtractor:
     
     async def extract_tables_from_bytes(self, file_data: bytes) -> Dict[str, Any]:
         """Raw table extraction from bytes - no business logic."""
+        if self.page_engine:
+            return await self._extract_tables_page_parallel(file_data)
         try:
             import io
             
@@ -135,6 +143,38 @@ class PdfplumberTableExtractor:
                 "extraction_timestamp": datetime.utcnow().isoformat()
             }
     
+    async def _extract_tables_page_parallel(self, file_data: bytes) -> Dict[str, Any]:
+        """Table extraction sharded by page range (pages without ruling lines are skipped)."""
+        try:
+            # Text rides along with the table pass, so the text extractor reuses this extraction
+            page_count, pages = 0, []
+            async for shard in self.page_engine.iter_shards(file_data, extract_text=True, extract_tables=True):
+                page_count = shard["page_count"]
+                pages.extend(shard["pages"])
+            pages.sort(key=lambda page: page["page_number"])
+            timestamp = datetime.utcnow().isoformat()
+            tables = [{**table, "extractor": self.extractor_name, "extraction_timestamp": timestamp}
+                      for page in pages for table in page["tables"]]
+            return {
+                "success": True,
+                "tables": tables,
+                "table_count": len(tables),
+                "page_count": page_count,
+                "table_pass_skipped_pages": sum(1 for page in pages if page["table_pass_skipped"]),
+                "extractor": self.extractor_name,
+                "extraction_timestamp": timestamp
+            }
+        except Exception as e:
+            self.logger.error(f"❌ Page-parallel table extraction failed from bytes: {e}")
+            return {
+                "success": False,
+                "error": str(e),
+                "tables": [],
+                "table_count": 0,
+                "extractor": self.extractor_name,
+                "extraction_timestamp": datetime.utcnow().isoformat()
+            }
+    
     async def extract_tables_from_page(self, file_path: str, page_number: int) -> Dict[str, Any]:
         """Raw table extraction from specific page - no business logic."""
         try:
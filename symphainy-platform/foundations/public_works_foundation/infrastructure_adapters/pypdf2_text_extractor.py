@@ -33,9 +33,15 @@ class PyPDF2TextExtractor:
     any business logic or abstraction. It's the raw technology layer.
     """
     
-    def __init__(self):
-        """Initialize PyPDF2 text extractor adapter."""
+    def __init__(self, page_engine=None):
+        """
+        Initialize PyPDF2 text extractor adapter.
+        
+        Args:
+            page_engine: Optional PdfPageExtractionEngine; when set, byte extraction runs page-parallel in worker processes
+        """
         self.extractor_name = "pypdf2_text_extractor"
+        self.page_engine = page_engine
         self.logger = logging.getLogger(__name__)
         
         self.logger.info(f"✅ {self.extractor_name} initialized")
@@ -81,6 +87,8 @@ class PyPDF2TextExtractor:
     
     async def extract_text_from_bytes(self, file_data: bytes) -> Dict[str, Any]:
         """Raw text extraction from bytes - no business logic."""
+        if self.page_engine:
+            return await self._extract_text_page_parallel(file_data)
         try:
             import io
             
@@ -117,6 +125,33 @@ class PyPDF2TextExtractor:
                 "extraction_timestamp": datetime.utcnow().isoformat()
             }
     
+    async def _extract_text_page_parallel(self, file_data: bytes) -> Dict[str, Any]:
+        """Text extraction sharded by page range over the page engine's worker processes."""
+        try:
+            page_count, metadata, pages = 0, {}, []
+            async for shard in self.page_engine.iter_shards(file_data, extract_text=True, extract_tables=False):
+                page_count, metadata = shard["page_count"], shard["metadata"]
+                pages.extend({"page_number": page["page_number"], "text": page["text"]} for page in shard["pages"])
+            pages.sort(key=lambda page: page["page_number"])
+            return {
+                "success": True,
+                "text": "\n".join(page["text"] for page in pages if page["text"]).strip(),
+                "page_count": page_count,
+                "pages": pages,
+                "metadata": metadata,
+                "extractor": self.extractor_name,
+                "extraction_timestamp": datetime.utcnow().isoformat()
+            }
+        except Exception as e:
+            self.logger.error(f"❌ Page-parallel text extraction failed from bytes: {e}")
+            return {
+                "success": False,
+                "error": str(e),
+                "text": "",
+                "extractor": self.extractor_name,
+                "extraction_timestamp": datetime.utcnow().isoformat()
+            }
+    
     async def extract_text_from_page(self, file_path: str, page_number: int) -> Dict[str, Any]:
         """Raw text extraction from specific page - no business logic."""
         try:
@@ -0,0 +1,502 @@
+#!/usr/bin/env python3
+"""
+Rate Limiting Adapter - Raw Technology Client
+
+Token-bucket and GCRA primitives for rate limiting with swappable backends.
+This is Layer 1 of the 5-layer infrastructure architecture.
+
+WHAT (Infrastructure Role): I atomically take from and give back to sets of token buckets, and
+decide request admission under one or more rate limits (GCRA)
+HOW (Infrastructure Implementation): One Lua script per decision on Redis (shared across workers),
+or an in-process dictionary (single worker and tests); no business logic
+"""
+
+import time
+import logging
+from dataclasses import dataclass
+from typing import Dict, Any, List, Callable, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TokenBucket:
+    """One bucket: holds up to `capacity` tokens, refilled continuously at `refill_per_second`."""
+    key: str
+    capacity: float
+    refill_per_second: float
+    cost: float = 0
+
+
+# Modes: "reserve" takes `cost` from every bucket or from none (denied buckets report the wait);
+# "adjust" applies `cost` unconditionally (negative = refund), clamped to [-capacity, capacity];
+# "peek" only reports levels. Clock is Redis TIME so every worker agrees on it.
+TOKEN_BUCKET_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local mode = ARGV[1]
+local levels = {}
+local wait = 0
+for i, key in ipairs(KEYS) do
+    local base = 2 + (i - 1) * 3
+    local capacity = tonumber(ARGV[base])
+    local rate = tonumber(ARGV[base + 1])
+    local cost = tonumber(ARGV[base + 2])
+    local state = redis.call('HMGET', key, 'tokens', 'ts')
+    local tokens = tonumber(state[1]) or capacity
+    local ts = tonumber(state[2]) or now
+    tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+    levels[i] = tokens
+    if mode == 'reserve' then
+        local needed = math.min(cost, capacity)
+        if needed > tokens then
+            wait = math.max(wait, (needed - tokens) / rate)
+        end
+    end
+end
+if mode ~= 'peek' and wait == 0 then
+    for i, key in ipairs(KEYS) do
+        local base = 2 + (i - 1) * 3
+        local capacity = tonumber(ARGV[base])
+        local rate = tonumber(ARGV[base + 1])
+        local tokens = math.max(-capacity, math.min(capacity, levels[i] - tonumber(ARGV[base + 2])))
+        levels[i] = tokens
+        redis.call('HSET', key, 'tokens', tostring(tokens), 'ts', tostring(now))
+        redis.call('PEXPIRE', key, math.ceil((capacity - tokens) / rate * 1000) + 1000)
+    end
+end
+local out = {wait == 0 and 1 or 0, tostring(wait)}
+for i = 1, #levels do
+    out[#out + 1] = tostring(levels[i])
+end
+return out
+"""
+
+
+class InMemoryTokenBucketBackend:
+    """In-process token buckets with the same semantics as the Redis script (single worker / tests)."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self._buckets: Dict[str, List[float]] = {}  # key -> [tokens, ts]
+
+    async def apply(self, mode: str, buckets: List[TokenBucket]) -> Dict[str, Any]:
+        # No awaits between read and write, so this is atomic on the event loop
+        now = self.clock()
+        levels, wait = [], 0.0
+        for bucket in buckets:
+            tokens, ts = self._buckets.get(bucket.key, (bucket.capacity, now))
+            tokens = min(bucket.capacity, tokens + max(0.0, now - ts) * bucket.refill_per_second)
+            levels.append(tokens)
+            needed = min(bucket.cost, bucket.capacity)
+            if mode == "reserve" and needed > tokens:
+                wait = max(wait, (needed - tokens) / bucket.refill_per_second)
+        if mode != "peek" and wait == 0:
+            for i, bucket in enumerate(buckets):
+                levels[i] = max(-bucket.capacity, min(bucket.capacity, levels[i] - bucket.cost))
+                self._buckets[bucket.key] = [levels[i], now]
+        return {"allowed": wait == 0, "retry_after": wait, "levels": levels}
+
+    async def delete(self, keys: List[str]) -> int:
+        return sum(self._buckets.pop(key, None) is not None for key in keys)
+
+    async def health_check(self) -> Dict[str, Any]:
+        return {"healthy": True, "backend": "memory", "buckets": len(self._buckets)}
+
+
+class RedisTokenBucketBackend:
+    """Token buckets in Redis hashes, updated by one atomic Lua script per call."""
+
+    def __init__(self, redis_adapter):
+        """
+        Args:
+            redis_adapter: RedisAdapter (register_script/delete/test_connection)
+        """
+        self.redis_adapter = redis_adapter
+        self._script = redis_adapter.register_script(TOKEN_BUCKET_LUA)
+
+    async def apply(self, mode: str, buckets: List[TokenBucket]) -> Dict[str, Any]:
+        args = [mode]
+        for bucket in buckets:
+            args.extend([repr(float(bucket.capacity)), repr(float(bucket.refill_per_second)), repr(float(bucket.cost))])
+        result = await self._script(keys=[bucket.key for bucket in buckets], args=args)
+        return {
+            "allowed": int(result[0]) == 1,
+            "retry_after": float(result[1]),
+            "levels": [float(level) for level in result[2:]]
+        }
+
+    async def delete(self, keys: List[str]) -> int:
+        deleted = 0
+        for key in keys:
+            deleted += bool(await self.redis_adapter.delete(key))
+        return deleted
+
+    async def health_check(self) -> Dict[str, Any]:
+        connection = await self.redis_adapter.test_connection()
+        healthy = connection.get("success", False) if isinstance(connection, dict) else bool(connection)
+        return {"healthy": healthy, "backend": "redis"}
+
+
+class RateLimitingAdapter:
+    """Raw token-bucket rate limiting adapter - no business logic."""
+
+    def __init__(self, backend=None):
+        """
+        Initialize rate limiting adapter.
+
+        Args:
+            backend: RedisTokenBucketBackend or InMemoryTokenBucketBackend (default: in-memory)
+        """
+        self.backend = backend or InMemoryTokenBucketBackend()
+        logger.info(f"✅ Rate limiting adapter initialized ({type(self.backend).__name__})")
+
+    async def reserve(self, buckets: List[TokenBucket]) -> Dict[str, Any]:
+        """
+        Atomically take each bucket's cost from all buckets, or from none.
+
+        A cost above a bucket's capacity is admitted once the bucket is full and leaves it
+        in debt, so oversized requests are delayed rather than rejected forever.
+
+        Returns:
+            Dict: allowed, retry_after (seconds until all buckets could cover the cost), levels
+        """
+        return await self.backend.apply("reserve", buckets)
+
+    async def adjust(self, buckets: List[TokenBucket]) -> Dict[str, Any]:
+        """Unconditionally apply each bucket's cost (negative cost refunds tokens)."""
+        return await self.backend.apply("adjust", buckets)
+
+    async def peek(self, buckets: List[TokenBucket]) -> List[float]:
+        """Current (refilled) level of each bucket, without changing it."""
+        return (await self.backend.apply("peek", buckets))["levels"]
+
+    async def delete_buckets(self, keys: List[str]) -> int:
+        """Forget buckets (they read as full afterwards)."""
+        return await self.backend.delete(keys)
+
+    async def health_check(self) -> Dict[str, Any]:
+        """Perform health check."""
+        try:
+            return await self.backend.health_check()
+        except Exception as e:
+            logger.error(f"❌ Rate limiting backend health check failed: {e}")
+            return {"healthy": False, "error": str(e)}
+
+
+# ============================================================================
+# GCRA (generic cell rate algorithm) - request admission
+# ============================================================================
+
+@dataclass
+class RateLimit:
+    """At most `limit` requests per `period` seconds under `key` (bursts up to `limit`)."""
+    key: str
+    limit: int
+    period: float
+
+
+@dataclass
+class RateLimitDecision:
+    """Outcome of one admission decision."""
+    allowed: bool
+    remaining: int
+    retry_after: float
+    reset_after: float
+    source: str = "backend"
+
+
+# Each key stores its theoretical arrival time (TAT). A request of `cost` is admitted under
+# every limit or under none; the TATs only move when it is admitted. One round trip per decision.
+GCRA_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local cost = tonumber(ARGV[1])
+local tats = {}
+local retry_after = 0
+local remaining = -1
+local reset_after = 0
+for i, key in ipairs(KEYS) do
+    local period = tonumber(ARGV[2 * i])
+    local interval = period / tonumber(ARGV[2 * i + 1])
+    local tat = math.max(tonumber(redis.call('GET', key)) or now, now)
+    local new_tat = tat + interval * cost
+    local slack = now - (new_tat - period)
+    tats[i] = new_tat
+    if slack < -0.000001 then
+        retry_after = math.max(retry_after, -slack)
+    else
+        local left = math.max(0, math.floor(slack / interval + 0.000001))
+        if remaining < 0 or left < remaining then
+            remaining = left
+        end
+    end
+    reset_after = math.max(reset_after, new_tat - now)
+end
+if retry_after > 0 then
+    return {0, tostring(retry_after), '0', tostring(reset_after)}
+end
+for i, key in ipairs(KEYS) do
+    redis.call('SET', key, tostring(tats[i]), 'PX', math.ceil((tats[i] - now) * 1000) + 1)
+end
+return {1, '0', tostring(remaining), tostring(reset_after)}
+"""
+
+# Gives back `cost` unused admissions: moves each TAT back by cost emission intervals
+# (never below now; a key that ends up at or before now reads as a fresh key).
+GCRA_REFUND_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local cost = tonumber(ARGV[1])
+for i, key in ipairs(KEYS) do
+    local tat = tonumber(redis.call('GET', key))
+    if tat then
+        local new_tat = tat - tonumber(ARGV[2 * i]) / tonumber(ARGV[2 * i + 1]) * cost
+        if new_tat > now then
+            redis.call('SET', key, tostring(new_tat), 'PX', math.ceil((new_tat - now) * 1000) + 1)
+        else
+            redis.call('DEL', key)
+        end
+    end
+end
+return 1
+"""
+
+
+class InMemoryGCRABackend:
+    """In-process GCRA with the same semantics as the Redis script (single worker / tests)."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic, max_keys: int = 100000):
+        self.clock = clock
+        self.max_keys = max_keys
+        self._tats: Dict[str, float] = {}
+
+    async def gcra(self, limits: List[RateLimit], cost: int = 1) -> RateLimitDecision:
+        return self.gcra_now(limits, cost)
+
+    def gcra_now(self, limits: List[RateLimit], cost: int = 1) -> RateLimitDecision:
+        """Synchronous decision (no awaits, so atomic on the event loop)."""
+        now = self.clock()
+        new_tats, retry_after, remaining, reset_after = [], 0.0, None, 0.0
+        for limit in limits:
+            interval = limit.period / limit.limit
+            new_tat = max(self._tats.get(limit.key, now), now) + interval * cost
+            slack = now - (new_tat - limit.period)
+            new_tats.append(new_tat)
+            if slack < -1e-6:  # tolerance for float drift in accumulated TATs
+                retry_after = max(retry_after, -slack)
+            else:
+                left = max(0, int(slack / interval + 1e-6))
+                remaining = left if remaining is None else min(remaining, left)
+            reset_after = max(reset_after, new_tat - now)
+        if retry_after > 0:
+            return RateLimitDecision(False, 0, retry_after, reset_after)
+        if len(self._tats) >= self.max_keys:
+            self._tats = {key: tat for key, tat in self._tats.items() if tat > now}
+        for limit, new_tat in zip(limits, new_tats):
+            self._tats[limit.key] = new_tat
+        return RateLimitDecision(True, remaining or 0, 0.0, reset_after)
+
+    async def refund(self, limits: List[RateLimit], cost: int) -> None:
+        self.refund_now(limits, cost)
+
+    def refund_now(self, limits: List[RateLimit], cost: int) -> None:
+        """Give back `cost` unused admissions under every limit."""
+        now = self.clock()
+        for limit in limits:
+            tat = self._tats.get(limit.key)
+            if tat is None:
+                continue
+            new_tat = tat - limit.period / limit.limit * cost
+            if new_tat > now:
+                self._tats[limit.key] = new_tat
+            else:
+                del self._tats[limit.key]
+
+    async def delete(self, keys: List[str]) -> int:
+        return sum(self._tats.pop(key, None) is not None for key in keys)
+
+
+class RedisGCRABackend:
+    """GCRA state in Redis strings, decided by one atomic Lua script per call."""
+
+    def __init__(self, redis_client):
+        """
+        Args:
+            redis_client: RedisAdapter or redis.asyncio client (register_script/delete)
+        """
+        self.redis_client = redis_client
+        self._script = redis_client.register_script(GCRA_LUA)
+        self._refund_script = redis_client.register_script(GCRA_REFUND_LUA)
+
+    async def gcra(self, limits: List[RateLimit], cost: int = 1) -> RateLimitDecision:
+        args = [cost]
+        for limit in limits:
+            args.extend([repr(float(limit.period)), limit.limit])
+        result = await self._script(keys=[limit.key for limit in limits], args=args)
+        return RateLimitDecision(
+            allowed=int(result[0]) == 1,
+            retry_after=float(result[1]),
+            remaining=int(float(result[2])),
+            reset_after=float(result[3])
+        )
+
+    async def refund(self, limits: List[RateLimit], cost: int) -> None:
+        args = [cost]
+        for limit in limits:
+            args.extend([repr(float(limit.period)), limit.limit])
+        await self._refund_script(keys=[limit.key for limit in limits], args=args)
+
+    async def delete(self, keys: List[str]) -> int:
+        deleted = 0
+        for key in keys:
+            deleted += bool(await self.redis_client.delete(key))
+        return deleted
+
+
+@dataclass
+class _Lease:
+    """Admissions debited in a backend but not yet used by this process."""
+    limits: List[RateLimit]
+    cost_left: int
+    expires_at: float
+    remaining: int      # backend remaining when the batch was admitted
+    fallback: bool      # debited in the in-process fallback instead of the backend
+
+
+class GCRARateLimiter:
+    """
+    Shared request-admission engine (Traffic Cop and the HTTP rate limiting middleware).
+
+    Decisions are made by the backend (Redis: one round trip, exact across workers). A local
+    pre-check avoids the round trip for clients far below their limit: when the last decision
+    left more than `lease_threshold` of the limit, the next backend call admits a small batch
+    (debited in the backend, so the global limit is never exceeded) and the extra admissions
+    are served from process memory for up to `lease_ttl` seconds. Whatever is left of a batch
+    when it expires, is dropped or the limiter is closed is refunded to the backend, so leases
+    only hold quota back for `lease_ttl` and never lose it. If the backend fails, decisions
+    fall back to an in-process limiter instead of failing open.
+    """
+
+    def __init__(self, backend, lease_max: int = 16, lease_fraction: float = 0.05,
+                 lease_threshold: float = 0.5, lease_ttl: float = 1.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize rate limiter.
+
+        Args:
+            backend: RedisGCRABackend or InMemoryGCRABackend
+            lease_max: Largest batch admitted per backend call (1 disables the local pre-check)
+            lease_fraction: Batch size as a fraction of the remaining allowance
+            lease_threshold: Only batch while remaining/limit is above this fraction
+            lease_ttl: Seconds a locally held batch may be used
+        """
+        self.backend = backend
+        self.lease_max = lease_max
+        self.lease_fraction = lease_fraction
+        self.lease_threshold = lease_threshold
+        self.lease_ttl = lease_ttl
+        self.clock = clock
+        self.fallback = InMemoryGCRABackend(clock)
+
+        self._leases: Dict[Tuple[str, ...], _Lease] = {}
+        self._remaining: Dict[Tuple[str, ...], float] = {}  # keys -> last remaining/limit ratio
+        self._next_sweep = 0.0
+        self.stats = {"decisions": 0, "allowed": 0, "denied": 0, "local": 0, "backend_calls": 0,
+                      "fallbacks": 0, "refunded": 0}
+
+    async def check(self, limits: List[RateLimit], cost: int = 1) -> RateLimitDecision:
+        """Admit or deny one request of `cost` under every limit in `limits`."""
+        self.stats["decisions"] += 1
+        scope = tuple(limit.key for limit in limits)
+        now = self.clock()
+        if self._leases and now >= self._next_sweep:
+            await self._refund_expired(now)
+
+        lease = self._leases.get(scope)
+        if lease is not None:
+            if lease.cost_left >= cost and lease.expires_at > now:
+                lease.cost_left -= cost
+                self.stats["local"] += 1
+                self.stats["allowed"] += 1
+                return RateLimitDecision(True, lease.cost_left + lease.remaining, 0.0, 0.0, source="local")
+            await self._refund(self._leases.pop(scope))
+
+        batch = 1
+        if self.lease_max > 1 and self._remaining.get(scope, 0.0) > self.lease_threshold:
+            smallest = min(limit.limit for limit in limits)
+            batch = max(1, min(self.lease_max, int(smallest * self._remaining[scope] * self.lease_fraction)))
+
+        decision = await self._decide(limits, cost * batch)
+        if not decision.allowed and batch > 1:
+            batch = 1
+            decision = await self._decide(limits, cost)
+
+        smallest = min(limit.limit for limit in limits)
+        self._remaining[scope] = decision.remaining / smallest if decision.allowed else 0.0
+        if len(self._remaining) > 100000:
+            self._remaining.clear()
+        if decision.allowed and batch > 1:
+            self._leases[scope] = _Lease(limits, cost * (batch - 1), self.clock() + self.lease_ttl,
+                                         decision.remaining, decision.source == "fallback")
+            decision.remaining += cost * (batch - 1)
+
+        self.stats["allowed" if decision.allowed else "denied"] += 1
+        return decision
+
+    async def _decide(self, limits: List[RateLimit], cost: int) -> RateLimitDecision:
+        self.stats["backend_calls"] += 1
+        try:
+            return await self.backend.gcra(limits, cost)
+        except Exception as e:
+            self.stats["fallbacks"] += 1
+            logger.warning(f"⚠️ Rate limit backend unavailable, deciding locally: {e}")
+            decision = self.fallback.gcra_now(limits, cost)
+            decision.source = "fallback"
+            return decision
+
+    async def _refund_expired(self, now: float) -> None:
+        """Refund every expired lease (at most once per `lease_ttl`, so idle clients give quota back too)."""
+        self._next_sweep = now + self.lease_ttl
+        for scope in [scope for scope, lease in self._leases.items() if lease.expires_at <= now]:
+            lease = self._leases.pop(scope, None)
+            if lease is not None:
+                await self._refund(lease)
+
+    async def _refund(self, lease: _Lease) -> None:
+        """Give a lease's unused admissions back to whichever limiter debited them."""
+        if lease.cost_left <= 0:
+            return
+        self.stats["refunded"] += lease.cost_left
+        if lease.fallback:
+            self.fallback.refund_now(lease.limits, lease.cost_left)
+            return
+        try:
+            await self.backend.refund(lease.limits, lease.cost_left)
+        except Exception as e:
+            logger.warning(f"⚠️ Rate limit backend unavailable, unused lease not refunded: {e}")
+
+    async def close(self) -> None:
+        """Refund all outstanding leases (call on shutdown)."""
+        leases, self._leases = list(self._leases.values()), {}
+        for lease in leases:
+            await self._refund(lease)
+
+    async def reset(self, keys: List[str]) -> bool:
+        """Forget limiter state (backend and local) for the given keys."""
+        for scope in [scope for scope in self._leases if set(scope) & set(keys)]:
+            del self._leases[scope]
+        for scope in [scope for scope in self._remaining if set(scope) & set(keys)]:
+            del self._remaining[scope]
+        await self.fallback.delete(keys)
+        await self.backend.delete(keys)
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Decision counters, including how many were served by the local pre-check."""
+        decisions = self.stats["decisions"]
+        return {
+            **self.stats,
+            "local_ratio": self.stats["local"] / decisions if decisions else 0.0,
+            "leases": len(self._leases)
+        }
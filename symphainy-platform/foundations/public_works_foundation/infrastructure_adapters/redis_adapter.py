@@ -6,7 +6,8 @@ Real Redis client wrapper with no business logic.
 This is Layer 1 of the 5-layer security architecture.
 
 WHAT (Infrastructure Role): I provide raw Redis client operations
-HOW (Infrastructure Implementation): I use real Redis client with no business logic
+HOW (Infrastructure Implementation): I use a redis.asyncio client on the shared connection
+pool (never blocking the event loop) and expose pipelines for batching commands
 """
 
 import os
@@ -15,9 +16,11 @@ import json
 import uuid
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime, timedelta
-import redis
+import redis.asyncio as aioredis
 from redis.exceptions import RedisError
 
+from .redis_connection_pool import get_shared_pool, release_client, DEFAULT_MAX_CONNECTIONS
+
 logger = logging.getLogger(__name__)
 
 class RedisAdapter:
@@ -28,26 +31,31 @@ class RedisAdapter:
     any business logic or abstraction. It's the raw technology layer.
     """
     
-    def __init__(self, host: str, port: int, db: int = 0, password: str = None):
-        """Initialize Redis adapter with real connection."""
+    def __init__(self, host: str, port: int, db: int = 0, password: str = None,
+                 max_connections: int = DEFAULT_MAX_CONNECTIONS):
+        """Initialize Redis adapter on the shared asyncio connection pool."""
         self.host = host
         self.port = port
         self.db = db
         self.password = password
+        self.max_connections = max_connections
         
         # Create Redis client (private - use wrapper methods instead)
-        self._client = redis.Redis(
-            host=host,
-            port=port,
-            db=db,
-            password=password,
-            decode_responses=True
-        )
+        self._client = aioredis.Redis(connection_pool=get_shared_pool(
+            host=host, port=port, db=db, password=password,
+            decode_responses=True, max_connections=max_connections
+        ))
         # Keep client as alias for backward compatibility (will be removed)
         self.client = self._client
         # Also expose as redis_client for compatibility (will be removed)
         self.redis_client = self._client
         
+        # Binary client for raw byte values (shares the connection settings, no response decoding)
+        self._binary_client = aioredis.Redis(connection_pool=get_shared_pool(
+            host=host, port=port, db=db, password=password,
+            decode_responses=False, max_connections=max_connections
+        ))
+        
         logger.info(f"✅ Redis adapter initialized with {host}:{port}/{db}")
     
     # ============================================================================
@@ -58,9 +66,9 @@ class RedisAdapter:
         """Raw Redis SET operation - no business logic."""
         try:
             if ttl:
-                return self._client.setex(key, ttl, value)
+                return await self._client.setex(key, ttl, value)
             else:
-                return self._client.set(key, value)
+                return await self._client.set(key, value)
         except RedisError as e:
             logger.error(f"Redis SET error: {str(e)}")
             return False
@@ -68,7 +76,7 @@ class RedisAdapter:
     async def get(self, key: str) -> Optional[str]:
         """Raw Redis GET operation - no business logic."""
         try:
-            return self._client.get(key)
+            return await self._client.get(key)
         except RedisError as e:
             logger.error(f"Redis GET error: {str(e)}")
             return None
@@ -76,7 +84,7 @@ class RedisAdapter:
     async def delete(self, key: str) -> bool:
         """Raw Redis DELETE operation - no business logic."""
         try:
-            return self._client.delete(key) > 0
+            return (await self._client.delete(key)) > 0
         except RedisError as e:
             logger.error(f"Redis DELETE error: {str(e)}")
             return False
@@ -84,7 +92,7 @@ class RedisAdapter:
     async def exists(self, key: str) -> bool:
         """Raw Redis EXISTS operation - no business logic."""
         try:
-            return self._client.exists(key) > 0
+            return (await self._client.exists(key)) > 0
         except RedisError as e:
             logger.error(f"Redis EXISTS error: {str(e)}")
             return False
@@ -92,11 +100,88 @@ class RedisAdapter:
     async def expire(self, key: str, ttl: int) -> bool:
         """Raw Redis EXPIRE operation - no business logic."""
         try:
-            return self._client.expire(key, ttl)
+            return await self._client.expire(key, ttl)
         except RedisError as e:
             logger.error(f"Redis EXPIRE error: {str(e)}")
             return False
     
+    async def mget(self, keys: List[str]) -> List[Optional[str]]:
+        """Raw Redis MGET operation - no business logic."""
+        try:
+            return await self._client.mget(keys) if keys else []
+        except RedisError as e:
+            logger.error(f"Redis MGET error: {str(e)}")
+            return [None] * len(keys)
+    
+    async def mset(self, mapping: Dict[str, str], ttl: int = None) -> bool:
+        """Raw Redis MSET operation (one round trip; per-key TTL via pipeline) - no business logic."""
+        try:
+            if not mapping:
+                return True
+            if not ttl:
+                return await self._client.mset(mapping)
+            pipe = self._client.pipeline(transaction=False)
+            for key, value in mapping.items():
+                pipe.setex(key, ttl, value)
+            await pipe.execute()
+            return True
+        except RedisError as e:
+            logger.error(f"Redis MSET error: {str(e)}")
+            return False
+    
+    # ============================================================================
+    # RAW PIPELINE OPERATIONS
+    # ============================================================================
+    
+    def pipeline(self, transaction: bool = True):
+        """
+        Raw Redis pipeline - queue commands and send them in one round trip.
+        
+        Usage:
+            async with redis_adapter.pipeline() as pipe:
+                pipe.hset(key, mapping=fields).expire(key, ttl)
+                results = await pipe.execute()
+        
+        transaction=True wraps the commands in MULTI/EXEC.
+        """
+        return self._client.pipeline(transaction=transaction)
+
+    def register_script(self, script: str):
+        """
+        Raw Lua script registration - no business logic.
+
+        Returns an awaitable callable `script(keys=[...], args=[...])` that runs the script
+        atomically via EVALSHA (loading it on first use).
+        """
+        return self._client.register_script(script)
+
+    # ============================================================================
+    # RAW BINARY OPERATIONS
+    # ============================================================================
+    
+    async def mget_bytes(self, keys: List[str]) -> List[Optional[bytes]]:
+        """Raw Redis MGET of byte values - no business logic."""
+        try:
+            return await self._binary_client.mget(keys) if keys else []
+        except RedisError as e:
+            logger.error(f"Redis MGET error: {str(e)}")
+            return [None] * len(keys)
+    
+    async def mset_bytes(self, items: Dict[str, bytes], ttl: int = None) -> bool:
+        """Raw Redis pipelined SET of byte values - no business logic."""
+        try:
+            pipe = self._binary_client.pipeline(transaction=False)
+            for key, value in items.items():
+                if ttl:
+                    pipe.setex(key, ttl, value)
+                else:
+                    pipe.set(key, value)
+            await pipe.execute()
+            return True
+        except RedisError as e:
+            logger.error(f"Redis MSET error: {str(e)}")
+            return False
+    
     # ============================================================================
     # RAW HASH OPERATIONS
     # ============================================================================
@@ -112,20 +197,34 @@ class RedisAdapter:
         try:
             if mapping:
                 # Use mapping parameter (Redis hset with mapping)
-                return self._client.hset(key, mapping=mapping) >= 0
+                return (await self._client.hset(key, mapping=mapping)) >= 0
             elif field and value:
                 # Use single field/value
-                return self._client.hset(key, field, value) >= 0
+                return (await self._client.hset(key, field, value)) >= 0
             else:
                 raise ValueError("Must provide either (field, value) or mapping parameter")
         except RedisError as e:
             logger.error(f"Redis HSET error: {str(e)}")
             return False
     
+    async def hset_many(self, mappings: Dict[str, Dict[str, Any]], ttl: int = None) -> bool:
+        """Raw Redis batched HSET of several hashes in one round trip - no business logic."""
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            for key, mapping in mappings.items():
+                pipe.hset(key, mapping=mapping)
+                if ttl:
+                    pipe.expire(key, ttl)
+            await pipe.execute()
+            return True
+        except RedisError as e:
+            logger.error(f"Redis HSET error: {str(e)}")
+            return False
+    
     async def hget(self, key: str, field: str) -> Optional[str]:
         """Raw Redis HGET operation - no business logic."""
         try:
-            return self._client.hget(key, field)
+            return await self._client.hget(key, field)
         except RedisError as e:
             logger.error(f"Redis HGET error: {str(e)}")
             return None
@@ -133,7 +232,7 @@ class RedisAdapter:
     async def hgetall(self, key: str) -> Dict[str, str]:
         """Raw Redis HGETALL operation - no business logic."""
         try:
-            return self._client.hgetall(key)
+            return await self._client.hgetall(key)
         except RedisError as e:
             logger.error(f"Redis HGETALL error: {str(e)}")
             return {}
@@ -141,7 +240,7 @@ class RedisAdapter:
     async def hdel(self, key: str, field: str) -> bool:
         """Raw Redis HDEL operation - no business logic."""
         try:
-            return self._client.hdel(key, field) > 0
+            return (await self._client.hdel(key, field)) > 0
         except RedisError as e:
             logger.error(f"Redis HDEL error: {str(e)}")
             return False
@@ -153,7 +252,7 @@ class RedisAdapter:
     async def sadd(self, key: str, member: str) -> bool:
         """Raw Redis SADD operation - no business logic."""
         try:
-            return self._client.sadd(key, member) > 0
+            return (await self._client.sadd(key, member)) > 0
         except RedisError as e:
             logger.error(f"Redis SADD error: {str(e)}")
             return False
@@ -161,7 +260,7 @@ class RedisAdapter:
     async def srem(self, key: str, member: str) -> bool:
         """Raw Redis SREM operation - no business logic."""
         try:
-            return self._client.srem(key, member) > 0
+            return (await self._client.srem(key, member)) > 0
         except RedisError as e:
             logger.error(f"Redis SREM error: {str(e)}")
             return False
@@ -169,7 +268,7 @@ class RedisAdapter:
     async def smembers(self, key: str) -> List[str]:
         """Raw Redis SMEMBERS operation - no business logic."""
         try:
-            return list(self._client.smembers(key))
+            return list(await self._client.smembers(key))
         except RedisError as e:
             logger.error(f"Redis SMEMBERS error: {str(e)}")
             return []
@@ -177,7 +276,7 @@ class RedisAdapter:
     async def sismember(self, key: str, member: str) -> bool:
         """Raw Redis SISMEMBER operation - no business logic."""
         try:
-            return self._client.sismember(key, member)
+            return await self._client.sismember(key, member)
         except RedisError as e:
             logger.error(f"Redis SISMEMBER error: {str(e)}")
             return False
@@ -189,7 +288,7 @@ class RedisAdapter:
     async def zadd(self, key: str, score: float, member: str) -> bool:
         """Raw Redis ZADD operation - no business logic."""
         try:
-            return self._client.zadd(key, {member: score}) > 0
+            return (await self._client.zadd(key, {member: score})) > 0
         except RedisError as e:
             logger.error(f"Redis ZADD error: {str(e)}")
             return False
@@ -197,7 +296,7 @@ class RedisAdapter:
     async def zrem(self, key: str, member: str) -> bool:
         """Raw Redis ZREM operation - no business logic."""
         try:
-            return self._client.zrem(key, member) > 0
+            return (await self._client.zrem(key, member)) > 0
         except RedisError as e:
             logger.error(f"Redis ZREM error: {str(e)}")
             return False
@@ -205,7 +304,7 @@ class RedisAdapter:
     async def zrange(self, key: str, start: int, stop: int, withscores: bool = False) -> List:
         """Raw Redis ZRANGE operation - no business logic."""
         try:
-            return self._client.zrange(key, start, stop, withscores=withscores)
+            return await self._client.zrange(key, start, stop, withscores=withscores)
         except RedisError as e:
             logger.error(f"Redis ZRANGE error: {str(e)}")
             return []
@@ -213,7 +312,7 @@ class RedisAdapter:
     async def zscore(self, key: str, member: str) -> Optional[float]:
         """Raw Redis ZSCORE operation - no business logic."""
         try:
-            return self._client.zscore(key, member)
+            return await self._client.zscore(key, member)
         except RedisError as e:
             logger.error(f"Redis ZSCORE error: {str(e)}")
             return None
@@ -225,7 +324,7 @@ class RedisAdapter:
     async def lpush(self, key: str, value: str) -> int:
         """Raw Redis LPUSH operation - no business logic."""
         try:
-            return self._client.lpush(key, value)
+            return await self._client.lpush(key, value)
         except RedisError as e:
             logger.error(f"Redis LPUSH error: {str(e)}")
             return 0
@@ -233,7 +332,7 @@ class RedisAdapter:
     async def rpush(self, key: str, value: str) -> int:
         """Raw Redis RPUSH operation - no business logic."""
         try:
-            return self._client.rpush(key, value)
+            return await self._client.rpush(key, value)
         except RedisError as e:
             logger.error(f"Redis RPUSH error: {str(e)}")
             return 0
@@ -241,7 +340,7 @@ class RedisAdapter:
     async def lpop(self, key: str) -> Optional[str]:
         """Raw Redis LPOP operation - no business logic."""
         try:
-            return self._client.lpop(key)
+            return await self._client.lpop(key)
         except RedisError as e:
             logger.error(f"Redis LPOP error: {str(e)}")
             return None
@@ -249,7 +348,7 @@ class RedisAdapter:
     async def rpop(self, key: str) -> Optional[str]:
         """Raw Redis RPOP operation - no business logic."""
         try:
-            return self._client.rpop(key)
+            return await self._client.rpop(key)
         except RedisError as e:
             logger.error(f"Redis RPOP error: {str(e)}")
             return None
@@ -257,7 +356,7 @@ class RedisAdapter:
     async def llen(self, key: str) -> int:
         """Raw Redis LLEN operation - no business logic."""
         try:
-            return self._client.llen(key)
+            return await self._client.llen(key)
         except RedisError as e:
             logger.error(f"Redis LLEN error: {str(e)}")
             return 0
@@ -280,14 +379,14 @@ class RedisAdapter:
                 "data": json.dumps(session_data)
             }
             
-            # Store session in Redis with TTL
-            await self.hset(session_key, "data", json.dumps(session_info))
-            await self.expire(session_key, ttl_seconds)
-            
-            # Store user session mapping for easy cleanup
+            # Store session + user session mapping (for easy cleanup) in one transaction
             user_sessions_key = f"user_sessions:{user_id}"
-            await self.sadd(user_sessions_key, session_id)
-            await self.expire(user_sessions_key, ttl_seconds)
+            async with self.pipeline(transaction=True) as pipe:
+                pipe.hset(session_key, "data", json.dumps(session_info))
+                pipe.expire(session_key, ttl_seconds)
+                pipe.sadd(user_sessions_key, session_id)
+                pipe.expire(user_sessions_key, ttl_seconds)
+                await pipe.execute()
             
             logger.info(f"✅ Created session {session_id} for user {user_id}")
             return session_id
@@ -327,8 +426,10 @@ class RedisAdapter:
             }
             
             # Update session in Redis
-            await self.hset(session_key, "data", json.dumps(session_info))
-            await self.expire(session_key, ttl_seconds)
+            async with self.pipeline(transaction=True) as pipe:
+                pipe.hset(session_key, "data", json.dumps(session_info))
+                pipe.expire(session_key, ttl_seconds)
+                await pipe.execute()
             
             return True
             
@@ -365,7 +466,7 @@ class RedisAdapter:
         """Test Redis connection - no business logic."""
         try:
             # Test with a simple ping
-            result = self._client.ping()
+            result = await self._client.ping()
             return {
                 "success": True,
                 "message": "Redis connection successful",
@@ -390,5 +491,16 @@ class RedisAdapter:
             "port": self.port,
             "db": self.db,
             "has_password": bool(self.password),
-            "client_initialized": self._client is not None
+            "client_initialized": self._client is not None,
+            "max_connections": self.max_connections
         }
+    
+    async def close(self) -> bool:
+        """Release this adapter's clients; the shared pools stay open for other adapters - no business logic."""
+        try:
+            await release_client(self._client)
+            await release_client(self._binary_client)
+            return True
+        except Exception as e:
+            logger.error(f"Redis close failed: {str(e)}")
+            return False
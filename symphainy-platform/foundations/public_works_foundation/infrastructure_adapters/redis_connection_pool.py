@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Redis Connection Pool - Shared asyncio Connection Pools
+
+Process-wide registry of redis.asyncio connection pools.
+This is Layer 1 of the 5-layer infrastructure architecture.
+
+WHAT (Infrastructure Role): I give every Redis adapter in a worker the same bounded connection pool
+HOW (Infrastructure Implementation): I key redis.asyncio ConnectionPools by server, db and
+response decoding, so RedisAdapter, RedisStateAdapter and CacheAdapter share connections
+instead of each opening their own
+"""
+
+import logging
+from typing import Dict, Optional, Tuple
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 50
+
+_pools: Dict[Tuple, "aioredis.ConnectionPool"] = {}
+
+
+def get_shared_pool(
+    host: str = "localhost",
+    port: int = 6379,
+    db: int = 0,
+    password: Optional[str] = None,
+    url: Optional[str] = None,
+    decode_responses: bool = True,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS
+) -> "aioredis.ConnectionPool":
+    """
+    Get (or create) the shared asyncio connection pool for a Redis server.
+
+    Args:
+        host / port / db / password: Server settings (ignored when url is given)
+        url: redis:// URL
+        decode_responses: Decode replies to str (False for raw bytes)
+        max_connections: Pool size; only applied when the pool is first created
+
+    Returns:
+        redis.asyncio.ConnectionPool
+    """
+    if aioredis is None:
+        raise ImportError("redis.asyncio not available")
+
+    key = (url, host, port, db, password, decode_responses)
+    pool = _pools.get(key)
+    if pool is None:
+        if url:
+            pool = aioredis.ConnectionPool.from_url(
+                url, decode_responses=decode_responses, max_connections=max_connections
+            )
+        else:
+            pool = aioredis.ConnectionPool(
+                host=host,
+                port=port,
+                db=db,
+                password=password,
+                decode_responses=decode_responses,
+                max_connections=max_connections
+            )
+        _pools[key] = pool
+        logger.info(f"✅ Redis connection pool created for {url or f'{host}:{port}/{db}'} (max {max_connections})")
+    return pool
+
+
+async def release_client(client: "aioredis.Redis"):
+    """
+    Close one consumer's client without touching the shared pool behind it.
+
+    Clients built with an explicit connection_pool never close that pool, so
+    other adapters keep working; the pools themselves are only disconnected
+    by close_shared_pools() at foundation shutdown.
+    """
+    close = getattr(client, "aclose", None) or client.close
+    await close()
+
+
+async def close_shared_pools():
+    """Disconnect and forget every shared pool (shutdown)."""
+    for pool in list(_pools.values()):
+        try:
+            await pool.disconnect()
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to disconnect Redis pool: {e}")
+    _pools.clear()
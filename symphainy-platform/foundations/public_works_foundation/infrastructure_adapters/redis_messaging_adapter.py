@@ -658,5 +658,14 @@ class RedisMessagingAdapter:
                 self.logger.error(f"❌ Error cleaning up old messages: {e}")
             return 0
 
+    # ============================================================================
+    # PUB/SUB (raw Redis channels, used for WebSocket fan-out)
+    # ============================================================================
 
+    def pubsub(self):
+        """Create a raw Redis PubSub on the adapter's client."""
+        return self.redis_client.pubsub()
 
+    async def publish(self, channel: str, payload: str) -> int:
+        """Publish a raw payload to a Redis channel; returns the number of subscribers reached."""
+        return await self.redis_client.publish(channel, payload)
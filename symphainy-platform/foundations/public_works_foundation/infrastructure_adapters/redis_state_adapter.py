@@ -6,24 +6,31 @@ Raw Redis client wrapper for session state management.
 This is Layer 1 of the 5-layer infrastructure architecture.
 
 WHAT (Infrastructure Role): I provide raw Redis operations for session state management
-HOW (Infrastructure Implementation): I use real Redis client with no business logic
+HOW (Infrastructure Implementation): I use a redis.asyncio client on the shared connection
+pool with no business logic
 """
 
 import logging
 import json
 from typing import Dict, Any, Optional, List, Union
-import redis
+import redis.asyncio as aioredis
 from redis.exceptions import RedisError
 
+from .redis_connection_pool import get_shared_pool, release_client, DEFAULT_MAX_CONNECTIONS
+
 logger = logging.getLogger(__name__)
 
 class RedisStateAdapter:
     """Raw Redis client wrapper for state management - no business logic."""
     
-    def __init__(self, host: str, port: int, db: int = 0, password: str = None):
-        """Initialize Redis state adapter with real connection."""
+    def __init__(self, host: str, port: int, db: int = 0, password: str = None,
+                 max_connections: int = DEFAULT_MAX_CONNECTIONS):
+        """Initialize Redis state adapter on the shared asyncio connection pool."""
         # Create Redis client (private - use wrapper methods instead)
-        self._client = redis.Redis(host=host, port=port, db=db, password=password, decode_responses=True)
+        self._client = aioredis.Redis(connection_pool=get_shared_pool(
+            host=host, port=port, db=db, password=password,
+            decode_responses=True, max_connections=max_connections
+        ))
         # Keep client as alias for backward compatibility (will be removed)
         self.client = self._client
         logger.info(f"✅ Redis State adapter initialized with {host}:{port}/{db}")
@@ -35,7 +42,7 @@ class RedisStateAdapter:
     async def set_string(self, key: str, value: str, ttl: int = None) -> bool:
         """Raw string set - no business logic."""
         try:
-            return self._client.set(key, value, ex=ttl)
+            return await self._client.set(key, value, ex=ttl)
         except RedisError as e:
             logger.error(f"❌ Failed to set string {key}: {e}")
             return False
@@ -43,7 +50,7 @@ class RedisStateAdapter:
     async def get_string(self, key: str) -> Optional[str]:
         """Raw string get - no business logic."""
         try:
-            return self._client.get(key)
+            return await self._client.get(key)
         except RedisError as e:
             logger.error(f"❌ Failed to get string {key}: {e}")
             return None
@@ -51,7 +58,7 @@ class RedisStateAdapter:
     async def delete_string(self, key: str) -> bool:
         """Raw string delete - no business logic."""
         try:
-            return bool(self._client.delete(key))
+            return bool(await self._client.delete(key))
         except RedisError as e:
             logger.error(f"❌ Failed to delete string {key}: {e}")
             return False
@@ -63,7 +70,7 @@ class RedisStateAdapter:
     async def set_hash(self, key: str, field: str, value: str) -> bool:
         """Raw hash field set - no business logic."""
         try:
-            return bool(self._client.hset(key, field, value))
+            return bool(await self._client.hset(key, field, value))
         except RedisError as e:
             logger.error(f"❌ Failed to set hash field {key}.{field}: {e}")
             return False
@@ -71,7 +78,7 @@ class RedisStateAdapter:
     async def get_hash(self, key: str, field: str) -> Optional[str]:
         """Raw hash field get - no business logic."""
         try:
-            return self._client.hget(key, field)
+            return await self._client.hget(key, field)
         except RedisError as e:
             logger.error(f"❌ Failed to get hash field {key}.{field}: {e}")
             return None
@@ -79,7 +86,7 @@ class RedisStateAdapter:
     async def get_all_hash(self, key: str) -> Dict[str, str]:
         """Raw hash get all - no business logic."""
         try:
-            return self._client.hgetall(key)
+            return await self._client.hgetall(key)
         except RedisError as e:
             logger.error(f"❌ Failed to get hash {key}: {e}")
             return {}
@@ -87,14 +94,63 @@ class RedisStateAdapter:
     async def set_multiple_hash(self, key: str, mapping: Dict[str, str], ttl: int = None) -> bool:
         """Raw hash set multiple - no business logic."""
         try:
-            result = self._client.hset(key, mapping=mapping)
+            # HSET + EXPIRE in one round trip
+            pipe = self._client.pipeline(transaction=True)
+            pipe.hset(key, mapping=mapping)
             if ttl:
-                self._client.expire(key, ttl)
-            return bool(result)
+                pipe.expire(key, ttl)
+            results = await pipe.execute()
+            return bool(results[0])
         except RedisError as e:
             logger.error(f"❌ Failed to set hash multiple {key}: {e}")
             return False
     
+    async def set_hashes(self, mappings: Dict[str, Dict[str, str]], ttl: int = None) -> bool:
+        """Raw batched hash set across several keys in one round trip - no business logic."""
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            for key, mapping in mappings.items():
+                pipe.hset(key, mapping=mapping)
+                if ttl:
+                    pipe.expire(key, ttl)
+            await pipe.execute()
+            return True
+        except RedisError as e:
+            logger.error(f"❌ Failed to set hashes: {e}")
+            return False
+    
+    # ============================================================================
+    # RAW BATCH OPERATIONS
+    # ============================================================================
+    
+    def pipeline(self, transaction: bool = True):
+        """Raw pipeline (MULTI/EXEC when transaction=True) - queue commands, then await execute()."""
+        return self._client.pipeline(transaction=transaction)
+    
+    async def get_strings(self, keys: List[str]) -> List[Optional[str]]:
+        """Raw multi-get - no business logic."""
+        try:
+            return await self._client.mget(keys) if keys else []
+        except RedisError as e:
+            logger.error(f"❌ Failed to get strings: {e}")
+            return [None] * len(keys)
+    
+    async def set_strings(self, mapping: Dict[str, str], ttl: int = None) -> bool:
+        """Raw multi-set (pipelined SET EX when ttl is given) - no business logic."""
+        try:
+            if not mapping:
+                return True
+            if not ttl:
+                return bool(await self._client.mset(mapping))
+            pipe = self._client.pipeline(transaction=False)
+            for key, value in mapping.items():
+                pipe.set(key, value, ex=ttl)
+            await pipe.execute()
+            return True
+        except RedisError as e:
+            logger.error(f"❌ Failed to set strings: {e}")
+            return False
+    
     # ============================================================================
     # RAW LIST OPERATIONS
     # ============================================================================
@@ -102,7 +158,7 @@ class RedisStateAdapter:
     async def push_list(self, key: str, value: str, side: str = "right") -> int:
         """Raw list push - no business logic."""
         try:
-            return self._client.lpush(key, value) if side == "left" else self._client.rpush(key, value)
+            return await (self._client.lpush(key, value) if side == "left" else self._client.rpush(key, value))
         except RedisError as e:
             logger.error(f"❌ Failed to push list {key}: {e}")
             return 0
@@ -110,7 +166,7 @@ class RedisStateAdapter:
     async def pop_list(self, key: str, side: str = "right") -> Optional[str]:
         """Raw list pop - no business logic."""
         try:
-            return self._client.lpop(key) if side == "left" else self._client.rpop(key)
+            return await (self._client.lpop(key) if side == "left" else self._client.rpop(key))
         except RedisError as e:
             logger.error(f"❌ Failed to pop list {key}: {e}")
             return None
@@ -118,7 +174,7 @@ class RedisStateAdapter:
     async def get_list_range(self, key: str, start: int = 0, end: int = -1) -> List[str]:
         """Raw list range - no business logic."""
         try:
-            return self._client.lrange(key, start, end)
+            return await self._client.lrange(key, start, end)
         except RedisError as e:
             logger.error(f"❌ Failed to get list range {key}: {e}")
             return []
@@ -130,7 +186,7 @@ class RedisStateAdapter:
     async def add_set(self, key: str, *values: str) -> int:
         """Raw set add - no business logic."""
         try:
-            return self._client.sadd(key, *values)
+            return await self._client.sadd(key, *values)
         except RedisError as e:
             logger.error(f"❌ Failed to add set {key}: {e}")
             return 0
@@ -138,7 +194,7 @@ class RedisStateAdapter:
     async def get_set_members(self, key: str) -> set:
         """Raw set members - no business logic."""
         try:
-            return self._client.smembers(key)
+            return await self._client.smembers(key)
         except RedisError as e:
             logger.error(f"❌ Failed to get set members {key}: {e}")
             return set()
@@ -146,7 +202,7 @@ class RedisStateAdapter:
     async def is_set_member(self, key: str, value: str) -> bool:
         """Raw set membership check - no business logic."""
         try:
-            return self._client.sismember(key, value)
+            return await self._client.sismember(key, value)
         except RedisError as e:
             logger.error(f"❌ Failed to check set membership {key}.{value}: {e}")
             return False
@@ -158,7 +214,7 @@ class RedisStateAdapter:
     async def add_sorted_set(self, key: str, mapping: Dict[str, float]) -> int:
         """Raw sorted set add - no business logic."""
         try:
-            return self._client.zadd(key, mapping)
+            return await self._client.zadd(key, mapping)
         except RedisError as e:
             logger.error(f"❌ Failed to add sorted set {key}: {e}")
             return 0
@@ -167,7 +223,7 @@ class RedisStateAdapter:
                                  with_scores: bool = False) -> List[Union[str, tuple]]:
         """Raw sorted set range - no business logic."""
         try:
-            return self._client.zrange(key, start, end, withscores=with_scores)
+            return await self._client.zrange(key, start, end, withscores=with_scores)
         except RedisError as e:
             logger.error(f"❌ Failed to get sorted set range {key}: {e}")
             return []
@@ -179,7 +235,7 @@ class RedisStateAdapter:
     async def set_ttl(self, key: str, ttl: int) -> bool:
         """Raw TTL set - no business logic."""
         try:
-            return self._client.expire(key, ttl)
+            return await self._client.expire(key, ttl)
         except RedisError as e:
             logger.error(f"❌ Failed to set TTL {key}: {e}")
             return False
@@ -187,7 +243,7 @@ class RedisStateAdapter:
     async def get_ttl(self, key: str) -> int:
         """Raw TTL get - no business logic."""
         try:
-            return self._client.ttl(key)
+            return await self._client.ttl(key)
         except RedisError as e:
             logger.error(f"❌ Failed to get TTL {key}: {e}")
             return -1
@@ -199,7 +255,7 @@ class RedisStateAdapter:
     async def key_exists(self, key: str) -> bool:
         """Raw key existence check - no business logic."""
         try:
-            return bool(self._client.exists(key))
+            return bool(await self._client.exists(key))
         except RedisError as e:
             logger.error(f"❌ Failed to check key existence {key}: {e}")
             return False
@@ -207,7 +263,7 @@ class RedisStateAdapter:
     async def get_keys(self, pattern: str = "*") -> List[str]:
         """Raw keys search - no business logic."""
         try:
-            return self._client.keys(pattern)
+            return await self._client.keys(pattern)
         except RedisError as e:
             logger.error(f"❌ Failed to get keys {pattern}: {e}")
             return []
@@ -215,7 +271,7 @@ class RedisStateAdapter:
     async def delete_keys(self, *keys: str) -> int:
         """Raw keys delete - no business logic."""
         try:
-            return self._client.delete(*keys)
+            return await self._client.delete(*keys)
         except RedisError as e:
             logger.error(f"❌ Failed to delete keys: {e}")
             return 0
@@ -228,7 +284,7 @@ class RedisStateAdapter:
         """Raw JSON set - no business logic."""
         try:
             json_data = json.dumps(data)
-            return self._client.set(key, json_data, ex=ttl)
+            return await self._client.set(key, json_data, ex=ttl)
         except (RedisError, json.JSONEncodeError) as e:
             logger.error(f"❌ Failed to set JSON {key}: {e}")
             return False
@@ -236,7 +292,7 @@ class RedisStateAdapter:
     async def get_json(self, key: str) -> Optional[Dict[str, Any]]:
         """Raw JSON get - no business logic."""
         try:
-            result = self._client.get(key)
+            result = await self._client.get(key)
             return json.loads(result) if result else None
         except (RedisError, json.JSONDecodeError) as e:
             logger.error(f"❌ Failed to get JSON {key}: {e}")
@@ -249,7 +305,7 @@ class RedisStateAdapter:
     async def test_connection(self) -> bool:
         """Raw connection test - no business logic."""
         try:
-            return self._client.ping()
+            return await self._client.ping()
         except RedisError as e:
             logger.error(f"❌ Connection test failed: {e}")
             return False
@@ -257,15 +313,15 @@ class RedisStateAdapter:
     async def get_info(self) -> Dict[str, Any]:
         """Raw Redis info - no business logic."""
         try:
-            return self._client.info()
+            return await self._client.info()
         except RedisError as e:
             logger.error(f"❌ Failed to get Redis info: {e}")
             return {}
     
     async def close_connection(self) -> bool:
-        """Raw connection close - no business logic."""
+        """Raw connection close (shared pool stays open) - no business logic."""
         try:
-            self._client.close()
+            await release_client(self._client)
             return True
         except Exception as e:
             logger.error(f"❌ Failed to close connection: {e}")
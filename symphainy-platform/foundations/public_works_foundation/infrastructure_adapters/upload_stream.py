@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Upload Stream - Raw Technology Client
+
+Chunked, hashed, size-checked view of an uploaded file.
+This is Layer 1 of the 5-layer infrastructure architecture.
+
+An UploadStream wraps the uploaded file part (a Starlette UploadFile, any object with
+an async or sync read(size), or an async iterator of chunks) and is passed through the
+upload path in place of the file bytes. Storage adapters pull it chunk by chunk, so at
+most one chunk of the file is in memory per upload; the SHA-256 and byte count are
+computed as chunks go by, and the upload is aborted as soon as it exceeds max_bytes.
+len() returns the declared size so callers that only need the size keep working.
+
+WHAT (Infrastructure Role): I stream uploaded files in bounded chunks
+HOW (Infrastructure Implementation): I read the file part chunk by chunk, hashing and size-checking incrementally
+"""
+
+import asyncio
+import hashlib
+import logging
+from typing import Any, AsyncIterator, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+class UploadTooLargeError(ValueError):
+    """Raised when an upload exceeds its size limit."""
+    
+    def __init__(self, size: int, max_bytes: int):
+        super().__init__(f"Upload exceeds the {max_bytes} byte limit ({size}+ bytes)")
+        self.size = size
+        self.max_bytes = max_bytes
+
+
+class UploadStream:
+    """
+    Raw chunked upload source - no business logic.
+    
+    Single pass: chunks() can be iterated once unless the source is seekable (rewind()).
+    """
+    
+    def __init__(
+        self,
+        source: Any,
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+        size: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_bytes: Optional[int] = None
+    ):
+        """
+        Initialize upload stream.
+        
+        Args:
+            source: Object with (async) read(size), or an async iterator of byte chunks
+            filename: Original filename
+            content_type: MIME type
+            size: Declared size in bytes (None if unknown until read)
+            chunk_size: Bytes per chunk
+            max_bytes: Abort once more than this many bytes are read (None = unlimited)
+        """
+        self.source = source
+        self.filename = filename
+        self.content_type = content_type
+        self.size = size
+        self.chunk_size = max(1, chunk_size)
+        self.max_bytes = max_bytes
+        self.bytes_read = 0
+        self.completed = False
+        self.size_error: Optional[UploadTooLargeError] = None  # Set once the size limit is hit
+        self._sha256 = hashlib.sha256()
+        self._md5 = hashlib.md5()
+    
+    @classmethod
+    def from_upload_file(cls, upload_file: Any, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                         max_bytes: Optional[int] = None) -> "UploadStream":
+        """Wrap a Starlette/FastAPI UploadFile (already spooled by the multipart parser)."""
+        size = getattr(upload_file, "size", None)
+        if size is None:
+            file_obj = getattr(upload_file, "file", None)
+            if file_obj is not None and file_obj.seekable():
+                position = file_obj.tell()
+                size = file_obj.seek(0, 2) - position
+                file_obj.seek(position)
+        return cls(
+            upload_file,
+            filename=getattr(upload_file, "filename", None),
+            content_type=getattr(upload_file, "content_type", None),
+            size=size,
+            chunk_size=chunk_size,
+            max_bytes=max_bytes
+        )
+    
+    def __len__(self) -> int:
+        return self.size if self.size is not None else self.bytes_read
+    
+    def __bool__(self) -> bool:
+        return True
+    
+    @property
+    def sha256(self) -> Optional[str]:
+        """Hex SHA-256 of the content (available once the stream is fully read)."""
+        return self._sha256.hexdigest() if self.completed else None
+    
+    @property
+    def md5(self) -> Optional[str]:
+        """Hex MD5 of the content (available once the stream is fully read)."""
+        return self._md5.hexdigest() if self.completed else None
+    
+    def check_size(self):
+        """Fail fast on a declared size over the limit."""
+        if self.max_bytes is not None and self.size is not None and self.size > self.max_bytes:
+            self.size_error = UploadTooLargeError(self.size, self.max_bytes)
+            raise self.size_error
+    
+    @property
+    def rewindable(self) -> bool:
+        seek = getattr(self.source, "seek", None)
+        file_obj = getattr(self.source, "file", None)
+        return callable(seek) and (file_obj is None or file_obj.seekable())
+    
+    async def rewind(self):
+        """Restart from the first byte (seekable sources only)."""
+        if not self.rewindable:
+            raise RuntimeError("Upload source is not seekable")
+        result = self.source.seek(0)
+        if asyncio.iscoroutine(result):
+            await result
+        self.bytes_read = 0
+        self.completed = False
+        self._sha256 = hashlib.sha256()
+        self._md5 = hashlib.md5()
+    
+    async def _read_source(self) -> AsyncIterator[bytes]:
+        read = getattr(self.source, "read", None)
+        if read is None:
+            async for chunk in self.source:
+                yield chunk
+            return
+        while True:
+            chunk = read(self.chunk_size)
+            if asyncio.iscoroutine(chunk):
+                chunk = await chunk
+            if not chunk:
+                return
+            yield chunk
+    
+    async def chunks(self) -> AsyncIterator[bytes]:
+        """Yield the content chunk by chunk, hashing and size-checking as it goes."""
+        self.check_size()
+        async for chunk in self._read_source():
+            self.bytes_read += len(chunk)
+            if self.max_bytes is not None and self.bytes_read > self.max_bytes:
+                self.size_error = UploadTooLargeError(self.bytes_read, self.max_bytes)
+                raise self.size_error
+            self._sha256.update(chunk)
+            self._md5.update(chunk)
+            yield chunk
+        self.completed = True
+        if self.size is None:
+            self.size = self.bytes_read
+    
+    async def read(self) -> bytes:
+        """Materialize the whole content (for consumers that need bytes - avoid for large files)."""
+        if self.bytes_read and self.rewindable:
+            await self.rewind()
+        return b"".join([chunk async for chunk in self.chunks()])
@@ -0,0 +1,517 @@
+#!/usr/bin/env python3
+"""
+Vector Index Adapter - Raw Technology Client
+
+In-process nearest-neighbour index over embedding vectors, partitioned by tenant.
+This is Layer 1 of the 5-layer infrastructure architecture.
+
+WHAT (Infrastructure Role): I provide raw vector similarity search
+HOW (Infrastructure Implementation): I use NumPy brute-force scoring for small partitions and an
+inverted-file (IVF) index built with spherical k-means for large ones
+"""
+
+import os
+import re
+import json
+import logging
+import threading
+from typing import Dict, Any, Optional, List, Tuple
+
+# Dependency Injection for standard libraries
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_FIELDS = ("metadata_embedding", "meaning_embedding", "samples_embedding", "chunk_embedding")
+DEFAULT_TENANT = "_default"
+
+
+class _IVFIndex:
+    """Inverted-file index: vectors are bucketed by their nearest k-means centroid."""
+
+    def __init__(self, centroids: "np.ndarray"):
+        self.centroids = centroids
+        self.lists: List[List[int]] = [[] for _ in range(len(centroids))]
+
+    @classmethod
+    def build(cls, matrix: "np.ndarray", nlist: int, iterations: int = 8, seed: int = 0) -> "_IVFIndex":
+        """Run spherical k-means on matrix and bucket every row."""
+        rng = np.random.default_rng(seed)
+        nlist = max(1, min(nlist, len(matrix)))
+        centroids = matrix[rng.choice(len(matrix), size=nlist, replace=False)].copy()
+        for _ in range(iterations):
+            assignment = np.argmax(matrix @ centroids.T, axis=1)
+            for c in range(nlist):
+                members = matrix[assignment == c]
+                if len(members):
+                    centroid = members.mean(axis=0)
+                    norm = np.linalg.norm(centroid)
+                    centroids[c] = centroid / norm if norm > 0 else centroid
+        index = cls(centroids)
+        index.add(np.arange(len(matrix)), matrix)
+        return index
+
+    def add(self, rows: "np.ndarray", vectors: "np.ndarray"):
+        assignment = np.argmax(vectors @ self.centroids.T, axis=1)
+        for row, c in zip(rows.tolist(), assignment.tolist()):
+            self.lists[c].append(row)
+
+    def candidates(self, query: "np.ndarray", nprobe: int) -> "np.ndarray":
+        order = np.argsort(-(self.centroids @ query))[:nprobe]
+        rows = [r for c in order for r in self.lists[c]]
+        return np.asarray(rows, dtype=np.int64)
+
+
+class _FieldPartition:
+    """
+    Vectors of one embedding field for one tenant.
+
+    Removed rows are tombstoned (their key becomes None) and dropped from the matrix
+    once they make up a quarter of it.
+    """
+
+    def __init__(self, dimension: int):
+        self.dimension = dimension
+        self.keys: List[Optional[str]] = []
+        self.rows: Dict[str, int] = {}
+        self.dead = 0
+        self.matrix = np.zeros((0, dimension), dtype=np.float32)
+        self._pending: List["np.ndarray"] = []
+        self.ivf: Optional[_IVFIndex] = None
+        self.ivf_size = 0
+
+    def __len__(self) -> int:
+        return len(self.keys) - self.dead
+
+    def add(self, key: str, vector: "np.ndarray"):
+        self.remove(key)
+        self.rows[key] = len(self.keys)
+        self.keys.append(key)
+        self._pending.append(vector)
+
+    def remove(self, key: str) -> bool:
+        row = self.rows.pop(key, None)
+        if row is None:
+            return False
+        self.keys[row] = None
+        self.dead += 1
+        return True
+
+    def materialize(self) -> "np.ndarray":
+        """Fold pending vectors into the matrix (and the IVF lists, if built)."""
+        if self._pending:
+            start = len(self.matrix)
+            added = np.vstack(self._pending).astype(np.float32, copy=False)
+            self.matrix = np.vstack([self.matrix, added])
+            self._pending = []
+            if self.ivf is not None:
+                self.ivf.add(np.arange(start, start + len(added)), added)
+        if self.dead and self.dead * 4 >= len(self.keys):
+            self.compact()
+        return self.matrix
+
+    def compact(self):
+        """Drop tombstoned rows (the IVF index is rebuilt on next use)."""
+        live = [row for row, key in enumerate(self.keys) if key is not None]
+        self.matrix = self.matrix[live]
+        self.keys = [self.keys[row] for row in live]
+        self.rows = {key: row for row, key in enumerate(self.keys)}
+        self.dead = 0
+        self.ivf = None
+        self.ivf_size = 0
+
+
+class VectorIndexAdapter:
+    """
+    In-process vector index partitioned by tenant.
+
+    Each tenant partition keeps one float32 matrix per embedding field plus the
+    non-vector document fields used for filtering. Partitions below
+    brute_force_threshold vectors are scored exactly with a single matrix product;
+    larger partitions get an IVF index (rebuilt when the partition doubles) and are
+    probed with nprobe lists, widening the probe when filters reject candidates.
+
+    Documents are upserted by _key: a document whose revision (_rev, updated_at or
+    created_at) is unchanged is skipped, otherwise its vectors are replaced. Each
+    partition also carries an opaque sync cursor for the caller's incremental sync,
+    persisted with snapshots.
+
+    Index updates, searches and snapshots hold one lock, so callers may run them
+    in worker threads (asyncio.to_thread) while the event loop keeps serving.
+    """
+
+    def __init__(
+        self,
+        metric: str = "cosine",
+        brute_force_threshold: int = 20000,
+        nprobe: int = 8,
+        snapshot_dir: Optional[str] = None
+    ):
+        """
+        Initialize vector index adapter.
+
+        Args:
+            metric: "cosine" (vectors normalized on insert) or "dot"
+            brute_force_threshold: Partition size above which an IVF index is used
+            nprobe: Number of IVF lists probed per query
+            snapshot_dir: Directory for partition snapshots (optional)
+        """
+        if np is None:
+            raise ImportError("numpy is required for VectorIndexAdapter")
+        if metric not in ("cosine", "dot"):
+            raise ValueError(f"Unsupported metric: {metric}")
+
+        self.metric = metric
+        self.brute_force_threshold = brute_force_threshold
+        self.nprobe = nprobe
+        self.snapshot_dir = snapshot_dir
+
+        # tenant -> {"fields": {field: _FieldPartition}, "documents": {key: doc}, "cursor": Any}
+        self._tenants: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+
+        logger.info(f"✅ Vector index adapter initialized (metric={metric}, brute_force_threshold={brute_force_threshold})")
+
+    # ============================================================================
+    # INDEX MAINTENANCE
+    # ============================================================================
+
+    def has_tenant(self, tenant_id: Optional[str]) -> bool:
+        return self._tenant_key(tenant_id) in self._tenants
+
+    def tenant_ids(self) -> List[str]:
+        return list(self._tenants.keys())
+
+    def ensure_tenant(self, tenant_id: Optional[str]) -> Dict[str, Any]:
+        """Create an (empty) partition for tenant_id if it does not exist yet."""
+        with self._lock:
+            return self._tenants.setdefault(
+                self._tenant_key(tenant_id), {"fields": {}, "documents": {}, "cursor": None}
+            )
+
+    def get_sync_cursor(self, tenant_id: Optional[str]) -> Any:
+        partition = self._tenants.get(self._tenant_key(tenant_id))
+        return partition.get("cursor") if partition else None
+
+    def set_sync_cursor(self, tenant_id: Optional[str], cursor: Any):
+        self.ensure_tenant(tenant_id)["cursor"] = cursor
+
+    def document_keys(self, tenant_id: Optional[str]) -> List[str]:
+        with self._lock:
+            partition = self._tenants.get(self._tenant_key(tenant_id))
+            return list(partition["documents"]) if partition else []
+
+    def add_document(
+        self,
+        tenant_id: Optional[str],
+        document: Dict[str, Any],
+        embedding_fields: Tuple[str, ...] = DEFAULT_EMBEDDING_FIELDS
+    ) -> int:
+        """
+        Add (or replace) a document's embedding vectors in its tenant partition.
+
+        Args:
+            tenant_id: Tenant the document belongs to
+            document: Embedding document (must have _key)
+            embedding_fields: Vector fields to index
+
+        Returns:
+            Number of vectors indexed (0 if the same revision is already indexed)
+        """
+        key = document.get("_key")
+        if not key:
+            return 0
+
+        with self._lock:
+            return self._add_document(tenant_id, key, document, embedding_fields)
+
+    def _add_document(
+        self,
+        tenant_id: Optional[str],
+        key: str,
+        document: Dict[str, Any],
+        embedding_fields: Tuple[str, ...]
+    ) -> int:
+        partition = self.ensure_tenant(tenant_id)
+        existing = partition["documents"].get(key)
+        if existing is not None:
+            revision = self._revision(document)
+            if revision is not None and revision == self._revision(existing):
+                return 0
+            self._remove_document(partition, key)
+        partition["documents"][key] = {k: v for k, v in document.items() if k not in embedding_fields}
+
+        indexed = 0
+        for field in embedding_fields:
+            vector = self._prepare(document.get(field))
+            if vector is None:
+                continue
+            field_partition = partition["fields"].get(field)
+            if field_partition is None:
+                field_partition = partition["fields"][field] = _FieldPartition(len(vector))
+            if len(vector) != field_partition.dimension:
+                logger.warning(f"⚠️ Skipping {field} for {key}: dimension {len(vector)} != {field_partition.dimension}")
+                continue
+            field_partition.add(key, vector)
+            indexed += 1
+        return indexed
+
+    def add_documents(self, tenant_id: Optional[str], documents: List[Dict[str, Any]]) -> int:
+        """Upsert many documents; ones already indexed at the same revision are skipped."""
+        with self._lock:
+            return sum(self.add_document(tenant_id, doc) for doc in documents)
+
+    def remove_documents(self, tenant_id: Optional[str], keys: List[str]) -> int:
+        """Remove documents (and their vectors) from a tenant partition; returns how many were present."""
+        with self._lock:
+            partition = self._tenants.get(self._tenant_key(tenant_id))
+            if partition is None:
+                return 0
+            return sum(1 for key in keys if self._remove_document(partition, key))
+
+    @staticmethod
+    def _remove_document(partition: Dict[str, Any], key: str) -> bool:
+        if partition["documents"].pop(key, None) is None:
+            return False
+        for field_partition in partition["fields"].values():
+            field_partition.remove(key)
+        return True
+
+    @staticmethod
+    def _revision(document: Dict[str, Any]):
+        return document.get("_rev") or document.get("updated_at") or document.get("created_at")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            tenant: {
+                "documents": len(partition["documents"]),
+                "fields": {
+                    field: {"vectors": len(fp), "ivf": fp.ivf is not None}
+                    for field, fp in partition["fields"].items()
+                }
+            }
+            for tenant, partition in self._tenants.items()
+        }
+
+    # ============================================================================
+    # SEARCH
+    # ============================================================================
+
+    def search(
+        self,
+        tenant_id: Optional[str],
+        query_embedding: List[float],
+        limit: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+        embedding_fields: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Nearest-neighbour search within a tenant partition.
+
+        Args:
+            tenant_id: Tenant partition to search
+            query_embedding: Query vector
+            limit: Maximum number of results
+            filters: Equality filters on non-vector document fields
+            embedding_fields: Vector fields to search (default: all indexed fields)
+
+        Returns:
+            Documents (without vectors) with similarity_score and matched_embedding_field,
+            best first. A document matched through several fields is returned once.
+        """
+        with self._lock:
+            return self._search(tenant_id, query_embedding, limit, filters, embedding_fields)
+
+    def _search(
+        self,
+        tenant_id: Optional[str],
+        query_embedding: List[float],
+        limit: int,
+        filters: Optional[Dict[str, Any]],
+        embedding_fields: Optional[List[str]]
+    ) -> List[Dict[str, Any]]:
+        partition = self._tenants.get(self._tenant_key(tenant_id))
+        query = self._prepare(query_embedding)
+        if partition is None or query is None or limit <= 0:
+            return []
+
+        documents = partition["documents"]
+        best: Dict[str, Tuple[float, str]] = {}
+        for field in embedding_fields or list(partition["fields"].keys()):
+            field_partition = partition["fields"].get(field)
+            if field_partition is None or len(field_partition) == 0:
+                continue
+            if field_partition.dimension != len(query):
+                logger.warning(f"⚠️ Query dimension {len(query)} does not match {field} ({field_partition.dimension})")
+                continue
+            for key, score in self._search_field(field_partition, documents, query, limit, filters):
+                if key not in best or score > best[key][0]:
+                    best[key] = (score, field)
+
+        ranked = sorted(best.items(), key=lambda item: item[1][0], reverse=True)[:limit]
+        return [
+            {**documents[key], "similarity_score": score, "matched_embedding_field": field}
+            for key, (score, field) in ranked
+        ]
+
+    def _search_field(
+        self,
+        field_partition: _FieldPartition,
+        documents: Dict[str, Dict[str, Any]],
+        query: "np.ndarray",
+        limit: int,
+        filters: Optional[Dict[str, Any]]
+    ) -> List[Tuple[str, float]]:
+        matrix = field_partition.materialize()
+        keys = field_partition.keys
+
+        allowed = None
+        if filters or field_partition.dead:
+            allowed = np.fromiter(
+                (k is not None and (not filters or self._matches(documents[k], filters)) for k in keys),
+                dtype=bool, count=len(keys)
+            )
+            if not allowed.any():
+                return []
+
+        allowed_count = len(keys) if allowed is None else int(allowed.sum())
+        if allowed_count <= self.brute_force_threshold:
+            rows = np.arange(len(keys)) if allowed is None else np.flatnonzero(allowed)
+            return self._top_k(matrix, keys, rows, query, limit)
+
+        self._ensure_ivf(field_partition)
+        nlist = len(field_partition.ivf.centroids)
+        nprobe = min(self.nprobe, nlist)
+        while True:
+            rows = field_partition.ivf.candidates(query, nprobe)
+            if allowed is not None:
+                rows = rows[allowed[rows]]
+            if len(rows) >= limit or nprobe >= nlist:
+                return self._top_k(matrix, keys, rows, query, limit)
+            nprobe = min(nlist, nprobe * 2)
+
+    def _ensure_ivf(self, field_partition: _FieldPartition):
+        """Build the IVF index on first use, rebuild when the partition has doubled."""
+        size = len(field_partition)
+        if field_partition.ivf is None or size >= 2 * field_partition.ivf_size:
+            nlist = max(1, int(np.sqrt(size)))
+            field_partition.ivf = _IVFIndex.build(field_partition.matrix, nlist)
+            field_partition.ivf_size = size
+            logger.info(f"✅ Built IVF index ({nlist} lists) over {size} vectors")
+
+    @staticmethod
+    def _top_k(matrix, keys, rows, query, limit) -> List[Tuple[str, float]]:
+        if len(rows) == 0:
+            return []
+        scores = matrix[rows] @ query
+        k = min(limit, len(rows))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(keys[rows[i]], float(scores[i])) for i in top]
+
+    @staticmethod
+    def _matches(document: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+        return all(document.get(field) == value for field, value in filters.items())
+
+    def _prepare(self, vector) -> Optional["np.ndarray"]:
+        if vector is None:
+            return None
+        array = np.asarray(vector, dtype=np.float32).ravel()
+        if array.size == 0:
+            return None
+        if self.metric == "cosine":
+            norm = np.linalg.norm(array)
+            if norm == 0:
+                return None
+            array = array / norm
+        return array
+
+    @staticmethod
+    def _tenant_key(tenant_id: Optional[str]) -> str:
+        return tenant_id or DEFAULT_TENANT
+
+    # ============================================================================
+    # SNAPSHOTS
+    # ============================================================================
+
+    def save_snapshot(self, tenant_id: Optional[str], directory: Optional[str] = None) -> Optional[str]:
+        """
+        Persist a tenant partition to <directory>/<tenant>.npz.
+
+        Returns:
+            Snapshot path, or None if there is nothing to save
+        """
+        directory = directory or self.snapshot_dir
+        partition = self._tenants.get(self._tenant_key(tenant_id))
+        if not directory or partition is None:
+            return None
+
+        os.makedirs(directory, exist_ok=True)
+        arrays = {}
+        with self._lock:
+            meta = {
+                "metric": self.metric,
+                "documents": dict(partition["documents"]),
+                "cursor": partition.get("cursor"),
+                "fields": {}
+            }
+            for i, (field, field_partition) in enumerate(partition["fields"].items()):
+                field_partition.materialize()
+                if field_partition.dead:
+                    field_partition.compact()
+                arrays[f"field_{i}"] = field_partition.matrix
+                meta["fields"][field] = {"array": f"field_{i}", "keys": list(field_partition.keys)}
+        arrays["meta"] = np.frombuffer(json.dumps(meta, default=str).encode("utf-8"), dtype=np.uint8)
+
+        path = self._snapshot_path(directory, tenant_id)
+        tmp_path = path + ".tmp.npz"
+        np.savez(tmp_path, **arrays)
+        os.replace(tmp_path, path)
+        logger.info(f"✅ Saved vector index snapshot for tenant {self._tenant_key(tenant_id)} to {path}")
+        return path
+
+    def save_all_snapshots(self, directory: Optional[str] = None) -> List[str]:
+        """Persist every tenant partition (shutdown); returns the snapshot paths written."""
+        paths = []
+        for tenant in self.tenant_ids():
+            path = self.save_snapshot(tenant, directory)
+            if path:
+                paths.append(path)
+        return paths
+
+    def load_snapshot(self, tenant_id: Optional[str], directory: Optional[str] = None) -> bool:
+        """Load a tenant partition snapshot, replacing any in-memory partition."""
+        directory = directory or self.snapshot_dir
+        if not directory:
+            return False
+        path = self._snapshot_path(directory, tenant_id)
+        if not os.path.exists(path):
+            return False
+
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(data["meta"].tobytes().decode("utf-8"))
+            if meta.get("metric") != self.metric:
+                logger.warning(f"⚠️ Ignoring snapshot {path}: metric {meta.get('metric')} != {self.metric}")
+                return False
+            fields = {}
+            for field, info in meta["fields"].items():
+                matrix = data[info["array"]].astype(np.float32, copy=False)
+                field_partition = _FieldPartition(matrix.shape[1])
+                field_partition.keys = list(info["keys"])
+                field_partition.rows = {key: row for row, key in enumerate(field_partition.keys)}
+                field_partition.matrix = matrix
+                fields[field] = field_partition
+
+        with self._lock:
+            self._tenants[self._tenant_key(tenant_id)] = {
+                "fields": fields, "documents": meta["documents"], "cursor": meta.get("cursor")
+            }
+        logger.info(f"✅ Loaded vector index snapshot for tenant {self._tenant_key(tenant_id)} from {path}")
+        return True
+
+    def _snapshot_path(self, directory: str, tenant_id: Optional[str]) -> str:
+        safe = re.sub(r"[^A-Za-z0-9_.-]", "_", self._tenant_key(tenant_id))
+        return os.path.join(directory, f"{safe}.npz")
@@ -0,0 +1,762 @@
+#!/usr/bin/env python3
+"""
+WAL Segment Adapter - Raw Technology Client
+
+Append-only segment-file write-ahead log with group commit.
+This is Layer 1 of the 5-layer infrastructure architecture.
+
+WHAT (Infrastructure Role): I provide a durable, replayable append-only log
+HOW (Infrastructure Implementation): I batch concurrent appends into one write + fsync, keep
+per-namespace time, status and correlation indexes plus status counters in memory (rebuilt
+from segments on open and caught up with other processes' appends under a directory file
+lock), rotate segments by size and compact whole segments once every entry in them has
+passed its TTL
+"""
+
+import os
+import json
+import zlib
+import time
+import struct
+import bisect
+import heapq
+import asyncio
+import logging
+import contextlib
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms run single-process
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Record framing: payload length + CRC32 of payload, big-endian
+_HEADER = struct.Struct(">II")
+
+RECORD_ENTRY = "e"
+RECORD_STATUS = "s"
+
+# Statuses always present in per-namespace counters
+COUNTED_STATUSES = ("pending", "completed", "failed", "retrying")
+
+# Counters are bucketed by the hour of the entry timestamp so windows can be summed
+COUNTER_BUCKET_SECONDS = 3600
+
+
+def _to_epoch(value) -> float:
+    """Convert a datetime, ISO string or epoch number to epoch seconds (naive datetimes are UTC)."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        return (value - datetime(1970, 1, 1)).total_seconds()
+    return value.timestamp()
+
+
+class WALSegmentAdapter:
+    """
+    Append-only segment log with group commit.
+
+    Every record gets a monotonically increasing offset. Segment files are named after
+    the first offset they contain (<offset>.wal) and hold framed JSON records:
+    entries (a full WAL entry) and status records (updates to an earlier entry).
+
+    Writers await append_entry()/append_status(); a single flusher task drains
+    everything queued while the previous fsync was in flight and commits it with one
+    write and one fsync. The log_id -> offset map, the per-namespace time index, the
+    status/correlation indexes, per-namespace status counters and the entry headers
+    (status, retry count, correlation id) are kept in memory and rebuilt by scanning the
+    segments on open.
+
+    Several processes may share one directory: writes and compaction hold an exclusive
+    flock on <directory>/LOCK, reads hold a shared one, and every holder first tails the
+    records other processes appended (and drops segments they compacted) so offsets and
+    indexes stay consistent across workers.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_max_bytes: int = 64 * 1024 * 1024,
+        max_batch: int = 1024,
+        group_commit_delay: float = 0.0,
+        fsync: bool = True,
+        compact_on_rotate: bool = True
+    ):
+        """
+        Initialize WAL segment adapter.
+
+        Args:
+            directory: Absolute path of the directory holding segment files
+            segment_max_bytes: Size at which the active segment is rotated
+            max_batch: Maximum records committed per fsync
+            group_commit_delay: Extra seconds to wait for more writers before committing
+            fsync: fsync after every group commit (disable only for tests)
+            compact_on_rotate: Run TTL compaction whenever a segment is sealed
+        """
+        if not directory or not os.path.isabs(directory):
+            raise ValueError(f"WAL directory must be an absolute path, got {directory!r}")
+        self.directory = directory
+        self.segment_max_bytes = segment_max_bytes
+        self.max_batch = max_batch
+        self.group_commit_delay = group_commit_delay
+        self.fsync = fsync
+        self.compact_on_rotate = compact_on_rotate
+
+        # segment base offset -> {"path", "size", "expires_at", "offsets"}
+        self._segments: Dict[int, Dict[str, Any]] = {}
+        self._active_segment: Optional[int] = None
+        self._active_file = None
+        self._next_offset = 0
+
+        # offset -> (segment, position, length)
+        self._locations: Dict[int, Tuple[int, int, int]] = {}
+        # log_id -> entry header
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        # namespace -> sorted [(timestamp, offset, log_id)]
+        self._time_index: Dict[str, List[Tuple[float, int, str]]] = {}
+        # status -> {log_id}, correlation_id -> {log_id}
+        self._by_status: Dict[str, set] = {}
+        self._by_correlation: Dict[str, set] = {}
+        # namespace -> tenant_id -> hour bucket -> status -> count
+        self._counters: Dict[str, Dict[Optional[str], Dict[int, Dict[str, int]]]] = {}
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._open_lock: Optional[asyncio.Lock] = None
+        self._io_lock: Optional[asyncio.Lock] = None
+        self._lock_fd: Optional[int] = None
+        self._opened = False
+
+        self.stats = {"records": 0, "commits": 0, "fsyncs": 0, "segments_rotated": 0, "segments_compacted": 0}
+
+    # ============================================================================
+    # LIFECYCLE
+    # ============================================================================
+
+    async def open(self):
+        """Recover indexes from existing segments and start the group-commit flusher."""
+        if self._opened:
+            return
+        if self._open_lock is None:
+            self._open_lock = asyncio.Lock()
+        async with self._open_lock:
+            if self._opened:
+                return
+            await asyncio.to_thread(os.makedirs, self.directory, exist_ok=True)
+            self._lock_fd = os.open(os.path.join(self.directory, "LOCK"), os.O_RDWR | os.O_CREAT, 0o644)
+            self._io_lock = asyncio.Lock()
+            # Recovery is the first catch-up; the exclusive lock lets it truncate a torn tail
+            async with self._locked(exclusive=True):
+                pass
+            self._queue = asyncio.Queue()
+            self._flusher = asyncio.create_task(self._flush_loop())
+            self._opened = True
+            logger.info(
+                f"✅ WAL segment adapter opened at {self.directory} "
+                f"({len(self._segments)} segments, {len(self._entries)} entries)"
+            )
+
+    async def close(self):
+        """Flush pending writes, stop the flusher and close the active segment."""
+        if not self._opened:
+            return
+        await self._queue.join()
+        self._flusher.cancel()
+        try:
+            await self._flusher
+        except asyncio.CancelledError:
+            pass
+        if self._active_file:
+            await asyncio.to_thread(self._active_file.close)
+            self._active_file = None
+        os.close(self._lock_fd)
+        self._lock_fd = None
+        self._opened = False
+
+    @contextlib.asynccontextmanager
+    async def _locked(self, exclusive: bool):
+        """
+        Hold the directory lock (exclusive for writers and compaction, shared for readers)
+        after catching up with records and compactions from other processes.
+        """
+        async with self._io_lock:
+            if fcntl is not None:
+                mode = fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+                # Non-blocking attempts keep the wait cancellable without leaking a held lock
+                while True:
+                    try:
+                        fcntl.flock(self._lock_fd, mode | fcntl.LOCK_NB)
+                        break
+                    except BlockingIOError:
+                        await asyncio.sleep(0.001)
+            try:
+                self._apply_tail(*await asyncio.to_thread(self._read_tail, exclusive))
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    async def refresh(self):
+        """Catch up with records appended (or segments compacted) by other processes."""
+        await self.open()
+        async with self._locked(exclusive=False):
+            pass
+
+    # ============================================================================
+    # WRITES
+    # ============================================================================
+
+    async def append_entry(self, entry: Dict[str, Any], ttl_seconds: int) -> Dict[str, Any]:
+        """
+        Durably append a WAL entry.
+
+        Args:
+            entry: WAL entry (log_id, namespace, timestamp, status, correlation_id, ...)
+            ttl_seconds: Retention; the entry is compacted once its segment has fully expired
+
+        Returns:
+            Dict with offset and segment once the record is fsynced
+        """
+        timestamp = _to_epoch(entry["timestamp"])
+        record = {"k": RECORD_ENTRY, "exp": timestamp + ttl_seconds, "entry": entry}
+        return await self._submit(record)
+
+    async def append_status(self, log_id: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Durably append a status update for an existing entry.
+
+        Returns:
+            Dict with offset and segment, or None if log_id is unknown
+        """
+        header = self._entries.get(log_id)
+        if header is None:
+            # The entry may have been written by another process
+            await self.refresh()
+            header = self._entries.get(log_id)
+            if header is None:
+                return None
+        record = {"k": RECORD_STATUS, "exp": header["expires_at"], "log_id": log_id, "updates": updates}
+        return await self._submit(record)
+
+    async def _submit(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        await self.open()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((record, future))
+        return await future
+
+    async def _flush_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.group_commit_delay
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            rotated = self.stats["segments_rotated"]
+            try:
+                records = [record for record, _ in batch]
+                async with self._locked(exclusive=True):
+                    # Offsets are assigned after catching up, so they follow other writers' records
+                    first_offset = self._next_offset
+                    segment, positions = await asyncio.to_thread(self._write_batch, first_offset, records)
+                    self._next_offset = first_offset + len(records)
+                    for i, (record, future) in enumerate(batch):
+                        offset = first_offset + i
+                        self._index_record(offset, segment, positions[i], record)
+                        if not future.done():
+                            future.set_result({"offset": offset, "segment": segment})
+            except Exception as e:
+                logger.error(f"❌ WAL group commit failed: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+            if self.compact_on_rotate and self.stats["segments_rotated"] != rotated:
+                try:
+                    await self.compact()
+                except Exception as e:
+                    logger.warning(f"⚠️ WAL compaction failed: {e}")
+
+    def _write_batch(self, first_offset: int, records: List[Dict[str, Any]]) -> Tuple[int, List[Tuple[int, int]]]:
+        """Write records to the active segment with one write and one fsync (runs in a thread)."""
+        # The newest segment is the active one for every process sharing the directory
+        last = max(self._segments) if self._segments else None
+        if last is None or self._segments[last]["size"] >= self.segment_max_bytes:
+            self._rotate(first_offset)
+        elif self._active_segment != last or self._active_file is None:
+            if self._active_file:
+                self._active_file.close()
+            self._active_file = open(self._segments[last]["path"], "ab")
+            self._active_segment = last
+
+        segment = self._segments[self._active_segment]
+        buffer = bytearray()
+        positions = []
+        for record in records:
+            payload = json.dumps(record, default=str, separators=(",", ":")).encode("utf-8")
+            positions.append((segment["size"] + len(buffer), len(payload)))
+            buffer += _HEADER.pack(len(payload), zlib.crc32(payload))
+            buffer += payload
+            segment["expires_at"] = max(segment["expires_at"], record["exp"])
+
+        try:
+            self._active_file.write(buffer)
+            self._active_file.flush()
+            if self.fsync:
+                os.fsync(self._active_file.fileno())
+                self.stats["fsyncs"] += 1
+        except Exception:
+            # Drop the partial batch so later commits do not land behind a torn record
+            self._active_file.truncate(segment["size"])
+            raise
+        segment["size"] += len(buffer)
+        self.stats["commits"] += 1
+        self.stats["records"] += len(records)
+        return self._active_segment, positions
+
+    def _rotate(self, base_offset: int):
+        if self._active_file:
+            self._active_file.close()
+            self.stats["segments_rotated"] += 1
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"{base_offset:020d}.wal")
+        self._active_file = open(path, "ab")
+        self._active_segment = base_offset
+        self._segments[base_offset] = {"path": path, "size": 0, "expires_at": 0.0, "offsets": []}
+
+    # ============================================================================
+    # INDEXES
+    # ============================================================================
+
+    def _index_record(self, offset: int, segment: int, position: Tuple[int, int], record: Dict[str, Any]):
+        self._locations[offset] = (segment, position[0], position[1])
+        self._segments[segment]["offsets"].append(offset)
+
+        if record["k"] == RECORD_ENTRY:
+            entry = record["entry"]
+            header = {
+                "offset": offset,
+                "log_id": entry["log_id"],
+                "namespace": entry.get("namespace"),
+                "timestamp": _to_epoch(entry["timestamp"]),
+                "expires_at": record["exp"],
+                "status": entry.get("status", "pending"),
+                "retry_count": entry.get("retry_count", 0),
+                "correlation_id": entry.get("correlation_id"),
+                "tenant_id": (entry.get("metadata") or {}).get("tenant_id"),
+                "updates": []
+            }
+            previous = self._entries.get(header["log_id"])
+            if previous is not None:
+                self._unindex_header(previous)
+            self._entries[header["log_id"]] = header
+            bisect.insort(
+                self._time_index.setdefault(header["namespace"], []),
+                (header["timestamp"], offset, header["log_id"])
+            )
+            self._by_status.setdefault(header["status"], set()).add(header["log_id"])
+            if header["correlation_id"] is not None:
+                self._by_correlation.setdefault(header["correlation_id"], set()).add(header["log_id"])
+            self._count(header, header["status"], 1)
+            self._count(header, "total", 1)
+        else:
+            header = self._entries.get(record["log_id"])
+            if header is None:
+                return
+            header["updates"].append(offset)
+            updates = record.get("updates", {})
+            if "status" in updates and updates["status"] != header["status"]:
+                self._discard(self._by_status, header["status"], header["log_id"])
+                self._count(header, header["status"], -1)
+                header["status"] = updates["status"]
+                self._by_status.setdefault(header["status"], set()).add(header["log_id"])
+                self._count(header, header["status"], 1)
+            if "retry_count" in updates:
+                header["retry_count"] = updates["retry_count"]
+
+    def _unindex_header(self, header: Dict[str, Any]):
+        """Remove an entry header from the status/correlation indexes and counters."""
+        self._discard(self._by_status, header["status"], header["log_id"])
+        if header["correlation_id"] is not None:
+            self._discard(self._by_correlation, header["correlation_id"], header["log_id"])
+        self._count(header, header["status"], -1)
+        self._count(header, "total", -1)
+
+    @staticmethod
+    def _discard(index: Dict[str, set], key, log_id: str):
+        members = index.get(key)
+        if members is not None:
+            members.discard(log_id)
+            if not members:
+                del index[key]
+
+    def _count(self, header: Dict[str, Any], status: str, delta: int):
+        buckets = self._counters.setdefault(header["namespace"], {}).setdefault(header["tenant_id"], {})
+        bucket = int(header["timestamp"] // COUNTER_BUCKET_SECONDS)
+        counts = buckets.setdefault(bucket, {})
+        counts[status] = counts.get(status, 0) + delta
+        if delta < 0 and not any(counts.values()):
+            del buckets[bucket]
+
+    def _read_tail(self, exclusive: bool):
+        """
+        Read the records appended since the last catch-up (runs in a thread, under the lock).
+
+        Only the newest known segment and segments created after it can have grown. A torn
+        tail on the last segment is truncated when holding the exclusive lock; with the
+        shared lock reading simply stops there.
+
+        Returns:
+            (vanished segment bases, {base: (path, size)}, [(offset, base, position, record)])
+        """
+        if not os.path.isdir(self.directory):
+            return [], {}, []
+        on_disk = {
+            int(name[:-4]): os.path.join(self.directory, name)
+            for name in os.listdir(self.directory) if name.endswith(".wal")
+        }
+        vanished = [base for base in self._segments if base not in on_disk]
+        known = [base for base in self._segments if base in on_disk]
+        newest_known = max(known) if known else -1
+        last = max(on_disk) if on_disk else None
+
+        sizes = {}
+        records = []
+        for base in sorted(b for b in on_disk if b >= newest_known):
+            path = on_disk[base]
+            segment = self._segments.get(base)
+            start_position = segment["size"] if segment else 0
+            offset = base + (len(segment["offsets"]) if segment else 0)
+            with open(path, "rb") as f:
+                f.seek(start_position)
+                data = f.read()
+            position = 0
+            while position + _HEADER.size <= len(data):
+                length, crc = _HEADER.unpack_from(data, position)
+                start = position + _HEADER.size
+                payload = data[start:start + length]
+                if len(payload) < length or zlib.crc32(payload) != crc:
+                    break
+                records.append((offset, base, (start_position + position, length), json.loads(payload)))
+                offset += 1
+                position = start + length
+            if position < len(data):
+                name = os.path.basename(path)
+                if base != last:
+                    logger.error(f"❌ Corrupt record in sealed WAL segment {name} at byte {start_position + position}")
+                elif exclusive:
+                    logger.warning(f"⚠️ Truncating torn WAL tail in {name} at byte {start_position + position}")
+                    with open(path, "r+b") as f:
+                        f.truncate(start_position + position)
+            sizes[base] = (path, start_position + position)
+        return vanished, sizes, records
+
+    def _apply_tail(self, vanished: List[int], sizes: Dict[int, Tuple[str, int]], records: List[tuple]):
+        """Fold a catch-up from _read_tail into the in-memory indexes."""
+        if vanished:
+            self._drop_segments(vanished)
+        for base, (path, size) in sizes.items():
+            segment = self._segments.setdefault(base, {"path": path, "size": 0, "expires_at": 0.0, "offsets": []})
+            segment["size"] = size
+        for offset, base, position, record in records:
+            segment = self._segments[base]
+            segment["expires_at"] = max(segment["expires_at"], record.get("exp", 0.0))
+            self._index_record(offset, base, position, record)
+        if self._segments:
+            last = max(self._segments)
+            self._next_offset = max(self._next_offset, last + len(self._segments[last]["offsets"]))
+
+    # ============================================================================
+    # READS
+    # ============================================================================
+
+    async def get_entry(self, log_id: str) -> Optional[Dict[str, Any]]:
+        """Return the entry for log_id with all status updates applied, or None."""
+        await self.open()
+        async with self._locked(exclusive=False):
+            header = self._entries.get(log_id)
+            if header is None:
+                return None
+            return (await asyncio.to_thread(self._materialize, [header]))[0]
+
+    async def scan(
+        self,
+        namespace: Optional[str],
+        from_timestamp,
+        to_timestamp,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Range scan over the namespace time index.
+
+        Args:
+            namespace: WAL namespace (None scans all namespaces)
+            from_timestamp / to_timestamp: Inclusive time range (datetime, ISO string or epoch)
+            filters: Equality filters on status, correlation_id, tenant_id (index-only)
+            limit: Maximum number of entries
+
+        Returns:
+            Entries in timestamp order with status updates applied
+        """
+        await self.open()
+        async with self._locked(exclusive=False):
+            headers = self._select(namespace, _to_epoch(from_timestamp), _to_epoch(to_timestamp), filters, limit)
+            return await asyncio.to_thread(self._materialize, headers)
+
+    async def scan_page(
+        self,
+        namespace: Optional[str],
+        from_timestamp,
+        to_timestamp,
+        filters: Optional[Dict[str, Any]] = None,
+        cursor: Optional[str] = None,
+        page_size: int = 500,
+        descending: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Cursor-paged range scan; only one page of entries is read from disk per call.
+
+        Args:
+            namespace / from_timestamp / to_timestamp / filters: As for scan()
+            cursor: next_cursor from the previous page (None for the first page)
+            page_size: Maximum entries per page
+            descending: Page from to_timestamp backwards (newest first); keep the same
+                direction for every page of one cursor
+
+        Returns:
+            Dict with "entries" and "next_cursor" (None on the last page)
+        """
+        await self.open()
+        after = None
+        if cursor:
+            timestamp, offset = cursor.rsplit(":", 1)
+            after = (float(timestamp), int(offset))
+        async with self._locked(exclusive=False):
+            headers = self._select(
+                namespace, _to_epoch(from_timestamp), _to_epoch(to_timestamp), filters, page_size + 1, after,
+                descending
+            )
+            next_cursor = None
+            if len(headers) > page_size:
+                headers = headers[:page_size]
+                next_cursor = f"{headers[-1]['timestamp']!r}:{headers[-1]['offset']}"
+            entries = await asyncio.to_thread(self._materialize, headers)
+        return {"entries": entries, "next_cursor": next_cursor}
+
+    def _select(self, namespace, start, end, filters, limit, after=None, descending=False) -> List[Dict[str, Any]]:
+        """
+        Pick the cheapest access path: the status or correlation index when its
+        candidate set is smaller than the time window, otherwise the time index.
+
+        after is the (timestamp, offset) cursor key; descending scans return keys
+        below it, newest first.
+        """
+        filters = filters or {}
+        windows = []
+        for ns in ([namespace] if namespace is not None else list(self._time_index)):
+            index = self._time_index.get(ns, [])
+            lo = bisect.bisect_left(index, (start, -1, ""))
+            hi = bisect.bisect_right(index, (end, float("inf"), ""))
+            if after is not None and descending:
+                hi = min(hi, bisect.bisect_left(index, (after[0], after[1], "")))
+            elif after is not None:
+                lo = max(lo, bisect.bisect_right(index, (after[0], after[1], "\U0010ffff")))
+            if hi > lo:
+                windows.append((index, lo, hi))
+        window_size = sum(hi - lo for _, lo, hi in windows)
+
+        candidates = None
+        for field, index in (("correlation_id", self._by_correlation), ("status", self._by_status)):
+            if field in filters:
+                members = index.get(filters[field], ())
+                if candidates is None or len(members) < len(candidates):
+                    candidates = members
+
+        if candidates is not None and len(candidates) < window_size:
+            keys = []
+            for log_id in candidates:
+                header = self._entries[log_id]
+                key = (header["timestamp"], header["offset"])
+                if namespace is not None and header["namespace"] != namespace:
+                    continue
+                if not start <= key[0] <= end:
+                    continue
+                if after is not None and (key >= after if descending else key <= after):
+                    continue
+                keys.append((key[0], key[1], log_id))
+            keys.sort(reverse=descending)
+        elif descending:
+            keys = heapq.merge(*(reversed(index[lo:hi]) for index, lo, hi in windows), reverse=True)
+        else:
+            keys = heapq.merge(*(index[lo:hi] for index, lo, hi in windows))
+
+        headers = []
+        for timestamp, offset, log_id in keys:
+            header = self._entries.get(log_id)
+            if header is None or header["offset"] != offset:
+                continue
+            if filters and any(header.get(field) != value for field, value in filters.items()):
+                continue
+            headers.append(header)
+            if limit and len(headers) >= limit:
+                break
+        return headers
+
+    def get_counters(
+        self,
+        namespace: Optional[str] = None,
+        tenant_id: Optional[str] = None,
+        since=None
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        Pre-aggregated status counts per namespace, maintained on every append/status record.
+
+        Counts are kept in hourly buckets of the entry timestamp, so a window costs
+        O(hours) per namespace. Reflects this process's last catch-up; call refresh()
+        first to include other writers.
+
+        Args:
+            namespace: Restrict to one namespace (None returns all)
+            tenant_id: Restrict to one tenant (None sums all tenants)
+            since: Only count entries from this hour on (datetime, ISO string or epoch;
+                None covers the whole retention window)
+
+        Returns:
+            namespace -> {"pending", "completed", "failed", "retrying", ..., "total"}
+        """
+        first_bucket = int(_to_epoch(since) // COUNTER_BUCKET_SECONDS) if since is not None else None
+        counters = {}
+        for ns, tenants in self._counters.items():
+            if namespace is not None and ns != namespace:
+                continue
+            totals = {status: 0 for status in COUNTED_STATUSES}
+            totals["total"] = 0
+            for tenant, buckets in tenants.items():
+                if tenant_id is not None and tenant != tenant_id:
+                    continue
+                for bucket, counts in buckets.items():
+                    if first_bucket is not None and bucket < first_bucket:
+                        continue
+                    for status, count in counts.items():
+                        totals[status] = totals.get(status, 0) + count
+            counters[ns] = totals
+        return counters
+
+    def get_time_range(self, namespace: Optional[str] = None) -> Tuple[Optional[float], Optional[float]]:
+        """Epoch timestamps of the oldest and newest retained entries (None, None when empty)."""
+        windows = [
+            keys for ns, keys in self._time_index.items()
+            if keys and (namespace is None or ns == namespace)
+        ]
+        if not windows:
+            return None, None
+        return min(keys[0][0] for keys in windows), max(keys[-1][0] for keys in windows)
+
+    def _materialize(self, headers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Read entry and status records from disk and merge them (runs in a thread)."""
+        handles = {}
+        try:
+            def read(offset):
+                segment, position, length = self._locations[offset]
+                handle = handles.get(segment)
+                if handle is None:
+                    handle = handles[segment] = open(self._segments[segment]["path"], "rb")
+                handle.seek(position + _HEADER.size)
+                return json.loads(handle.read(length))
+
+            entries = []
+            for header in headers:
+                entry = read(header["offset"])["entry"]
+                for update_offset in header["updates"]:
+                    updates = read(update_offset).get("updates", {})
+                    entry.update(updates)
+                entries.append(entry)
+            return entries
+        finally:
+            for handle in handles.values():
+                handle.close()
+
+    # ============================================================================
+    # COMPACTION
+    # ============================================================================
+
+    async def compact(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Delete sealed segments whose records have all passed their TTL.
+
+        Returns:
+            Dict with removed segment count and remaining segment count
+        """
+        await self.open()
+        now = time.time() if now is None else now
+        async with self._locked(exclusive=True):
+            expired = [
+                base for base, segment in self._segments.items()
+                if base != max(self._segments) and segment["expires_at"] <= now
+            ]
+            for base in expired:
+                with contextlib.suppress(FileNotFoundError):
+                    await asyncio.to_thread(os.remove, self._segments[base]["path"])
+                self.stats["segments_compacted"] += 1
+            if expired:
+                dropped = self._drop_segments(expired)
+                logger.info(f"✅ WAL compaction removed {len(expired)} segments ({dropped} entries)")
+
+        return {"removed_segments": len(expired), "segments": len(self._segments)}
+
+    def _drop_segments(self, bases: List[int]) -> int:
+        """Forget segments (compacted here or by another process) and the entries they held."""
+        for base in bases:
+            segment = self._segments.pop(base)
+            for offset in segment["offsets"]:
+                self._locations.pop(offset, None)
+            if base == self._active_segment:
+                if self._active_file:
+                    self._active_file.close()
+                self._active_file = None
+                self._active_segment = None
+
+        dropped = [log_id for log_id, header in self._entries.items() if header["offset"] not in self._locations]
+        for log_id in dropped:
+            self._unindex_header(self._entries.pop(log_id))
+        for namespace, index in list(self._time_index.items()):
+            kept = [item for item in index if item[1] in self._locations]
+            if kept:
+                self._time_index[namespace] = kept
+            else:
+                del self._time_index[namespace]
+        for header in self._entries.values():
+            header["updates"] = [offset for offset in header["updates"] if offset in self._locations]
+        return len(dropped)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Commit/fsync counters and index sizes."""
+        return {
+            **self.stats,
+            "segments": len(self._segments),
+            "entries": len(self._entries),
+            "namespaces": len(self._time_index),
+            "statuses": len(self._by_status),
+            "correlations": len(self._by_correlation),
+            "next_offset": self._next_offset
+        }
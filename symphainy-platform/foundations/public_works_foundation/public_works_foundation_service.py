@@ -9,6 +9,7 @@ WHAT (Foundation Role): I provide infrastructure capabilities to all Smart City
 HOW (Foundation Implementation): I use 5-layer architecture with dependency injection
 """
 
+import os
 import logging
 import asyncio
 from typing import Dict, Any, Optional, List
@@ -100,6 +101,9 @@ class PublicWorksFoundationService(FoundationServiceBase):
         # Cache abstraction (for content/data caching, NOT messaging)
         self.cache_abstraction = None
         
+        # Request rate limiter (shared GCRA engine for Traffic Cop)
+        self.request_rate_limiter = None
+        
         # File management abstractions
         self.file_management_abstraction = None
         self.file_management_composition = None
@@ -265,7 +269,8 @@ class PublicWorksFoundationService(FoundationServiceBase):
                 host=redis_config["host"],
                 port=redis_config["port"],
                 db=redis_config["db"],
-                password=redis_config["password"]
+                password=redis_config["password"],
+                max_connections=redis_config["max_connections"]
             )
             # BREAKING: JWT adapter removed - will break SessionManagementAbstraction
             # jwt_config = self.config_adapter.get_jwt_config()
@@ -304,12 +309,24 @@ class PublicWorksFoundationService(FoundationServiceBase):
                 messaging_adapter, self.config_adapter, di_container=self.di_container
             )
             
+            # Request admission: one atomic GCRA decision per request in Redis, shared by all workers
+            from .infrastructure_adapters.rate_limiting_adapter import GCRARateLimiter, RedisGCRABackend
+            self.request_rate_limiter = GCRARateLimiter(
+                RedisGCRABackend(redis_adapter),
+                lease_max=self.config_adapter.get_int("RATE_LIMIT_LOCAL_LEASE_MAX", 16)
+            )
+            
             # Initialize Cache abstraction (for content/data caching, NOT messaging)
             from .infrastructure_abstractions.cache_abstraction import CacheAbstraction
             from .infrastructure_adapters.cache_adapter import CacheAdapter
             
             # Create cache adapter (defaults to memory, can be configured for Redis)
-            cache_adapter = CacheAdapter(storage_type="memory")  # TODO: Configure from environment
+            cache_adapter = CacheAdapter(
+                storage_type="memory",  # TODO: Configure storage type from environment
+                memory_max_entries=self.config_adapter.get_int("CACHE_MEMORY_MAX_ENTRIES", 10000),
+                memory_max_bytes=self.config_adapter.get_int("CACHE_MEMORY_MAX_BYTES", 64 * 1024 * 1024),
+                memory_default_ttl=self.config_adapter.get_int("CACHE_MEMORY_DEFAULT_TTL", 3600) or None
+            )
             self.cache_abstraction = CacheAbstraction(
                 cache_adapter, self.config_adapter, di_container=self.di_container
             )
@@ -404,7 +421,8 @@ class PublicWorksFoundationService(FoundationServiceBase):
             openai_adapter = OpenAIAdapter(
                 api_key=openai_api_key, 
                 base_url=openai_base_url,
-                config_adapter=self.config_adapter  # Pass ConfigAdapter for centralized configuration
+                config_adapter=self.config_adapter,  # Pass ConfigAdapter for centralized configuration
+                embedding_cache=self.embedding_cache
             )
             # Create Anthropic adapter (optional - skip if API key not available)
             try:
@@ -424,6 +442,37 @@ class PublicWorksFoundationService(FoundationServiceBase):
             # Get LLM configuration for retry/timeout
             llm_config = self.config_adapter.get_llm_abstraction_config() if hasattr(self.config_adapter, 'get_llm_abstraction_config') else {}
             
+            # Response cache for deterministic LLM requests (optional)
+            llm_caching_abstraction = None
+            if llm_config.get("cache_enabled", True):
+                from .infrastructure_abstractions.llm_caching_abstraction import LLMCachingAbstraction
+                from .infrastructure_adapters.cache_adapter import CacheAdapter
+                llm_cache_ttl = llm_config.get("cache_ttl_seconds", 3600)
+                llm_caching_abstraction = LLMCachingAbstraction(
+                    CacheAdapter(
+                        storage_type=llm_config.get("cache_storage_type", "memory"),
+                        redis_url=llm_config.get("cache_redis_url", "redis://localhost:6379/1"),
+                        memory_max_entries=llm_config.get("cache_max_size", 1000),
+                        memory_default_ttl=llm_cache_ttl
+                    ),
+                    di_container=self.di_container,
+                    default_ttl=llm_cache_ttl
+                )
+            
+            # Token-bucket rate limiter shared across workers through Redis (optional)
+            llm_rate_limiting_abstraction = None
+            if llm_config.get("rate_limit_enabled", False):
+                from .infrastructure_adapters.rate_limiting_adapter import RateLimitingAdapter, RedisTokenBucketBackend
+                from .infrastructure_abstractions.llm_rate_limiting_abstraction import LLMRateLimitingAbstraction
+                llm_rate_limiting_abstraction = LLMRateLimitingAbstraction(
+                    RateLimitingAdapter(RedisTokenBucketBackend(redis_adapter)),
+                    di_container=self.di_container,
+                    requests_per_minute=llm_config.get("rate_limit_requests_per_minute", 60),
+                    requests_per_hour=llm_config.get("rate_limit_requests_per_hour", 1000),
+                    tokens_per_minute=llm_config.get("rate_limit_tokens_per_minute", 100000),
+                    tokens_per_hour=llm_config.get("rate_limit_tokens_per_hour", 1000000)
+                )
+            
             # Create LLM abstraction with injected adapters and production resilience config
             self.llm_abstraction = LLMAbstraction(
                 openai_adapter=openai_adapter,
@@ -435,7 +484,8 @@ class PublicWorksFoundationService(FoundationServiceBase):
                 max_retries=llm_config.get("provider_retry_attempts", 3),
                 retry_base_delay=llm_config.get("provider_retry_delay_seconds", 2.0),
                 timeout=llm_config.get("provider_timeout_seconds", 120.0),
-                rate_limiting_abstraction=None  # Optional - can be set later if needed
+                rate_limiting_abstraction=llm_rate_limiting_abstraction,
+                caching_abstraction=llm_caching_abstraction
             )
             
             # Create LLM composition service
@@ -1356,6 +1406,34 @@ class PublicWorksFoundationService(FoundationServiceBase):
                 # Registry cleanup would go here if needed
                 pass
             
+            # Refund request admissions leased locally but not used
+            if self.request_rate_limiter:
+                await self.request_rate_limiter.close()
+            
+            # Flush pending WAL group commits and close the active segment
+            if getattr(self, "wal_segment_adapter", None):
+                await self.wal_segment_adapter.close()
+            
+            # Snapshot the vector index partitions for a warm start on the next boot
+            if getattr(self, "vector_index_adapter", None) and self.vector_index_adapter.snapshot_dir:
+                await asyncio.to_thread(self.vector_index_adapter.save_all_snapshots)
+            
+            # Stop the PDF page extraction worker processes
+            if getattr(self, "pdf_page_engine", None):
+                self.pdf_page_engine.shutdown()
+            
+            # Stop the batch OCR worker processes
+            if getattr(self, "batch_ocr_engine", None):
+                self.batch_ocr_engine.shutdown()
+            
+            # Stop the storage I/O thread pool
+            if getattr(self, "gcs_adapter", None):
+                self.gcs_adapter.shutdown()
+            
+            # Release the shared asyncio Redis connection pools
+            from .infrastructure_adapters.redis_connection_pool import close_shared_pools
+            await close_shared_pools()
+            
             self.is_initialized = False
             self.logger.info("✅ Public Works Foundation shutdown complete")
             
@@ -1620,7 +1698,8 @@ class PublicWorksFoundationService(FoundationServiceBase):
                 host=redis_config["host"],
                 port=redis_config["port"],
                 db=redis_config["db"],
-                password=redis_config.get("password")
+                password=redis_config.get("password"),
+                max_connections=redis_config.get("max_connections", 50)
             )
             self.logger.info("✅ Redis adapter created")
             
@@ -1667,7 +1746,8 @@ class PublicWorksFoundationService(FoundationServiceBase):
                 self.gcs_adapter = GCSFileAdapter(
                     project_id=gcs_config.get("project_id"),
                     bucket_name=gcs_config["bucket_name"],
-                    credentials_json=gcs_config.get("credentials_json")  # JSON string (Supabase pattern)
+                    credentials_json=gcs_config.get("credentials_json"),  # JSON string (Supabase pattern)
+                    io_workers=self.config_adapter.get_int("GCS_IO_WORKERS", 16)
                 )
                 self.logger.info("✅ GCS adapter created")
             except Exception as e:
@@ -1768,6 +1848,33 @@ class PublicWorksFoundationService(FoundationServiceBase):
             self.huggingface_business_metrics_adapter = HuggingFaceBusinessMetricsAdapter()
             self.logger.info("✅ Business Metrics adapters created")
             
+            # WAL Segment Adapter (append-only group-commit log for Data Steward write-ahead logging)
+            from .infrastructure_adapters.wal_segment_adapter import WALSegmentAdapter
+            
+            # The log must live on a persistent volume shared by all workers (segments are flock-coordinated)
+            wal_data_dir = self.config_adapter.get("WAL_DATA_DIR")
+            if not wal_data_dir or not os.path.isabs(wal_data_dir):
+                raise ValueError(
+                    f"WAL_DATA_DIR must be an absolute path on a persistent volume, got {wal_data_dir!r}. "
+                    "Set WAL_DATA_DIR (e.g. /var/lib/symphainy/wal) and mount it in the container"
+                )
+            self.wal_segment_adapter = WALSegmentAdapter(
+                directory=wal_data_dir,
+                segment_max_bytes=self.config_adapter.get_int("WAL_SEGMENT_MAX_BYTES", 64 * 1024 * 1024),
+                group_commit_delay=self.config_adapter.get_float("WAL_GROUP_COMMIT_DELAY_MS", 0.0) / 1000.0
+            )
+            self.logger.info("✅ WAL segment adapter created")
+            
+            # Embedding Cache (content-addressed, shared by HuggingFace and OpenAI embedding calls)
+            from .infrastructure_adapters.embedding_cache import EmbeddingCache
+            
+            self.embedding_cache = EmbeddingCache(
+                max_entries=self.config_adapter.get_int("EMBEDDING_CACHE_MAX_ENTRIES", 50000),
+                redis_adapter=self.redis_adapter,
+                redis_ttl=self.config_adapter.get_int("EMBEDDING_CACHE_TTL_SECONDS", 30 * 24 * 3600)
+            )
+            self.logger.info("✅ Embedding cache created")
+            
             # HuggingFace Adapter (for semantic inference)
             from .infrastructure_adapters.huggingface_adapter import HuggingFaceAdapter
             
@@ -1778,7 +1885,8 @@ class PublicWorksFoundationService(FoundationServiceBase):
                 self.huggingface_adapter = HuggingFaceAdapter(
                     endpoint_url=hf_endpoint_url,
                     api_key=hf_api_key,
-                    config_adapter=self.config_adapter  # Pass ConfigAdapter for centralized configuration
+                    config_adapter=self.config_adapter,  # Pass ConfigAdapter for centralized configuration
+                    embedding_cache=self.embedding_cache
                 )
                 self.logger.info("✅ HuggingFace adapter created")
             else:
@@ -1854,23 +1962,37 @@ class PublicWorksFoundationService(FoundationServiceBase):
             # The homegrown solution uses explicit byte positions and extensible patterns
             # It handles both ASCII and EBCDIC files with better control over field alignment
             from .infrastructure_adapters.mainframe_processing_adapter import MainframeProcessingAdapter
+            from .infrastructure_adapters.pdf_page_extraction_engine import PdfPageExtractionEngine
+            from .infrastructure_adapters.batch_ocr_engine import BatchOCREngine
             
             self.beautifulsoup_adapter = BeautifulSoupHTMLAdapter()
             self.python_docx_adapter = PythonDocxAdapter()
-            self.pdfplumber_adapter = PdfplumberTableExtractor()  # Class name is PdfplumberTableExtractor
-            self.pypdf2_adapter = PyPDF2TextExtractor()  # Class name is PyPDF2TextExtractor
+            # PDF text/table extraction is sharded by page range over one shared worker pool
+            self.pdf_page_engine = PdfPageExtractionEngine(
+                max_workers=self.config_adapter.get_int("PDF_EXTRACTION_WORKERS", 0) or None,
+                pages_per_shard=self.config_adapter.get_int("PDF_PAGES_PER_SHARD", 8)
+            )
+            self.pdfplumber_adapter = PdfplumberTableExtractor(page_engine=self.pdf_page_engine)  # Class name is PdfplumberTableExtractor
+            self.pypdf2_adapter = PyPDF2TextExtractor(page_engine=self.pdf_page_engine)  # Class name is PyPDF2TextExtractor
             
             # Document processing adapters (REQUIRED for image file support)
             # PyTesseractOCRAdapter is required for OCR on image files (PNG, JPG, etc.)
             # OpenCVImageProcessor is required for image enhancement before OCR
             # DocumentIntelligenceAbstraction requires these for full platform functionality
-            self.pytesseract_adapter = PyTesseractOCRAdapter()
+            # Preprocessing and OCR run in a bounded worker pool, cached by image content hash
+            self.batch_ocr_engine = BatchOCREngine(
+                max_workers=self.config_adapter.get_int("OCR_WORKERS", 0) or None,
+                cache_size=self.config_adapter.get_int("OCR_CACHE_SIZE", 1024),
+                target_dpi=self.config_adapter.get_int("OCR_TARGET_DPI", 300)
+            )
+            self.pytesseract_adapter = PyTesseractOCRAdapter(ocr_engine=self.batch_ocr_engine)
             self.opencv_adapter = OpenCVImageProcessor()
             
             # Use MainframeProcessingAdapter (homegrown solution) for extensible COBOL parsing
             # This provides explicit byte position control and extensible pattern matching
             # Better for handling ASCII files with headers, comments, and record prefixes
-            self.mainframe_adapter = MainframeProcessingAdapter()
+            # Compiled copybook layouts are shared across workers through Redis
+            self.mainframe_adapter = MainframeProcessingAdapter(redis_adapter=self.redis_adapter)
             # Legacy alias for backward compatibility
             self.cobol_adapter = self.mainframe_adapter
             self.document_processing_adapter = DocumentProcessingAdapter()
@@ -2133,11 +2255,22 @@ class PublicWorksFoundationService(FoundationServiceBase):
             
             # Semantic Data Abstraction (NEW - for embeddings and semantic graphs)
             from .infrastructure_abstractions.semantic_data_abstraction import SemanticDataAbstraction
+            from .infrastructure_adapters.vector_index_adapter import VectorIndexAdapter
+            
+            # In-process vector index (brute force for small tenants, IVF for large ones)
+            self.vector_index_adapter = VectorIndexAdapter(
+                metric=self.config_adapter.get("VECTOR_INDEX_METRIC", "cosine"),
+                brute_force_threshold=self.config_adapter.get_int("VECTOR_INDEX_BRUTE_FORCE_THRESHOLD", 20000),
+                nprobe=self.config_adapter.get_int("VECTOR_INDEX_NPROBE", 8),
+                snapshot_dir=self.config_adapter.get("VECTOR_INDEX_SNAPSHOT_DIR")
+            )
             
             self.semantic_data_abstraction = SemanticDataAbstraction(
                 arango_adapter=self.arango_adapter,
                 config_adapter=self.config_adapter,
-                di_container=self.di_container
+                di_container=self.di_container,
+                vector_index_adapter=self.vector_index_adapter,
+                vector_refresh_seconds=self.config_adapter.get_int("VECTOR_INDEX_REFRESH_SECONDS", 60)
             )
             self.logger.info("✅ Semantic Data abstraction created")
             
@@ -2528,6 +2661,7 @@ class PublicWorksFoundationService(FoundationServiceBase):
             "messaging": self.messaging_abstraction,
             "event_management": self.event_management_abstraction,
             "cache": self.cache_abstraction,
+            "rate_limiting": self.request_rate_limiter,
             # New file parsing abstractions (5-layer architecture)
             "excel_processing": self.excel_processing_abstraction,
             "csv_processing": self.csv_processing_abstraction,
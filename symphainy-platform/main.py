@@ -1320,6 +1320,14 @@ async def lifespan(app: FastAPI):
                     logger.info(f"✅ {manager_name} shutdown complete")
                 except Exception as e:
                     logger.error(f"❌ {manager_name} shutdown failed: {e}")
+        
+        # Shutdown the DI container last (flushes aggregated telemetry)
+        di_container = getattr(platform_orchestrator, 'infrastructure_services', {}).get("di_container")
+        if di_container and hasattr(di_container, 'shutdown'):
+            try:
+                await di_container.shutdown()
+            except Exception as e:
+                logger.error(f"❌ DI Container shutdown failed: {e}")
 
 async def setup_platform_routes(app: FastAPI):
     """Setup FastAPI routes for the platform."""
@@ -1404,7 +1412,7 @@ async def setup_platform_routes(app: FastAPI):
 # Note: utils is in the same directory as main.py, so we can import directly
 # The Docker container sets PYTHONPATH to include /app (symphainy-platform directory)
 try:
-    from utils.json_encoder import custom_jsonable_encoder
+    from utils.json_encoder import custom_jsonable_encoder, deferred_jsonable_encoder, NumpyJSONResponse
     logger.info("✅ Custom JSON encoder module imported successfully")
 except ImportError as e:
     logger.error(f"❌ Failed to import custom JSON encoder: {e}")
@@ -1413,14 +1421,18 @@ except ImportError as e:
     def custom_jsonable_encoder(obj, **kwargs):
         from fastapi.encoders import jsonable_encoder
         return jsonable_encoder(obj, **kwargs)
+    deferred_jsonable_encoder = None
+    from fastapi.responses import JSONResponse as NumpyJSONResponse
 
-# Create FastAPI app with custom JSON encoder
-# This ensures all responses can be JSON-serialized, even with numpy/pandas types
+# Create FastAPI app with the single-pass JSON response class
+# NumpyJSONResponse serializes numpy/pandas/datetime/enum/dataclass values natively,
+# so responses are encoded exactly once
 app = FastAPI(
     title="SymphAIny Platform",
     description="AI-Coexistence Platform with Updated Architecture",
     version="2.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=NumpyJSONResponse
 )
 
 # Override FastAPI's default jsonable_encoder to use our custom encoder
@@ -1441,6 +1453,12 @@ if fastapi.encoders.jsonable_encoder == custom_jsonable_encoder:
 else:
     logger.error("❌ Failed to replace FastAPI's jsonable_encoder")
 
+# Route return values go straight to NumpyJSONResponse (no separate jsonable_encoder walk)
+if deferred_jsonable_encoder is not None:
+    import fastapi.routing
+    fastapi.routing.jsonable_encoder = deferred_jsonable_encoder
+    logger.info("✅ Single-pass JSON responses enabled (NumpyJSONResponse)")
+
 # Instrument FastAPI app for automatic span creation
 # This enables automatic trace creation for HTTP requests
 try:
@@ -1471,11 +1489,11 @@ except Exception as e:
 # Store the middleware setup for later (after other middlewares are added)
 _cors_middleware_setup = None
 try:
-    from utilities.api_routing.websocket_routing_helper import WebSocketRoutingHelper, FastAPICORSMiddleware
+    from utilities.api_routing.websocket_routing_helper import FastAPICORSMiddleware
     _cors_middleware_setup = ("FastAPICORSMiddleware", FastAPICORSMiddleware)
     logger.info("✅ CORS middleware imported (will be registered after other middlewares)")
 except ImportError as e:
-    logger.warning(f"⚠️ Failed to import WebSocketRoutingHelper: {e}")
+    logger.warning(f"⚠️ Failed to import FastAPICORSMiddleware: {e}")
     logger.warning("⚠️ Will use fallback CORS middleware")
     # Fallback CORS middleware setup
     cors_origins = config_manager.get("CORS_ORIGINS") or config_manager.get("API_CORS_ORIGINS", "*")
@@ -1517,48 +1535,6 @@ except ImportError as e:
     
     _cors_middleware_setup = ("CustomCORSMiddleware", CustomCORSMiddleware)
 
-# Add JSON sanitization middleware (handles numpy/pandas types in responses)
-class JSONSanitizationMiddleware(BaseHTTPMiddleware):
-    """Middleware to sanitize JSON responses for numpy/pandas types."""
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
-        # Only sanitize JSON responses
-        if response.headers.get("content-type", "").startswith("application/json"):
-            try:
-                import json
-                from utils.json_encoder import sanitize_for_json
-                # Read response body
-                body = b""
-                async for chunk in response.body_iterator:
-                    body += chunk
-                # Parse and sanitize
-                try:
-                    data = json.loads(body.decode('utf-8'))
-                    sanitized_data = sanitize_for_json(data)
-                    # Create new response with sanitized data
-                    from fastapi.responses import JSONResponse
-                    return JSONResponse(
-                        content=sanitized_data,
-                        status_code=response.status_code,
-                        headers=dict(response.headers)
-                    )
-                except (json.JSONDecodeError, UnicodeDecodeError):
-                    # If not JSON, return original response
-                    from fastapi.responses import Response
-                    return Response(
-                        content=body,
-                        status_code=response.status_code,
-                        headers=dict(response.headers),
-                        media_type=response.headers.get("content-type")
-                    )
-            except Exception as e:
-                logger.warning(f"⚠️ JSON sanitization middleware error: {e}")
-                # Return original response on error
-                return response
-        return response
-
-app.add_middleware(JSONSanitizationMiddleware)
-
 # Add security headers middleware
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
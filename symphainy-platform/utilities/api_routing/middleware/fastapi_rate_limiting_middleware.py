@@ -7,15 +7,23 @@ and follows the platform's middleware architecture patterns.
 """
 
 import logging
-import time
+import math
 from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
-from collections import defaultdict, deque
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 from fastapi import status
 
+from foundations.public_works_foundation.infrastructure_adapters.rate_limiting_adapter import (
+    GCRARateLimiter, InMemoryGCRABackend, RedisGCRABackend, RateLimit
+)
+
+try:
+    import redis.asyncio as aioredis
+    from foundations.public_works_foundation.infrastructure_adapters.redis_connection_pool import get_shared_pool
+except ImportError:
+    aioredis = None
+
 logger = logging.getLogger("RateLimitingMiddleware")
 
 
@@ -24,10 +32,12 @@ class FastAPIRateLimitingMiddleware(BaseHTTPMiddleware):
     Rate limiting middleware for FastAPI.
     
     Integrates with UnifiedConfigurationManager for configuration.
-    Uses in-memory storage (can be extended to Redis for distributed deployments).
+    Decisions come from the shared GCRA limiter engine (also used by Traffic Cop): with
+    REDIS_URL configured every uvicorn worker shares one atomic limit per client; without
+    it, limits are enforced per process.
     """
     
-    def __init__(self, app, config_manager=None):
+    def __init__(self, app, config_manager=None, rate_limiter: Optional[GCRARateLimiter] = None):
         """Initialize rate limiting middleware."""
         super().__init__(app)
         self.config_manager = config_manager
@@ -50,11 +60,12 @@ class FastAPIRateLimitingMiddleware(BaseHTTPMiddleware):
             "/api/v1/content-pillar/process-file",  # File processing - exclude from rate limiting during development
         ]
         
-        # Request tracking (in-memory, can be extended to Redis)
-        self.request_history: Dict[str, deque] = defaultdict(deque)
+        # Shared limiter engine (Redis-backed when configured)
+        self.rate_limiter = rate_limiter or self._create_rate_limiter()
         
         if self.enabled:
-            self.logger.info(f"✅ Rate limiting enabled: {self.default_requests} requests per {self.default_window}s")
+            self.logger.info(f"✅ Rate limiting enabled: {self.default_requests} requests per {self.default_window}s "
+                             f"({type(self.rate_limiter.backend).__name__})")
             self.logger.info(f"   Excluded paths: {len(self.excluded_paths)} read-only endpoints")
         else:
             self.logger.info("⚠️ Rate limiting disabled")
@@ -77,6 +88,26 @@ class FastAPIRateLimitingMiddleware(BaseHTTPMiddleware):
         except Exception:
             return default
     
+    def _get_config_str(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Get string config value."""
+        if not self.config_manager:
+            return default
+        try:
+            return self.config_manager.get(key, default)
+        except Exception:
+            return default
+    
+    def _create_rate_limiter(self) -> GCRARateLimiter:
+        """Build the limiter engine on the shared Redis pool, or in-process without Redis."""
+        backend = InMemoryGCRABackend()
+        redis_url = self._get_config_str("RATE_LIMIT_REDIS_URL") or self._get_config_str("REDIS_URL")
+        if redis_url and aioredis is not None:
+            try:
+                backend = RedisGCRABackend(aioredis.Redis(connection_pool=get_shared_pool(url=redis_url, decode_responses=True)))
+            except Exception as e:
+                self.logger.warning(f"⚠️ Redis rate limit backend unavailable, limiting per process: {e}")
+        return GCRARateLimiter(backend, lease_max=self._get_config_int("RATE_LIMIT_LOCAL_LEASE_MAX", 16))
+    
     async def dispatch(self, request: Request, call_next):
         """Process rate limiting for the request."""
         # Skip rate limiting if disabled
@@ -92,8 +123,10 @@ class FastAPIRateLimitingMiddleware(BaseHTTPMiddleware):
         client_ip = request.client.host if request.client else "unknown"
         user_key = f"{user_id}:{client_ip}"
         
-        # Check rate limit
-        if not self._check_rate_limit(user_key):
+        # Check and record in one atomic decision
+        decision = await self._check_rate_limit(user_key)
+        if not decision.allowed:
+            retry_after = max(1, math.ceil(decision.retry_after))
             self.logger.warning(f"⚠️ Rate limit exceeded for {user_key}")
             return JSONResponse(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
@@ -102,15 +135,12 @@ class FastAPIRateLimitingMiddleware(BaseHTTPMiddleware):
                     "error": {
                         "code": "RATE_LIMIT_EXCEEDED",
                         "message": "Rate limit exceeded. Please try again later.",
-                        "retry_after": self.default_window
+                        "retry_after": retry_after
                     }
                 },
-                headers={"Retry-After": str(self.default_window)}
+                headers={"Retry-After": str(retry_after)}
             )
         
-        # Record request
-        self._record_request(user_key)
-        
         # Continue to next handler
         return await call_next(request)
     
@@ -125,39 +155,8 @@ class FastAPIRateLimitingMiddleware(BaseHTTPMiddleware):
         
         return "anonymous"
     
-    def _check_rate_limit(self, user_key: str) -> bool:
-        """Check if request is within rate limit."""
-        try:
-            current_time = time.time()
-            
-            # Clean old requests
-            self._clean_old_requests(user_key, current_time)
-            
-            # Check if under limit
-            request_count = len(self.request_history[user_key])
-            if request_count >= self.default_requests:
-                return False
-            
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"❌ Rate limit check failed: {e}")
-            return True  # Allow request on error (fail open)
-    
-    def _clean_old_requests(self, user_key: str, current_time: float):
-        """Clean old requests from history."""
-        cutoff_time = current_time - self.default_window
-        user_history = self.request_history[user_key]
-        
-        # Remove requests older than the window
-        while user_history and user_history[0] < cutoff_time:
-            user_history.popleft()
-    
-    def _record_request(self, user_key: str):
-        """Record the request for rate limiting."""
-        try:
-            # Record request timestamp
-            self.request_history[user_key].append(time.time())
-        except Exception as e:
-            self.logger.error(f"❌ Failed to record request: {e}")
-
+    async def _check_rate_limit(self, user_key: str):
+        """Admit or deny the request (the limiter falls back to in-process limits if Redis fails)."""
+        return await self.rate_limiter.check(
+            [RateLimit(f"http_rate_limit:{user_key}", self.default_requests, self.default_window)]
+        )
@@ -5,5 +5,6 @@ Bootstrap-aware telemetry reporting utilities for Smart City services.
 """
 
 from .telemetry_reporting_utility import TelemetryReportingUtility, get_telemetry_reporting_utility
+from .metric_aggregator import MetricAggregator
 
-__all__ = ["TelemetryReportingUtility", "get_telemetry_reporting_utility"]
+__all__ = ["TelemetryReportingUtility", "get_telemetry_reporting_utility", "MetricAggregator"]
@@ -0,0 +1,141 @@
+"""
+Metric Aggregator
+
+In-process pre-aggregation for the telemetry reporting utility. Recording a metric updates
+one in-memory series (counter, gauge or histogram) for the current interval; a background
+flush swaps the buffer out and exports the aggregated series in batches.
+
+WHAT (Utility Role): I turn a stream of metric calls into one record per series per interval
+HOW (Utility Implementation): Double-buffered dict of series (swapped by reference at flush, no locks),
+bounded series count and bounded export queue that drop on overflow and count what they dropped
+"""
+
+import time
+from bisect import bisect_left
+from collections import deque
+from typing import Dict, Any, Optional, List, Tuple
+
+DEFAULT_HISTOGRAM_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class MetricAggregator:
+    """
+    Per-interval aggregation of counters, gauges and histograms.
+
+    Series are keyed by (type, name, tags). Entries are plain lists updated in place:
+    counter [count, sum]; gauge [count, sum, min, max, last];
+    histogram [count, sum, min, max, bucket counts (one per bound plus +Inf)].
+    """
+
+    METRIC_TYPES = ("counter", "gauge", "histogram")
+
+    def __init__(self, max_series: int = 10000, max_pending_batches: int = 20, batch_size: int = 500,
+                 histogram_buckets: Tuple[float, ...] = DEFAULT_HISTOGRAM_BUCKETS):
+        """
+        Initialize metric aggregator.
+
+        Args:
+            max_series: Most distinct series held per interval (new series beyond it are dropped)
+            max_pending_batches: Most batches waiting for export (oldest dropped beyond it)
+            batch_size: Series per exported batch
+            histogram_buckets: Upper bounds of histogram buckets
+        """
+        self.max_series = max_series
+        self.max_pending_batches = max_pending_batches
+        self.batch_size = batch_size
+        self.histogram_buckets = tuple(histogram_buckets)
+
+        self._series: Dict[tuple, list] = {}
+        self._interval_start = time.time()
+        self.pending: deque = deque()
+        self.stats = {"recorded": 0, "series_flushed": 0, "batches_exported": 0}
+        self.dropped = {"series_overflow": 0, "batch_overflow": 0, "invalid": 0}
+
+    def record(self, metric_name: str, value: float, tags: Optional[Dict[str, str]] = None,
+               metric_type: str = "gauge") -> bool:
+        """Fold one measurement into the current interval (O(1), never blocks)."""
+        if metric_type not in self.METRIC_TYPES:
+            self.dropped["invalid"] += 1
+            return False
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            self.dropped["invalid"] += 1
+            return False
+
+        key = (metric_type, metric_name, tuple(sorted(tags.items())) if tags else ())
+        series = self._series
+        entry = series.get(key)
+        if entry is None:
+            if len(series) >= self.max_series:
+                self.dropped["series_overflow"] += 1
+                return False
+            if metric_type == "counter":
+                entry = [0, 0.0]
+            elif metric_type == "gauge":
+                entry = [0, 0.0, value, value, value]
+            else:
+                entry = [0, 0.0, value, value, [0] * (len(self.histogram_buckets) + 1)]
+            series[key] = entry
+
+        entry[0] += 1
+        entry[1] += value
+        if metric_type != "counter":
+            if value < entry[2]:
+                entry[2] = value
+            if value > entry[3]:
+                entry[3] = value
+            if metric_type == "gauge":
+                entry[4] = value
+            else:
+                entry[4][bisect_left(self.histogram_buckets, value)] += 1
+        self.stats["recorded"] += 1
+        return True
+
+    def swap(self) -> List[Dict[str, Any]]:
+        """Close the current interval and return its aggregated series."""
+        series, self._series = self._series, {}
+        start, self._interval_start = self._interval_start, time.time()
+        records = []
+        for (metric_type, metric_name, tags), entry in series.items():
+            record = {
+                "metric_name": metric_name,
+                "metric_type": metric_type,
+                "tags": dict(tags),
+                "count": entry[0],
+                "sum": entry[1],
+                "interval_start": start,
+                "interval_end": self._interval_start
+            }
+            if metric_type == "counter":
+                record["value"] = entry[1]
+            else:
+                record.update({"min": entry[2], "max": entry[3]})
+                if metric_type == "gauge":
+                    record["value"] = entry[4]
+                else:
+                    record["value"] = entry[1] / entry[0]
+                    bounds = [str(bound) for bound in self.histogram_buckets] + ["+Inf"]
+                    record["buckets"] = dict(zip(bounds, entry[4]))
+            records.append(record)
+        self.stats["series_flushed"] += len(records)
+        return records
+
+    def enqueue_interval(self) -> int:
+        """Swap the interval into export batches; drops the oldest batches beyond the bound."""
+        records = self.swap()
+        for i in range(0, len(records), self.batch_size):
+            self.pending.append(records[i:i + self.batch_size])
+        while len(self.pending) > self.max_pending_batches:
+            self.dropped["batch_overflow"] += len(self.pending.popleft())
+        return len(records)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters, drop counts and current buffer sizes."""
+        return {
+            **self.stats,
+            "dropped": dict(self.dropped),
+            "dropped_total": sum(self.dropped.values()),
+            "active_series": len(self._series),
+            "pending_batches": len(self.pending)
+        }
@@ -4,15 +4,22 @@ Telemetry Reporting Utility
 Bootstrap-aware telemetry utility that provides metrics collection,
 health monitoring, and anomaly detection through a lazy bootstrap pattern.
 
+Metrics are pre-aggregated in process (see MetricAggregator) and exported in batches by a
+background flush task, so recording a metric never waits on Nurse or the bootstrap provider.
+
 WHAT (Utility Role): I provide telemetry reporting capabilities through bootstrap pattern
 HOW (Utility Implementation): I bootstrap from foundation service, then work independently
 """
 
+import asyncio
 import logging
+from collections import deque
 from typing import Dict, Any, Optional, List, Callable
 from datetime import datetime
 import json
 
+from .metric_aggregator import MetricAggregator
+
 logger = logging.getLogger(__name__)
 
 class TelemetryReportingUtility:
@@ -26,8 +33,19 @@ class TelemetryReportingUtility:
     - Anomaly detection and alerting
     """
     
-    def __init__(self, service_name: str):
-        """Initialize telemetry reporting utility (not yet bootstrapped)."""
+    def __init__(self, service_name: str, flush_interval: float = 10.0, max_series: int = 10000,
+                 max_pending_batches: int = 20, batch_size: int = 500, max_stored_metrics: int = 1000):
+        """
+        Initialize telemetry reporting utility (not yet bootstrapped).
+        
+        Args:
+            service_name: Name of the owning service
+            flush_interval: Seconds between background flushes of aggregated metrics
+            max_series: Most distinct metric series aggregated per interval
+            max_pending_batches: Most metric batches waiting for export (oldest dropped)
+            batch_size: Aggregated series per exported batch
+            max_stored_metrics: Most recently exported series kept locally for backup
+        """
         self.service_name = service_name
         self.logger = logging.getLogger(f"TelemetryReportingUtility-{service_name}")
         
@@ -38,8 +56,18 @@ class TelemetryReportingUtility:
         # Nurse Service client (will be set after bootstrap)
         self.nurse_client = None
         
-        # Local metrics storage
-        self.metrics_storage = []
+        # Metric pipeline: aggregation buffer, bounded export queue, background flush
+        self.flush_interval = flush_interval
+        self.aggregator = MetricAggregator(
+            max_series=max_series,
+            max_pending_batches=max_pending_batches,
+            batch_size=batch_size
+        )
+        self._flush_task: Optional[asyncio.Task] = None
+        self.export_failures = 0
+        
+        # Local metrics storage (most recent exported series only)
+        self.metrics_storage = deque(maxlen=max_stored_metrics)
         self.health_metrics = {}
         self.anomaly_logs = []
         
@@ -63,53 +91,116 @@ class TelemetryReportingUtility:
     # METRICS COLLECTION AND REPORTING
     # ============================================================================
     
-    async def record_metric(self, metric_name: str, value: float, tags: Dict[str, str] = None):
-        """Record a telemetry metric - uses bootstrap implementation."""
+    async def record_metric(self, metric_name: str, value: float, tags: Dict[str, str] = None,
+                            metric_type: str = "gauge"):
+        """
+        Record a telemetry metric into the current aggregation interval.
+        
+        Does no I/O: the aggregated series are exported in batches by the background
+        flush task. metric_type is "counter", "gauge" or "histogram".
+        """
         if not self.is_bootstrapped:
             raise RuntimeError("Telemetry reporting utility not bootstrapped. Call bootstrap() first.")
         
+        self.aggregator.record(metric_name, value, tags, metric_type)
+        self._ensure_flush_task()
+    
+    def _ensure_flush_task(self):
+        """Start the background flush task on first use (bootstrap may run before the event loop)."""
+        if self._flush_task is not None and not self._flush_task.done():
+            return
         try:
-            metric_data = {
-                "metric_name": metric_name,
-                "value": value,
-                "tags": tags or {},
-                "timestamp": datetime.utcnow().isoformat(),
-                "service": self.service_name
-            }
-            
-            # Try Smart City role first (enhanced implementation)
-            if self.nurse_client:
-                await self._send_metric_to_nurse(metric_data)
-            else:
-                # Fallback: Use bootstrap provider's implementation
-                await self._record_metric_to_bootstrap(metric_data)
-            
-            # Store locally for backup
-            self.metrics_storage.append(metric_data)
-            
-        except Exception as e:
-            self.logger.error(f"Failed to record metric {metric_name}: {e}")
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._flush_task = loop.create_task(self._flush_loop())
     
-    async def _send_metric_to_nurse(self, metric_data: Dict[str, Any]):
-        """Send metric to Nurse Service (enhanced)."""
+    async def _flush_loop(self):
+        """Background task exporting aggregated metrics every flush_interval."""
         try:
-            # Prepare telemetry data for Nurse
-            nurse_input = {
-                "service_name": self.service_name,
-                "telemetry_type": "metric",
-                "telemetry_data": metric_data,
-                "timestamp": datetime.utcnow().isoformat()
-            }
-            
-            # Call Nurse's collect_telemetry_data tool
-            result = await self.nurse_client.call_tool(
-                "collect_telemetry_data",
-                input_data=json.dumps(nurse_input)
-            )
-            
-            return result
-        except Exception as e:
-            self.logger.error(f"Failed to send metric to Nurse: {e}")
+            while True:
+                await asyncio.sleep(self.flush_interval)
+                await self.flush()
+        except asyncio.CancelledError:
+            pass
+    
+    async def flush(self) -> int:
+        """
+        Close the current interval and export pending batches, oldest first.
+        
+        A batch that fails to export stays queued for the next flush; the queue is bounded,
+        so a long outage drops the oldest batches (counted in the pipeline stats).
+        
+        Returns:
+            Number of batches exported
+        """
+        self.aggregator.enqueue_interval()
+        exported = 0
+        pending = self.aggregator.pending
+        while pending:
+            batch = pending[0]
+            try:
+                await self._export_metric_batch(batch)
+            except Exception as e:
+                self.export_failures += 1
+                self.logger.warning(f"⚠️ Failed to export metric batch ({len(batch)} series), will retry: {e}")
+                break
+            if pending and pending[0] is batch:
+                pending.popleft()
+            self.metrics_storage.extend(batch)
+            self.aggregator.stats["batches_exported"] += 1
+            exported += 1
+        return exported
+    
+    async def shutdown(self):
+        """Stop the background flush task and export what has been aggregated so far."""
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+        self._flush_task = None
+        if self.is_bootstrapped:
+            await self.flush()
+    
+    async def _export_metric_batch(self, batch: List[Dict[str, Any]]):
+        """Export one batch of aggregated series (raises on failure so the batch is retried)."""
+        for metric_data in batch:
+            metric_data["service"] = self.service_name
+        
+        # Try Smart City role first (enhanced implementation)
+        if self.nurse_client:
+            await self._send_metric_batch_to_nurse(batch)
+        else:
+            # Fallback: Use bootstrap provider's implementation
+            await self._record_metric_batch_to_bootstrap(batch)
+    
+    async def _send_metric_batch_to_nurse(self, batch: List[Dict[str, Any]]):
+        """Send a batch of aggregated metrics to Nurse Service (enhanced)."""
+        nurse_input = {
+            "service_name": self.service_name,
+            "telemetry_type": "metric_batch",
+            "telemetry_data": {
+                "metrics": batch,
+                "pipeline": self.aggregator.get_stats()
+            },
+            "timestamp": datetime.utcnow().isoformat()
+        }
+        
+        # Call Nurse's collect_telemetry_data tool (one call per batch)
+        return await self.nurse_client.call_tool(
+            "collect_telemetry_data",
+            input_data=json.dumps(nurse_input)
+        )
+    
+    async def _record_metric_batch_to_bootstrap(self, batch: List[Dict[str, Any]]):
+        """Record a batch of aggregated metrics using bootstrap provider's implementation."""
+        if hasattr(self.bootstrap_provider, 'implement_telemetry_reporting_record_metric_batch'):
+            await self.bootstrap_provider.implement_telemetry_reporting_record_metric_batch(batch)
+        else:
+            for metric_data in batch:
+                await self._record_metric_to_bootstrap(metric_data)
     
     async def _record_metric_to_bootstrap(self, metric_data: Dict[str, Any]):
         """Record metric using bootstrap provider's implementation."""
@@ -246,7 +337,8 @@ class TelemetryReportingUtility:
             await self.record_metric(
                 metric_name=f"platform.operation.{operation_name}",
                 value=1.0,
-                tags=tags
+                tags=tags,
+                metric_type="counter"
             )
         except Exception as e:
             self.logger.error(f"Failed to record platform operation event {operation_name}: {e}")
@@ -328,6 +420,7 @@ class TelemetryReportingUtility:
             "nurse_connected": self.nurse_client is not None,
             "timestamp": datetime.utcnow().isoformat(),
             "metrics_stored": len(self.metrics_storage),
+            "metric_pipeline": self.get_metric_pipeline_stats(),
             "health_metrics_count": len(self.health_metrics),
             "anomaly_logs_count": len(self.anomaly_logs)
         }
@@ -336,10 +429,21 @@ class TelemetryReportingUtility:
         """Get summary of stored metrics."""
         return {
             "total_metrics": len(self.metrics_storage),
+            "metrics_recorded": self.aggregator.stats["recorded"],
+            "metrics_dropped": self.aggregator.get_stats()["dropped_total"],
             "health_metrics": self.health_metrics,
             "recent_anomalies": len(self.anomaly_logs),
             "timestamp": datetime.utcnow().isoformat()
         }
+    
+    def get_metric_pipeline_stats(self) -> Dict[str, Any]:
+        """Aggregation/export counters, including drop counts."""
+        return {
+            **self.aggregator.get_stats(),
+            "export_failures": self.export_failures,
+            "flush_interval": self.flush_interval,
+            "flush_task_running": self._flush_task is not None and not self._flush_task.done()
+        }
 
 # Global telemetry reporting utility instance
 _telemetry_reporting_utility: Optional[TelemetryReportingUtility] = None
@@ -11,10 +11,31 @@ like pandas DataFrames, custom objects, etc.
 """
 
 import json
+import math
+import dataclasses
+from enum import Enum
+from pathlib import PurePath
 from typing import Any
 from datetime import datetime
 from decimal import Decimal
 
+from starlette.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
 
 def sanitize_for_json(data: Any, visited: set = None) -> Any:
     """
@@ -101,6 +122,10 @@ def sanitize_for_json(data: Any, visited: set = None) -> Any:
         except (AttributeError, ValueError, TypeError):
             pass
         
+        # Handle Enum (before simple types: str/int enums keep their value)
+        if isinstance(data, Enum):
+            return sanitize_for_json(data.value, visited)
+        
         # Handle simple types (after numpy/pandas checks)
         if isinstance(data, (str, int, float, bool)):
             return data
@@ -195,3 +220,145 @@ def custom_jsonable_encoder(
         # This ensures we always return something JSON-serializable
         return sanitized_obj
 
+
+
+# ============================================================================
+# SINGLE-PASS RESPONSE SERIALIZATION
+# ============================================================================
+
+def json_default(obj: Any) -> Any:
+    """
+    `default` hook for json/orjson: converts one non-native value per call.
+
+    The serializer walks the tree once and only calls this for values it cannot
+    encode itself (numpy scalars/arrays it can't serialize natively, pandas
+    values, Decimal, Pydantic models, ...). Unknown objects fall back to
+    their __dict__ or str(), like sanitize_for_json.
+    """
+    if np is not None:
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        if isinstance(obj, np.generic):
+            value = obj.item()
+            return None if isinstance(value, float) and not math.isfinite(value) else value
+    if pd is not None:
+        if obj is pd.NaT or obj is pd.NA:
+            return None
+        if isinstance(obj, (pd.Timestamp, pd.Timedelta)):
+            return obj.isoformat()
+        if isinstance(obj, pd.DataFrame):
+            return obj.to_dict("records")
+        if isinstance(obj, pd.Series):
+            return obj.to_dict()
+        if isinstance(obj, pd.Index):
+            return obj.tolist()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, bytes):
+        return obj.decode("utf-8", errors="replace")
+    if isinstance(obj, PurePath):
+        return str(obj)
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json")
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    if hasattr(obj, "__dict__"):
+        return vars(obj)
+    return str(obj)
+
+
+def _replace_non_finite(data: Any) -> Any:
+    """Replace NaN/Infinity floats with None (stdlib fallback only; orjson does this natively)."""
+    if isinstance(data, float):
+        return data if math.isfinite(data) else None
+    if isinstance(data, dict):
+        return {k: _replace_non_finite(v) for k, v in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [_replace_non_finite(v) for v in data]
+    return data
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def dumps_json(content: Any) -> bytes:
+    """
+    Serialize content to compact UTF-8 JSON in a single pass.
+
+    Uses orjson when available (native numpy, dataclass, enum, datetime and UUID
+    support; NaN/Infinity become null), otherwise the stdlib encoder with the same
+    `default` hook. Content orjson rejects (numpy dict keys, ints beyond 64 bits)
+    goes through the stdlib path instead.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(content, default=json_default, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # orjson.JSONEncodeError is a TypeError
+            pass
+    try:
+        text = json.dumps(content, default=json_default, allow_nan=False, ensure_ascii=False, separators=(",", ":"))
+    except (TypeError, ValueError):
+        # Non-finite floats, dict keys json can't encode (numpy scalars, ...) or
+        # circular references: sanitize the whole tree and replace NaN/Infinity with null
+        text = json.dumps(
+            _replace_non_finite(sanitize_for_json(content)),
+            ensure_ascii=False,
+            separators=(",", ":")
+        )
+    return text.encode("utf-8")
+
+
+class NumpyJSONResponse(JSONResponse):
+    """
+    Default response class: one-pass JSON serialization with numpy/pandas support.
+
+    Replaces the sanitize -> encode -> re-parse -> re-encode chain (jsonable_encoder
+    pass + the old JSON sanitization middleware). Bodies above STREAM_THRESHOLD are sent to
+    the ASGI server in CHUNK_SIZE pieces instead of one message.
+    """
+
+    STREAM_THRESHOLD = 1024 * 1024
+    CHUNK_SIZE = 256 * 1024
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
+
+    async def __call__(self, scope, receive, send):
+        if len(self.body) <= self.STREAM_THRESHOLD:
+            await super().__call__(scope, receive, send)
+            return
+
+        prefix = "websocket." if scope["type"] == "websocket" else ""
+        await send({"type": prefix + "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        body = memoryview(self.body)
+        for start in range(0, len(body), self.CHUNK_SIZE):
+            chunk = body[start:start + self.CHUNK_SIZE]
+            await send({
+                "type": prefix + "http.response.body",
+                "body": bytes(chunk),
+                "more_body": start + self.CHUNK_SIZE < len(body)
+            })
+        if self.background is not None:
+            await self.background()
+
+
+def deferred_jsonable_encoder(obj: Any, **kwargs) -> Any:
+    """
+    Route-level encoder used with NumpyJSONResponse.
+
+    FastAPI runs jsonable_encoder over every return value that has no response
+    model before handing it to the response class. NumpyJSONResponse already
+    handles every type that pass would convert, so plain return values are passed
+    through untouched; calls with include/exclude options still use the full encoder.
+    """
+    if kwargs:
+        return custom_jsonable_encoder(obj, **kwargs)
+    return obj
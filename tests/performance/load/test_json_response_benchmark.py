@@ -0,0 +1,189 @@
+"""
+Benchmark and checks for the single-pass JSON response class.
+
+Tests:
+- numpy scalars/arrays, pandas Timestamp/NaT/NaN, datetimes, enums and dataclasses
+  serialize in one pass
+- numpy dict keys and ints beyond 64 bits fall back to the stdlib encoder
+- The stdlib fallback handles NaN next to numpy keys and circular references
+- Large bodies are streamed to the ASGI server in chunks
+- Response latency on a large parsed-file preview vs the legacy
+  encode -> sanitize middleware -> re-encode chain
+"""
+
+import pytest
+import json
+import time
+import dataclasses
+import importlib.util
+from enum import Enum
+from datetime import datetime
+from pathlib import Path
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+
+from fastapi.responses import JSONResponse
+
+# tests/utils shadows the platform's utils package, so load the module by path
+_spec = importlib.util.spec_from_file_location(
+    "platform_json_encoder",
+    Path(__file__).resolve().parents[3] / "symphainy-platform" / "utils" / "json_encoder.py"
+)
+json_encoder = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(json_encoder)
+NumpyJSONResponse = json_encoder.NumpyJSONResponse
+custom_jsonable_encoder = json_encoder.custom_jsonable_encoder
+sanitize_for_json = json_encoder.sanitize_for_json
+
+
+class _Status(Enum):
+    PARSED = "parsed"
+
+
+@dataclasses.dataclass
+class _Column:
+    name: str
+    dtype: str
+
+
+def _preview_payload(rows: int = 20000, with_nan: bool = True):
+    """Parsed-file preview shaped like the structured parser output."""
+    frame = pd.DataFrame({
+        "policy_number": np.arange(rows, dtype=np.int64),
+        "premium": np.random.default_rng(7).normal(1000, 250, rows),
+        "active": np.arange(rows) % 2 == 0,
+        "effective_date": pd.date_range("2020-01-01", periods=rows, freq="h"),
+        "holder": [f"holder_{i}" for i in range(rows)],
+    })
+    if with_nan:
+        frame.loc[::50, "premium"] = np.nan
+    return {
+        "success": True,
+        "status": _Status.PARSED,
+        "columns": [_Column(name, str(dtype)) for name, dtype in frame.dtypes.items()],
+        "row_count": np.int64(rows),
+        "preview": [dict(zip(frame.columns, row)) for row in frame.itertuples(index=False)],
+        "generated_at": datetime(2026, 1, 1, 12, 0),
+    }
+
+
+def _legacy_body(payload) -> bytes:
+    """Former pipeline: global encoder pass, JSONResponse, then middleware re-parse + re-encode."""
+    encoded = custom_jsonable_encoder(payload)
+    body = JSONResponse(content=sanitize_for_json(encoded)).body
+    return JSONResponse(content=sanitize_for_json(json.loads(body))).body
+
+
+async def _collect(response):
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    await response({"type": "http"}, None, send)
+    return messages
+
+
+@pytest.mark.performance
+@pytest.mark.fast
+class TestNumpyJSONResponse:
+    """Correctness checks for NumpyJSONResponse."""
+
+    def test_native_types_single_pass(self):
+        body = NumpyJSONResponse({
+            "int": np.int32(3),
+            "float": np.float64(1.5),
+            "nan": np.float64("nan"),
+            "array": np.array([[1, 2], [3, 4]]),
+            "strided": np.arange(10)[::3],
+            "timestamp": pd.Timestamp("2024-05-01 10:00"),
+            "nat": pd.NaT,
+            "py_nan": float("nan"),
+            "enum": _Status.PARSED,
+            "column": _Column("a", "int64"),
+            4: "non-str key",
+        }).body
+
+        assert json.loads(body) == {
+            "int": 3,
+            "float": 1.5,
+            "nan": None,
+            "array": [[1, 2], [3, 4]],
+            "strided": [0, 3, 6, 9],
+            "timestamp": "2024-05-01T10:00:00",
+            "nat": None,
+            "py_nan": None,
+            "enum": "parsed",
+            "column": {"name": "a", "dtype": "int64"},
+            "4": "non-str key",
+        }
+
+    def test_numpy_keys_and_big_ints_fall_back(self):
+        body = NumpyJSONResponse({
+            np.int64(7): {"count": np.int64(2), "ratio": np.float64("nan")},
+            "big": 2 ** 70,
+            "negative_big": -(2 ** 65),
+        }).body
+
+        assert json.loads(body) == {
+            "7": {"count": 2, "ratio": None},
+            "big": 2 ** 70,
+            "negative_big": -(2 ** 65),
+        }
+
+    def test_nan_with_numpy_keys_falls_back(self):
+        body = NumpyJSONResponse({
+            "n": float("nan"),
+            "k": {np.int64(1): 2},
+            "status": _Status.PARSED,
+        }).body
+
+        assert json.loads(body) == {"n": None, "k": {"1": 2}, "status": "parsed"}
+
+    def test_circular_reference_falls_back(self):
+        content = {"name": "loop", "ratio": float("inf")}
+        content["self"] = content
+
+        body = NumpyJSONResponse(content).body
+
+        assert json.loads(body) == {"name": "loop", "ratio": None, "self": "<circular_reference>"}
+
+    @pytest.mark.asyncio
+    async def test_large_body_is_streamed(self):
+        response = NumpyJSONResponse({"blob": "x" * (3 * NumpyJSONResponse.STREAM_THRESHOLD)})
+        messages = await _collect(response)
+        bodies = [m for m in messages if m["type"] == "http.response.body"]
+
+        assert messages[0]["type"] == "http.response.start"
+        assert len(bodies) > 1
+        assert not bodies[-1]["more_body"]
+        assert b"".join(m["body"] for m in bodies) == response.body
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestJSONResponseBenchmark:
+    """Latency of large preview responses: single pass vs legacy chain."""
+
+    def test_preview_latency(self):
+        # The legacy chain rejects NaN (JSONResponse uses allow_nan=False), so compare without it
+        payload = _preview_payload(with_nan=False)
+
+        def timed(fn, repeats=3):
+            best = float("inf")
+            for _ in range(repeats):
+                start = time.perf_counter()
+                fn(payload)
+                best = min(best, time.perf_counter() - start)
+            return best
+
+        legacy = timed(_legacy_body)
+        single = timed(lambda p: NumpyJSONResponse(p).body)
+        print(f"\npreview 20k rows: legacy {legacy * 1000:.1f} ms, single-pass {single * 1000:.1f} ms "
+              f"({legacy / single:.1f}x)")
+
+        single_body, legacy_body = json.loads(NumpyJSONResponse(payload).body), json.loads(_legacy_body(payload))
+        assert single_body["preview"] == legacy_body["preview"]
+        assert len(json.loads(NumpyJSONResponse(_preview_payload()).body)["preview"]) == 20000
+        assert single < legacy
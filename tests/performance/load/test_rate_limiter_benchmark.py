@@ -0,0 +1,98 @@
+"""
+Benchmark for the shared GCRA request limiter.
+
+Tests:
+- Decisions per second on the in-process backend
+- Backend round trips with and without the local pre-check, against a backend with
+  network-like latency, while the global limit stays exact across workers
+"""
+
+import pytest
+import asyncio
+import time
+
+from foundations.public_works_foundation.infrastructure_adapters.rate_limiting_adapter import (
+    GCRARateLimiter, InMemoryGCRABackend, RateLimit
+)
+
+
+class _LatencyBackend:
+    """In-process GCRA behind an artificial round-trip delay (stands in for Redis)."""
+
+    def __init__(self, latency: float = 0.0005):
+        self.latency = latency
+        self.inner = InMemoryGCRABackend()
+        self.calls = 0
+
+    async def gcra(self, limits, cost=1):
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        return self.inner.gcra_now(limits, cost)
+
+    async def delete(self, keys):
+        return await self.inner.delete(keys)
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestRateLimiterBenchmark:
+    """Throughput and round trips of the request limiter."""
+
+    @pytest.mark.asyncio
+    async def test_in_memory_decisions_per_second(self):
+        limiter = GCRARateLimiter(InMemoryGCRABackend(), lease_max=1)
+        clients = [[RateLimit(f"client_{i}:minute", 1000, 60), RateLimit(f"client_{i}:hour", 10000, 3600)]
+                   for i in range(100)]
+
+        decisions = 50000
+        start = time.perf_counter()
+        for n in range(decisions):
+            await limiter.check(clients[n % len(clients)])
+        elapsed = time.perf_counter() - start
+        print(f"\nin-memory GCRA: {decisions / elapsed:,.0f} decisions/s (2 limits per decision)")
+
+        assert limiter.get_stats()["allowed"] == decisions
+
+    @pytest.mark.asyncio
+    async def test_local_precheck_round_trips(self):
+        limits = [RateLimit("bench:minute", 10000, 60)]
+        requests_per_worker, workers = 500, 4
+
+        async def run(lease_max):
+            backend = _LatencyBackend()
+            limiters = [GCRARateLimiter(backend, lease_max=lease_max) for _ in range(workers)]
+
+            async def worker(limiter):
+                allowed = 0
+                for _ in range(requests_per_worker):
+                    allowed += (await limiter.check(limits)).allowed
+                return allowed
+
+            start = time.perf_counter()
+            allowed = sum(await asyncio.gather(*(worker(limiter) for limiter in limiters)))
+            return allowed, backend.calls, time.perf_counter() - start
+
+        plain_allowed, plain_calls, plain_time = await run(1)
+        lease_allowed, lease_calls, lease_time = await run(16)
+        total = requests_per_worker * workers
+        print(f"\n{total} decisions, 4 workers: backend only {plain_calls} round trips {plain_time * 1000:.0f} ms, "
+              f"with pre-check {lease_calls} round trips {lease_time * 1000:.0f} ms")
+
+        assert plain_allowed == lease_allowed == total
+        assert plain_calls == total
+        assert lease_calls < total / 4
+
+    @pytest.mark.asyncio
+    async def test_global_limit_exact_under_contention(self):
+        backend = _LatencyBackend(latency=0)
+        limiters = [GCRARateLimiter(backend, lease_max=16) for _ in range(8)]
+        limits = [RateLimit("contended:minute", 1000, 60)]
+
+        async def worker(limiter):
+            return sum([(await limiter.check(limits)).allowed for _ in range(400)])
+
+        allowed = sum(await asyncio.gather(*(worker(limiter) for limiter in limiters)))
+
+        # Leases are debited in the backend up front, so batching can never over-admit
+        assert allowed <= 1000
+        assert allowed >= 1000 - 8 * 16
@@ -0,0 +1,58 @@
+"""
+Soak test for the bounded CacheAdapter memory tier.
+
+Tests:
+- Sustained unique-key writes (LLM-response sized values) keep memory flat once the
+  cache is full: traced Python heap and RSS stop growing after warm-up
+"""
+
+import gc
+import os
+import pytest
+import tracemalloc
+
+from foundations.public_works_foundation.infrastructure_adapters.cache_adapter import CacheAdapter
+
+
+def _rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return 0
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.asyncio
+class TestCacheMemorySoak:
+
+    async def test_memory_flat_under_unique_key_load(self):
+        adapter = CacheAdapter(storage_type="memory", memory_max_entries=5000,
+                               memory_max_bytes=8 * 1024 * 1024)
+        response = {"response": "lorem ipsum " * 100, "model": "gpt-4o-mini", "tokens": 512}
+
+        async def write(start, count):
+            for i in range(start, start + count):
+                await adapter.set(f"llm:{i}", dict(response, id=i), ttl=3600)
+
+        tracemalloc.start()
+        try:
+            await write(0, 20000)  # warm-up: fill the cache and evict
+            gc.collect()
+            heap_warm, rss_warm = tracemalloc.get_traced_memory()[0], _rss_bytes()
+
+            for round_no in range(1, 6):
+                await write(round_no * 20000, 20000)
+            gc.collect()
+            heap_end, rss_end = tracemalloc.get_traced_memory()[0], _rss_bytes()
+        finally:
+            tracemalloc.stop()
+
+        stats = (await adapter.health_check())["memory_cache"]
+        assert stats["bytes"] <= 8 * 1024 * 1024
+        assert stats["evictions"] >= 100000
+        # 100k further unique keys: heap within 10% and RSS within 16 MB of the warm-up level
+        assert heap_end < heap_warm * 1.1
+        if rss_warm:
+            assert rss_end - rss_warm < 16 * 1024 * 1024
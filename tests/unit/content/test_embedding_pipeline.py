@@ -0,0 +1,125 @@
+"""
+Unit tests for the batched structured-file embedding pipeline.
+
+Tests:
+- EmbeddingCreation._create_column_embeddings() batching and per-column reassembly
+- Bounded concurrency of semantic meaning inference
+- HuggingFaceAdapter.generate_embeddings_batch() request splitting and ordering
+"""
+
+import pytest
+import asyncio
+from unittest.mock import Mock
+
+pd = pytest.importorskip("pandas")
+
+from backend.content.services.embedding_service.modules.embedding_creation import EmbeddingCreation
+from foundations.public_works_foundation.infrastructure_adapters.huggingface_adapter import HuggingFaceAdapter
+
+
+class _FakeHFAdapter:
+    """Records batch calls and returns a distinct vector per text."""
+
+    def __init__(self):
+        self.batch_calls = []
+
+    async def generate_embeddings_batch(self, texts, batch_size=None, **kwargs):
+        self.batch_calls.append(list(texts))
+        return {"embeddings": [[float(len(text)), float(i)] for i, text in enumerate(texts)]}
+
+    async def generate_embedding(self, text, **kwargs):
+        raise AssertionError("per-text embedding calls should not be used")
+
+
+class _FakeMeaningAgent:
+    """LLM stand-in that tracks peak concurrency."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+
+    async def _call_llm_simple(self, prompt, **kwargs):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return f"Meaning of {kwargs['metadata']['column']}"
+
+
+@pytest.mark.unit
+@pytest.mark.content
+@pytest.mark.embedding
+class TestColumnEmbeddingPipeline:
+    """Unit tests for EmbeddingCreation._create_column_embeddings."""
+
+    @pytest.fixture
+    def module(self):
+        service = Mock()
+        service.logger = Mock()
+        service.hf_adapter = _FakeHFAdapter()
+        service.semantic_meaning_agent = _FakeMeaningAgent()
+        module = EmbeddingCreation(service)
+        module.meaning_concurrency = 4
+        return module
+
+    @pytest.mark.asyncio
+    async def test_embeds_all_columns_in_one_batched_call(self, module):
+        df = pd.DataFrame({f"col_{i}": range(20) for i in range(30)})
+
+        embeddings = await module._create_column_embeddings(
+            columns=list(df.columns), sampled_df=df, row_count=200,
+            parsed_file_id="parsed_1", content_type="structured", format_type="csv"
+        )
+
+        assert len(module.service.hf_adapter.batch_calls) == 1
+        assert len(module.service.hf_adapter.batch_calls[0]) == 90
+        assert [e["column_name"] for e in embeddings] == list(df.columns)
+        assert embeddings[7]["semantic_meaning"] == "Meaning of col_7"
+        assert embeddings[7]["meaning_embedding"][1] == 22.0
+        assert all(e["parsed_file_id"] == "parsed_1" and e["row_count"] == 200 for e in embeddings)
+
+    @pytest.mark.asyncio
+    async def test_meaning_inference_concurrency_is_bounded(self, module):
+        df = pd.DataFrame({f"col_{i}": ["a", "b"] for i in range(12)})
+
+        await module._create_column_embeddings(
+            columns=list(df.columns), sampled_df=df, row_count=2,
+            parsed_file_id="parsed_1", content_type="structured", format_type="csv"
+        )
+
+        assert module.service.semantic_meaning_agent.peak == 4
+
+
+@pytest.mark.unit
+@pytest.mark.content
+@pytest.mark.embedding
+class TestHuggingFaceBatchEmbeddings:
+    """Unit tests for HuggingFaceAdapter.generate_embeddings_batch."""
+
+    @pytest.mark.asyncio
+    async def test_splits_into_batches_and_preserves_order(self, monkeypatch):
+        adapter = HuggingFaceAdapter(endpoint_url="https://hf.example", api_key="test_key")
+        payloads = []
+
+        async def fake_post(payload, client):
+            payloads.append(payload)
+            await asyncio.sleep(0.01 * (5 - len(payloads)))
+            return [[float(text)] for text in payload["inputs"]]
+
+        monkeypatch.setattr(adapter, "_post", fake_post)
+        result = await adapter.generate_embeddings_batch([str(i) for i in range(10)], batch_size=3)
+
+        assert [len(p["inputs"]) for p in payloads] == [3, 3, 3, 1]
+        assert result["embeddings"] == [[float(i)] for i in range(10)]
+        assert result["count"] == 10
+
+    @pytest.mark.asyncio
+    async def test_rejects_mismatched_batch_response(self, monkeypatch):
+        adapter = HuggingFaceAdapter(endpoint_url="https://hf.example", api_key="test_key")
+
+        async def fake_post(payload, client):
+            return [[0.0]]
+
+        monkeypatch.setattr(adapter, "_post", fake_post)
+        with pytest.raises(ValueError):
+            await adapter.generate_embeddings_batch(["a", "b"], batch_size=2)
@@ -0,0 +1,84 @@
+"""
+Unit tests for concurrent hybrid parsing.
+
+Tests:
+- Structured and unstructured passes run concurrently on the same bytes object
+- A pass that times out yields a partial result with the other pass's output
+- A non-timeout failure still fails the hybrid parse
+"""
+
+import time
+import asyncio
+import pytest
+from unittest.mock import Mock, AsyncMock, patch
+
+from backend.content.services.file_parser_service.modules.hybrid_parsing import HybridParsing
+from backend.content.services.file_parser_service.modules.structured_parsing import StructuredParsing
+from backend.content.services.file_parser_service.modules.unstructured_parsing import UnstructuredParsing
+
+
+def _pass(delay, result, seen=None):
+    async def parse(self, file_data, file_type, filename, parse_options=None, user_context=None):
+        if seen is not None:
+            seen.append(file_data)
+        await asyncio.sleep(delay)
+        return dict(result)
+    return parse
+
+
+STRUCTURED = {"success": True, "tables": [{"rows": 2}], "records": [], "data": {"tables": [{"rows": 2}]}, "metadata": {}}
+UNSTRUCTURED = {"success": True, "chunks": ["intro", "terms"], "metadata": {"page_count": 2}}
+
+
+@pytest.mark.unit
+@pytest.mark.content
+@pytest.mark.fast
+class TestHybridParsingConcurrency:
+
+    @pytest.fixture
+    def hybrid_parsing(self):
+        service = Mock()
+        service.log_operation_with_telemetry = AsyncMock()
+        service.record_health_metric = AsyncMock()
+        service.handle_error_with_audit = AsyncMock()
+        return HybridParsing(service)
+
+    async def test_passes_run_concurrently_on_shared_bytes(self, hybrid_parsing):
+        seen = []
+        data = bytearray(b"claims bundle")
+        with patch.object(StructuredParsing, "parse", _pass(0.3, STRUCTURED, seen)), \
+                patch.object(UnstructuredParsing, "parse", _pass(0.3, UNSTRUCTURED, seen)):
+            started = time.monotonic()
+            result = await hybrid_parsing.parse(data, "xlsx", "claims.xlsx")
+            elapsed = time.monotonic() - started
+
+        assert result["success"] and "partial" not in result
+        assert elapsed < 0.5  # max of the passes, not their sum
+        assert seen[0] is seen[1] and isinstance(seen[0], bytes)
+        assert result["parsed_files"]["correlation_map"]["data"]["structured_to_unstructured"] == {"table_0": "chunk_0"}
+        assert set(result["metadata"]["pass_durations"]) == {"structured", "unstructured"}
+
+    async def test_timed_out_pass_gives_partial_result(self, hybrid_parsing):
+        with patch.object(StructuredParsing, "parse", _pass(0, STRUCTURED)), \
+                patch.object(UnstructuredParsing, "parse", _pass(10, UNSTRUCTURED)):
+            result = await hybrid_parsing.parse(b"data", "xlsx", "claims.xlsx", parse_options={"hybrid_timeout": 0.2})
+
+        assert result["success"] and result["partial"]
+        assert result["timed_out_passes"] == ["unstructured"]
+        assert result["parsed_files"]["structured"]["tables"] == [{"rows": 2}]
+        assert result["parsed_files"]["unstructured"]["chunk_count"] == 0
+
+        executor_timeout = {"success": False, "error": "file_parsing_timeout"}
+        with patch.object(StructuredParsing, "parse", _pass(0, executor_timeout)), \
+                patch.object(UnstructuredParsing, "parse", _pass(0, UNSTRUCTURED)):
+            result = await hybrid_parsing.parse(b"data", "xlsx", "claims.xlsx")
+        assert result["success"] and result["timed_out_passes"] == ["structured"]
+
+    async def test_other_failures_fail_the_parse(self, hybrid_parsing):
+        failed = {"success": False, "error": "unsupported_file_type"}
+        with patch.object(StructuredParsing, "parse", _pass(0, failed)), \
+                patch.object(UnstructuredParsing, "parse", _pass(0, UNSTRUCTURED)):
+            result = await hybrid_parsing.parse(b"data", "xlsx", "claims.xlsx")
+
+        assert not result["success"]
+        assert "unsupported_file_type" in result["error"]
@@ -0,0 +1,114 @@
+"""
+Unit tests for the File Parser parsing executor.
+
+Tests:
+- A hung parser is killed at its deadline while the event loop keeps serving
+- Per-parser quotas limit concurrency; jobs beyond the admission queue are rejected
+- A job over its memory limit fails without taking down the executor
+- Job exceptions come back as ParsingJobError and the worker is reused
+- Abstractions that cannot run in a worker are parsed in-loop
+"""
+
+import os
+import time
+import asyncio
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+from backend.content.services.file_parser_service.modules.parsing_executor import (
+    ParsingExecutor, ParsingJobError, ParsingTimeoutError
+)
+
+
+def _hang():
+    time.sleep(3600)
+
+
+def _sleep_and_return(seconds, value):
+    time.sleep(seconds)
+    return value
+
+
+def _allocate(megabytes):
+    return len(bytearray(megabytes * 1024 * 1024))
+
+
+def _fail():
+    raise ValueError("bad copybook")
+
+
+def _pid():
+    return os.getpid()
+
+
+@pytest.mark.unit
+@pytest.mark.content
+@pytest.mark.slow
+class TestParsingExecutor:
+
+    @pytest.fixture
+    async def executor(self):
+        executor = ParsingExecutor(max_workers=2, max_queue=1, parser_quotas={"mainframe_processing": 1})
+        yield executor
+        await executor.shutdown()
+
+    async def test_hung_parser_is_killed_at_deadline(self, executor):
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker_task = asyncio.create_task(ticker())
+        started = time.monotonic()
+        with pytest.raises(ParsingTimeoutError) as exc_info:
+            await executor.submit(_hang, parser="mainframe_processing", timeout=1.0)
+        elapsed = time.monotonic() - started
+        ticker_task.cancel()
+
+        assert exc_info.value.code == "file_parsing_timeout"
+        assert isinstance(exc_info.value, asyncio.TimeoutError)
+        assert 1.0 <= elapsed < 5.0
+        assert ticks >= 30  # the loop kept running while the job hung
+        assert executor.stats["timed_out"] == 1
+        assert executor.get_stats()["running"] == 0 and executor.get_stats()["idle_workers"] == 0
+
+        # The executor keeps working after the kill
+        assert await executor.submit(_sleep_and_return, 0, "ok", timeout=30) == "ok"
+
+    async def test_quota_and_admission_queue(self, executor):
+        first = asyncio.create_task(executor.submit(_sleep_and_return, 1.0, "a", parser="mainframe_processing", timeout=30))
+        await asyncio.sleep(0.1)
+        second = asyncio.create_task(executor.submit(_sleep_and_return, 0, "b", parser="mainframe_processing", timeout=30))
+        await asyncio.sleep(0.1)
+
+        # One mainframe job runs, one waits (queue of 1); a third is rejected
+        assert executor.get_stats()["running"] == 1 and executor.get_stats()["waiting"] == 1
+        with pytest.raises(ParsingJobError) as exc_info:
+            await executor.submit(_sleep_and_return, 0, "c", parser="mainframe_processing")
+        assert exc_info.value.code == "parsing_queue_full"
+
+        # Other parsers still get the free worker
+        assert await executor.submit(_sleep_and_return, 0, "csv", parser="csv_processing", timeout=30) == "csv"
+        assert await asyncio.gather(first, second) == ["a", "b"]
+
+    async def test_memory_limit_and_job_errors(self, executor):
+        with pytest.raises(ParsingJobError) as exc_info:
+            await executor.submit(_allocate, 2048, memory_limit_mb=512, timeout=30)
+        assert exc_info.value.code == "memory_limit_exceeded"
+
+        pid = await executor.submit(_pid, timeout=30)
+        with pytest.raises(ParsingJobError) as exc_info:
+            await executor.submit(_fail, timeout=30)
+        assert exc_info.value.code == "parsing_job_failed"
+        assert "bad copybook" in str(exc_info.value)
+        assert await executor.submit(_pid, timeout=30) == pid  # worker reused after a job error
+
+    async def test_in_loop_fallback_for_other_abstractions(self, executor):
+        file_parser = Mock()
+        file_parser.parse_file = AsyncMock(return_value="parsed")
+
+        assert await executor.parse_file("sop_processing", file_parser, Mock(), timeout=5) == "parsed"
+        assert executor.stats["submitted"] == 0
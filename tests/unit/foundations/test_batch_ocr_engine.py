@@ -0,0 +1,125 @@
+"""
+Unit tests for the batch OCR engine.
+
+Tests:
+- Preprocessing binarizes, normalizes DPI and recovers page skew
+- Pages with a text layer skip OCR; results come back in page order
+- OCR results are cached by image content hash and duplicates in a batch are OCR'd once
+- A failing page does not fail the batch
+- A crashed worker process fails its batch only; the next batch gets a fresh pool
+- Page text is rebuilt from image_to_data output in reading order
+"""
+
+import os
+import time
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from foundations.public_works_foundation.infrastructure_adapters.batch_ocr_engine import (
+    BatchOCREngine, binarize, estimate_skew_angle, normalize_dpi, preprocess_page, rotate,
+    text_from_ocr_data
+)
+
+
+def _fake_ocr(image_data, source_dpi, language, config, target_dpi):
+    if image_data == b"corrupt":
+        raise ValueError("Unreadable image data")
+    if image_data == b"crash":
+        os._exit(1)
+    time.sleep(0.05)
+    return {"text": f"ocr {image_data.decode()}", "confidence": 0.9, "word_count": 2, "worker": os.getpid()}
+
+
+def _text_lines_page(angle=0.0):
+    page = np.full((400, 600), 230, dtype=np.uint8)
+    for top in range(60, 340, 40):
+        page[top:top + 8, 80:520] = 20
+    return rotate(page, angle) if angle else page
+
+
+@pytest.mark.unit
+@pytest.mark.foundations
+@pytest.mark.slow
+class TestBatchOCREngine:
+
+    @pytest.fixture
+    def engine(self):
+        engine = BatchOCREngine(max_workers=2, cache_size=8, page_processor=_fake_ocr)
+        yield engine
+        engine.shutdown()
+
+    def test_text_from_ocr_data(self):
+        # image_to_data rows: page/block/paragraph/line levels carry no text
+        rows = [(1, 0, 0, ""), (1, 1, 1, ""), (1, 1, 1, "Claim"), (1, 1, 1, "form"),
+                (1, 1, 2, "Policy:"), (1, 1, 2, " 42 "), (1, 1, 2, " "),
+                (2, 1, 1, ""), (2, 1, 1, "Signed")]
+        data = {"block_num": [r[0] for r in rows], "par_num": [r[1] for r in rows],
+                "line_num": [r[2] for r in rows], "text": [r[3] for r in rows]}
+
+        assert text_from_ocr_data(data) == "Claim form\nPolicy: 42\n\nSigned"
+        assert text_from_ocr_data({"block_num": [], "par_num": [], "line_num": [], "text": []}) == ""
+
+    def test_preprocessing(self):
+        gray = np.full((100, 200), 200, dtype=np.uint8)
+        gray[40:50, 20:180] = 30
+        binary = binarize(gray)
+        assert set(np.unique(binary)) == {0, 255}
+        assert binary[45, 100] == 0 and binary[10, 10] == 255
+
+        assert normalize_dpi(gray, 150).shape == (200, 400)
+        assert normalize_dpi(gray, 300) is gray
+        assert normalize_dpi(gray, None) is gray
+
+        assert abs(estimate_skew_angle(binarize(_text_lines_page()))) < 0.5
+        assert abs(estimate_skew_angle(binarize(_text_lines_page(4.0))) - 4.0) < 1.0
+
+        page, details = preprocess_page(_text_lines_page(4.0), source_dpi=300)
+        assert abs(details["skew_angle"] - 4.0) < 1.0
+        assert abs(estimate_skew_angle(page)) < 1.0  # deskewed
+
+    async def test_text_layer_pages_skip_ocr(self, engine):
+        result = await engine.ocr_pages([
+            {"page_number": 1, "image_data": b"scan-1"},
+            {"page_number": 2, "image_data": b"scan-2", "text_layer": "embedded text"},
+            {"page_number": 3, "image_data": b"scan-3"},
+        ])
+
+        assert [page["page_number"] for page in result["pages"]] == [1, 2, 3]
+        assert [page["source"] for page in result["pages"]] == ["ocr", "text_layer", "ocr"]
+        assert result["text"] == "ocr scan-1\nembedded text\nocr scan-3"
+        assert result["ocr_pages"] == 2 and result["text_layer_pages"] == 1
+        assert result["pages_per_second"] > 0
+
+    async def test_results_cached_by_content_hash(self, engine):
+        first = await engine.ocr_pages([b"a", b"b", b"a"])
+        assert first["ocr_pages"] == 2 and first["cache_hits"] == 1
+        assert first["pages"][0]["text"] == first["pages"][2]["text"] == "ocr a"
+
+        second = await engine.ocr_pages([b"a", b"b"])
+        assert second["ocr_pages"] == 0 and second["cache_hits"] == 2
+        assert [page["source"] for page in second["pages"]] == ["cache", "cache"]
+
+        # Different OCR settings are a different cache entry
+        assert (await engine.ocr_pages([b"a"], language="deu"))["ocr_pages"] == 1
+
+        stats = engine.get_stats()
+        assert stats["pages"] == 6 and stats["ocr_pages"] == 3 and stats["cache_hits"] == 3
+        assert stats["pages_per_second"] > 0
+
+    async def test_failed_page_does_not_fail_batch(self, engine):
+        result = await engine.ocr_pages([b"good", b"corrupt"])
+
+        assert result["success"] and result["failed_pages"] == 1
+        assert result["pages"][0]["success"] and not result["pages"][1]["success"]
+        assert "Unreadable" in result["pages"][1]["error"]
+        assert engine.get_stats()["cache_entries"] == 1  # failures are not cached
+
+    async def test_recovers_after_worker_crash(self, engine):
+        crashed = await engine.ocr_pages([b"crash"])
+        assert crashed["failed_pages"] == 1 and not crashed["pages"][0]["success"]
+
+        result = await engine.ocr_pages([b"after-1", b"after-2"])
+
+        assert result["failed_pages"] == 0
+        assert result["text"] == "ocr after-1\nocr after-2"
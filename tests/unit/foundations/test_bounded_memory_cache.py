@@ -0,0 +1,96 @@
+"""
+Unit tests for the bounded memory tier of CacheAdapter.
+
+Tests:
+- LRU eviction by entry count keeps recently read keys
+- The byte budget evicts old entries and rejects oversized values
+- Per-entry TTLs expire on read and in the periodic sweep
+- health_check reports eviction and hit-rate stats
+"""
+
+import pytest
+
+from foundations.public_works_foundation.infrastructure_adapters import bounded_memory_cache
+from foundations.public_works_foundation.infrastructure_adapters.bounded_memory_cache import BoundedMemoryCache
+from foundations.public_works_foundation.infrastructure_adapters.cache_adapter import CacheAdapter
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _Clock()
+    monkeypatch.setattr(bounded_memory_cache.time, "monotonic", fake)
+    return fake
+
+
+@pytest.mark.unit
+@pytest.mark.foundations
+@pytest.mark.fast
+class TestBoundedMemoryCache:
+
+    def test_lru_eviction_by_entry_count(self):
+        cache = BoundedMemoryCache(max_entries=3)
+        for key in ("a", "b", "c"):
+            cache.set(key, {"v": key})
+        cache.get("a")
+        cache.set("d", {"v": "d"})
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {"v": "a"}
+        assert len(cache) == 3
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_byte_budget(self):
+        entry_size = BoundedMemoryCache.estimate_size("k0", {"text": "x" * 100})
+        cache = BoundedMemoryCache(max_entries=100, max_bytes=entry_size * 4)
+        for i in range(10):
+            cache.set(f"k{i}", {"text": "x" * 100})
+
+        stats = cache.get_stats()
+        assert stats["entries"] == 4
+        assert stats["bytes"] <= cache.max_bytes
+        assert cache.set("huge", {"text": "x" * entry_size * 10}) is False
+        assert cache.get_stats()["rejected"] == 1
+
+    def test_ttl_expiry(self, clock):
+        cache = BoundedMemoryCache(default_ttl=60, sweep_interval=2)
+        cache.set("short", {"v": 1}, ttl=5)
+        cache.set("default", {"v": 2})
+        cache.set("forever", {"v": 3}, ttl=0)
+
+        clock.now += 10
+        assert cache.get("short") is None
+        assert cache.get("default") == {"v": 2}
+
+        clock.now += 100
+        cache.set("x", {"v": 4})
+        cache.set("y", {"v": 5})
+        assert not cache.contains("default")
+        assert cache.get("forever") == {"v": 3}
+        assert cache.get_stats()["expirations"] == 2
+
+
+@pytest.mark.unit
+@pytest.mark.foundations
+@pytest.mark.asyncio
+class TestCacheAdapterMemoryTier:
+
+    async def test_health_check_reports_stats(self):
+        adapter = CacheAdapter(storage_type="memory", memory_max_entries=2)
+        await adapter.set("a", {"v": 1}, ttl=60)
+        await adapter.set("b", {"v": 2})
+        await adapter.set("c", {"v": 3})
+        assert await adapter.get("a") is None
+        assert await adapter.get("c") == {"v": 3}
+
+        health = await adapter.health_check()
+        assert health["current_size"] == 2
+        assert health["memory_cache"]["evictions"] == 1
+        assert health["memory_cache"]["hit_rate"] == 0.5
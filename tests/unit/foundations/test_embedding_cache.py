@@ -0,0 +1,140 @@
+"""
+Unit tests for the content-addressed embedding cache.
+
+Tests:
+- Key normalization and model separation
+- LRU eviction and hit/miss counters
+- Redis tier stores raw float32 bytes and is shared between workers
+- HuggingFaceAdapter skips the endpoint for cached texts
+- Endpoints (URL or revision) serving the same model label do not share vectors
+"""
+
+import pytest
+import struct
+
+from foundations.public_works_foundation.infrastructure_adapters.embedding_cache import EmbeddingCache
+from foundations.public_works_foundation.infrastructure_adapters.huggingface_adapter import HuggingFaceAdapter
+
+
+class _FakeBinaryRedis:
+    """Minimal async Redis stand-in (mget_bytes/mset_bytes)."""
+
+    def __init__(self):
+        self.store = {}
+
+    async def mget_bytes(self, keys):
+        return [self.store.get(key) for key in keys]
+
+    async def mset_bytes(self, items, ttl=None):
+        self.store.update(items)
+        return True
+
+
+@pytest.mark.unit
+@pytest.mark.foundations
+@pytest.mark.fast
+class TestEmbeddingCache:
+    """Test suite for EmbeddingCache."""
+
+    @pytest.mark.asyncio
+    async def test_normalized_text_hits(self):
+        cache = EmbeddingCache()
+        await cache.put("model-a", "policy_number  string", [0.5, 0.25])
+
+        assert await cache.get("model-a", " policy_number string\n") == [0.5, 0.25]
+        assert await cache.get("model-b", "policy_number string") is None
+        assert await cache.get("model-a", "Policy_Number string") is None
+        stats = cache.get_stats()
+        assert (stats["memory_hits"], stats["misses"]) == (1, 2)
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        cache = EmbeddingCache(max_entries=2)
+        await cache.put_many("m", ["a", "b"], [[1.0], [2.0]])
+        await cache.get("m", "a")
+        await cache.put("m", "c", [3.0])
+
+        assert await cache.get("m", "b") is None
+        assert await cache.get("m", "a") == [1.0]
+        assert cache.get_stats()["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_tier_stores_float32_bytes(self):
+        redis = _FakeBinaryRedis()
+        first = EmbeddingCache(redis_adapter=redis)
+        second = EmbeddingCache(redis_adapter=redis)
+
+        await first.put("m", "effective_date date", [1.5, -2.0, 0.125])
+        payload = next(iter(redis.store.values()))
+
+        assert isinstance(payload, bytes)
+        assert struct.unpack("<3f", payload) == (1.5, -2.0, 0.125)
+        assert await second.get("m", "effective_date date") == [1.5, -2.0, 0.125]
+        assert second.get_stats()["redis_hits"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.foundations
+@pytest.mark.fast
+class TestHuggingFaceAdapterCaching:
+    """Test suite for HuggingFaceAdapter with an embedding cache."""
+
+    @pytest.fixture
+    def adapter(self, monkeypatch):
+        adapter = HuggingFaceAdapter(endpoint_url="https://hf.example", api_key="test_key", embedding_cache=EmbeddingCache())
+        adapter.sent = []
+
+        async def fake_post(payload, client):
+            inputs = payload["inputs"]
+            adapter.sent.append(inputs)
+            if isinstance(inputs, list):
+                return [[float(len(text))] for text in inputs]
+            return [[float(len(inputs))]]
+
+        monkeypatch.setattr(adapter, "_post", fake_post)
+        return adapter
+
+    @pytest.mark.asyncio
+    async def test_generate_embedding_uses_cache(self, adapter):
+        first = await adapter.generate_embedding("policy_number string")
+        second = await adapter.generate_embedding("policy_number string")
+
+        assert first["embedding"] == second["embedding"] == [20.0]
+        assert second["cached"] is True
+        assert len(adapter.sent) == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_sends_only_distinct_misses(self, adapter):
+        await adapter.generate_embedding("a")
+        result = await adapter.generate_embeddings_batch(["a", "bb", "bb", "ccc"], batch_size=10)
+
+        assert adapter.sent[-1] == ["bb", "ccc"]
+        assert result["embeddings"] == [[1.0], [2.0], [2.0], [3.0]]
+        assert result["cached_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_is_namespaced_by_endpoint_and_revision(self, monkeypatch):
+        cache = EmbeddingCache()
+        sent = []
+
+        def make(endpoint_url, revision=None, dimension=1):
+            adapter = HuggingFaceAdapter(
+                endpoint_url=endpoint_url, api_key="test_key", embedding_cache=cache, revision=revision
+            )
+
+            async def fake_post(payload, client):
+                sent.append((endpoint_url, revision))
+                return [[float(dimension)] * dimension]
+
+            monkeypatch.setattr(adapter, "_post", fake_post)
+            return adapter
+
+        old = make("https://hf-a.example", dimension=1)
+        other_endpoint = make("https://hf-b.example", dimension=2)
+        redeployed = make("https://hf-a.example", revision="v2", dimension=3)
+
+        assert (await old.generate_embedding("age int"))["dimension"] == 1
+        assert (await other_endpoint.generate_embedding("age int"))["dimension"] == 2
+        assert (await redeployed.generate_embedding("age int"))["dimension"] == 3
+        assert (await make("https://hf-a.example/").generate_embedding("age int"))["cached"] is True
+        assert len(sent) == 3
@@ -0,0 +1,164 @@
+"""
+Unit tests for the shared GCRA request limiter.
+
+Tests:
+- Bursts up to the limit, then one admission per emission interval
+- Several limits are decided together (all or nothing)
+- Workers sharing one backend never exceed the global limit, with the local pre-check on
+- The local pre-check skips the backend for clients far below their limit
+- Unused leased admissions are refunded on expiry and on close, so no quota is lost
+- Backend failures fall back to in-process limits instead of failing open
+- The HTTP middleware answers 429 with Retry-After from the shared engine
+"""
+
+import asyncio
+import pytest
+
+from foundations.public_works_foundation.infrastructure_adapters.rate_limiting_adapter import (
+    GCRARateLimiter, InMemoryGCRABackend, RateLimit
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _BrokenBackend:
+    async def gcra(self, limits, cost=1):
+        raise ConnectionError("redis down")
+
+    async def refund(self, limits, cost):
+        raise ConnectionError("redis down")
+
+    async def delete(self, keys):
+        return 0
+
+
+@pytest.mark.unit
+@pytest.mark.foundations
+@pytest.mark.asyncio
+class TestGCRARateLimiter:
+
+    async def test_burst_then_emission_interval(self):
+        clock = _Clock()
+        limiter = GCRARateLimiter(InMemoryGCRABackend(clock), lease_max=1, clock=clock)
+        limits = [RateLimit("k", limit=10, period=60)]
+
+        decisions = [await limiter.check(limits) for _ in range(11)]
+        assert [d.allowed for d in decisions] == [True] * 10 + [False]
+        assert decisions[0].remaining == 9
+        assert decisions[-1].retry_after == pytest.approx(6.0)
+
+        clock.now += 6
+        assert (await limiter.check(limits)).allowed
+        assert not (await limiter.check(limits)).allowed
+
+    async def test_limits_are_decided_together(self):
+        clock = _Clock()
+        limiter = GCRARateLimiter(InMemoryGCRABackend(clock), lease_max=1, clock=clock)
+        limits = [RateLimit("m", limit=5, period=60), RateLimit("h", limit=3, period=3600)]
+
+        assert sum([(await limiter.check(limits)).allowed for _ in range(5)]) == 3
+        # The minute limit was only charged for admitted requests
+        assert (await limiter.check([RateLimit("m", limit=5, period=60)])).remaining == 1
+
+    async def test_workers_share_one_global_limit(self):
+        clock = _Clock()
+        backend = InMemoryGCRABackend(clock)
+        workers = [GCRARateLimiter(backend, clock=clock) for _ in range(4)]
+        limits = [RateLimit("client", limit=100, period=60)]
+
+        results = await asyncio.gather(*(workers[i % 4].check(limits) for i in range(400)))
+
+        assert sum(d.allowed for d in results) == 100
+
+    async def test_local_precheck_skips_backend(self):
+        clock = _Clock()
+        limiter = GCRARateLimiter(InMemoryGCRABackend(clock), lease_max=16, clock=clock)
+        limits = [RateLimit("client", limit=10000, period=60)]
+
+        for _ in range(1000):
+            assert (await limiter.check(limits)).allowed
+            clock.now += 0.001
+
+        stats = limiter.get_stats()
+        assert stats["local"] > 800
+        assert stats["backend_calls"] < 100
+
+    @pytest.mark.parametrize("lease_max", [1, 16])
+    async def test_expired_leases_do_not_lose_quota(self, lease_max):
+        clock = _Clock()
+        backend = InMemoryGCRABackend(clock)
+        limiter = GCRARateLimiter(backend, lease_max=lease_max, clock=clock)
+        limits = [RateLimit("client", limit=100, period=60)]
+
+        # 40 requests/minute: every lease expires before the next request
+        for _ in range(80):
+            assert (await limiter.check(limits)).allowed
+            clock.now += 1.5
+        burst = [await limiter.check(limits) for _ in range(150)]
+
+        assert sum(d.allowed for d in burst) == 100
+
+    async def test_close_refunds_outstanding_leases(self):
+        clock = _Clock()
+        backend = InMemoryGCRABackend(clock)
+        limiter = GCRARateLimiter(backend, lease_max=16, clock=clock)
+        other = GCRARateLimiter(backend, lease_max=1, clock=clock)
+        limits = [RateLimit("client", limit=100, period=60)]
+
+        await limiter.check(limits)  # learns the remaining allowance
+        await limiter.check(limits)  # admits a batch, most of it held locally
+        assert limiter.get_stats()["leases"] == 1
+        await limiter.close()
+
+        assert limiter.get_stats()["leases"] == 0
+        assert sum([(await other.check(limits)).allowed for _ in range(100)]) == 98
+
+    async def test_backend_failure_falls_back_locally(self):
+        limiter = GCRARateLimiter(_BrokenBackend(), lease_max=1)
+        limits = [RateLimit("client", limit=2, period=60)]
+
+        assert [(await limiter.check(limits)).allowed for _ in range(3)] == [True, True, False]
+        assert limiter.get_stats()["fallbacks"] == 3
+
+
+@pytest.mark.unit
+@pytest.mark.foundations
+class TestRateLimitingMiddleware:
+
+    def test_429_with_retry_after(self):
+        # Imported by the utilities and public works packages
+        pytest.importorskip("psutil")
+        pytest.importorskip("supabase")
+        pytest.importorskip("jwt")
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from utilities.api_routing.middleware.fastapi_rate_limiting_middleware import FastAPIRateLimitingMiddleware
+
+        class _Config:
+            def get_bool(self, key, default):
+                return default
+
+            def get_int(self, key, default):
+                return {"RATE_LIMIT_REQUESTS": 3, "RATE_LIMIT_WINDOW": 60}.get(key, default)
+
+            def get(self, key, default=None):
+                return default
+
+        app = FastAPI()
+        app.add_middleware(FastAPIRateLimitingMiddleware, config_manager=_Config())
+
+        @app.get("/api/v1/echo")
+        async def echo():
+            return {"ok": True}
+
+        client = TestClient(app)
+        codes = [client.get("/api/v1/echo").status_code for _ in range(4)]
+
+        assert codes == [200, 200, 200, 429]
+        assert client.get("/api/v1/echo").headers["Retry-After"] == "20"
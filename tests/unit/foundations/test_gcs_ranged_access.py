@@ -0,0 +1,169 @@
+"""
+Unit tests for ranged, streaming and Parquet reads in GCSFileAdapter.
+
+Tests:
+- Storage calls run on the adapter's dedicated I/O thread pool
+- Ranged reads transfer only the requested bytes; streaming reads arrive in bounded chunks
+- The Parquet reader fetches the footer plus only the requested row groups and columns
+- A blob that is not Parquet reads as None instead of raising
+- Deletes run on the I/O pool
+- FileManagementAbstraction exposes ranged, streaming and leading-row Parquet reads
+- Data Steward reads a parsed Parquet preview without downloading the whole file
+"""
+
+import os
+import threading
+import pytest
+from unittest.mock import Mock
+
+from foundations.public_works_foundation.infrastructure_adapters.gcs_file_adapter import GCSFileAdapter
+from foundations.public_works_foundation.infrastructure_adapters.local_object_store import (
+    LocalObjectStoreBucket, LocalObjectStoreBlob
+)
+from foundations.public_works_foundation.infrastructure_abstractions.file_management_abstraction_gcs import (
+    FileManagementAbstraction
+)
+from backend.smart_city.services.data_steward.modules.parsed_file_processing import ParsedFileProcessing
+
+MB = 1024 * 1024
+
+
+def _write_parquet(bucket, tmp_path, blob_name, rows=200000, columns=8, row_group_size=25000):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    table = pa.table({f"col_{i}": pa.array(range(i * rows, (i + 1) * rows), type=pa.int64()) for i in range(columns)})
+    local_path = tmp_path / "table.parquet"
+    pq.write_table(table, local_path, row_group_size=row_group_size, compression="none")
+    bucket.blob(blob_name).upload_from_filename(str(local_path))
+    return table, os.path.getsize(local_path)
+
+
+@pytest.mark.unit
+@pytest.mark.foundations
+@pytest.mark.fast
+class TestGCSRangedAccess:
+
+    @pytest.fixture
+    def bucket(self, tmp_path):
+        return LocalObjectStoreBucket(str(tmp_path / "bucket"))
+
+    @pytest.fixture
+    def adapter(self, bucket):
+        adapter = GCSFileAdapter(project_id="local", bucket_name="local-bucket", bucket=bucket, io_workers=2)
+        yield adapter
+        adapter.shutdown()
+
+    async def test_io_runs_on_dedicated_pool(self, adapter, bucket, monkeypatch):
+        bucket.blob("files/a").upload_from_string(b"abc")
+        threads = []
+        original = LocalObjectStoreBlob.download_as_bytes
+
+        def recording_download(blob, *args, **kwargs):
+            threads.append(threading.current_thread().name)
+            return original(blob, *args, **kwargs)
+
+        monkeypatch.setattr(LocalObjectStoreBlob, "download_as_bytes", recording_download)
+        assert await adapter.download_file("files/a") == b"abc"
+        assert threads and threads[0].startswith("gcs-io")
+
+    async def test_ranged_and_streaming_reads(self, adapter, bucket):
+        content = os.urandom(5 * MB + 123)
+        bucket.blob("parsed/big.bin").upload_from_string(content)
+        bucket.reset_stats()
+
+        assert await adapter.read_range("parsed/big.bin", 100, 200) == content[100:200]
+        assert await adapter.read_range("parsed/big.bin", -64) == content[-64:]
+        assert await adapter.read_range("parsed/big.bin", 10, 10) == b""
+        assert bucket.stats["bytes_downloaded"] == 164
+        assert await adapter.get_file_size("parsed/big.bin") == len(content)
+
+        bucket.reset_stats()
+        chunks = [chunk async for chunk in adapter.stream_file("parsed/big.bin", chunk_size=MB)]
+        assert b"".join(chunks) == content
+        assert max(len(chunk) for chunk in chunks) <= MB and len(chunks) == 6
+
+        assert await adapter.read_range("parsed/missing.bin", 0, 10) is None
+
+    async def test_parquet_reads_only_requested_row_groups_and_columns(self, adapter, bucket, tmp_path):
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        rows = 200000
+        table = pa.table({f"col_{i}": pa.array(range(i * rows, (i + 1) * rows), type=pa.int64()) for i in range(8)})
+        local_path = tmp_path / "claims.parquet"
+        pq.write_table(table, local_path, row_group_size=25000, compression="none")
+        bucket.blob("parsed/claims.parquet").upload_from_filename(str(local_path))
+        file_size = os.path.getsize(local_path)
+        bucket.reset_stats()
+
+        metadata = await adapter.read_parquet_metadata("parsed/claims.parquet")
+        assert metadata["num_rows"] == rows and metadata["num_row_groups"] == 8
+        assert metadata["columns"][:2] == ["col_0", "col_1"]
+        assert metadata["bytes_fetched"] < 80 * 1024  # footer only
+
+        bucket.reset_stats()
+        subset = await adapter.read_parquet("parsed/claims.parquet", columns=["col_3"], row_groups=[2])
+        assert subset.column_names == ["col_3"] and subset.num_rows == 25000
+        assert subset.column("col_3")[0].as_py() == 3 * rows + 2 * 25000
+        # One of 64 column chunks plus the footer
+        assert bucket.stats["bytes_downloaded"] < file_size / 64 + 80 * 1024
+
+        full = await adapter.read_parquet("parsed/claims.parquet")
+        assert full.equals(table)
+
+    async def test_non_parquet_blob_reads_as_none(self, adapter, bucket):
+        pytest.importorskip("pyarrow.parquet")
+        bucket.blob("parsed/corrupt.parquet").upload_from_string(b"not a parquet file" * 100)
+
+        assert await adapter.read_parquet_metadata("parsed/corrupt.parquet") is None
+        assert await adapter.read_parquet("parsed/corrupt.parquet") is None
+
+    async def test_delete_runs_on_dedicated_pool(self, adapter, bucket, monkeypatch):
+        bucket.blob("files/a").upload_from_string(b"abc")
+        threads = []
+        original = LocalObjectStoreBlob.delete
+
+        def recording_delete(blob, *args, **kwargs):
+            threads.append(threading.current_thread().name)
+            return original(blob, *args, **kwargs)
+
+        monkeypatch.setattr(LocalObjectStoreBlob, "delete", recording_delete)
+        assert await adapter.delete_file("files/a") is True
+        assert threads and threads[0].startswith("gcs-io")
+        assert await adapter.file_exists("files/a") is False
+
+    async def test_abstraction_exposes_ranged_reads(self, adapter, bucket, tmp_path):
+        file_management = FileManagementAbstraction(gcs_adapter=adapter, supabase_adapter=Mock())
+        content = os.urandom(3 * MB)
+        bucket.blob("files/raw.bin").upload_from_string(content)
+
+        assert await file_management.read_file_range("files/raw.bin", 10, 20) == content[10:20]
+        chunks = [chunk async for chunk in file_management.stream_file("files/raw.bin", chunk_size=MB)]
+        assert b"".join(chunks) == content and len(chunks) == 3
+
+        table, file_size = _write_parquet(bucket, tmp_path, "parsed/claims.parquet")
+        bucket.reset_stats()
+        head = await file_management.read_parquet("parsed/claims.parquet", columns=["col_0", "col_1"], max_rows=20)
+        assert head.column_names == ["col_0", "col_1"] and head.num_rows == 20
+        assert head.column("col_1").to_pylist() == list(range(200000, 200020))
+        # Two of 64 column chunks plus footer reads
+        assert bucket.stats["bytes_downloaded"] < file_size / 16
+
+    async def test_parsed_parquet_preview_uses_ranged_reads(self, adapter, bucket, tmp_path):
+        table, file_size = _write_parquet(bucket, tmp_path, "parsed_data/parsed_1.parquet")
+        row = {"uuid": "parsed_1", "parsed_file_id": "parsed_1", "format_type": "parquet",
+               "content_type": "structured", "metadata": {}}
+        supabase_adapter = Mock()
+        supabase_adapter.client.table.return_value.select.return_value.eq.return_value.execute.return_value = Mock(data=[row])
+        service = Mock()
+        service.is_infrastructure_connected = True
+        service.file_management_abstraction = FileManagementAbstraction(gcs_adapter=adapter, supabase_adapter=supabase_adapter)
+        processing = ParsedFileProcessing(service)
+        bucket.reset_stats()
+
+        preview = await processing.read_parsed_parquet("parsed_1", max_rows=20, max_columns=3, user_context={})
+
+        assert preview["table"].column_names == ["col_0", "col_1", "col_2"]
+        assert preview["table"].num_rows == 20
+        assert preview["total_rows"] == 200000 and preview["total_columns"] == 8
+        assert preview["gcs_path"] == "parsed_data/parsed_1.parquet" and preview["file_data"] is None
+        assert bucket.stats["bytes_downloaded"] < file_size / 8
@@ -0,0 +1,134 @@
+"""
+Unit tests for the token-bucket LLM rate limiter (in-process backend).
+
+Tests:
+- A concurrent burst admits exactly the bucket capacity, atomically
+- Token reservations are reconciled with provider-reported usage
+- Buckets are keyed per tenant/user/model
+- wait_for_capacity sleeps for the refill instead of failing
+- LLMAbstraction reserves before dispatch and reconciles afterwards
+- A failed provider call releases its reservation
+"""
+
+import asyncio
+import pytest
+
+from foundations.public_works_foundation.abstraction_contracts.llm_protocol import LLMRequest, LLMModel
+from foundations.public_works_foundation.abstraction_contracts.llm_rate_limiting_protocol import RateLimitRequest
+from foundations.public_works_foundation.infrastructure_abstractions.llm_abstraction import LLMAbstraction
+from foundations.public_works_foundation.infrastructure_abstractions.llm_rate_limiting_abstraction import (
+    LLMRateLimitingAbstraction
+)
+from foundations.public_works_foundation.infrastructure_adapters.rate_limiting_adapter import (
+    RateLimitingAdapter, InMemoryTokenBucketBackend
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _limiter(clock=None, **limits):
+    backend = InMemoryTokenBucketBackend(clock) if clock else InMemoryTokenBucketBackend()
+    return LLMRateLimitingAbstraction(RateLimitingAdapter(backend), **limits)
+
+
+@pytest.mark.unit
+@pytest.mark.foundations
+@pytest.mark.asyncio
+class TestLLMRateLimiting:
+
+    async def test_concurrent_burst_admits_capacity(self):
+        limiter = _limiter(_Clock(), requests_per_minute=10)
+        request = RateLimitRequest(user_id="u1", model="gpt-4o-mini", estimated_tokens=100)
+
+        responses = await asyncio.gather(*(limiter.check_rate_limit(request) for _ in range(25)))
+
+        assert sum(r.allowed for r in responses) == 10
+        denied = [r for r in responses if not r.allowed]
+        assert denied[0].reason == "request_rate_limit_exceeded"
+        assert denied[0].retry_after == 6  # one request refills every 6s
+
+    async def test_reconcile_refunds_and_charges(self):
+        clock = _Clock()
+        limiter = _limiter(clock, tokens_per_minute=1000)
+        request = RateLimitRequest(user_id="u1", model="gpt-4o-mini", estimated_tokens=800)
+
+        assert (await limiter.check_rate_limit(request)).allowed
+        assert not (await limiter.check_rate_limit(request)).allowed
+
+        await limiter.reconcile_usage(request, actual_tokens=100)
+        assert (await limiter.get_rate_limit_status("u1", "gpt-4o-mini"))["current_minute_tokens"] == 100
+        assert (await limiter.check_rate_limit(request)).allowed
+
+        await limiter.reconcile_usage(request, actual_tokens=1200)
+        status = await limiter.get_rate_limit_status("u1", "gpt-4o-mini")
+        assert status["current_minute_tokens"] == 1300  # bucket is in debt
+        assert not (await limiter.check_rate_limit(request)).allowed
+        assert limiter.stats["tokens_refunded"] == 700
+        assert limiter.stats["tokens_charged"] == 400
+
+    async def test_buckets_are_scoped(self):
+        limiter = _limiter(_Clock(), requests_per_minute=1)
+        assert (await limiter.check_rate_limit(RateLimitRequest("u1", "gpt-4o-mini", tenant_id="t1"))).allowed
+        assert not (await limiter.check_rate_limit(RateLimitRequest("u1", "gpt-4o-mini", tenant_id="t1"))).allowed
+        assert (await limiter.check_rate_limit(RateLimitRequest("u1", "gpt-4o-mini", tenant_id="t2"))).allowed
+        assert (await limiter.check_rate_limit(RateLimitRequest("u2", "gpt-4o-mini", tenant_id="t1"))).allowed
+        assert (await limiter.check_rate_limit(RateLimitRequest("u1", "gpt-4o", tenant_id="t1"))).allowed
+
+    async def test_wait_for_capacity(self):
+        limiter = _limiter(requests_per_minute=600)  # one request per 0.1s, real clock
+        request = RateLimitRequest(user_id="u1", model="gpt-4o-mini")
+        for _ in range(600):
+            await limiter.check_rate_limit(request)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        assert (await limiter.wait_for_capacity(request, max_wait=2)).allowed
+        assert 0.05 <= loop.time() - started < 1
+        assert limiter.stats["waits"] == 1
+
+        assert not (await limiter.wait_for_capacity(request, max_wait=0.01)).allowed
+
+    async def test_llm_abstraction_reserves_and_reconciles(self):
+        limiter = _limiter(_Clock(), tokens_per_minute=10000)
+
+        class _Provider:
+            async def generate_completion(self, request):
+                return {"id": "r1", "choices": [{"message": {"content": "ok"}, "finish_reason": "stop"}],
+                        "usage": {"total_tokens": 2500}}
+
+        llm = LLMAbstraction(openai_adapter=_Provider(), rate_limiting_abstraction=limiter, retry_enabled=False)
+        await llm.generate_response(LLMRequest(
+            messages=[{"role": "user", "content": "x" * 400}],  # estimated 100 tokens
+            model=LLMModel.GPT_4O_MINI, temperature=0.2, metadata={"user_id": "u1", "tenant_id": "t1"}
+        ))
+
+        status = await limiter.get_rate_limit_status("u1", "gpt-4o-mini", tenant_id="t1")
+        assert status["current_minute_requests"] == 1
+        assert status["current_minute_tokens"] == 2500
+
+    async def test_llm_abstraction_releases_reservation_on_failure(self):
+        limiter = _limiter(_Clock(), requests_per_minute=1, tokens_per_minute=10000)
+
+        class _FailingProvider:
+            async def generate_completion(self, request):
+                raise ValueError("invalid request")
+
+        llm = LLMAbstraction(openai_adapter=_FailingProvider(), rate_limiting_abstraction=limiter, retry_enabled=False)
+        request = LLMRequest(
+            messages=[{"role": "user", "content": "x" * 400}],
+            model=LLMModel.GPT_4O_MINI, temperature=0.2, metadata={"user_id": "u1", "tenant_id": "t1"}
+        )
+        for _ in range(2):  # the second call still fits the one-request budget
+            with pytest.raises(ValueError):
+                await llm.generate_response(request)
+
+        status = await limiter.get_rate_limit_status("u1", "gpt-4o-mini", tenant_id="t1")
+        assert status["current_minute_requests"] == 0
+        assert status["current_minute_tokens"] == 0
+        assert limiter.stats["released_reservations"] == 2
@@ -0,0 +1,109 @@
+"""
+Unit tests for the LLMAbstraction response cache and single-flight.
+
+Tests:
+- Deterministic requests are served from the cache on repeat
+- Concurrent identical requests collapse onto one provider call
+- Non-deterministic requests bypass the cache
+- A failed leading call propagates to coalesced callers and is not cached
+"""
+
+import asyncio
+import pytest
+
+from foundations.public_works_foundation.abstraction_contracts.llm_protocol import LLMRequest, LLMModel
+from foundations.public_works_foundation.infrastructure_abstractions.llm_abstraction import LLMAbstraction
+from foundations.public_works_foundation.infrastructure_abstractions.llm_caching_abstraction import LLMCachingAbstraction
+from foundations.public_works_foundation.infrastructure_adapters.cache_adapter import CacheAdapter
+
+
+class _FakeProvider:
+    """OpenAI-shaped adapter that counts calls and can be held open."""
+
+    def __init__(self, delay=0.0, fail=False):
+        self.calls = 0
+        self.delay = delay
+        self.fail = fail
+
+    async def generate_completion(self, request):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            return {"error": "invalid request"}
+        return {
+            "id": f"resp-{self.calls}",
+            "choices": [{"message": {"content": "Upload a file to begin."}, "finish_reason": "stop"}],
+            "usage": {"total_tokens": 42}
+        }
+
+
+def _abstraction(provider, with_cache=True):
+    caching = LLMCachingAbstraction(CacheAdapter(storage_type="memory")) if with_cache else None
+    return LLMAbstraction(openai_adapter=provider, caching_abstraction=caching, retry_enabled=False)
+
+
+def _request(temperature=0, **metadata):
+    return LLMRequest(
+        messages=[{"role": "user", "content": "How do I start onboarding?"}],
+        model=LLMModel.GPT_4O_MINI,
+        temperature=temperature,
+        metadata=metadata
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.foundations
+@pytest.mark.asyncio
+class TestLLMResponseCache:
+
+    async def test_repeat_deterministic_request_hits_cache(self):
+        provider = _FakeProvider()
+        llm = _abstraction(provider)
+
+        first = await llm.generate_response(_request())
+        second = await llm.generate_response(_request())
+
+        assert provider.calls == 1
+        assert second.content == first.content
+        assert second.metadata["cached"] is True
+        stats = llm.get_cache_stats()
+        assert (stats["hits"], stats["misses"], stats["stores"]) == (1, 1, 1)
+
+    async def test_concurrent_identical_requests_coalesce(self):
+        provider = _FakeProvider(delay=0.05)
+        llm = _abstraction(provider, with_cache=False)
+
+        responses = await asyncio.gather(*(llm.generate_response(_request()) for _ in range(10)))
+
+        assert provider.calls == 1
+        assert {r.content for r in responses} == {"Upload a file to begin."}
+        assert llm.get_cache_stats()["coalesced"] == 9
+        assert llm.get_cache_stats()["in_flight"] == 0
+        responses[1].metadata["mutated"] = True
+        assert "mutated" not in responses[2].metadata
+
+    async def test_non_deterministic_requests_bypass(self):
+        provider = _FakeProvider()
+        llm = _abstraction(provider)
+
+        await llm.generate_response(_request(temperature=0.7))
+        await llm.generate_response(_request(temperature=0.7))
+        await llm.generate_response(_request(temperature=0.7, cache=True))
+        await llm.generate_response(_request(temperature=0.7, cache=True))
+        await llm.generate_response(_request(cache=False))
+
+        assert provider.calls == 4
+        assert llm.get_cache_stats()["bypassed"] == 3
+
+    async def test_leader_failure_is_shared_and_not_cached(self):
+        provider = _FakeProvider(delay=0.05, fail=True)
+        llm = _abstraction(provider)
+
+        results = await asyncio.gather(*(llm.generate_response(_request()) for _ in range(3)),
+                                       return_exceptions=True)
+
+        assert provider.calls == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+        provider.fail = False
+        assert (await llm.generate_response(_request())).content == "Upload a file to begin."
+        assert provider.calls == 2
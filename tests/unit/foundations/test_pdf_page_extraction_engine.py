@@ -0,0 +1,153 @@
+"""
+Unit tests for page-parallel PDF extraction.
+
+Tests:
+- Pages are sharded into ranges, at least one per worker for small documents
+- Page ranges stream back as they complete; extract() reassembles them in page order and
+  workers read the document from one temp file
+- The table pass is skipped on pages without ruling lines
+- The extractor adapters delegate byte extraction to the engine and keep the document info
+- The table and text adapters share one extraction of the same document
+- A timed-out extraction kills the workers still running its ranges
+- A crashed worker process fails its extraction only; the next one gets a fresh pool
+"""
+
+import os
+import time
+import asyncio
+import pytest
+
+from foundations.public_works_foundation.infrastructure_adapters.pdf_page_extraction_engine import (
+    PdfPageExtractionEngine, has_table_structure
+)
+from foundations.public_works_foundation.infrastructure_adapters.pdfplumber_table_extractor import PdfplumberTableExtractor
+from foundations.public_works_foundation.infrastructure_adapters.pypdf2_text_extractor import PyPDF2TextExtractor
+
+
+def _read_info(file_path):
+    with open(file_path) as pdf_file:
+        return {"page_count": int(pdf_file.read()), "metadata": {"/Title": "Quarterly report"}}
+
+
+def _extract_range(file_path, start, end, extract_text, extract_tables):
+    with open(file_path) as pdf_file:
+        page_count = int(pdf_file.read())
+    # Earlier ranges are slower, so ranges complete out of order
+    time.sleep(0.05 * (page_count - start) / 10)
+    return [{
+        "page_number": page,
+        "text": f"page {page}" if extract_text else "",
+        "tables": [{"table_id": f"page_{page}_table_0", "page_number": page, "rows": [["a"]]}] if extract_tables and page % 10 == 0 else [],
+        "table_pass_skipped": extract_tables and page % 10 != 0
+    } for page in range(start, end)]
+
+
+def _extract_range_crashing(file_path, start, end, extract_text, extract_tables):
+    with open(file_path) as pdf_file:
+        if pdf_file.read() == "13":
+            os._exit(1)
+    return _extract_range(file_path, start, end, extract_text, extract_tables)
+
+
+def _extract_range_hanging(file_path, start, end, extract_text, extract_tables):
+    time.sleep(60)
+    return [{
+        "page_number": page,
+        "text": f"page {page}" if extract_text else "",
+        "tables": [{"table_id": f"page_{page}_table_0", "page_number": page, "rows": [["a"]]}] if extract_tables and page % 10 == 0 else [],
+        "table_pass_skipped": extract_tables and page % 10 != 0
+    } for page in range(start, end)]
+
+
+@pytest.mark.unit
+@pytest.mark.foundations
+@pytest.mark.slow
+class TestPdfPageExtractionEngine:
+
+    @pytest.fixture
+    def engine(self):
+        engine = PdfPageExtractionEngine(max_workers=4, pages_per_shard=10,
+                                         info_reader=_read_info, range_extractor=_extract_range)
+        yield engine
+        engine.shutdown()
+
+    def test_shard_planning(self, engine):
+        assert engine.plan_shards(400)[:2] == [(0, 10), (10, 20)] and len(engine.plan_shards(400)) == 40
+        assert engine.plan_shards(6) == [(0, 2), (2, 4), (4, 6)]
+        assert engine.plan_shards(0) == []
+
+    def test_table_structure_detection(self):
+        assert not has_table_structure([])
+        assert not has_table_structure([{"orientation": "h"}])  # a single underline
+        assert has_table_structure([{"orientation": "h"}] * 2 + [{"orientation": "v"}] * 2)
+        assert has_table_structure([{"orientation": "h"}] * 3)
+
+    async def test_pages_reassemble_in_order(self, engine):
+        result = await engine.extract(b"80")
+        assert [page["page_number"] for page in result["pages"]] == list(range(80))
+        assert result["text"].startswith("page 0\npage 1\n")
+        assert [table["page_number"] for table in result["tables"]] == list(range(0, 80, 10))
+        assert result["table_pass_skipped_pages"] == 72
+        assert result["shards"] == 8
+
+    async def test_ranges_stream_as_they_complete(self, engine):
+        started, arrivals = time.perf_counter(), []
+        async for shard in engine.iter_shards(b"40", extract_tables=False):
+            arrivals.append(time.perf_counter() - started)
+            assert shard["page_count"] == 40 and shard["metadata"] == {"/Title": "Quarterly report"}
+            assert [page["page_number"] for page in shard["pages"]] == list(range(shard["start_page"], shard["end_page"]))
+
+        assert len(arrivals) == 4
+        assert arrivals[-1] - arrivals[0] > 0.04  # ranges arrive one by one, not all at the end
+
+    async def test_adapters_delegate_to_engine(self, engine):
+        text = await PyPDF2TextExtractor(page_engine=engine).extract_text_from_bytes(b"12")
+        tables = await PdfplumberTableExtractor(page_engine=engine).extract_tables_from_bytes(b"12")
+
+        assert text["success"] and text["page_count"] == 12 and len(text["pages"]) == 12
+        assert text["metadata"] == {"/Title": "Quarterly report"}
+        assert tables["success"] and tables["table_count"] == 2
+        assert tables["table_pass_skipped_pages"] == 10
+        assert tables["tables"][0]["extractor"] == "pdfplumber_table_extractor"
+
+    async def test_table_and_text_adapters_share_one_extraction(self, engine):
+        tables = await PdfplumberTableExtractor(page_engine=engine).extract_tables_from_bytes(b"30")
+        text = await PyPDF2TextExtractor(page_engine=engine).extract_text_from_bytes(b"30")
+
+        assert tables["table_count"] == 3
+        assert text["page_count"] == 30 and text["text"].startswith("page 0\npage 1\n")
+        assert engine.stats["extractions"] == 1 and engine.stats["shared"] == 1
+
+        # A different document is extracted on its own
+        await PyPDF2TextExtractor(page_engine=engine).extract_text_from_bytes(b"31")
+        assert engine.stats["extractions"] == 2
+
+    async def test_recovers_after_worker_crash(self):
+        engine = PdfPageExtractionEngine(max_workers=2, pages_per_shard=10,
+                                         info_reader=_read_info, range_extractor=_extract_range_crashing)
+        try:
+            crashed = await PyPDF2TextExtractor(page_engine=engine).extract_text_from_bytes(b"13")
+            assert not crashed["success"]
+            assert engine._pool is None and engine.stats["pool_restarts"] == 1
+
+            result = await engine.extract(b"12")
+            assert [page["page_number"] for page in result["pages"]] == list(range(12))
+        finally:
+            engine.shutdown()
+
+    async def test_timeout_kills_running_workers(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+        engine = PdfPageExtractionEngine(max_workers=2, pages_per_shard=10,
+                                         info_reader=_read_info, range_extractor=_extract_range_hanging)
+        extraction = asyncio.create_task(engine.extract(b"20"))
+        await asyncio.sleep(0.5)
+        processes = list(engine._pool._processes.values())
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(extraction, timeout=1.0)
+
+        assert engine._pool is None
+        for process in processes:
+            process.join(timeout=5)
+            assert not process.is_alive()
+        assert os.listdir(tmp_path) == []  # temp file removed
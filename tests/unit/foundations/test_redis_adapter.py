@@ -0,0 +1,130 @@
+"""
+Unit tests for the asyncio Redis adapters.
+
+Tests:
+- Adapters for the same server share one bounded connection pool
+- create_session batches its commands into one transactional pipeline
+- set_multiple_hash sends HSET + EXPIRE in one round trip
+- CacheAdapter.get_many/set_many use MGET and a pipeline
+- Closing one adapter leaves the shared pool to foundation shutdown
+"""
+
+import pytest
+import json
+
+from foundations.public_works_foundation.infrastructure_adapters import redis_connection_pool
+from foundations.public_works_foundation.infrastructure_adapters.redis_adapter import RedisAdapter
+from foundations.public_works_foundation.infrastructure_adapters.redis_state_adapter import RedisStateAdapter
+from foundations.public_works_foundation.infrastructure_adapters.cache_adapter import CacheAdapter
+
+
+class _FakePipeline:
+    """Records queued commands; execute() is the only round trip."""
+
+    def __init__(self, client, transaction):
+        self.client = client
+        self.transaction = transaction
+        self.commands = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+            return self
+        return queue
+
+    async def execute(self):
+        self.client.round_trips.append((self.transaction, [c[0] for c in self.commands]))
+        return [1] * len(self.commands)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _FakeAsyncRedis:
+    """Minimal redis.asyncio stand-in that counts round trips."""
+
+    def __init__(self, store=None):
+        self.store = store or {}
+        self.round_trips = []
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self, transaction)
+
+    async def mget(self, keys):
+        self.round_trips.append((False, ["mget"]))
+        return [self.store.get(key) for key in keys]
+
+
+@pytest.fixture(autouse=True)
+def _reset_pools():
+    redis_connection_pool._pools.clear()
+    yield
+    redis_connection_pool._pools.clear()
+
+
+@pytest.mark.unit
+@pytest.mark.foundations
+@pytest.mark.fast
+class TestAsyncRedisAdapters:
+    """Test suite for the redis.asyncio adapters."""
+
+    def test_adapters_share_pool(self):
+        first = RedisAdapter(host="redis.local", port=6379, max_connections=7)
+        second = RedisAdapter(host="redis.local", port=6379)
+        state = RedisStateAdapter(host="redis.local", port=6379)
+
+        assert first._client.connection_pool is second._client.connection_pool
+        assert state._client.connection_pool is first._client.connection_pool
+        assert first._binary_client.connection_pool is not first._client.connection_pool
+        assert first._client.connection_pool.max_connections == 7
+
+    @pytest.mark.asyncio
+    async def test_create_session_is_one_transaction(self):
+        adapter = RedisAdapter(host="redis.local", port=6379)
+        adapter._client = _FakeAsyncRedis()
+
+        session_id = await adapter.create_session("user_1", {"role": "admin"}, ttl_seconds=60)
+
+        assert session_id
+        assert adapter._client.round_trips == [(True, ["hset", "expire", "sadd", "expire"])]
+
+    @pytest.mark.asyncio
+    async def test_set_multiple_hash_single_round_trip(self):
+        adapter = RedisStateAdapter(host="redis.local", port=6379)
+        adapter._client = _FakeAsyncRedis()
+
+        assert await adapter.set_multiple_hash("state:1", {"a": "1", "b": "2"}, ttl=30) is True
+        assert adapter._client.round_trips == [(True, ["hset", "expire"])]
+
+    @pytest.mark.asyncio
+    async def test_cache_adapter_batches(self):
+        cache = CacheAdapter(storage_type="redis", redis_url="redis://redis.local:6379/1")
+        cache.redis_client = _FakeAsyncRedis({"k1": json.dumps({"v": 1}).encode()})
+
+        found = await cache.get_many(["k1", "k2"])
+        await cache.set_many({"k3": {"v": 3}, "k4": {"v": 4}}, ttl=10)
+
+        assert found == {"k1": {"v": 1}}
+        assert cache.redis_client.round_trips == [(False, ["mget"]), (False, ["setex", "setex"])]
+
+    @pytest.mark.asyncio
+    async def test_close_keeps_shared_pool_open(self):
+        first = RedisAdapter(host="redis.local", port=6379)
+        state = RedisStateAdapter(host="redis.local", port=6379)
+        pool = first._client.connection_pool
+        disconnects = []
+
+        async def disconnect(*args, **kwargs):
+            disconnects.append(pool)
+
+        pool.disconnect = disconnect
+
+        assert await first.close() is True
+        assert await state.close_connection() is True
+        assert disconnects == []
+
+        await redis_connection_pool.close_shared_pools()
+        assert disconnects == [pool]
@@ -0,0 +1,181 @@
+"""
+Unit tests for the StateManagementAbstraction read-through tiers.
+
+Tests:
+- An ArangoDB hit is promoted so the next read is served from memory
+- update_state invalidates the cached copies and the next read sees the new version
+- delete_state clears every tier
+- A read racing a write cannot promote the stale value (generation fencing)
+- A read that runs while the backend write is in flight does not outlive the write
+- Overwriting with store_state continues the stored version
+- Storing in another backend drops the older value so reads never return it
+"""
+
+import asyncio
+import copy
+import json
+import pytest
+
+from foundations.public_works_foundation.infrastructure_abstractions.state_management_abstraction import (
+    StateManagementAbstraction
+)
+
+
+class _FakeRedis:
+    """Minimal string store with the RedisAdapter get/set/delete/mget surface."""
+
+    def __init__(self):
+        self.data = {}
+        self.mget_calls = 0
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ttl=None):
+        self.data[key] = value
+        return True
+
+    async def delete(self, key):
+        return self.data.pop(key, None) is not None
+
+    async def mget(self, keys):
+        self.mget_calls += 1
+        return [self.data.get(key) for key in keys]
+
+
+class _FakeArango:
+    """Document store that hands out copies, like a real database round trip."""
+
+    def __init__(self):
+        self.docs = {}
+        self.reads = 0
+
+    async def get_document(self, collection, key):
+        self.reads += 1
+        doc = self.docs.get(key)
+        return copy.deepcopy(doc) if doc else None
+
+    async def create_document(self, collection, document):
+        self.docs[document["_key"]] = copy.deepcopy(document)
+        return document
+
+    async def update_document(self, collection, key, document):
+        self.docs[key].update(copy.deepcopy(document))
+        return document
+
+    async def delete_document(self, collection, key):
+        return self.docs.pop(key, None) is not None
+
+
+@pytest.fixture
+def tiers():
+    redis, arango = _FakeRedis(), _FakeArango()
+    return StateManagementAbstraction(arango, redis, config_adapter=None), redis, arango
+
+
+@pytest.mark.unit
+@pytest.mark.foundations
+@pytest.mark.asyncio
+class TestStateManagementTiers:
+
+    async def test_arango_hit_is_promoted_to_memory(self, tiers):
+        abstraction, redis, arango = tiers
+        await abstraction.store_state("s1", {"step": 1}, metadata={"backend": "arango_db"})
+        reads_after_store = arango.reads
+
+        assert await abstraction.retrieve_state("s1") == {"step": 1}
+        assert await abstraction.retrieve_state("s1") == {"step": 1}
+
+        stats = abstraction.get_tier_stats()
+        assert arango.reads - reads_after_store == 1
+        assert stats["arango_db"]["hits"] == 1
+        assert stats["memory"]["hits"] == 1
+        assert stats["memory"]["hit_ratio"] == 0.5
+        assert "traffic_cop:state_cache:s1" in redis.data
+        assert redis.mget_calls == 1
+
+    async def test_update_invalidates_cached_copies(self, tiers):
+        abstraction, redis, arango = tiers
+        await abstraction.store_state("s1", {"step": 1}, metadata={"backend": "arango_db"})
+        await abstraction.retrieve_state("s1")
+
+        assert await abstraction.update_state("s1", {"step": 2})
+        assert "traffic_cop:state_cache:s1" not in redis.data
+        assert await abstraction.retrieve_state("s1") == {"step": 2}
+        assert arango.docs["s1"]["metadata"]["version"] == 2
+
+    async def test_delete_clears_every_tier(self, tiers):
+        abstraction, redis, arango = tiers
+        await abstraction.store_state("s1", {"step": 1}, metadata={"backend": "arango_db"})
+        await abstraction.retrieve_state("s1")
+
+        assert await abstraction.delete_state("s1")
+        assert await abstraction.retrieve_state("s1") is None
+        assert abstraction.get_tier_stats()["memory_cache_size"] == 0
+        assert not any(key.endswith("s1") for key in redis.data)
+
+    async def test_write_during_read_fences_stale_promotion(self, tiers):
+        abstraction, redis, arango = tiers
+        await abstraction.store_state("s1", {"step": 1}, metadata={"backend": "arango_db"})
+        original_get = arango.get_document
+
+        async def racing_get(collection, key):
+            stale = await original_get(collection, key)
+            arango.get_document = original_get
+            await abstraction.update_state("s1", {"step": 2})
+            return stale
+
+        arango.get_document = racing_get
+        assert await abstraction.retrieve_state("s1") == {"step": 1}
+
+        assert "traffic_cop:state_cache:s1" not in redis.data
+        assert await abstraction.retrieve_state("s1") == {"step": 2}
+
+    async def test_read_during_backend_write_is_not_served_after_it(self, tiers):
+        abstraction, redis, arango = tiers
+        await abstraction.store_state("s1", {"step": 1}, metadata={"backend": "arango_db"})
+        original_update = arango.update_document
+        write_started, release_write = asyncio.Event(), asyncio.Event()
+
+        async def slow_update(collection, key, document):
+            write_started.set()
+            await release_write.wait()
+            return await original_update(collection, key, document)
+
+        arango.update_document = slow_update
+        writer = asyncio.create_task(abstraction.update_state("s1", {"step": 2}))
+        await write_started.wait()
+
+        # Concurrent read sees (and caches) the old value while the write is in flight
+        assert await abstraction.retrieve_state("s1") == {"step": 1}
+
+        release_write.set()
+        assert await writer
+        assert "traffic_cop:state_cache:s1" not in redis.data
+        assert await abstraction.retrieve_state("s1") == {"step": 2}
+
+    async def test_store_overwrite_increments_version(self, tiers):
+        abstraction, redis, arango = tiers
+        for backend in ("arango_db", "redis", "memory"):
+            await abstraction.store_state(f"{backend}_state", {"step": 1}, metadata={"backend": backend})
+            await abstraction.update_state(f"{backend}_state", {"step": 2})
+            await abstraction.store_state(f"{backend}_state", {"step": 3}, metadata={"backend": backend})
+
+        assert arango.docs["arango_db_state"]["metadata"]["version"] == 3
+        assert json.loads(redis.data["traffic_cop:state:redis_state"])["metadata"]["version"] == 3
+        assert abstraction.memory_states["memory_state"]["metadata"]["version"] == 3
+
+    async def test_store_in_other_backend_replaces_older_value(self, tiers):
+        abstraction, redis, arango = tiers
+        await abstraction.store_state("s1", {"v": "old"}, metadata={"backend": "redis"})
+        assert await abstraction.retrieve_state("s1") == {"v": "old"}
+
+        await abstraction.store_state("s1", {"v": "new"}, metadata={"backend": "arango_db"})
+
+        assert await abstraction.retrieve_state("s1") == {"v": "new"}
+        assert "traffic_cop:state:s1" not in redis.data
+        assert arango.docs["s1"]["metadata"]["version"] == 2
+
+        await abstraction.store_state("s1", {"v": "newest"}, metadata={"backend": "memory"})
+        assert await abstraction.retrieve_state("s1") == {"v": "newest"}
+        assert "s1" not in arango.docs
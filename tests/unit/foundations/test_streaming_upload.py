@@ -0,0 +1,243 @@
+"""
+Unit tests for the streaming upload path.
+
+Tests:
+- A large upload is written through to a filesystem-backed store with memory bounded by the chunk size
+- Size and SHA-256 are computed incrementally; oversized uploads are aborted without creating the object
+- A failed resumable write on a seekable source falls back to an on-disk spool
+- File management stores streamed uploads with their size and content hash
+- The pillar router rejects an oversized upload with HTTP 413
+- An undeclared-size upload that outgrows the limit while stored reaches the caller as UploadTooLargeError, not a generic failure
+- The pillar router answers 413 for that upload whether the gateway re-raises the error or turns it into an error body
+"""
+
+import io
+import os
+import hashlib
+import tracemalloc
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from starlette.datastructures import FormData, UploadFile
+
+from foundations.public_works_foundation.infrastructure_adapters.gcs_file_adapter import GCSFileAdapter
+from foundations.public_works_foundation.infrastructure_adapters.local_object_store import (
+    LocalObjectStoreBucket, LocalObjectStoreBlob
+)
+from foundations.public_works_foundation.infrastructure_adapters.upload_stream import (
+    UploadStream, UploadTooLargeError
+)
+from foundations.public_works_foundation.infrastructure_abstractions.file_management_abstraction_gcs import (
+    FileManagementAbstraction
+)
+from backend.smart_city.services.data_steward.modules.file_lifecycle import FileLifecycle
+
+MB = 1024 * 1024
+
+
+class _GeneratedUpload:
+    """Upload body produced on demand, so the test itself never holds the whole file."""
+
+    PATTERN = bytes(i % 251 for i in range(4096))
+
+    def __init__(self, size):
+        self.size = size
+        self.position = 0
+
+    def block(self, length):
+        return self.PATTERN * (length // 4096) + self.PATTERN[:length % 4096]
+
+    async def read(self, size):
+        length = min(size, self.size - self.position)
+        self.position += length
+        return self.block(length)
+
+    def expected_sha256(self, chunk_size):
+        digest = hashlib.sha256()
+        for offset in range(0, self.size, chunk_size):
+            digest.update(self.block(min(chunk_size, self.size - offset)))
+        return digest.hexdigest()
+
+
+class _UnsizedUploadBody:
+    """Non-seekable upload body, so the upload carries no declared size."""
+
+    def __init__(self, size):
+        self.remaining = size
+
+    def seekable(self):
+        return False
+
+    def read(self, size=-1):
+        length = self.remaining if size < 0 else min(size, self.remaining)
+        self.remaining -= length
+        return b"x" * length
+
+
+def _file_lifecycle(file_management):
+    service = Mock()
+    service.file_management_abstraction = file_management
+    service.is_infrastructure_connected = True
+    service.log_operation_with_telemetry = AsyncMock()
+    service.handle_error_with_audit = AsyncMock()
+    service.record_health_metric = AsyncMock()
+    return FileLifecycle(service)
+
+
+@pytest.mark.unit
+@pytest.mark.foundations
+@pytest.mark.fast
+class TestStreamingUpload:
+
+    @pytest.fixture
+    def bucket(self, tmp_path):
+        return LocalObjectStoreBucket(str(tmp_path / "bucket"))
+
+    @pytest.fixture
+    def adapter(self, bucket):
+        return GCSFileAdapter(project_id="local", bucket_name="local-bucket", bucket=bucket,
+                              upload_chunk_size=MB)
+
+    async def test_memory_bounded_by_chunk_size(self, adapter, bucket):
+        source = _GeneratedUpload(64 * MB)
+        stream = UploadStream(source, filename="claims.dat", size=source.size, chunk_size=MB)
+
+        tracemalloc.start()
+        try:
+            result = await adapter.upload_stream("files/claims", stream, content_type="application/octet-stream")
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert result["success"] and result["method"] == "resumable"
+        assert result["size"] == 64 * MB == bucket.blob("files/claims").size
+        assert result["sha256"] == source.expected_sha256(MB)
+        assert peak < 4 * MB  # a few chunks, not the 64 MB file
+        assert len(stream) == 64 * MB
+
+    async def test_oversized_upload_is_aborted(self, adapter, bucket):
+        source = _GeneratedUpload(5 * MB)
+        stream = UploadStream(source, chunk_size=MB, max_bytes=3 * MB)  # size not declared
+
+        result = await adapter.upload_stream("files/too_big", stream)
+
+        assert not result["success"] and result["error"] == "upload_too_large"
+        assert stream.bytes_read == 4 * MB  # stopped at the first chunk over the limit
+        assert not bucket.blob("files/too_big").exists()
+        assert os.listdir(os.path.join(bucket.root, "files")) == []  # partial upload discarded
+
+        declared = UploadStream(_GeneratedUpload(5 * MB), size=5 * MB, max_bytes=3 * MB)
+        assert (await adapter.upload_stream("files/too_big", declared))["error"] == "upload_too_large"
+        assert declared.bytes_read == 0  # rejected before reading
+
+    async def test_spool_fallback_on_seekable_source(self, adapter, bucket, monkeypatch):
+        content = os.urandom(3 * MB + 17)
+        upload = UploadFile(file=io.BytesIO(content), filename="copybook.cpy", size=len(content))
+        stream = UploadStream.from_upload_file(upload, chunk_size=MB)
+        original_open = LocalObjectStoreBlob.open
+
+        def failing_open(blob, mode="rb", **kwargs):
+            writer = original_open(blob, mode, **kwargs)
+            if mode == "wb":
+                def fail(data):
+                    raise ConnectionError("resumable session lost")
+                writer.write = fail
+            return writer
+
+        monkeypatch.setattr(LocalObjectStoreBlob, "open", failing_open)
+        result = await adapter.upload_stream("files/copybook", stream, content_type="text/plain")
+
+        assert result["success"] and result["method"] == "spooled"
+        assert result["sha256"] == hashlib.sha256(content).hexdigest()
+        assert bucket.blob("files/copybook").download_as_bytes() == content
+
+    async def test_file_management_stores_streamed_upload(self, adapter, bucket):
+        supabase = AsyncMock()
+        supabase.create_file = AsyncMock(side_effect=lambda record: record)
+        file_management = FileManagementAbstraction(gcs_adapter=adapter, supabase_adapter=supabase)
+        content = b"01HEADER\n" * 100000
+
+        record = await file_management.create_file({
+            "user_id": "user_1",
+            "ui_name": "claims",
+            "file_type": "dat",
+            "file_content": UploadStream(io.BytesIO(content), size=len(content), chunk_size=64 * 1024)
+        })
+
+        assert record["file_size"] == len(content)
+        assert record["service_context"]["content_sha256"] == hashlib.sha256(content).hexdigest()
+        assert bucket.blob(record["original_path"]).download_as_bytes() == content
+
+    def test_router_rejects_oversized_upload_with_413(self, monkeypatch):
+        pytest.importorskip("multipart")
+        router_module = pytest.importorskip("backend.api.universal_pillar_router")
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        class _Config:
+            def get(self, key, default=None):
+                return {"UPLOAD_MAX_BYTES": "1024"}.get(key, default)
+
+        monkeypatch.setattr(router_module, "_config_manager", _Config())
+        monkeypatch.setattr(router_module, "_frontend_gateway", AsyncMock())
+        app = FastAPI()
+        app.include_router(router_module.router)
+        url = router_module.route_pattern.replace("{pillar}", "content-pillar").replace("{path:path}", "upload-file")
+
+        response = TestClient(app).post(url, files={"file": ("big.bin", b"x" * 4096)})
+
+        assert response.status_code == 413
+        assert response.json()["error"] == "upload_too_large"
+        router_module._frontend_gateway.route_frontend_request.assert_not_called()
+
+    async def test_file_lifecycle_surfaces_oversized_stream(self, adapter, bucket):
+        file_management = FileManagementAbstraction(gcs_adapter=adapter, supabase_adapter=AsyncMock())
+        stream = UploadStream(_GeneratedUpload(5 * MB), filename="big.bin", chunk_size=MB, max_bytes=3 * MB)
+
+        with pytest.raises(UploadTooLargeError):
+            await _file_lifecycle(file_management).process_upload(
+                stream, "application/octet-stream", metadata={"ui_name": "big", "file_type": "bin"}
+            )
+
+        assert stream.size_error is not None and stream.size_error.max_bytes == 3 * MB
+        file_management.supabase_adapter.create_file.assert_not_called()
+
+    @pytest.mark.parametrize("gateway_swallows_error", [False, True])
+    async def test_router_maps_size_error_from_storage_to_413(self, adapter, bucket, monkeypatch,
+                                                              gateway_swallows_error):
+        pytest.importorskip("email_validator")
+        router_module = pytest.importorskip("backend.api.universal_pillar_router")
+        file_lifecycle = _file_lifecycle(FileManagementAbstraction(gcs_adapter=adapter, supabase_adapter=AsyncMock()))
+
+        class _Config:
+            def get(self, key, default=None):
+                return {"UPLOAD_MAX_BYTES": "1024"}.get(key, default)
+
+        class _Gateway:
+            async def route_frontend_request(self, request_payload):
+                params = request_payload["params"]
+                try:
+                    return await file_lifecycle.process_upload(
+                        params["file_data"], params["content_type"], metadata={"ui_name": "big", "file_type": "bin"}
+                    )
+                except Exception as e:
+                    if not gateway_swallows_error:
+                        raise
+                    return {"success": False, "error": str(e)}
+
+        class _Request:
+            method = "POST"
+            headers = {"content-type": "multipart/form-data; boundary=x", "x-user-id": "user_1"}
+            query_params = {}
+
+            async def form(self):
+                return FormData([("file", UploadFile(file=_UnsizedUploadBody(4096), filename="big.bin"))])
+
+        monkeypatch.setattr(router_module, "_config_manager", _Config())
+        monkeypatch.setattr(router_module, "_frontend_gateway", _Gateway())
+
+        response = await router_module.universal_pillar_handler(_Request(), "content-pillar", "upload-file")
+
+        assert response.status_code == 413
+        assert b'"upload_too_large"' in response.body
+        assert not any(files for _, _, files in os.walk(bucket.root))  # partial upload discarded
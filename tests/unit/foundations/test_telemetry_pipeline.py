@@ -0,0 +1,125 @@
+"""
+Unit tests for the batched telemetry pipeline.
+
+Tests:
+- Counters, gauges and histograms aggregate to one series per name/tags per interval
+- The series count and the export queue are bounded and count what they drop
+- record_metric does no I/O; the flush exports one Nurse call per batch
+- A failed export stays queued and is retried on the next flush
+- DI container shutdown stops the flush task and exports what is pending
+"""
+
+import json
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+pytest.importorskip("psutil")  # utilities package imports it
+
+from utilities.telemetry_reporting.metric_aggregator import MetricAggregator
+from utilities.telemetry_reporting.telemetry_reporting_utility import TelemetryReportingUtility
+
+
+@pytest.mark.unit
+@pytest.mark.foundations
+@pytest.mark.fast
+class TestMetricAggregator:
+
+    def test_aggregates_by_type_name_and_tags(self):
+        aggregator = MetricAggregator(histogram_buckets=(0.1, 1.0))
+        for _ in range(5):
+            aggregator.record("requests", 1, {"route": "/a"}, "counter")
+        aggregator.record("requests", 1, {"route": "/b"}, "counter")
+        for value in (3, 7, 5):
+            aggregator.record("queue_depth", value)
+        for value in (0.05, 0.5, 0.7, 4.0):
+            aggregator.record("latency", value, metric_type="histogram")
+
+        records = {(r["metric_name"], tuple(r["tags"].items())): r for r in aggregator.swap()}
+
+        assert len(records) == 4
+        assert records[("requests", (("route", "/a"),))]["value"] == 5
+        gauge = records[("queue_depth", ())]
+        assert (gauge["count"], gauge["min"], gauge["max"], gauge["value"]) == (3, 3, 7, 5)
+        histogram = records[("latency", ())]
+        assert histogram["buckets"] == {"0.1": 1, "1.0": 2, "+Inf": 1}
+        assert histogram["max"] == 4.0
+        assert aggregator.swap() == []  # next interval starts empty
+
+    def test_bounds_drop_and_count(self):
+        aggregator = MetricAggregator(max_series=2, max_pending_batches=2, batch_size=1)
+        assert aggregator.record("a", 1)
+        assert aggregator.record("b", 1)
+        assert not aggregator.record("c", 1)
+        assert aggregator.record("a", 2)  # existing series still update
+        assert not aggregator.record("d", "not a number")
+
+        aggregator.enqueue_interval()
+        aggregator.record("e", 1)
+        aggregator.enqueue_interval()
+
+        stats = aggregator.get_stats()
+        assert stats["pending_batches"] == 2
+        assert stats["dropped"] == {"series_overflow": 1, "batch_overflow": 1, "invalid": 1}
+        assert stats["dropped_total"] == 3
+
+
+@pytest.mark.unit
+@pytest.mark.foundations
+@pytest.mark.fast
+class TestTelemetryReportingPipeline:
+
+    @pytest.fixture
+    def nurse(self):
+        nurse = Mock()
+        nurse.call_tool = AsyncMock(return_value={"status": "success"})
+        return nurse
+
+    @pytest.fixture
+    def telemetry(self, nurse):
+        telemetry = TelemetryReportingUtility("test_service", flush_interval=3600, batch_size=100)
+        telemetry.bootstrap(Mock(), nurse_client=nurse)
+        return telemetry
+
+    @pytest.mark.asyncio
+    async def test_record_is_buffered_and_flushed_in_batches(self, telemetry, nurse):
+        for i in range(1000):
+            await telemetry.record_metric("operation.parse.duration", i / 1000, metric_type="histogram")
+            await telemetry.record_platform_operation_event("file_parsed", {"pillar": f"p{i % 150}"})
+
+        nurse.call_tool.assert_not_awaited()
+        assert telemetry.get_metric_pipeline_stats()["flush_task_running"]
+
+        assert await telemetry.flush() == 2  # 151 series, 100 per batch
+        assert nurse.call_tool.await_count == 2
+        payload = json.loads(nurse.call_tool.await_args_list[0].kwargs["input_data"])
+        assert payload["telemetry_type"] == "metric_batch"
+        assert "dropped_total" in payload["telemetry_data"]["pipeline"]
+        assert len(telemetry.metrics_storage) == 151
+
+        await telemetry.shutdown()
+        assert not telemetry.get_metric_pipeline_stats()["flush_task_running"]
+
+    @pytest.mark.asyncio
+    async def test_failed_export_is_retried(self, telemetry, nurse):
+        nurse.call_tool = AsyncMock(side_effect=[RuntimeError("nurse down"), {"status": "success"}])
+        await telemetry.record_metric("health.ok", 1.0)
+
+        assert await telemetry.flush() == 0
+        assert telemetry.get_metric_pipeline_stats()["pending_batches"] == 1
+        assert await telemetry.flush() == 1
+        assert telemetry.export_failures == 1
+
+        await telemetry.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_di_container_shutdown_flushes_telemetry(self, telemetry, nurse):
+        di_container_service = pytest.importorskip("foundations.di_container.di_container_service")
+        container = di_container_service.DIContainerService.__new__(di_container_service.DIContainerService)
+        container.telemetry = telemetry
+        container._logger = Mock()
+        await telemetry.record_metric("health.ok", 1.0)
+
+        await container.shutdown()
+
+        nurse.call_tool.assert_awaited_once()
+        assert not telemetry.get_metric_pipeline_stats()["flush_task_running"]
@@ -0,0 +1,260 @@
+"""
+Unit tests for the in-process vector index and SemanticDataAbstraction.vector_search.
+
+Tests:
+- Brute-force ranking and IVF recall against exact search
+- Filter-aware search and tenant isolation
+- Snapshot round-trip
+- Incremental updates from store_semantic_embeddings
+- Partitions re-sync from ArangoDB, so other workers' embeddings become searchable
+- A snapshot is only a warm start: documents missing from it are caught up from ArangoDB
+- Upserts replace changed vectors; removed documents stop matching
+- Syncs only fetch changed documents and drop keys deleted in ArangoDB
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from foundations.public_works_foundation.infrastructure_adapters.vector_index_adapter import VectorIndexAdapter
+from foundations.public_works_foundation.infrastructure_abstractions.semantic_data_abstraction import SemanticDataAbstraction
+
+
+def _docs(vectors, **extra):
+    return [
+        {"_key": f"emb_{i}", "column_name": f"col_{i}", "group": i % 4, "meaning_embedding": v.tolist(), **extra}
+        for i, v in enumerate(vectors)
+    ]
+
+
+class _FakeArango:
+    """
+    Minimal async ArangoDB stand-in (create/find/delete documents). execute_aql serves the
+    two vector-sync queries by their bind variables: changed documents after a cursor, or keys.
+    """
+
+    def __init__(self):
+        self.documents = []
+        self.find_calls = 0
+        self.changed_queries = []
+
+    async def create_document(self, collection, document):
+        self.documents.append(dict(document))
+        return document
+
+    async def delete_document(self, collection, key):
+        before = len(self.documents)
+        self.documents = [d for d in self.documents if d["_key"] != key]
+        return len(self.documents) < before
+
+    async def execute_aql(self, query, bind_vars=None):
+        tenant = [d for d in self.documents if d.get("tenant_id") == bind_vars["tenant_id"]]
+        if "after_ts" not in bind_vars:
+            return [d["_key"] for d in tenant]
+        self.changed_queries.append(bind_vars["after_ts"])
+        after = (bind_vars["after_ts"], bind_vars["after_key"])
+        changed = sorted(
+            (d for d in tenant if (d.get("updated_at") or d.get("created_at") or "", d["_key"]) > after),
+            key=lambda d: (d.get("updated_at") or d.get("created_at") or "", d["_key"])
+        )
+        return [dict(d) for d in changed[:bind_vars["page_size"]]]
+
+    async def find_documents(self, collection, filter_conditions=None, limit=None, offset=None):
+        self.find_calls += 1
+        filter_conditions = filter_conditions or {}
+        return [
+            d for d in self.documents
+            if all(d.get(k) == v for k, v in filter_conditions.items())
+        ][:limit]
+
+
+@pytest.mark.unit
+@pytest.mark.foundations
+@pytest.mark.fast
+class TestVectorIndexAdapter:
+    """Test suite for VectorIndexAdapter."""
+
+    @pytest.fixture
+    def vectors(self):
+        return np.random.default_rng(7).normal(size=(3000, 32)).astype(np.float32)
+
+    def test_brute_force_returns_exact_neighbour(self, vectors):
+        index = VectorIndexAdapter()
+        index.add_documents("tenant_a", _docs(vectors))
+
+        results = index.search("tenant_a", vectors[42], limit=3)
+
+        assert results[0]["_key"] == "emb_42"
+        assert results[0]["similarity_score"] == pytest.approx(1.0, abs=1e-5)
+        assert results[0]["matched_embedding_field"] == "meaning_embedding"
+        assert "meaning_embedding" not in results[0]
+
+    def test_ivf_recall_against_exact_search(self, vectors):
+        exact = VectorIndexAdapter()
+        approximate = VectorIndexAdapter(brute_force_threshold=500, nprobe=16)
+        exact.add_documents("t", _docs(vectors))
+        approximate.add_documents("t", _docs(vectors))
+
+        recall = []
+        for query in vectors[:20] + 0.1:
+            truth = {r["_key"] for r in exact.search("t", query, limit=10)}
+            found = {r["_key"] for r in approximate.search("t", query, limit=10)}
+            recall.append(len(truth & found) / 10)
+
+        assert approximate.get_stats()["t"]["fields"]["meaning_embedding"]["ivf"] is True
+        assert np.mean(recall) >= 0.8
+
+    def test_filters_apply_before_ranking(self, vectors):
+        index = VectorIndexAdapter(brute_force_threshold=500)
+        index.add_documents("t", _docs(vectors))
+
+        results = index.search("t", vectors[42], limit=10, filters={"group": 1})
+
+        assert len(results) == 10
+        assert all(r["group"] == 1 for r in results)
+
+    def test_tenants_are_isolated(self, vectors):
+        index = VectorIndexAdapter()
+        index.add_documents("tenant_a", _docs(vectors[:10]))
+        index.add_documents("tenant_b", _docs(vectors[10:20]))
+
+        assert {r["_key"] for r in index.search("tenant_b", vectors[3], limit=20)} == {f"emb_{i}" for i in range(10)}
+        assert index.search("tenant_c", vectors[3]) == []
+
+    def test_upsert_replaces_and_remove_drops_vectors(self, vectors):
+        index = VectorIndexAdapter(brute_force_threshold=500)
+        docs = _docs(vectors[:1000], updated_at="2026-01-01T00:00:00")
+        index.add_documents("t", docs)
+
+        moved = {**docs[42], "meaning_embedding": vectors[7].tolist(), "updated_at": "2026-01-02T00:00:00"}
+        same_revision = {**docs[43], "meaning_embedding": vectors[8].tolist()}
+        assert index.add_documents("t", [moved, same_revision]) == 1
+        assert index.remove_documents("t", [f"emb_{i}" for i in range(500, 1000)]) == 500
+
+        near_seven = [r["_key"] for r in index.search("t", vectors[7], limit=2)]
+        assert sorted(near_seven) == ["emb_42", "emb_7"]
+        assert index.search("t", vectors[8], limit=1)[0]["_key"] == "emb_8"
+        assert all(int(r["_key"][4:]) < 500 for r in index.search("t", vectors[700], limit=50))
+        assert index.get_stats()["t"]["fields"]["meaning_embedding"]["vectors"] == 500
+
+    def test_snapshot_round_trip(self, vectors, tmp_path):
+        index = VectorIndexAdapter(snapshot_dir=str(tmp_path))
+        index.add_documents("tenant/a", _docs(vectors[:100]))
+        path = index.save_snapshot("tenant/a")
+
+        restored = VectorIndexAdapter(snapshot_dir=str(tmp_path))
+        assert restored.load_snapshot("tenant/a") is True
+        assert path.endswith("tenant_a.npz")
+        assert [r["_key"] for r in restored.search("tenant/a", vectors[5], limit=5)] == \
+            [r["_key"] for r in index.search("tenant/a", vectors[5], limit=5)]
+
+
+@pytest.mark.unit
+@pytest.mark.foundations
+@pytest.mark.fast
+class TestSemanticDataVectorSearch:
+    """Test suite for SemanticDataAbstraction.vector_search over the index."""
+
+    @pytest.mark.asyncio
+    async def test_stored_embeddings_are_searchable_without_reload(self):
+        arango = _FakeArango()
+        abstraction = SemanticDataAbstraction(arango_adapter=arango, config_adapter=None)
+        user_context = {"tenant_id": "tenant_a"}
+
+        await abstraction.store_semantic_embeddings(
+            "content_1", "file_1",
+            [{"column_name": "age", "meaning_embedding": [1.0, 0.0, 0.0]},
+             {"column_name": "name", "meaning_embedding": [0.0, 1.0, 0.0]}],
+            user_context=user_context
+        )
+        await abstraction.store_semantic_embeddings(
+            "content_2", "file_2",
+            [{"column_name": "dob", "meaning_embedding": [0.9, 0.1, 0.0]}],
+            user_context=user_context
+        )
+        results = await abstraction.vector_search([1.0, 0.0, 0.0], limit=2, user_context=user_context)
+
+        assert [r["column_name"] for r in results] == ["age", "dob"]
+        assert len(arango.changed_queries) == 1
+
+    @pytest.mark.asyncio
+    async def test_partition_hydrates_from_arango(self):
+        arango = _FakeArango()
+        arango.documents = [
+            {"_key": "emb_1", "tenant_id": "tenant_a", "content_id": "c1", "metadata_embedding": [0.0, 1.0]},
+            {"_key": "emb_2", "tenant_id": "tenant_a", "content_id": "c2", "metadata_embedding": [0.0, 1.0]},
+            {"_key": "emb_3", "tenant_id": "tenant_b", "content_id": "c1", "metadata_embedding": [0.0, 1.0]},
+        ]
+        abstraction = SemanticDataAbstraction(arango_adapter=arango, config_adapter=None)
+
+        results = await abstraction.vector_search(
+            [0.0, 1.0], filters={"content_id": "c1"}, user_context={"tenant_id": "tenant_a"}
+        )
+
+        assert [r["_key"] for r in results] == ["emb_1"]
+
+    @pytest.mark.asyncio
+    async def test_partition_resyncs_writes_from_other_workers(self):
+        arango = _FakeArango()
+        worker_a = SemanticDataAbstraction(arango_adapter=arango, config_adapter=None, vector_refresh_seconds=0)
+        worker_b = SemanticDataAbstraction(arango_adapter=arango, config_adapter=None, vector_refresh_seconds=0)
+        user_context = {"tenant_id": "tenant_a"}
+
+        assert await worker_b.vector_search([1.0, 0.0], user_context=user_context) == []
+        await worker_a.store_semantic_embeddings(
+            "content_1", "file_1",
+            [{"column_name": "age", "meaning_embedding": [1.0, 0.0]}],
+            user_context=user_context
+        )
+
+        results = await worker_b.vector_search([1.0, 0.0], user_context=user_context)
+        assert [r["column_name"] for r in results] == ["age"]
+
+    @pytest.mark.asyncio
+    async def test_snapshot_warm_start_catches_up_from_arango(self, tmp_path):
+        arango = _FakeArango()
+        arango.documents = [
+            {"_key": "emb_1", "tenant_id": "tenant_a", "column_name": "old", "meaning_embedding": [1.0, 0.0]},
+        ]
+        first = SemanticDataAbstraction(
+            arango_adapter=arango, config_adapter=None,
+            vector_index_adapter=VectorIndexAdapter(snapshot_dir=str(tmp_path))
+        )
+        await first.vector_search([1.0, 0.0], user_context={"tenant_id": "tenant_a"})
+        assert len(first.vector_index_adapter.save_all_snapshots()) == 1
+
+        # Written after the snapshot was taken
+        arango.documents.append(
+            {"_key": "emb_2", "tenant_id": "tenant_a", "column_name": "new", "meaning_embedding": [0.9, 0.1]}
+        )
+        restarted = SemanticDataAbstraction(
+            arango_adapter=arango, config_adapter=None,
+            vector_index_adapter=VectorIndexAdapter(snapshot_dir=str(tmp_path))
+        )
+        results = await restarted.vector_search([1.0, 0.0], user_context={"tenant_id": "tenant_a"})
+
+        assert [r["column_name"] for r in results] == ["old", "new"]
+
+    @pytest.mark.asyncio
+    async def test_sync_upserts_changes_and_drops_deletes(self):
+        arango = _FakeArango()
+        arango.documents = [
+            {"_key": "emb_1", "tenant_id": "t", "column_name": "a", "meaning_embedding": [1.0, 0.0],
+             "created_at": "2026-01-01T00:00:00", "updated_at": "2026-01-01T00:00:00"},
+            {"_key": "emb_2", "tenant_id": "t", "column_name": "b", "meaning_embedding": [0.0, 1.0],
+             "created_at": "2026-01-01T00:00:00", "updated_at": "2026-01-01T00:00:00"},
+        ]
+        worker = SemanticDataAbstraction(arango_adapter=arango, config_adapter=None, vector_refresh_seconds=0)
+        other = SemanticDataAbstraction(arango_adapter=arango, config_adapter=None, vector_refresh_seconds=0)
+        user_context = {"tenant_id": "t"}
+        await worker.vector_search([1.0, 0.0], user_context=user_context)
+
+        # Another writer re-embeds emb_2 and another worker deletes emb_1
+        arango.documents[1].update({"meaning_embedding": [1.0, 0.1], "updated_at": "2026-01-02T00:00:00"})
+        await other.delete_semantic_embeddings(filters={"column_name": "a"}, user_context=user_context)
+        results = await worker.vector_search([1.0, 0.0], user_context=user_context)
+
+        assert [r["_key"] for r in results] == ["emb_2"]
+        assert results[0]["similarity_score"] > 0.99
+        assert arango.changed_queries[0] == ""
+        assert arango.changed_queries[-1] == "2025-12-31T23:55:00"
@@ -0,0 +1,266 @@
+"""
+Unit tests for the group-commit WAL segment engine.
+
+Tests:
+- Concurrent appends share fsyncs (group commit)
+- Recovery rebuilds indexes and truncates a torn tail
+- Namespace/time range scans with status updates applied
+- Cursor pages and status/correlation index selection
+- Descending pages start from the newest entry
+- Per-namespace counters follow status updates and compaction
+- Hourly counter buckets restrict counts to a recent window
+- Segment rotation and TTL compaction
+- Relative directories are rejected
+- Adapters in several processes share one directory without corrupting it
+"""
+
+import pytest
+import asyncio
+import multiprocessing
+from datetime import datetime, timedelta
+
+from foundations.public_works_foundation.infrastructure_adapters.wal_segment_adapter import WALSegmentAdapter
+
+
+def _entry(log_id, namespace="saga_execution", timestamp=None, **extra):
+    return {
+        "log_id": log_id,
+        "namespace": namespace,
+        "timestamp": (timestamp or datetime.utcnow()).isoformat(),
+        "payload": {"operation": "step"},
+        "status": "pending",
+        "retry_count": 0,
+        "correlation_id": extra.pop("correlation_id", None),
+        "metadata": {"tenant_id": extra.pop("tenant_id", None)},
+        **extra
+    }
+
+
+def _append_from_process(directory, prefix, count):
+    async def run():
+        wal = WALSegmentAdapter(directory, segment_max_bytes=2048, fsync=False)
+        for i in range(count):
+            await wal.append_entry(_entry(f"{prefix}_{i}"), ttl_seconds=3600)
+            if i % 10 == 0:
+                await wal.append_status(f"{prefix}_{i}", {"status": "completed"})
+        await wal.close()
+    asyncio.run(run())
+
+
+@pytest.mark.unit
+@pytest.mark.foundations
+@pytest.mark.wal
+class TestWALSegmentAdapter:
+    """Test suite for WALSegmentAdapter."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_appends_are_group_committed(self, tmp_path):
+        wal = WALSegmentAdapter(str(tmp_path))
+
+        results = await asyncio.gather(*(wal.append_entry(_entry(f"wal_{i}"), ttl_seconds=3600) for i in range(200)))
+        await wal.close()
+
+        assert sorted(r["offset"] for r in results) == list(range(200))
+        assert wal.get_stats()["records"] == 200
+        assert wal.get_stats()["fsyncs"] < 20
+
+    @pytest.mark.asyncio
+    async def test_recovery_rebuilds_index_and_truncates_torn_tail(self, tmp_path):
+        wal = WALSegmentAdapter(str(tmp_path))
+        await wal.append_entry(_entry("wal_a"), ttl_seconds=3600)
+        await wal.append_entry(_entry("wal_b"), ttl_seconds=3600)
+        await wal.append_status("wal_a", {"status": "completed"})
+        await wal.close()
+        segment = next(tmp_path.glob("*.wal"))
+        with open(segment, "ab") as f:
+            f.write(b"\x00\x00\x01\x00partial")
+
+        reopened = WALSegmentAdapter(str(tmp_path))
+        entry = await reopened.get_entry("wal_a")
+        result = await reopened.append_entry(_entry("wal_c"), ttl_seconds=3600)
+
+        assert entry["status"] == "completed"
+        assert result["offset"] == 3
+        assert (await reopened.get_entry("wal_c"))["log_id"] == "wal_c"
+        await reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_scan_by_namespace_time_and_status(self, tmp_path):
+        wal = WALSegmentAdapter(str(tmp_path), fsync=False)
+        base = datetime(2026, 1, 1)
+        for i in range(10):
+            await wal.append_entry(_entry(f"wal_{i}", timestamp=base + timedelta(minutes=i)), ttl_seconds=3600)
+        await wal.append_entry(_entry("other", namespace="canonical_model", timestamp=base), ttl_seconds=3600)
+        await wal.append_status("wal_4", {"status": "failed", "error": "boom"})
+
+        window = await wal.scan("saga_execution", base + timedelta(minutes=2), base + timedelta(minutes=6))
+        failed = await wal.scan("saga_execution", base, base + timedelta(hours=1), filters={"status": "failed"})
+
+        assert [e["log_id"] for e in window] == ["wal_2", "wal_3", "wal_4", "wal_5", "wal_6"]
+        assert [(e["log_id"], e["error"]) for e in failed] == [("wal_4", "boom")]
+        await wal.close()
+
+    @pytest.mark.asyncio
+    async def test_scan_page_cursor_and_indexes(self, tmp_path):
+        wal = WALSegmentAdapter(str(tmp_path), fsync=False)
+        base = datetime(2026, 1, 1)
+        for i in range(7):
+            await wal.append_entry(
+                _entry(f"wal_{i}", timestamp=base, correlation_id="saga_1" if i % 3 == 0 else None),
+                ttl_seconds=3600
+            )
+        await wal.append_entry(_entry("other", namespace="canonical_model", timestamp=base), ttl_seconds=3600)
+
+        seen, cursor, pages = [], None, 0
+        while True:
+            page = await wal.scan_page("saga_execution", base, base, cursor=cursor, page_size=3)
+            seen.extend(e["log_id"] for e in page["entries"])
+            pages += 1
+            cursor = page["next_cursor"]
+            if not cursor:
+                break
+        correlated = await wal.scan(None, base, base, filters={"correlation_id": "saga_1"})
+        everything = await wal.scan(None, base, base)
+
+        assert seen == [f"wal_{i}" for i in range(7)]
+        assert pages == 3
+        assert [e["log_id"] for e in correlated] == ["wal_0", "wal_3", "wal_6"]
+        assert len(everything) == 8
+        await wal.close()
+
+    @pytest.mark.asyncio
+    async def test_counters_follow_status_updates(self, tmp_path):
+        wal = WALSegmentAdapter(str(tmp_path), fsync=False)
+        for i in range(4):
+            await wal.append_entry(_entry(f"wal_{i}", tenant_id="t1" if i < 3 else "t2"), ttl_seconds=3600)
+        await wal.append_status("wal_0", {"status": "retrying"})
+        await wal.append_status("wal_0", {"status": "completed"})
+        await wal.append_status("wal_1", {"status": "failed"})
+        await wal.close()
+
+        reopened = WALSegmentAdapter(str(tmp_path))
+        await reopened.open()
+        counters = reopened.get_counters()["saga_execution"]
+        tenant = reopened.get_counters("saga_execution", tenant_id="t1")["saga_execution"]
+
+        assert counters == {"pending": 2, "completed": 1, "failed": 1, "retrying": 0, "total": 4}
+        assert tenant["pending"] == 1 and tenant["total"] == 3
+        await reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_rotation_and_ttl_compaction(self, tmp_path):
+        wal = WALSegmentAdapter(str(tmp_path), segment_max_bytes=512, fsync=False, compact_on_rotate=False)
+        old = datetime.utcnow() - timedelta(days=2)
+        for i in range(10):
+            await wal.append_entry(_entry(f"old_{i}", timestamp=old), ttl_seconds=3600)
+        for i in range(10):
+            await wal.append_entry(_entry(f"new_{i}"), ttl_seconds=3600)
+
+        segments_before = wal.get_stats()["segments"]
+        result = await wal.compact()
+
+        assert segments_before > 2
+        assert result["removed_segments"] >= 1
+        assert await wal.get_entry("old_0") is None
+        assert (await wal.get_entry("new_9"))["log_id"] == "new_9"
+        assert len(await wal.scan("saga_execution", old, datetime.utcnow())) >= 10
+        assert wal.get_counters()["saga_execution"]["total"] == len(await wal.scan("saga_execution", old, datetime.utcnow()))
+        await wal.close()
+
+    @pytest.mark.asyncio
+    async def test_descending_pages_start_from_newest(self, tmp_path):
+        wal = WALSegmentAdapter(str(tmp_path), fsync=False)
+        base = datetime(2026, 1, 1)
+        for i in range(8):
+            await wal.append_entry(
+                _entry(f"wal_{i}", timestamp=base + timedelta(minutes=i), correlation_id="saga_1" if i % 2 else None),
+                ttl_seconds=3600
+            )
+
+        seen, cursor = [], None
+        while True:
+            page = await wal.scan_page(
+                "saga_execution", base, base + timedelta(hours=1), cursor=cursor, page_size=3, descending=True
+            )
+            seen.append([e["log_id"] for e in page["entries"]])
+            cursor = page["next_cursor"]
+            if not cursor:
+                break
+        correlated = await wal.scan_page(
+            "saga_execution", base, base + timedelta(hours=1),
+            filters={"correlation_id": "saga_1"}, page_size=2, descending=True
+        )
+
+        assert seen == [["wal_7", "wal_6", "wal_5"], ["wal_4", "wal_3", "wal_2"], ["wal_1", "wal_0"]]
+        assert [e["log_id"] for e in correlated["entries"]] == ["wal_7", "wal_5"]
+        await wal.close()
+
+    @pytest.mark.asyncio
+    async def test_counters_since_use_hourly_buckets(self, tmp_path):
+        wal = WALSegmentAdapter(str(tmp_path), fsync=False)
+        now = datetime.utcnow()
+        for i in range(3):
+            await wal.append_entry(_entry(f"old_{i}", timestamp=now - timedelta(days=3)), ttl_seconds=7 * 86400)
+        for i in range(2):
+            await wal.append_entry(_entry(f"new_{i}", timestamp=now - timedelta(hours=2)), ttl_seconds=7 * 86400)
+        await wal.append_status("new_0", {"status": "failed"})
+        await wal.append_status("old_0", {"status": "failed"})
+
+        day = wal.get_counters("saga_execution", since=now - timedelta(hours=24))["saga_execution"]
+        everything = wal.get_counters("saga_execution")["saga_execution"]
+
+        assert day == {"pending": 1, "completed": 0, "failed": 1, "retrying": 0, "total": 2}
+        assert everything["total"] == 5 and everything["failed"] == 2
+        await wal.close()
+
+    def test_relative_directory_is_rejected(self):
+        with pytest.raises(ValueError):
+            WALSegmentAdapter("data/wal")
+
+    @pytest.mark.asyncio
+    async def test_adapters_sharing_a_directory_see_each_other(self, tmp_path):
+        first = WALSegmentAdapter(str(tmp_path), segment_max_bytes=1024, fsync=False)
+        second = WALSegmentAdapter(str(tmp_path), segment_max_bytes=1024, fsync=False)
+        offsets = []
+        for i in range(20):
+            offsets.append((await first.append_entry(_entry(f"a_{i}"), ttl_seconds=3600))["offset"])
+            offsets.append((await second.append_entry(_entry(f"b_{i}"), ttl_seconds=3600))["offset"])
+        await second.append_status("a_3", {"status": "failed"})
+
+        assert offsets == list(range(40))
+        assert (await first.get_entry("b_19"))["log_id"] == "b_19"
+        assert (await first.get_entry("a_3"))["status"] == "failed"
+        await first.refresh()
+        assert first.get_counters()["saga_execution"]["total"] == 40
+
+        # Compaction by one adapter is picked up by the other
+        await first.append_entry(_entry("old", timestamp=datetime.utcnow() - timedelta(days=2)), ttl_seconds=60)
+        await first.compact(now=datetime.utcnow().timestamp() + 7200)
+        assert await second.get_entry("a_0") is None
+        await first.close()
+        await second.close()
+
+    def test_concurrent_processes_do_not_corrupt_segments(self, tmp_path):
+        context = multiprocessing.get_context("spawn")
+        workers = [
+            context.Process(target=_append_from_process, args=(str(tmp_path), prefix, 60))
+            for prefix in ("p1", "p2")
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(60)
+            assert worker.exitcode == 0
+
+        async def check():
+            wal = WALSegmentAdapter(str(tmp_path))
+            entries = await wal.scan("saga_execution", datetime.utcnow() - timedelta(hours=1), datetime.utcnow())
+            counters = wal.get_counters()["saga_execution"]
+            next_offset = wal.get_stats()["next_offset"]
+            await wal.close()
+            return entries, counters, next_offset
+
+        entries, counters, next_offset = asyncio.run(check())
+        assert sorted(e["log_id"] for e in entries) == sorted(f"{p}_{i}" for p in ("p1", "p2") for i in range(60))
+        assert counters["completed"] == 12 and counters["total"] == 120
+        assert next_offset == 132
@@ -0,0 +1,102 @@
+"""
+Unit tests for the Redis-backed connection registries on a redis.asyncio client.
+
+Tests:
+- Post Office ConnectionRegistry registers, looks up and unregisters connections
+- Channel subscriptions and connection counts go through the async client
+- Traffic Cop registry registers, lists and unregisters session connections
+"""
+
+import pytest
+from types import SimpleNamespace
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from backend.smart_city.services.post_office.connection_registry import ConnectionRegistry
+from backend.smart_city.services.traffic_cop.connection_registry import TrafficCopConnectionRegistry
+
+
+@pytest.fixture
+def redis_client():
+    return fakeredis.FakeAsyncRedis(decode_responses=True)
+
+
+@pytest.fixture
+def messaging_abstraction(redis_client):
+    # Same shape as MessagingAbstraction -> RedisMessagingAdapter -> redis.asyncio client
+    return SimpleNamespace(messaging_adapter=SimpleNamespace(redis_client=redis_client))
+
+
+@pytest.mark.unit
+@pytest.mark.smart_city
+@pytest.mark.fast
+class TestConnectionRegistryAsyncClient:
+    """Post Office registry against redis.asyncio."""
+
+    @pytest.mark.asyncio
+    async def test_register_lookup_unregister(self, messaging_abstraction, redis_client):
+        registry = ConnectionRegistry(messaging_abstraction)
+
+        assert await registry.register_connection(
+            "conn_1", "token", "guide", {"user_id": "user_1"}, "gateway_a"
+        ) is True
+
+        assert await redis_client.exists("websocket:connection:conn_1") == 1
+        conn = await registry.get_connection("conn_1")
+        assert conn["gateway_instance_id"] == "gateway_a"
+        assert conn["metadata"] == {"user_id": "user_1"}
+        assert await registry.get_connections_by_channel("guide") == ["conn_1"]
+        assert await registry.get_connections_by_user("user_1") == ["conn_1"]
+        assert await registry.get_connections_by_gateway("gateway_a") == ["conn_1"]
+
+        assert await registry.unregister_connection("conn_1") is True
+        assert await registry.get_connection("conn_1") is None
+        assert await registry.get_connections_by_channel("guide") == []
+
+    @pytest.mark.asyncio
+    async def test_subscriptions_and_counts(self, messaging_abstraction):
+        registry = ConnectionRegistry(messaging_abstraction)
+        await registry.register_connection("conn_1", "token", "guide", {}, "gateway_a")
+
+        assert await registry.add_channel_subscription("conn_1", "content") is True
+        assert (await registry.get_connection("conn_1"))["channel"] == "content"
+        assert await registry.update_connection_heartbeat("conn_1") is True
+
+        stats = await registry.get_connection_count()
+        assert stats["total"] == 1
+        assert stats["by_channel"] == {"guide": 1, "content": 1}
+
+        assert await registry.remove_channel_subscription("conn_1", "content") is True
+        assert await registry.get_connections_by_channel("content") == []
+
+    @pytest.mark.asyncio
+    async def test_refresh_reports_missing(self, messaging_abstraction):
+        registry = ConnectionRegistry(messaging_abstraction)
+        await registry.register_connection("conn_1", "token", "guide", {}, "gateway_a")
+
+        missing = await registry.refresh_connections(["conn_1", "gone"])
+
+        assert missing == ["gone"]
+
+
+@pytest.mark.unit
+@pytest.mark.smart_city
+@pytest.mark.fast
+class TestTrafficCopConnectionRegistryAsyncClient:
+    """Traffic Cop registry against redis.asyncio."""
+
+    @pytest.mark.asyncio
+    async def test_register_list_unregister(self, messaging_abstraction, redis_client):
+        registry = TrafficCopConnectionRegistry(messaging_abstraction)
+
+        assert await registry.register_connection(
+            "ws_1", "session_1", agent_type="liaison", pillar="content"
+        ) is True
+
+        assert await redis_client.exists("traffic_cop:session:session_1:websocket:ws_1") == 1
+        conn = await registry.get_connection("ws_1", "session_1")
+        assert conn["pillar"] == "content"
+        assert [c["websocket_id"] for c in await registry.get_session_connections("session_1")] == ["ws_1"]
+
+        assert await registry.unregister_connection("ws_1", "session_1") is True
+        assert await registry.get_connection("ws_1", "session_1") is None
@@ -0,0 +1,225 @@
+"""
+Unit tests for Post Office FanOutManager local delivery.
+
+Tests:
+- Channel messages reach local connections through the in-process index (no Redis lookup)
+- A slow client does not delay delivery to the others
+- One serialized frame is shared by every recipient
+- Slow consumer policies: drop_oldest bounds the queue, close disconnects the client
+- Unsubscribing the last local connection stops the channel subscription
+- Publish -> subscribe -> local delivery works through the real MessagingAbstraction
+- Client messages go to the inbound topic only: connections sharing a channel never see
+  each other's messages; addressed outbound frames reach only their target
+"""
+
+import pytest
+import json
+import asyncio
+import logging
+from types import SimpleNamespace
+from unittest.mock import Mock, AsyncMock
+
+from backend.smart_city.services.post_office.fanout_manager import FanOutManager
+from backend.smart_city.services.post_office.websocket_gateway_service import WebSocketGatewayService
+from foundations.public_works_foundation.infrastructure_abstractions.messaging_abstraction import MessagingAbstraction
+from foundations.public_works_foundation.infrastructure_adapters.redis_messaging_adapter import RedisMessagingAdapter
+
+
+class _FakePubSub:
+    def __init__(self):
+        self.messages = asyncio.Queue()
+        self.subscribe = AsyncMock()
+        self.unsubscribe = AsyncMock()
+
+    async def listen(self):
+        while True:
+            yield await self.messages.get()
+
+    def publish(self, payload):
+        self.messages.put_nowait({"type": "message", "data": json.dumps(payload)})
+
+
+class _FakeWebSocket:
+    def __init__(self, blocked=False):
+        self.frames = []
+        self.release = asyncio.Event()
+        if not blocked:
+            self.release.set()
+        self.close = AsyncMock()
+
+    async def send_text(self, frame):
+        await self.release.wait()
+        self.frames.append(frame)
+
+
+async def _settle():
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.unit
+@pytest.mark.smart_city
+@pytest.mark.fast
+class TestFanOutManager:
+    """Unit tests for FanOutManager."""
+
+    @pytest.fixture
+    def pubsub(self):
+        return _FakePubSub()
+
+    @pytest.fixture
+    def registry(self):
+        registry = Mock()
+        registry.get_connections_by_channel = AsyncMock(return_value=[])
+        return registry
+
+    def _manager(self, pubsub, registry, **kwargs):
+        messaging = Mock()
+        messaging.pubsub = Mock(return_value=pubsub)
+        return FanOutManager(messaging, registry, **kwargs)
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_delay_others(self, pubsub, registry):
+        manager = self._manager(pubsub, registry)
+        fast, slow = _FakeWebSocket(), _FakeWebSocket(blocked=True)
+        await manager.subscribe_connection("ws_fast", "guide", fast, "gw_1")
+        await manager.subscribe_connection("ws_slow", "guide", slow, "gw_1")
+
+        for i in range(3):
+            pubsub.publish({"n": i})
+        await _settle()
+
+        assert [json.loads(frame)["n"] for frame in fast.frames] == [0, 1, 2]
+        assert slow.frames == []
+        registry.get_connections_by_channel.assert_not_awaited()
+
+        slow.release.set()
+        await _settle()
+        assert slow.frames == fast.frames
+        assert all(a is b for a, b in zip(slow.frames, fast.frames))  # serialized once
+
+        await manager.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest_bounds_queue(self, pubsub, registry):
+        manager = self._manager(pubsub, registry, send_queue_size=2)
+        slow = _FakeWebSocket(blocked=True)
+        await manager.subscribe_connection("ws_slow", "guide", slow)
+
+        manager.deliver_local("guide", "m0")
+        await _settle()  # m0 is being sent
+        for frame in ("m1", "m2", "m3", "m4"):
+            manager.deliver_local("guide", frame)
+
+        assert manager.get_fanout_stats()["queued"] == 2
+        assert manager.stats["dropped"] == 2
+
+        slow.release.set()
+        await _settle()
+        assert slow.frames == ["m0", "m3", "m4"]
+
+        await manager.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_close_policy_disconnects_slow_consumer(self, pubsub, registry):
+        manager = self._manager(pubsub, registry, send_queue_size=1, slow_consumer_policy="close")
+        fast, slow = _FakeWebSocket(), _FakeWebSocket(blocked=True)
+        await manager.subscribe_connection("ws_fast", "guide", fast)
+        await manager.subscribe_connection("ws_slow", "guide", slow)
+
+        for frame in ("m0", "m1", "m2"):
+            manager.deliver_local("guide", frame)
+            await _settle()
+
+        slow.close.assert_awaited_once_with(code=1013, reason="Slow consumer")
+        assert manager.channel_index["guide"] == {"ws_fast"}
+        assert fast.frames == ["m0", "m1", "m2"]
+
+        await manager.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_last_unsubscribe_stops_channel(self, pubsub, registry):
+        manager = self._manager(pubsub, registry)
+        await manager.subscribe_connection("ws_1", "pillar:content", _FakeWebSocket())
+        await manager.subscribe_connection("ws_2", "pillar:content", _FakeWebSocket())
+        assert "websocket:out:pillar:content" in manager.active_subscriptions
+
+        await manager.unsubscribe_connection("ws_1")
+        assert "websocket:out:pillar:content" in manager.active_subscriptions
+        await manager.unsubscribe_connection("ws_2")
+
+        assert "websocket:out:pillar:content" not in manager.active_subscriptions
+        pubsub.unsubscribe.assert_awaited_once_with("websocket:out:pillar:content")
+        assert manager.send_queues == {}
+
+
+@pytest.mark.unit
+@pytest.mark.smart_city
+@pytest.mark.fast
+class TestFanOutManagerMessagingAbstraction:
+    """FanOutManager against the MessagingAbstraction the gateway actually passes it."""
+
+    @pytest.fixture
+    def messaging(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        adapter = RedisMessagingAdapter(
+            fakeredis.FakeAsyncRedis(decode_responses=True),
+            di_container=SimpleNamespace(get_logger=logging.getLogger)
+        )
+        return MessagingAbstraction(adapter, config_adapter=None)
+
+    @pytest.mark.asyncio
+    async def test_publish_reaches_local_connections(self, messaging):
+        registry = Mock()
+        registry.get_connections_by_channel = AsyncMock(return_value=[])
+        manager = FanOutManager(messaging, registry)
+        websocket = _FakeWebSocket()
+
+        await manager.subscribe_connection("ws_1", "guide", websocket, "gw_1")
+        assert "websocket:out:guide" in manager.active_subscriptions
+
+        result = await manager.publish_to_channel("guide", {"text": "hello"})
+        for _ in range(50):
+            if websocket.frames:
+                break
+            await asyncio.sleep(0.01)
+
+        assert result["success"] is True
+        assert result["subscribers"] == 1
+        assert json.loads(websocket.frames[0])["message"] == {"text": "hello"}
+
+        await manager.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_client_messages_are_not_fanned_out_to_other_clients(self, messaging):
+        manager = FanOutManager(messaging, Mock())
+        websockets = {"ws_1": _FakeWebSocket(), "ws_2": _FakeWebSocket()}
+        gateway = WebSocketGatewayService.__new__(WebSocketGatewayService)
+        gateway.__dict__.update(
+            connection_registry=None, fanout_manager=manager, backpressure_manager=None,
+            messaging_abstraction=messaging, local_connections=websockets, instance_id="gw_1",
+            metrics={}, logger=logging.getLogger("test_gateway")
+        )
+        agent = messaging.pubsub()
+        await agent.subscribe("websocket:guide")
+
+        await gateway._route_to_channel("ws_1", "guide", {"channel": "guide", "payload": {"text": "from user 1"}})
+        await gateway._route_to_channel("ws_2", "guide", {"channel": "guide", "payload": {"text": "from user 2"}})
+        await manager.publish_to_channel("guide", {"text": "for user 2"}, target_connection_id="ws_2")
+        for _ in range(50):
+            if websockets["ws_2"].frames:
+                break
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+
+        assert websockets["ws_1"].frames == []
+        assert [json.loads(frame)["message"] for frame in websockets["ws_2"].frames] == [{"text": "for user 2"}]
+        inbound = []
+        for _ in range(10):
+            message = await agent.get_message(ignore_subscribe_messages=True, timeout=0.05)
+            if message:
+                inbound.append(json.loads(message["data"])["connection_id"])
+        assert inbound == ["ws_1", "ws_2"]  # agents still receive client messages
+
+        await agent.aclose()
+        await manager.shutdown()
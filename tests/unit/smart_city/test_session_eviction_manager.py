@@ -0,0 +1,159 @@
+"""
+Unit tests for the timer-wheel SessionEvictionManager.
+
+Tests:
+- TimerWheel schedules, cancels and expires keys, including delays beyond one revolution
+- A tick touches only connections whose heartbeat is due, with one registry batch
+- Dead connections (failed ping or missing from the registry) are evicted
+- Message activity is recorded locally and written in the next batch
+- ConnectionRegistry.refresh_connections uses pipelines instead of per-connection calls
+"""
+
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+from backend.smart_city.services.post_office.session_eviction_manager import (
+    SessionEvictionManager, TimerWheel
+)
+from backend.smart_city.services.post_office.connection_registry import ConnectionRegistry
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _FakeWebSocket:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.pings = 0
+        self.close = AsyncMock()
+
+    async def send_json(self, data):
+        if self.fail:
+            raise RuntimeError("connection reset")
+        self.pings += 1
+
+
+@pytest.mark.unit
+@pytest.mark.smart_city
+@pytest.mark.fast
+class TestTimerWheel:
+
+    def test_schedule_cancel_and_long_delays(self):
+        wheel = TimerWheel(tick_interval=1.0, slots=8)
+        wheel.schedule("a", 3.0)
+        wheel.schedule("b", 20.0)  # more than two revolutions
+        wheel.schedule("c", 3.0)
+        wheel.cancel("c")
+
+        assert wheel.advance(2.0) == []
+        assert wheel.advance(3.0) == ["a"]
+        assert wheel.advance(19.0) == []
+        assert wheel.advance(20.0) == ["b"]
+        assert len(wheel) == 0
+
+
+@pytest.mark.unit
+@pytest.mark.smart_city
+@pytest.mark.fast
+class TestSessionEvictionManager:
+
+    @pytest.fixture
+    def clock(self):
+        return _Clock()
+
+    @pytest.fixture
+    def registry(self):
+        registry = Mock()
+        registry.refresh_connections = AsyncMock(return_value=[])
+        registry.unregister_connection = AsyncMock(return_value=True)
+        registry.get_connection = AsyncMock()
+        return registry
+
+    @pytest.fixture
+    def manager(self, registry, clock):
+        return SessionEvictionManager(registry, heartbeat_interval=30, max_idle_time=300, clock=clock)
+
+    @pytest.mark.asyncio
+    async def test_tick_touches_only_due_connections(self, manager, registry, clock):
+        local_connections = {}
+        for i in range(3000):
+            clock.now = i * 0.01  # connections arrive over 30 seconds
+            local_connections[f"ws_{i}"] = _FakeWebSocket()
+            await manager.start_heartbeat_monitor(f"ws_{i}", local_connections[f"ws_{i}"], local_connections)
+
+        clock.now = 31.0
+        result = await manager.run_tick(local_connections)
+
+        # Only connections registered in the first ~second are due; one registry batch for all of them
+        assert 0 < result["due"] <= 200
+        assert result["heartbeats"] == result["due"]
+        registry.refresh_connections.assert_awaited_once()
+        assert len(registry.refresh_connections.await_args.args[0]) == result["due"]
+        registry.get_connection.assert_not_awaited()
+        assert sum(ws.pings for ws in local_connections.values()) == result["due"]
+
+    @pytest.mark.asyncio
+    async def test_dead_connections_are_evicted(self, manager, registry, clock):
+        local_connections = {"ws_ok": _FakeWebSocket(), "ws_dead": _FakeWebSocket(fail=True), "ws_gone": _FakeWebSocket()}
+        for connection_id, websocket in local_connections.items():
+            await manager.start_heartbeat_monitor(connection_id, websocket, local_connections)
+        registry.refresh_connections = AsyncMock(return_value=["ws_gone"])
+
+        clock.now = 30.0
+        result = await manager.run_tick(local_connections)
+
+        assert result["evicted"] == 2
+        assert set(local_connections) == {"ws_ok"}
+        assert {call.args[0] for call in registry.unregister_connection.await_args_list} == {"ws_dead", "ws_gone"}
+        assert "ws_ok" in manager.timer_wheel and "ws_dead" not in manager.timer_wheel
+
+    @pytest.mark.asyncio
+    async def test_activity_is_batched(self, manager, registry, clock):
+        local_connections = {f"ws_{i}": _FakeWebSocket() for i in range(3)}
+        for connection_id, websocket in local_connections.items():
+            await manager.start_heartbeat_monitor(connection_id, websocket, local_connections)
+
+        clock.now = 5.0
+        manager.touch("ws_0")
+        manager.touch("ws_2")
+        await manager.run_tick(local_connections)
+
+        heartbeats, active = registry.refresh_connections.await_args.args
+        assert heartbeats == [] and sorted(active) == ["ws_0", "ws_2"]
+        assert manager.pending_activity == set()
+
+    @pytest.mark.asyncio
+    async def test_registry_refresh_uses_pipelines(self):
+        executed = []
+
+        class _Pipeline:
+            def __init__(self):
+                self.commands = []
+
+            def expire(self, key, ttl):
+                self.commands.append(("expire", key))
+
+            def hset(self, key, mapping):
+                self.commands.append(("hset", key, tuple(sorted(mapping))))
+
+            async def execute(self):
+                executed.append(self.commands)
+                return [key != "websocket:connection:ws_gone" for _, key, *rest in self.commands]
+
+        messaging = Mock()
+        messaging.messaging_adapter.redis_client.pipeline = Mock(side_effect=lambda transaction: _Pipeline())
+        registry = ConnectionRegistry(messaging)
+
+        missing = await registry.refresh_connections(["ws_1", "ws_gone"], ["ws_1", "ws_2"])
+
+        assert missing == ["ws_gone"]
+        assert len(executed) == 2
+        assert sorted(executed[1]) == [
+            ("hset", "websocket:connection:ws_1", ("last_activity", "last_heartbeat")),
+            ("hset", "websocket:connection:ws_2", ("last_activity",)),
+        ]
@@ -0,0 +1,222 @@
+"""
+Unit tests for Traffic Cop load balancing on the instance health table.
+
+Tests:
+- Health-based / least-connections selection does no I/O per request
+- Power-of-two-choices prefers instances with lower latency x in-flight load
+- Consecutive failures eject an instance for a growing period, capped per service
+- Latency outliers are ejected after a probe round
+- Probe rounds reuse one shared HTTP client
+- API routing counts forwarded requests as in flight and reports their latency and outcome
+"""
+
+import pytest
+import random
+from unittest.mock import Mock, AsyncMock
+
+from backend.smart_city.protocols.traffic_cop_service_protocol import (
+    APIGatewayRequest, LoadBalancingRequest, LoadBalancingStrategy, ServiceInstance
+)
+from backend.smart_city.services.traffic_cop.instance_health_prober import InstanceHealthProber
+from backend.smart_city.services.traffic_cop.modules.load_balancing import LoadBalancing
+from backend.smart_city.services.traffic_cop.modules.api_routing import ApiRouting
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class _FakeHttpx:
+    """Stands in for the httpx module: counts clients, answers by URL."""
+
+    class Limits:
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+
+    def __init__(self, statuses):
+        self.statuses = statuses
+        self.clients = 0
+        self.requests = 0
+
+    def AsyncClient(self, **kwargs):
+        fake = self
+        fake.clients += 1
+
+        class _Client:
+            async def get(self, url, timeout=None):
+                fake.requests += 1
+                return Mock(status_code=fake.statuses.get(url, 200))
+
+            async def aclose(self):
+                pass
+
+        return _Client()
+
+
+def _instances(count, with_urls=False):
+    return [ServiceInstance(id=f"inst_{i}", host="10.0.0.1", port=8000 + i,
+                            health_check_url=f"http://inst_{i}/health" if with_urls else None)
+            for i in range(count)]
+
+
+@pytest.mark.unit
+@pytest.mark.smart_city
+@pytest.mark.fast
+class TestTrafficCopLoadBalancing:
+    """Unit tests for LoadBalancing and InstanceHealthProber."""
+
+    @pytest.fixture
+    def clock(self):
+        return _Clock()
+
+    @pytest.fixture
+    def prober(self, clock):
+        return InstanceHealthProber(clock=clock, rng=random.Random(7))
+
+    @pytest.fixture
+    def service(self, prober):
+        service = Mock()
+        service.httpx = None
+        service.instance_health_prober = prober
+        service.service_instances = {}
+        service.load_balancing_counters = {}
+        service.traffic_metrics = {"load_balancing_operations": 0}
+        service.get_security = Mock(return_value=None)
+        service.log_operation_with_telemetry = AsyncMock()
+        service.record_health_metric = AsyncMock()
+        service.handle_error_with_audit = AsyncMock()
+        service.messaging_abstraction.get_data = AsyncMock(return_value=0)
+        service.messaging_abstraction.store_data = AsyncMock()
+        return service
+
+    @pytest.mark.asyncio
+    async def test_selection_does_no_io(self, service):
+        load_balancing = LoadBalancing(service)
+        for instance in _instances(50, with_urls=True):
+            assert await load_balancing.register_service_instance("content", instance)
+
+        for strategy in (LoadBalancingStrategy.HEALTH_BASED, LoadBalancingStrategy.LEAST_CONNECTIONS):
+            response = await load_balancing.select_service(
+                LoadBalancingRequest(service_name="content", strategy=strategy))
+            assert response.success
+
+        service.messaging_abstraction.get_data.assert_not_awaited()
+        assert await load_balancing._check_instance_health(service.service_instances["content"][0]) == 100
+
+    def test_p2c_prefers_lower_load(self, prober):
+        instances = _instances(2)
+        for instance in instances:
+            prober.add_instance("content", instance)
+        prober.end_request("inst_0", latency=0.010)
+        prober.end_request("inst_1", latency=0.200)
+
+        assert all(prober.select(instances).id == "inst_0" for _ in range(20))
+
+        # Enough in-flight requests on the fast instance tip the balance
+        for _ in range(30):
+            prober.begin_request("inst_0")
+        assert prober.select(instances).id == "inst_1"
+
+    def test_failures_eject_with_growing_period(self, prober, clock):
+        instances = _instances(4)
+        for instance in instances:
+            prober.add_instance("content", instance)
+
+        for _ in range(3):
+            prober.end_request("inst_0", success=False)
+        assert not prober.is_available("inst_0")
+        assert all(prober.select(instances).id != "inst_0" for _ in range(50))
+
+        clock.now += 31
+        assert prober.is_available("inst_0")
+        prober.end_request("inst_0", success=False)  # still failing: ejected again, for longer
+        clock.now += 31
+        assert not prober.is_available("inst_0")
+        clock.now += 30
+        assert prober.is_available("inst_0")
+
+    def test_ejection_is_capped_per_service(self, prober):
+        instances = _instances(4)
+        for instance in instances:
+            prober.add_instance("content", instance)
+        for instance in instances:
+            for _ in range(3):
+                prober.end_request(instance.id, success=False)
+
+        assert sum(not prober.is_available(instance.id) for instance in instances) == 2
+        assert prober.select(instances) is not None
+
+    @pytest.mark.asyncio
+    async def test_latency_outlier_ejected_after_probe_round(self, prober):
+        for instance in _instances(5):
+            prober.add_instance("content", instance)
+            prober.end_request(instance.id, latency=0.020)
+        prober.end_request("inst_4", latency=5.0)
+
+        await prober.probe_all()
+
+        assert not prober.is_available("inst_4")
+        assert all(prober.is_available(f"inst_{i}") for i in range(4))
+
+    @pytest.mark.asyncio
+    async def test_probes_share_one_client(self, clock):
+        httpx = _FakeHttpx({"http://inst_2/health": 503})
+        prober = InstanceHealthProber(httpx_module=httpx, probe_interval=3600, clock=clock)
+        for instance in _instances(6, with_urls=True):
+            prober.add_instance("content", instance)
+
+        await prober.start()
+        try:
+            for _ in range(3):
+                await prober.probe_all()
+        finally:
+            await prober.shutdown()
+
+        assert httpx.clients == 1
+        assert httpx.requests >= 18
+        assert not prober.is_available("inst_2")
+        assert prober.health_score("inst_2") == 0
+        assert prober.health_score("inst_0") == 100
+
+    @pytest.mark.asyncio
+    async def test_routing_reports_forwarded_requests(self, service, prober):
+        load_balancing = LoadBalancing(service)
+        instance = _instances(1)[0]
+        await load_balancing.register_service_instance("content", instance)
+        rate_limiting = Mock()
+        rate_limiting.check_rate_limit = AsyncMock(return_value=Mock(allowed=True))
+        service.get_module = Mock(side_effect={"rate_limiting": rate_limiting,
+                                               "load_balancing": load_balancing}.get)
+        service.api_routes = {"/api/v1/content": {"method": "GET", "service": "content"}}
+        service.traffic_metrics.update(total_requests=0, successful_requests=0, failed_requests=0)
+        api_routing = ApiRouting(service)
+
+        in_flight_during_forward = []
+
+        async def forward(request, selected):
+            in_flight_during_forward.append(prober.get_state(selected.id).in_flight)
+            return {"service_instance": selected.id}
+
+        api_routing._forward_request = forward
+        response = await api_routing.route_api_request(APIGatewayRequest(method="GET", path="/api/v1/content"))
+
+        assert response.success and response.service_instance.id == "inst_0"
+        assert in_flight_during_forward == [1]
+        state = prober.get_state("inst_0")
+        assert state.in_flight == 0
+        assert state.latency_ewma is not None
+
+        async def failing_forward(request, selected):
+            raise ConnectionError("upstream reset")
+
+        api_routing._forward_request = failing_forward
+        for _ in range(3):
+            response = await api_routing.route_api_request(APIGatewayRequest(method="GET", path="/api/v1/content"))
+            assert response.status_code == 500
+
+        assert state.in_flight == 0
+        assert state.consecutive_failures == 3
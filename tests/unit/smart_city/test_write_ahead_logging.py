@@ -0,0 +1,203 @@
+"""
+Unit tests for Data Steward write-ahead logging on the segment engine.
+
+Tests:
+- write_to_log is durable before ArangoDB projection runs
+- Projection creates governance metadata and lineage asynchronously
+- update_log_status / replay_log round-trip
+- Cursor-paged replay and per-namespace counters
+- Newest-first pages and counters limited to a recent window
+- Replay hands pages to on_page without accumulating them
+- Entries stored in State Management by earlier releases are migrated once
+"""
+
+import pytest
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import Mock, AsyncMock
+
+from foundations.public_works_foundation.infrastructure_adapters.wal_segment_adapter import WALSegmentAdapter
+from backend.smart_city.services.data_steward.modules.write_ahead_logging import WriteAheadLogging
+
+
+@pytest.mark.unit
+@pytest.mark.smart_city
+@pytest.mark.wal
+class TestWriteAheadLogging:
+    """Unit tests for WriteAheadLogging."""
+
+    @pytest.fixture
+    def service(self):
+        service = Mock()
+        service.di_container.get_logger = Mock(return_value=Mock())
+        service.is_infrastructure_connected = True
+        service.get_security = Mock(return_value=None)
+        service.get_tenant = Mock(return_value=None)
+        service.log_operation_with_telemetry = AsyncMock()
+        service.record_health_metric = AsyncMock()
+        service.handle_error_with_audit = AsyncMock()
+        service.knowledge_governance_abstraction.create_asset_metadata = AsyncMock()
+        service.knowledge_governance_abstraction.update_asset_metadata = AsyncMock()
+        service.lineage_tracking_module.record_lineage = AsyncMock()
+        service.state_management_abstraction.retrieve_state = AsyncMock(return_value=None)
+        return service
+
+    @pytest.fixture
+    def wal(self, service, tmp_path):
+        return WriteAheadLogging(service, wal_engine=WALSegmentAdapter(str(tmp_path), fsync=False))
+
+    @pytest.mark.asyncio
+    async def test_write_is_durable_and_projected_asynchronously(self, wal, service):
+        projected = asyncio.Event()
+
+        async def slow_projection(**kwargs):
+            await projected.wait()
+
+        service.knowledge_governance_abstraction.create_asset_metadata = AsyncMock(side_effect=slow_projection)
+        result = await wal.write_to_log("saga_execution", {"operation": "step", "saga_id": "saga_1"}, "queue")
+
+        assert result["success"] is True
+        assert (await wal.wal_engine.get_entry(result["log_id"]))["correlation_id"] == "saga_1"
+        service.lineage_tracking_module.record_lineage.assert_not_awaited()
+
+        projected.set()
+        await wal.flush_projections()
+        service.lineage_tracking_module.record_lineage.assert_awaited_once()
+        service.state_management_abstraction.store_state.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_status_update_and_replay(self, wal, service):
+        written = [
+            await wal.write_to_log("saga_execution", {"operation": f"step_{i}"}, "queue")
+            for i in range(3)
+        ]
+        await wal.update_log_status(written[1]["log_id"], "retrying", error="timeout")
+        await wal.flush_projections()
+
+        now = datetime.utcnow()
+        entries = await wal.replay_log("saga_execution", now - timedelta(minutes=1), now + timedelta(minutes=1))
+        retrying = await wal.replay_log(
+            "saga_execution", now - timedelta(minutes=1), now + timedelta(minutes=1), filters={"status": "retrying"}
+        )
+
+        assert len(entries) == 3
+        assert [(e["log_id"], e["retry_count"], e["error"]) for e in retrying] == [(written[1]["log_id"], 1, "timeout")]
+        service.knowledge_governance_abstraction.update_asset_metadata.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_update_unknown_entry(self, wal):
+        result = await wal.update_log_status("wal_missing", "completed")
+
+        assert result["success"] is False
+
+    @pytest.mark.asyncio
+    async def test_replay_pages_and_counters(self, wal):
+        written = [
+            await wal.write_to_log("saga_execution", {"operation": f"step_{i}"}, "queue")
+            for i in range(5)
+        ]
+        await wal.update_log_status(written[0]["log_id"], "completed")
+        await wal.update_log_status(written[1]["log_id"], "failed", error="boom")
+        await wal.flush_projections()
+
+        now = datetime.utcnow()
+        first = await wal.replay_log_page("saga_execution", now - timedelta(minutes=1), now, page_size=2)
+        second = await wal.replay_log_page(
+            "saga_execution", now - timedelta(minutes=1), now, cursor=first["next_cursor"], page_size=2
+        )
+        wal.replay_page_size = 2
+        replayed = await wal.replay_log("saga_execution", now - timedelta(minutes=1), now)
+        pages = []
+
+        async def on_page(entries):
+            pages.append([e["log_id"] for e in entries])
+
+        streamed = await wal.replay_log("saga_execution", now - timedelta(minutes=1), now, on_page=on_page)
+        counters = await wal.get_wal_counters("saga_execution")
+
+        assert [e["log_id"] for e in first["entries"] + second["entries"]] == [w["log_id"] for w in written[:4]]
+        assert len(replayed) == 5
+        assert streamed == [] and [len(page) for page in pages] == [2, 2, 1]
+        assert sum(pages, []) == [e["log_id"] for e in replayed]
+        assert counters["counters"]["saga_execution"] == {
+            "pending": 3, "completed": 1, "failed": 1, "retrying": 0, "total": 5
+        }
+        assert counters["time_range"]["from"] <= counters["time_range"]["to"] <= now.isoformat()
+
+    @pytest.mark.asyncio
+    async def test_newest_first_page_and_windowed_counters(self, wal):
+        now = datetime.utcnow()
+        engine = wal._get_wal_engine()
+        for i in range(3):
+            await engine.append_entry(
+                {"log_id": f"wal_old_{i}", "namespace": "saga_execution", "timestamp": (now - timedelta(days=2)).isoformat(),
+                 "status": "failed", "metadata": {}},
+                ttl_seconds=7 * 86400
+            )
+        written = [
+            await wal.write_to_log("saga_execution", {"operation": f"step_{i}"}, "queue")
+            for i in range(4)
+        ]
+        await wal.flush_projections()
+
+        page = await wal.replay_log_page(
+            "saga_execution", now - timedelta(hours=1), datetime.utcnow(), page_size=2, descending=True
+        )
+        day = await wal.get_wal_counters("saga_execution", since=now - timedelta(hours=24))
+        retention = await wal.get_wal_counters("saga_execution")
+
+        assert [e["log_id"] for e in page["entries"]] == [written[3]["log_id"], written[2]["log_id"]]
+        assert day["counters"]["saga_execution"]["total"] == 4
+        assert day["counters"]["saga_execution"]["failed"] == 0
+        assert day["time_range"]["from"] >= (now - timedelta(hours=24)).isoformat()
+        assert retention["counters"]["saga_execution"]["total"] == 7
+
+    @pytest.mark.asyncio
+    async def test_legacy_state_entries_are_migrated_once(self, wal, service):
+        now = datetime.utcnow()
+
+        def legacy(log_id, timestamp, status="pending"):
+            entry = {
+                "log_id": log_id, "namespace": "saga_execution", "timestamp": timestamp.isoformat(),
+                "payload": {"operation": "step"}, "target": "queue", "lifecycle": {"ttl": 3600},
+                "status": status, "retry_count": 0, "correlation_id": None, "metadata": {"tenant_id": None}
+            }
+            return {"state_id": f"wal:{log_id}", "state_data": entry, "metadata": {"type": "wal_entry"}}
+
+        states = [
+            legacy("wal_old_1", now - timedelta(minutes=5), status="failed"),
+            legacy("wal_old_2", now - timedelta(minutes=4)),
+            legacy("wal_expired", now - timedelta(days=2)),
+            {"state_id": "session:1", "state_data": {}, "metadata": {"type": "session"}}
+        ]
+        markers = {}
+        service.state_management_abstraction.list_states = AsyncMock(return_value=states)
+        service.state_management_abstraction.retrieve_state = AsyncMock(side_effect=lambda state_id: markers.get(state_id))
+        service.state_management_abstraction.store_state = AsyncMock(
+            side_effect=lambda state_id, state_data, metadata: markers.__setitem__(state_id, state_data)
+        )
+
+        first = await wal.migrate_legacy_entries()
+        second = await wal.migrate_legacy_entries()
+        replayed = await wal.replay_log("saga_execution", now - timedelta(hours=1), now)
+        updated = await wal.update_log_status("wal_old_2", "completed")
+
+        assert (first["migrated"], first["skipped"]) == (2, 1)
+        assert second.get("already_migrated") is True
+        service.state_management_abstraction.list_states.assert_awaited_once()
+        assert [(e["log_id"], e["status"]) for e in replayed] == [("wal_old_1", "failed"), ("wal_old_2", "pending")]
+        assert updated["success"] is True
+
+    @pytest.mark.asyncio
+    async def test_status_update_reads_through_to_legacy_entry(self, wal, service):
+        entry = {
+            "log_id": "wal_legacy", "namespace": "saga_execution", "timestamp": datetime.utcnow().isoformat(),
+            "payload": {}, "target": "queue", "lifecycle": {"ttl": 3600}, "status": "pending",
+            "retry_count": 0, "correlation_id": None, "metadata": {}
+        }
+        service.state_management_abstraction.retrieve_state = AsyncMock(return_value=entry)
+
+        result = await wal.update_log_status("wal_legacy", "completed")
+
+        assert result["success"] is True
+        assert (await wal.wal_engine.get_entry("wal_legacy"))["status"] == "completed"